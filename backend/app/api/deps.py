@@ -1,9 +1,23 @@
-from typing import Generator
+from typing import AsyncGenerator, Generator
+from fastapi import Request
+from app import database
 from app.database import SessionLocal
+from app.core.routing import mark_read_only
 
-def get_db() -> Generator:
+READ_ONLY_METHODS = ("GET", "HEAD")
+
+def get_db(request: Request) -> Generator:
     db = SessionLocal()
+    # 조회 요청만 복제본 사용 대상 (쓰기 요청은 처음부터 primary)
+    mark_read_only(db, request.method in READ_ONLY_METHODS)
     try:
         yield db
     finally:
         db.close()
+
+async def get_async_db(request: Request) -> AsyncGenerator:
+    if database.AsyncSessionLocal is None:
+        raise RuntimeError("Async database mode is disabled (set DB_ASYNC=true)")
+    async with database.AsyncSessionLocal() as db:
+        mark_read_only(db, request.method in READ_ONLY_METHODS)
+        yield db
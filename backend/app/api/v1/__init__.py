@@ -1,5 +1,5 @@
 from fastapi import APIRouter
-from app.api.v1 import accounts, transactions, recurring, summary
+from app.api.v1 import accounts, transactions, recurring, categories, budgets, summary, scheduler, debug
 
 api_router = APIRouter()
 
@@ -21,8 +21,32 @@ api_router.include_router(
     tags=["recurring-transactions"]
 )
 
+api_router.include_router(
+    categories.router,
+    prefix="/categories",
+    tags=["categories"]
+)
+
+api_router.include_router(
+    budgets.router,
+    prefix="/budgets",
+    tags=["budgets"]
+)
+
 api_router.include_router(
     summary.router,
     prefix="/summary",
     tags=["summary"]
 )
+
+api_router.include_router(
+    scheduler.router,
+    prefix="/scheduler",
+    tags=["scheduler"]
+)
+
+api_router.include_router(
+    debug.router,
+    prefix="/debug",
+    tags=["debug"]
+)
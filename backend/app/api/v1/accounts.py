@@ -5,14 +5,15 @@ from app import schemas
 from app.api.deps import get_db
 from app.services.account_service import AccountService
 from app.core.exceptions import AccountNotFoundError, InsufficientBalanceError
+from app.core.responses import FastJSONResponse, json_response
 
 router = APIRouter()
 
-@router.get("/", response_model=List[schemas.Account])
+@router.get("/", response_model=List[schemas.Account], response_class=FastJSONResponse)
 def get_accounts(db: Session = Depends(get_db)):
     """모든 계좌 조회"""
     service = AccountService(db)
-    return service.get_all_accounts()
+    return json_response(List[schemas.Account], service.get_account_rows())
 
 @router.get("/{account_id}", response_model=schemas.Account)
 def get_account(account_id: int, db: Session = Depends(get_db)):
@@ -0,0 +1,73 @@
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from datetime import date
+from app import schemas
+from app.api.deps import get_db
+from app.services.budget_service import BudgetService
+from app.core.exceptions import BudgetNotFoundError, CategoryNotFoundError, InvalidBudgetError
+
+router = APIRouter()
+
+@router.get("/", response_model=List[schemas.Budget])
+def get_budgets(db: Session = Depends(get_db)):
+    """모든 예산 조회"""
+    service = BudgetService(db)
+    return service.get_budgets()
+
+@router.get("/utilization", response_model=schemas.BudgetReport)
+def get_budget_utilization(
+    as_of: Optional[date] = Query(None, description="기준일 (기본값: 오늘, 해당 월이 집계 기간)"),
+    db: Session = Depends(get_db)
+):
+    """이번 달 예산별 사용률과 월말 예상 지출"""
+    service = BudgetService(db)
+    return service.get_utilization(as_of)
+
+@router.get("/alerts", response_model=List[schemas.BudgetStatus])
+def get_budget_alerts(
+    as_of: Optional[date] = Query(None, description="기준일 (기본값: 오늘)"),
+    threshold: Optional[float] = Query(None, gt=0, le=1, description="경고 사용률 (기본값: 설정값)"),
+    db: Session = Depends(get_db)
+):
+    """예산 초과/월말 초과 예상/경고 목록"""
+    service = BudgetService(db)
+    return service.get_alerts(as_of, threshold)
+
+@router.get("/projection", response_model=List[schemas.BudgetProjection])
+def get_budget_projection(
+    as_of: Optional[date] = Query(None, description="기준일 (기본값: 오늘)"),
+    db: Session = Depends(get_db)
+):
+    """예산별 월말 예상 지출과 예산 소진 예상일"""
+    service = BudgetService(db)
+    return service.get_projection(as_of)
+
+@router.post("/", response_model=schemas.Budget, status_code=status.HTTP_201_CREATED)
+def create_budget(budget: schemas.BudgetCreate, db: Session = Depends(get_db)):
+    """지출 카테고리에 월 예산 설정"""
+    service = BudgetService(db)
+    try:
+        return service.create_budget(budget)
+    except CategoryNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except InvalidBudgetError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+@router.patch("/{budget_id}", response_model=schemas.Budget)
+def update_budget(budget_id: int, budget_update: schemas.BudgetUpdate, db: Session = Depends(get_db)):
+    """월 예산 금액 수정"""
+    service = BudgetService(db)
+    try:
+        return service.update_budget(budget_id, budget_update)
+    except BudgetNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+@router.delete("/{budget_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_budget(budget_id: int, db: Session = Depends(get_db)):
+    """예산 삭제"""
+    service = BudgetService(db)
+    try:
+        service.delete_budget(budget_id)
+    except BudgetNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -0,0 +1,64 @@
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from datetime import date
+from app import schemas
+from app.models import TransactionType
+from app.api.deps import get_db
+from app.services.category_service import CategoryService
+from app.core.exceptions import CategoryNotFoundError, InvalidCategoryError
+
+router = APIRouter()
+
+@router.get("/", response_model=List[schemas.Category])
+def get_categories(db: Session = Depends(get_db)):
+    """모든 카테고리 조회"""
+    service = CategoryService(db)
+    return service.get_categories()
+
+@router.get("/rollup", response_model=List[schemas.CategoryRollup])
+def get_category_rollup(
+    start_date: date = Query(..., description="시작 날짜 (YYYY-MM-DD)"),
+    end_date: date = Query(..., description="종료 날짜 (YYYY-MM-DD)"),
+    type: Optional[TransactionType] = Query(None, description="income | expense"),
+    db: Session = Depends(get_db)
+):
+    """기간 내 카테고리 트리 노드별 합계 (하위 카테고리 포함)"""
+    service = CategoryService(db)
+    try:
+        return service.get_rollup(start_date, end_date, type)
+    except InvalidCategoryError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+@router.post("/", response_model=schemas.Category, status_code=status.HTTP_201_CREATED)
+def create_category(category: schemas.CategoryCreate, db: Session = Depends(get_db)):
+    """새 카테고리 생성"""
+    service = CategoryService(db)
+    try:
+        return service.create_category(category)
+    except CategoryNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+@router.patch("/{category_id}", response_model=schemas.Category)
+def update_category(
+    category_id: int,
+    category_update: schemas.CategoryUpdate,
+    db: Session = Depends(get_db)
+):
+    """카테고리 수정 (parent_id 변경 시 하위 트리 이동)"""
+    service = CategoryService(db)
+    try:
+        return service.update_category(category_id, category_update)
+    except CategoryNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except InvalidCategoryError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+@router.delete("/{category_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_category(category_id: int, db: Session = Depends(get_db)):
+    """카테고리 삭제 (하위 카테고리는 상위로 이동)"""
+    service = CategoryService(db)
+    try:
+        service.delete_category(category_id)
+    except CategoryNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -0,0 +1,25 @@
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.orm import Session
+from app.api.deps import get_db
+from app.core.slow_query_log import slow_query_log
+
+router = APIRouter()
+
+@router.get("/slow-queries", response_model=dict)
+def get_slow_queries(
+    explain: bool = Query(True, description="실행 계획이 없는 항목은 EXPLAIN 실행"),
+    limit: int = Query(50, ge=1, le=1000),
+    db: Session = Depends(get_db)
+):
+    """최근 느린 쿼리 (최신순, 파라미터 마스킹)"""
+    if explain:
+        slow_query_log.explain_pending(db.connection())
+    return {
+        **slow_query_log.stats(),
+        "queries": [entry.to_dict() for entry in slow_query_log.entries()[:limit]]
+    }
+
+@router.delete("/slow-queries", status_code=status.HTTP_204_NO_CONTENT)
+def clear_slow_queries():
+    """느린 쿼리 버퍼 비우기"""
+    slow_query_log.clear()
@@ -6,17 +6,18 @@ from app import schemas
 from app.api.deps import get_db
 from app.services.recurring_service import RecurringTransactionService
 from app.core.exceptions import AccountNotFoundError
+from app.core.responses import FastJSONResponse, json_response
 
 router = APIRouter()
 
-@router.get("/", response_model=List[schemas.RecurringTransaction])
+@router.get("/", response_model=List[schemas.RecurringTransaction], response_class=FastJSONResponse)
 def get_recurring_transactions(
     account_id: Optional[int] = Query(None, description="필터링할 계좌 ID"),
     db: Session = Depends(get_db)
 ):
     """정기 거래 목록 조회"""
     service = RecurringTransactionService(db)
-    return service.get_all_recurring(account_id)
+    return json_response(List[schemas.RecurringTransaction], service.get_recurring_rows(account_id))
 
 @router.get("/{recurring_id}", response_model=schemas.RecurringTransaction)
 def get_recurring_transaction(
@@ -0,0 +1,9 @@
+from fastapi import APIRouter
+from app.jobs import scheduler
+
+router = APIRouter()
+
+@router.get("/status", response_model=dict)
+def get_scheduler_status():
+    """스케줄러 리더 여부 및 작업별 마지막 실행 시간/처리량"""
+    return scheduler.status()
@@ -1,9 +1,14 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Path, Query
 from sqlalchemy.orm import Session
 from decimal import Decimal
+from datetime import date
+from typing import Optional
 from app import schemas
 from app.api.deps import get_db
 from app.services.summary_service import SummaryService
+from app.services.transaction_service import TransactionService
+from app.services.snapshot_service import SnapshotService
+from app.core.cache import summary_cache
 
 router = APIRouter()
 
@@ -35,7 +40,38 @@ def get_full_summary(db: Session = Depends(get_db)):
     return service.get_full_summary()
 
 @router.get("/net-worth-trend", response_model=dict)
-def get_net_worth_trend(months: int = 6, db: Session = Depends(get_db)):
-    """순자산 추이 조회"""
+def get_net_worth_trend(
+    months: int = 6,
+    mode: str = Query("snapshot", pattern="^(snapshot|reconstruct)$"),
+    granularity: str = Query("monthly", pattern="^(daily|weekly|monthly)$"),
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    db: Session = Depends(get_db)
+):
+    """순자산 추이 조회 (mode=reconstruct: 거래 원장으로 재구성)"""
     service = SummaryService(db)
-    return service.get_net_worth_trend(months=months)
+    return service.get_net_worth_trend(
+        months=months, mode=mode, granularity=granularity, start_date=start_date, end_date=end_date
+    )
+
+@router.post("/snapshots", response_model=schemas.SnapshotResult)
+def generate_snapshots(snapshot_date: Optional[date] = None, db: Session = Depends(get_db)):
+    """전체 사용자 자산 스냅샷 생성 (같은 날짜 재실행 가능)"""
+    service = SnapshotService(db)
+    return service.generate_snapshots(snapshot_date)
+
+@router.get("/monthly/{year}/{month}", response_model=dict)
+def get_monthly_summary(
+    year: int,
+    month: int = Path(..., ge=1, le=12),
+    db: Session = Depends(get_db)
+):
+    """월별 수입/고정 지출/변동 지출 요약"""
+    service = TransactionService(db)
+    summary = service.get_monthly_summary(year, month)
+    return {key: float(value) for key, value in summary.items()}
+
+@router.get("/cache-stats", response_model=dict)
+def get_cache_stats():
+    """요약 캐시 적중/미스 통계"""
+    return summary_cache.stats()
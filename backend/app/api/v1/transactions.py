@@ -1,15 +1,21 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query, File, Form, UploadFile
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import date
+from decimal import Decimal
 from app import schemas
 from app.api.deps import get_db
 from app.services.transaction_service import TransactionService
-from app.core.exceptions import AccountNotFoundError, InvalidTransactionError
+from app.services.transaction_batch_service import TransactionBatchService
+from app.services.import_service import TransactionImportService, DEFAULT_CATEGORY, detect_format
+from app.services.export_service import TransactionExportService, MEDIA_TYPES
+from app.core.exceptions import AccountNotFoundError, InvalidTransactionError, InvalidCursorError
+from app.core.responses import FastJSONResponse, json_response
 
 router = APIRouter()
 
-@router.get("/", response_model=List[schemas.Transaction])
+@router.get("/", response_model=List[schemas.Transaction], response_class=FastJSONResponse)
 def get_transactions(
     account_id: Optional[int] = Query(None, description="필터링할 계좌 ID"),
     start_date: Optional[date] = Query(None, description="시작 날짜 (YYYY-MM-DD)"),
@@ -19,7 +25,83 @@ def get_transactions(
 ):
     """거래 내역 조회"""
     service = TransactionService(db)
-    return service.get_transactions(account_id, limit, start_date, end_date)
+    return json_response(List[schemas.Transaction], service.get_transaction_rows(account_id, limit, start_date, end_date))
+
+@router.get("/page", response_model=schemas.TransactionPage)
+def get_transaction_page(
+    account_id: Optional[int] = Query(None, description="필터링할 계좌 ID"),
+    start_date: Optional[date] = Query(None, description="시작 날짜 (YYYY-MM-DD)"),
+    end_date: Optional[date] = Query(None, description="종료 날짜 (YYYY-MM-DD)"),
+    limit: int = Query(100, ge=1, le=1000, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    db: Session = Depends(get_db)
+):
+    """거래 내역 커서 페이지 조회"""
+    service = TransactionService(db)
+    try:
+        return service.get_transaction_page(account_id, limit, start_date, end_date, cursor)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+@router.get("/search", response_model=schemas.TransactionSearchPage)
+def search_transactions(
+    q: str = Query(..., min_length=1, max_length=100, description="검색어 (설명/카테고리, 공백으로 구분한 단어 모두 포함)"),
+    account_id: Optional[int] = Query(None, description="필터링할 계좌 ID"),
+    start_date: Optional[date] = Query(None, description="시작 날짜 (YYYY-MM-DD)"),
+    end_date: Optional[date] = Query(None, description="종료 날짜 (YYYY-MM-DD)"),
+    min_amount: Optional[Decimal] = Query(None, ge=0, description="최소 금액"),
+    max_amount: Optional[Decimal] = Query(None, ge=0, description="최대 금액"),
+    limit: int = Query(20, ge=1, le=100, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, description="이전 페이지의 next_cursor"),
+    db: Session = Depends(get_db)
+):
+    """거래 전문 검색 (관련도 순, 커서 기반 페이지)"""
+    service = TransactionService(db)
+    try:
+        return service.search_transactions(q, account_id, start_date, end_date, min_amount, max_amount, limit, cursor)
+    except (InvalidTransactionError, InvalidCursorError) as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+@router.get("/periods", response_model=schemas.PeriodSummary)
+def get_period_summary(
+    granularity: str = Query("month", pattern="^(day|week|month|quarter|year)$", description="구간 단위"),
+    start_date: date = Query(..., description="시작 날짜 (YYYY-MM-DD)"),
+    end_date: date = Query(..., description="종료 날짜 (YYYY-MM-DD, 포함)"),
+    account_id: Optional[int] = Query(None, description="필터링할 계좌 ID (없으면 사용자의 모든 계좌)"),
+    db: Session = Depends(get_db)
+):
+    """기간별(일/주/월/분기/연) 수입/지출 집계"""
+    service = TransactionService(db)
+    try:
+        return service.get_period_summary(granularity, start_date, end_date, account_id)
+    except AccountNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except InvalidTransactionError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+@router.get("/export")
+def export_transactions(
+    format: str = Query("csv", pattern="^(csv|ndjson|parquet)$", description="csv | ndjson | parquet"),
+    account_id: Optional[int] = Query(None, description="필터링할 계좌 ID"),
+    start_date: Optional[date] = Query(None, description="시작 날짜 (YYYY-MM-DD)"),
+    end_date: Optional[date] = Query(None, description="종료 날짜 (YYYY-MM-DD)"),
+    db: Session = Depends(get_db)
+):
+    """거래 원장 스트리밍 내보내기"""
+    rows = TransactionExportService(db).export(format, account_id, start_date, end_date)
+
+    def body():
+        # get_db의 정리 코드는 응답 전송 전에 실행되므로 스트림이 끝날 때 세션을 직접 닫음
+        try:
+            yield from rows
+        finally:
+            db.close()
+
+    return StreamingResponse(
+        body(),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="transactions.{format}"'}
+    )
 
 @router.post("/", response_model=schemas.Transaction, status_code=status.HTTP_201_CREATED)
 def create_transaction(
@@ -35,6 +117,29 @@ def create_transaction(
     except InvalidTransactionError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
+@router.post("/import", response_model=schemas.TransactionImportResult)
+def import_transactions(
+    account_id: int = Form(..., description="기본 계좌 ID (CSV에 account_id 컬럼이 없을 때)"),
+    file: UploadFile = File(..., description="CSV 또는 OFX 명세서"),
+    file_format: Optional[str] = Form(None, description="csv | ofx (기본: 파일 확장자)"),
+    default_category: str = Form(DEFAULT_CATEGORY, description="카테고리가 없는 행에 사용할 값"),
+    chunk_size: int = Query(1000, ge=1, le=10000, description="한 번에 commit할 행 수"),
+    db: Session = Depends(get_db)
+):
+    """은행 명세서 일괄 등록 (청크 단위 스트리밍)"""
+    service = TransactionImportService(db)
+    try:
+        return service.import_statement(
+            file.file,
+            file_format or detect_format(file.filename),
+            account_id,
+            default_category=default_category,
+            chunk_size=chunk_size
+        )
+    except AccountNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except InvalidTransactionError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 @router.patch("/{transaction_id}", response_model=schemas.Transaction)
 def update_transaction(
@@ -61,7 +166,20 @@ def delete_transaction(
     except InvalidTransactionError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
 
-@router.get("/monthly-spending/{account_id}/{year}/{month}")
+@router.post("/batch", response_model=schemas.TransactionBatchResult)
+def apply_transaction_batch(
+    batch: schemas.TransactionBatchRequest,
+    response: Response,
+    db: Session = Depends(get_db)
+):
+    """생성/수정/삭제 일괄 반영 (오프라인 편집 재전송용, commit 1회)"""
+    result = TransactionBatchService(db).apply(batch)
+    if not result.committed:
+        # atomic 모드에서 실패 항목이 있으면 아무것도 반영되지 않음 (항목별 오류는 본문에)
+        response.status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
+    return result
+
+@router.get("/monthly-spending/{account_id}/{year}/{month}", response_model=List[schemas.MonthlyExpense])
 def get_monthly_spending(
     account_id: int,
     year: int,
@@ -72,5 +190,5 @@ def get_monthly_spending(
     service = TransactionService(db)
     try:
         return service.get_monthly_spending_by_category(account_id, year, month)
-    except Exception as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except AccountNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
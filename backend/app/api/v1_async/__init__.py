@@ -0,0 +1,54 @@
+from fastapi import APIRouter
+from app.api.v1_async import accounts, transactions, recurring, summary
+# 카테고리는 트리 갱신이 여러 문장이라 동기 라우터를 그대로 사용 (예산도 카테고리 트리를 읽으므로 같이)
+from app.api.v1 import categories, budgets, scheduler, debug
+
+api_router = APIRouter()
+
+api_router.include_router(
+    accounts.router,
+    prefix="/accounts",
+    tags=["accounts"]
+)
+
+api_router.include_router(
+    transactions.router,
+    prefix="/transactions",
+    tags=["transactions"]
+)
+
+api_router.include_router(
+    recurring.router,
+    prefix="/recurring",
+    tags=["recurring-transactions"]
+)
+
+api_router.include_router(
+    categories.router,
+    prefix="/categories",
+    tags=["categories"]
+)
+
+api_router.include_router(
+    budgets.router,
+    prefix="/budgets",
+    tags=["budgets"]
+)
+
+api_router.include_router(
+    summary.router,
+    prefix="/summary",
+    tags=["summary"]
+)
+
+api_router.include_router(
+    scheduler.router,
+    prefix="/scheduler",
+    tags=["scheduler"]
+)
+
+api_router.include_router(
+    debug.router,
+    prefix="/debug",
+    tags=["debug"]
+)
@@ -0,0 +1,55 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List
+from app import schemas
+from app.api.deps import get_async_db
+from app.services.account_service import AsyncAccountService
+from app.core.exceptions import AccountNotFoundError, InsufficientBalanceError
+from app.core.responses import FastJSONResponse, json_response
+
+router = APIRouter()
+
+@router.get("/", response_model=List[schemas.Account], response_class=FastJSONResponse)
+async def get_accounts(db: AsyncSession = Depends(get_async_db)):
+    """모든 계좌 조회"""
+    service = AsyncAccountService(db)
+    return json_response(List[schemas.Account], await service.get_account_rows())
+
+@router.get("/{account_id}", response_model=schemas.Account)
+async def get_account(account_id: int, db: AsyncSession = Depends(get_async_db)):
+    """특정 계좌 조회"""
+    service = AsyncAccountService(db)
+    try:
+        return await service.get_account(account_id)
+    except AccountNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+@router.post("/", response_model=schemas.Account, status_code=status.HTTP_201_CREATED)
+async def create_account(account: schemas.AccountCreate, db: AsyncSession = Depends(get_async_db)):
+    """새 계좌 생성"""
+    service = AsyncAccountService(db)
+    return await service.create_account(account)
+
+@router.patch("/{account_id}", response_model=schemas.Account)
+async def update_account(
+    account_id: int,
+    account_update: schemas.AccountUpdate,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """계좌 정보 수정"""
+    service = AsyncAccountService(db)
+    try:
+        return await service.update_account(account_id, account_update)
+    except AccountNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+@router.delete("/{account_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_account(account_id: int, db: AsyncSession = Depends(get_async_db)):
+    """계좌 삭제"""
+    service = AsyncAccountService(db)
+    try:
+        await service.delete_account(account_id)
+    except AccountNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except InsufficientBalanceError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
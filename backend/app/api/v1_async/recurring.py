@@ -0,0 +1,95 @@
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from datetime import date
+from app import schemas
+from app.api.deps import get_async_db
+from app.services.recurring_service import AsyncRecurringTransactionService
+from app.core.exceptions import AccountNotFoundError
+from app.core.responses import FastJSONResponse, json_response
+
+router = APIRouter()
+
+@router.get("/", response_model=List[schemas.RecurringTransaction], response_class=FastJSONResponse)
+async def get_recurring_transactions(
+    account_id: Optional[int] = Query(None, description="필터링할 계좌 ID"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """정기 거래 목록 조회"""
+    service = AsyncRecurringTransactionService(db)
+    return json_response(List[schemas.RecurringTransaction], await service.get_recurring_rows(account_id))
+
+@router.get("/{recurring_id}", response_model=schemas.RecurringTransaction)
+async def get_recurring_transaction(
+    recurring_id: int,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """특정 정기 거래 조회"""
+    service = AsyncRecurringTransactionService(db)
+    try:
+        return await service.get_recurring(recurring_id)
+    except AccountNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+@router.post("/", response_model=schemas.RecurringTransaction, status_code=status.HTTP_201_CREATED)
+async def create_recurring_transaction(
+    recurring: schemas.RecurringTransactionCreate,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """정기 거래 생성"""
+    service = AsyncRecurringTransactionService(db)
+    try:
+        return await service.create_recurring(recurring)
+    except AccountNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+@router.patch("/{recurring_id}", response_model=schemas.RecurringTransaction)
+async def update_recurring_transaction(
+    recurring_id: int,
+    recurring_update: schemas.RecurringTransactionUpdate,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """정기 거래 수정"""
+    service = AsyncRecurringTransactionService(db)
+    try:
+        return await service.update_recurring(recurring_id, recurring_update)
+    except AccountNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+@router.post("/{recurring_id}/deactivate", status_code=status.HTTP_204_NO_CONTENT)
+async def deactivate_recurring_transaction(
+    recurring_id: int,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """정기 거래 비활성화"""
+    service = AsyncRecurringTransactionService(db)
+    try:
+        await service.deactivate_recurring(recurring_id)
+    except AccountNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+
+@router.delete("/{recurring_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_recurring_transaction(
+    recurring_id: int,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """정기 거래 삭제"""
+    service = AsyncRecurringTransactionService(db)
+    try:
+        await service.delete_recurring(recurring_id)
+    except AccountNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+@router.post("/process-due", status_code=status.HTTP_200_OK)
+async def process_due_transactions(
+    target_date: Optional[date] = Query(None, description="처리할 날짜 (기본: 오늘)"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    정기 거래 자동 실행
+    스케줄러나 수동으로 호출
+    """
+    service = AsyncRecurringTransactionService(db)
+    processed_count = await service.process_due_recurring_transactions(target_date)
+    return {"processed": processed_count, "date": target_date or date.today()}
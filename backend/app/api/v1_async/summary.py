@@ -0,0 +1,76 @@
+from fastapi import APIRouter, Depends, Path, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from decimal import Decimal
+from datetime import date
+from typing import Optional
+from app import schemas
+from app.api.deps import get_async_db
+from app.services.summary_service import AsyncSummaryService
+from app.services.transaction_service import AsyncTransactionService
+from app.services.snapshot_service import SnapshotService
+from app.core.cache import summary_cache
+
+router = APIRouter()
+
+@router.get("/total-assets", response_model=dict)
+async def get_total_assets(db: AsyncSession = Depends(get_async_db)):
+    """총 자산 조회"""
+    service = AsyncSummaryService(db)
+    total = await service.get_total_assets()
+    return {"total_assets": float(total)}
+
+@router.get("/monthly-expenses", response_model=dict)
+async def get_monthly_expenses(db: AsyncSession = Depends(get_async_db)):
+    """월 고정 지출 조회"""
+    service = AsyncSummaryService(db)
+    expenses = await service.get_monthly_fixed_expenses()
+    return {"monthly_fixed_expenses": float(expenses)}
+
+@router.get("/monthly-income", response_model=dict)
+async def get_monthly_income(db: AsyncSession = Depends(get_async_db)):
+    """월 고정 수입 조회"""
+    service = AsyncSummaryService(db)
+    income = await service.get_monthly_fixed_income()
+    return {"monthly_fixed_income": float(income)}
+
+@router.get("/", response_model=schemas.Summary)
+async def get_full_summary(db: AsyncSession = Depends(get_async_db)):
+    """전체 재정 요약"""
+    service = AsyncSummaryService(db)
+    return await service.get_full_summary()
+
+@router.get("/net-worth-trend", response_model=dict)
+async def get_net_worth_trend(
+    months: int = 6,
+    mode: str = Query("snapshot", pattern="^(snapshot|reconstruct)$"),
+    granularity: str = Query("monthly", pattern="^(daily|weekly|monthly)$"),
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """순자산 추이 조회 (mode=reconstruct: 거래 원장으로 재구성)"""
+    service = AsyncSummaryService(db)
+    return await service.get_net_worth_trend(
+        months=months, mode=mode, granularity=granularity, start_date=start_date, end_date=end_date
+    )
+
+@router.post("/snapshots", response_model=schemas.SnapshotResult)
+async def generate_snapshots(snapshot_date: Optional[date] = None, db: AsyncSession = Depends(get_async_db)):
+    """전체 사용자 자산 스냅샷 생성 (같은 날짜 재실행 가능, 집합 기반 생성은 동기 서비스를 run_sync로 재사용)"""
+    return await db.run_sync(lambda session: SnapshotService(session).generate_snapshots(snapshot_date))
+
+@router.get("/monthly/{year}/{month}", response_model=dict)
+async def get_monthly_summary(
+    year: int,
+    month: int = Path(..., ge=1, le=12),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """월별 수입/고정 지출/변동 지출 요약"""
+    service = AsyncTransactionService(db)
+    summary = await service.get_monthly_summary(year, month)
+    return {key: float(value) for key, value in summary.items()}
+
+@router.get("/cache-stats", response_model=dict)
+async def get_cache_stats():
+    """요약 캐시 적중/미스 통계"""
+    return summary_cache.stats()
@@ -0,0 +1,157 @@
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from datetime import date
+from decimal import Decimal
+from app import schemas
+from app.api.deps import get_async_db
+from app.api.v1 import transactions as sync_transactions
+from app.services.transaction_service import AsyncTransactionService
+from app.services.transaction_batch_service import TransactionBatchService
+from app.core.exceptions import AccountNotFoundError, InvalidTransactionError, InvalidCursorError
+from app.core.responses import FastJSONResponse, json_response
+
+router = APIRouter()
+
+@router.get("/", response_model=List[schemas.Transaction], response_class=FastJSONResponse)
+async def get_transactions(
+    account_id: Optional[int] = Query(None, description="필터링할 계좌 ID"),
+    start_date: Optional[date] = Query(None, description="시작 날짜 (YYYY-MM-DD)"),
+    end_date: Optional[date] = Query(None, description="종료 날짜 (YYYY-MM-DD)"),
+    limit: int = Query(100, ge=1, le=1000, description="조회할 최대 거래 수"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """거래 내역 조회"""
+    service = AsyncTransactionService(db)
+    rows = await service.get_transaction_rows(account_id, limit, start_date, end_date)
+    return json_response(List[schemas.Transaction], rows)
+
+@router.get("/page", response_model=schemas.TransactionPage)
+async def get_transaction_page(
+    account_id: Optional[int] = Query(None, description="필터링할 계좌 ID"),
+    start_date: Optional[date] = Query(None, description="시작 날짜 (YYYY-MM-DD)"),
+    end_date: Optional[date] = Query(None, description="종료 날짜 (YYYY-MM-DD)"),
+    limit: int = Query(100, ge=1, le=1000, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """거래 내역 커서 페이지 조회"""
+    service = AsyncTransactionService(db)
+    try:
+        return await service.get_transaction_page(account_id, limit, start_date, end_date, cursor)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+@router.get("/search", response_model=schemas.TransactionSearchPage)
+async def search_transactions(
+    q: str = Query(..., min_length=1, max_length=100, description="검색어 (설명/카테고리, 공백으로 구분한 단어 모두 포함)"),
+    account_id: Optional[int] = Query(None, description="필터링할 계좌 ID"),
+    start_date: Optional[date] = Query(None, description="시작 날짜 (YYYY-MM-DD)"),
+    end_date: Optional[date] = Query(None, description="종료 날짜 (YYYY-MM-DD)"),
+    min_amount: Optional[Decimal] = Query(None, ge=0, description="최소 금액"),
+    max_amount: Optional[Decimal] = Query(None, ge=0, description="최대 금액"),
+    limit: int = Query(20, ge=1, le=100, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, description="이전 페이지의 next_cursor"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """거래 전문 검색 (관련도 순, 커서 기반 페이지)"""
+    service = AsyncTransactionService(db)
+    try:
+        return await service.search_transactions(q, account_id, start_date, end_date, min_amount, max_amount, limit, cursor)
+    except (InvalidTransactionError, InvalidCursorError) as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+@router.get("/periods", response_model=schemas.PeriodSummary)
+async def get_period_summary(
+    granularity: str = Query("month", pattern="^(day|week|month|quarter|year)$", description="구간 단위"),
+    start_date: date = Query(..., description="시작 날짜 (YYYY-MM-DD)"),
+    end_date: date = Query(..., description="종료 날짜 (YYYY-MM-DD, 포함)"),
+    account_id: Optional[int] = Query(None, description="필터링할 계좌 ID (없으면 사용자의 모든 계좌)"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """기간별(일/주/월/분기/연) 수입/지출 집계"""
+    service = AsyncTransactionService(db)
+    try:
+        return await service.get_period_summary(granularity, start_date, end_date, account_id)
+    except AccountNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except InvalidTransactionError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+# 내보내기는 서버 사이드 커서로 배치를 읽는 동기 스트리밍 라우트를 그대로 사용
+# (동기 세션으로 읽고 StreamingResponse가 동기 제너레이터를 스레드풀에서 소비하므로 이벤트 루프를 막지 않음)
+router.add_api_route("/export", sync_transactions.export_transactions, methods=["GET"])
+
+@router.post("/", response_model=schemas.Transaction, status_code=status.HTTP_201_CREATED)
+async def create_transaction(
+    transaction: schemas.TransactionCreate,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """새 거래 생성"""
+    service = AsyncTransactionService(db)
+    try:
+        return await service.create_transaction(transaction)
+    except AccountNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except InvalidTransactionError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+# 명세서 가져오기는 동기 라우트를 그대로 사용
+# (청크마다 파싱/flush/commit하는 동기 작업이라 스레드풀의 동기 세션에서 돌려야 이벤트 루프를 막지 않음)
+router.add_api_route(
+    "/import", sync_transactions.import_transactions, methods=["POST"], response_model=schemas.TransactionImportResult
+)
+
+
+@router.post("/batch", response_model=schemas.TransactionBatchResult)
+async def apply_transaction_batch(
+    batch: schemas.TransactionBatchRequest,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """생성/수정/삭제 일괄 반영 (오프라인 편집 재전송용, commit 1회)"""
+    result = await db.run_sync(lambda session: TransactionBatchService(session).apply(batch))
+    if not result.committed:
+        # atomic 모드에서 실패 항목이 있으면 아무것도 반영되지 않음 (항목별 오류는 본문에)
+        response.status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
+    return result
+
+@router.patch("/{transaction_id}", response_model=schemas.Transaction)
+async def update_transaction(
+    transaction_id: int,
+    transaction_update: schemas.TransactionUpdate,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """거래 수정 (잔액 자동 조정)"""
+    service = AsyncTransactionService(db)
+    try:
+        return await service.update_transaction(transaction_id, transaction_update)
+    except InvalidTransactionError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+@router.delete("/{transaction_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_transaction(
+    transaction_id: int,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """거래 삭제 (잔액 원복됨)"""
+    service = AsyncTransactionService(db)
+    try:
+        await service.delete_transaction(transaction_id)
+    except InvalidTransactionError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+
+@router.get("/monthly-spending/{account_id}/{year}/{month}", response_model=List[schemas.MonthlyExpense])
+async def get_monthly_spending(
+    account_id: int,
+    year: int,
+    month: int,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """월별 카테고리별 지출 집계"""
+    service = AsyncTransactionService(db)
+    try:
+        return await service.get_monthly_spending_by_category(account_id, year, month)
+    except AccountNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
\ No newline at end of file
@@ -0,0 +1,191 @@
+"""
+관리 명령 실행
+사용법: python -m app.cli <command>
+"""
+import argparse
+from datetime import date
+from app.database import SessionLocal, engine
+
+def rebuild_monthly_totals(args: argparse.Namespace) -> None:
+    """transactions 원장으로 월별 카테고리 집계 테이블 백필"""
+    from app.services.transaction_service import TransactionService
+
+    db = SessionLocal()
+    try:
+        count = TransactionService(db).rebuild_monthly_totals()
+        print(f"Rebuilt {count} monthly category totals")
+    finally:
+        db.close()
+
+def generate_snapshots(args: argparse.Namespace) -> None:
+    """지정 날짜(기본 오늘)의 자산 스냅샷 생성"""
+    from app.services.snapshot_service import SnapshotService
+
+    db = SessionLocal()
+    try:
+        result = SnapshotService(db).generate_snapshots(args.date)
+        print(
+            f"Snapshots for {result.snapshot_date}: {result.created} created, "
+            f"{result.updated} updated, {result.skipped} skipped ({result.elapsed_seconds}s)"
+        )
+    finally:
+        db.close()
+
+def backfill_snapshots(args: argparse.Namespace) -> None:
+    """거래 원장으로 재구성한 잔액으로 과거 스냅샷 채우기"""
+    from app.services.net_worth_history import NetWorthHistoryService
+
+    db = SessionLocal()
+    try:
+        created = NetWorthHistoryService(db).backfill_snapshots(
+            args.user_id, args.start, args.end or date.today(), args.granularity
+        )
+        print(f"Backfilled {created} snapshots for user {args.user_id}")
+    finally:
+        db.close()
+
+def rebuild_category_closure(args: argparse.Namespace) -> None:
+    """categories.parent_id로 카테고리 클로저 테이블 재생성"""
+    from app.services.category_service import CategoryService
+
+    db = SessionLocal()
+    try:
+        count = CategoryService(db).rebuild_closure()
+        print(f"Rebuilt {count} category closure rows")
+    finally:
+        db.close()
+
+def rebuild_search_index(args: argparse.Namespace) -> None:
+    """거래 전문 검색 인덱스 생성 (기존 DB용) 및 SQLite FTS 테이블 재색인"""
+    from app.models import create_transaction_search_index
+
+    with engine.begin() as connection:
+        create_transaction_search_index(connection, rebuild=True)
+    print(f"Search index ready ({engine.dialect.name})")
+
+def intern_categories(args: argparse.Namespace) -> None:
+    """카테고리명을 categories에 인터닝하고 거래/정기 거래 category_id 백필 (컬럼이 없으면 추가)"""
+    from app.models import add_category_id_columns
+    from app.services.category_service import CategoryService
+
+    with engine.begin() as connection:
+        add_category_id_columns(connection)
+    db = SessionLocal()
+    try:
+        result = CategoryService(db).intern_ledger(args.batch_size)
+        print(
+            f"Interned categories: {result['created_categories']} created, "
+            f"{result['transactions']} transactions and {result['recurring_transactions']} recurring rows updated"
+        )
+    finally:
+        db.close()
+
+def migrate(args: argparse.Namespace) -> None:
+    """app/migrations/versions의 대기 중인 스키마 마이그레이션 적용"""
+    from app.migrations import migrate as apply_migrations
+
+    applied = apply_migrations(engine, args.to)
+    for migration in applied:
+        print(f"Applied {migration.version:04d} {migration.description}")
+    print(f"{len(applied)} migrations applied")
+
+def check_indexes(args: argparse.Namespace) -> None:
+    """모델에 선언된 인덱스와 실제 DB 인덱스 비교 (차이가 있으면 종료 코드 1)"""
+    from app.migrations import diff_indexes
+
+    with engine.connect() as connection:
+        diff = diff_indexes(connection)
+    for line in diff.describe():
+        print(line)
+    if not diff.is_clean:
+        raise SystemExit(1)
+    print("Indexes match the declared schema")
+
+def make_migration(args: argparse.Namespace) -> None:
+    """실제 DB와 선언된 인덱스의 차이로 새 마이그레이션 파일 생성"""
+    from app.migrations import diff_indexes, latest_version, write_migration
+
+    with engine.connect() as connection:
+        diff = diff_indexes(connection)
+    if diff.is_clean:
+        print("No index changes")
+        return
+    path = write_migration(diff, args.description, latest_version())
+    print(f"Wrote {path}")
+
+def archive_transactions(args: argparse.Namespace) -> None:
+    """마감된 연도의 거래를 Parquet 콜드 아카이브로 옮기고 핫 테이블에서 삭제"""
+    from app.services.archive_service import TransactionArchiveService
+
+    db = SessionLocal()
+    try:
+        result = TransactionArchiveService(db).archive_closed_years(args.through_year)
+        years = ", ".join(str(year) for year in result["years"]) or "none"
+        print(f"Archived years: {years} ({result['rows']} transactions)")
+    finally:
+        db.close()
+
+def partition_transactions(args: argparse.Namespace) -> None:
+    """MySQL transactions를 연도별 RANGE 파티션으로 변환/확장 (이후 TRANSACTION_PARTITIONING=true)"""
+    from app.models import partition_transactions as apply_partitions
+
+    with engine.begin() as connection:
+        added = apply_partitions(connection, args.through_year or date.today().year + 1)
+    print(f"Added partitions: {', '.join(added) or 'none'}")
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m app.cli", description="Asset Manager 관리 명령")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser(
+        "rebuild-monthly-totals", help="월별 카테고리 집계 테이블 재생성"
+    ).set_defaults(handler=rebuild_monthly_totals)
+
+    snapshot_parser = subparsers.add_parser("generate-snapshots", help="사용자별 자산 스냅샷 생성")
+    snapshot_parser.add_argument("--date", type=date.fromisoformat, default=None, help="스냅샷 날짜 (YYYY-MM-DD)")
+    snapshot_parser.set_defaults(handler=generate_snapshots)
+
+    backfill_parser = subparsers.add_parser("backfill-snapshots", help="원장 기반 과거 스냅샷 백필")
+    backfill_parser.add_argument("--user-id", type=int, default=1)
+    backfill_parser.add_argument("--start", type=date.fromisoformat, required=True, help="시작일 (YYYY-MM-DD)")
+    backfill_parser.add_argument("--end", type=date.fromisoformat, default=None, help="종료일 (기본 오늘)")
+    backfill_parser.add_argument("--granularity", choices=["daily", "weekly", "monthly"], default="monthly")
+    backfill_parser.set_defaults(handler=backfill_snapshots)
+
+    subparsers.add_parser(
+        "rebuild-category-closure", help="카테고리 클로저 테이블 재생성"
+    ).set_defaults(handler=rebuild_category_closure)
+
+    subparsers.add_parser(
+        "rebuild-search-index", help="거래 전문 검색 인덱스 생성/재색인"
+    ).set_defaults(handler=rebuild_search_index)
+
+    intern_parser = subparsers.add_parser("intern-categories", help="카테고리 인터닝 마이그레이션 (category_id 백필)")
+    intern_parser.add_argument("--batch-size", type=int, default=50_000, help="commit 단위 id 구간 크기")
+    intern_parser.set_defaults(handler=intern_categories)
+
+    migrate_parser = subparsers.add_parser("migrate", help="스키마 마이그레이션 적용")
+    migrate_parser.add_argument("--to", type=int, default=None, help="이 버전까지만 적용")
+    migrate_parser.set_defaults(handler=migrate)
+
+    subparsers.add_parser(
+        "check-indexes", help="선언된 인덱스와 실제 DB 인덱스 비교"
+    ).set_defaults(handler=check_indexes)
+
+    make_parser = subparsers.add_parser("make-migration", help="인덱스 차이로 마이그레이션 파일 생성")
+    make_parser.add_argument("description", help="마이그레이션 설명")
+    make_parser.set_defaults(handler=make_migration)
+
+    archive_parser = subparsers.add_parser("archive-transactions", help="마감된 연도 거래를 콜드 아카이브로 이동")
+    archive_parser.add_argument("--through-year", type=int, default=None, help="이 연도까지 아카이브 (기본 TRANSACTION_HOT_YEARS 이전 연도)")
+    archive_parser.set_defaults(handler=archive_transactions)
+
+    partition_parser = subparsers.add_parser("partition-transactions", help="transactions 연도별 파티션 생성 (MySQL)")
+    partition_parser.add_argument("--through-year", type=int, default=None, help="이 연도까지 파티션 생성 (기본 내년)")
+    partition_parser.set_defaults(handler=partition_transactions)
+
+    args = parser.parse_args(argv)
+    args.handler(args)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable, Tuple
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.repositories.summary_version_repository import SummaryVersionRepository, AsyncSummaryVersionRepository
+
+MISSING = object()
+DIRTY_USERS_KEY = "summary_cache_dirty_users"
+
+# (user_id, data_version, name, args)
+CacheKey = Tuple[int, int, str, Tuple[Hashable, ...]]
+
+
+class SummaryCache:
+    """
+    사용자별 데이터 버전을 키에 포함하는 프로세스 내 LRU 캐시
+    버전은 DB(summary_versions)에 있고 쓰기 트랜잭션이 commit 직전에 올리므로, 다른 워커/스케줄러/CLI의 쓰기도
+    다음 조회부터 반영됨 (조회마다 버전 행 PK 조회 1회). 이전 버전 결과는 더 이상 조회되지 않고 LRU로 밀려남
+    """
+
+    def __init__(self, max_entries: int = 1024, enabled: bool = True):
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self._entries: "OrderedDict[CacheKey, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def key(user_id: int, version: int, name: str, *args: Hashable) -> CacheKey:
+        """조회 시점의 버전으로 키 생성 (계산 도중 버전이 바뀌면 저장 결과는 재사용되지 않음)"""
+        return (user_id, version, name, args)
+
+    def get(self, key: CacheKey) -> Any:
+        if not self.enabled:
+            return MISSING
+        with self._lock:
+            value = self._entries.get(key, MISSING)
+            if value is MISSING:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: CacheKey, value: Any) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_compute(self, user_id: int, name: str, compute: Callable[[], Any], *args: Hashable, db: Session) -> Any:
+        """
+        캐시에 없으면 계산해서 저장 (버전과 데이터 모두 db 세션으로 조회 - 복제본이면 복제본에서 계산)
+        계산 전후로 버전을 읽어 그 사이 쓰기가 있었으면 저장하지 않음 (계산 결과가 어느 버전인지 알 수 없음)
+        """
+        versions = SummaryVersionRepository(db)
+        version = versions.get(user_id)
+        key = self.key(user_id, version, name, *args)
+        value = self.get(key)
+        if value is MISSING:
+            value = compute()
+            if versions.get(user_id) == version:
+                self.put(key, value)
+        return value
+
+    async def get_or_compute_async(self, user_id: int, name: str, compute: Callable[[], Awaitable[Any]], *args: Hashable, db: AsyncSession) -> Any:
+        """get_or_compute의 async 버전 (compute는 코루틴 함수)"""
+        versions = AsyncSummaryVersionRepository(db)
+        version = await versions.get(user_id)
+        key = self.key(user_id, version, name, *args)
+        value = self.get(key)
+        if value is MISSING:
+            value = await compute()
+            if await versions.get(user_id) == version:
+                self.put(key, value)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+summary_cache = SummaryCache(settings.SUMMARY_CACHE_SIZE, settings.SUMMARY_CACHE_ENABLED)
+
+
+def mark_summary_dirty(db, user_id: int) -> None:
+    """세션이 commit될 때 해당 사용자의 요약 데이터 버전을 올리도록 표시 (Session/AsyncSession 모두 가능)"""
+    db.info.setdefault(DIRTY_USERS_KEY, set()).add(user_id)
+
+
+@event.listens_for(Session, "before_commit")
+def _bump_dirty_users(session: Session) -> None:
+    # 쓰기와 같은 트랜잭션에서 버전을 올림 (commit이 실패하면 함께 롤백, 사용자 순서로 잠가 교착 방지)
+    versions = SummaryVersionRepository(session)
+    for user_id in sorted(session.info.pop(DIRTY_USERS_KEY, ())):
+        versions.bump(user_id)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_dirty_users(session: Session, previous_transaction) -> None:
+    if previous_transaction.parent is None:
+        session.info.pop(DIRTY_USERS_KEY, None)
@@ -1,13 +1,68 @@
 from pydantic_settings import BaseSettings
-from typing import Optional
+from typing import List, Optional
 
 class Settings(BaseSettings):
     PROJECT_NAME: str = "Asset Manager API"
     API_V1_PREFIX: str = "/api/v1"
     DATABASE_URL: str
+
+    # 비동기 DB 모드 (True면 async 엔진/세션과 async 라우터 사용)
+    DB_ASYNC: bool = False
+    # 비어 있으면 DATABASE_URL의 드라이버를 비동기 드라이버로 바꿔서 사용
+    ASYNC_DATABASE_URL: Optional[str] = None
+
+    # 읽기 복제본 URL (쉼표 구분, 비어 있으면 모든 쿼리를 DATABASE_URL로)
+    # GET 요청의 조회만 복제본으로 가고, 같은 요청에서 쓰기가 나오면 이후 조회는 primary로
+    DATABASE_REPLICA_URLS: str = ""
+    REPLICA_HEALTH_CHECK_SECONDS: float = 10
+
+    # 요약(summary) 결과 프로세스 내 캐시
+    SUMMARY_CACHE_ENABLED: bool = True
+    SUMMARY_CACHE_SIZE: int = 1024
+
+    # 예산 사용률이 이 비율 이상이면 경고 (초과/월말 예상 초과는 항상 알림)
+    BUDGET_ALERT_THRESHOLD: float = 0.8
+
+    # 카테고리 인터닝: 거래/정기 거래 쓰기 때 category_id도 저장하고 카테고리 집계를 정수 키로 GROUP BY
+    # 기존 원장은 python -m app.cli intern-categories로 category_id를 채운 뒤 켤 것
+    CATEGORY_INTERNING: bool = False
+
+    # 거래 콜드 아카이브: 최근 TRANSACTION_HOT_YEARS개 연도(올해 포함)만 transactions에 두고
+    # 마감된 연도는 TRANSACTION_ARCHIVE_DIR에 연도별 Parquet로 옮김 (python -m app.cli archive-transactions)
+    TRANSACTION_ARCHIVE_DIR: str = "archive"
+    TRANSACTION_HOT_YEARS: int = 2
+    ARCHIVE_JOB_ENABLED: bool = False
+    ARCHIVE_JOB_INTERVAL_SECONDS: float = 86400
+    # MySQL transactions가 연도별 RANGE 파티션인지 (python -m app.cli partition-transactions 후 켤 것)
+    # 파티션 테이블은 FULLTEXT 인덱스를 지원하지 않아서 검색이 LIKE로 바뀜
+    TRANSACTION_PARTITIONING: bool = False
+
+    # SQL 로그 출력 (개발용, 문장마다 동기 로깅하므로 운영에서는 /metrics 사용)
+    SQL_ECHO: bool = False
+    METRICS_ENABLED: bool = True
+
+    # 느린 쿼리 기록 (임계값 초과 문장 중 SAMPLE_RATE 비율만 링 버퍼에 보관)
+    SLOW_QUERY_LOG_ENABLED: bool = True
+    SLOW_QUERY_THRESHOLD_MS: float = 200
+    SLOW_QUERY_SAMPLE_RATE: float = 1.0
+    SLOW_QUERY_LOG_SIZE: int = 100
+
+    # 앱 내장 스케줄러 (여러 워커 중 리더 락을 잡은 하나만 실행)
+    SCHEDULER_ENABLED: bool = False
+    SCHEDULER_TICK_SECONDS: float = 30
+    SCHEDULER_LOCK_NAME: str = "asset_manager_scheduler"
+    SCHEDULER_LOCK_FILE: str = "/tmp/asset_manager_scheduler.lock"
+    RECURRING_JOB_INTERVAL_SECONDS: float = 3600
+    RECURRING_JOB_SHARDS: int = 4
+    RECURRING_JOB_WORKERS: int = 4
+    SNAPSHOT_JOB_INTERVAL_SECONDS: float = 86400
     
     class Config:
         env_file = ".env"
         case_sensitive = True
 
+    @property
+    def replica_urls(self) -> List[str]:
+        return [url.strip() for url in self.DATABASE_REPLICA_URLS.split(",") if url.strip()]
+
 settings = Settings()
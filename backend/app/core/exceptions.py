@@ -5,4 +5,19 @@ class InsufficientBalanceError(Exception):
     pass
 
 class InvalidTransactionError(Exception):
+    pass
+
+class InvalidCursorError(Exception):
+    pass
+
+class CategoryNotFoundError(Exception):
+    pass
+
+class InvalidCategoryError(Exception):
+    pass
+
+class BudgetNotFoundError(Exception):
+    pass
+
+class InvalidBudgetError(Exception):
     pass
\ No newline at end of file
@@ -0,0 +1,96 @@
+import fcntl
+import logging
+import os
+from typing import Optional
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+
+logger = logging.getLogger(__name__)
+
+
+class MySQLLeaderLock:
+    """
+    MySQL GET_LOCK 기반 리더 락
+    락은 커넥션 단위이므로 전용 커넥션을 잡고 있는 동안만 유지됨
+    """
+
+    def __init__(self, engine: Engine, name: str):
+        self.engine = engine
+        self.name = name
+        self._connection: Optional[Connection] = None
+
+    def acquire(self) -> bool:
+        """논블로킹 획득 (이미 보유 중이면 커넥션이 살아 있는지 확인)"""
+        try:
+            if self._connection is not None:
+                held = self._connection.execute(
+                    text("SELECT IS_USED_LOCK(:name) = CONNECTION_ID()"), {"name": self.name}
+                ).scalar()
+                if held:
+                    return True
+                self._close()
+            self._connection = self.engine.connect()
+            acquired = self._connection.execute(
+                text("SELECT GET_LOCK(:name, 0)"), {"name": self.name}
+            ).scalar()
+            if acquired != 1:
+                self._close()
+                return False
+            return True
+        except Exception:
+            logger.exception("Failed to acquire leader lock %s", self.name)
+            self._close()
+            return False
+
+    def release(self) -> None:
+        if self._connection is None:
+            return
+        try:
+            self._connection.execute(text("SELECT RELEASE_LOCK(:name)"), {"name": self.name})
+        except Exception:
+            logger.exception("Failed to release leader lock %s", self.name)
+        finally:
+            self._close()
+
+    def _close(self) -> None:
+        if self._connection is not None:
+            try:
+                self._connection.close()
+            except Exception:
+                pass
+            self._connection = None
+
+
+class FileLeaderLock:
+    """SQLite 등 DB 락이 없는 환경용 flock 기반 리더 락 (같은 호스트의 워커끼리만 유효)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._fd: Optional[int] = None
+
+    def acquire(self) -> bool:
+        if self._fd is not None:
+            return True
+        fd = os.open(self.path, os.O_CREAT | os.O_RDWR, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+        self._fd = fd
+        return True
+
+    def release(self) -> None:
+        if self._fd is None:
+            return
+        try:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        finally:
+            os.close(self._fd)
+            self._fd = None
+
+
+def create_leader_lock(engine: Engine, name: str, file_path: str):
+    if engine.dialect.name == "mysql":
+        return MySQLLeaderLock(engine, name)
+    return FileLeaderLock(file_path)
@@ -0,0 +1,239 @@
+"""
+SQL/요청 계측과 Prometheus 텍스트 포맷 출력
+- 엔진 이벤트 훅으로 쿼리 수/DB 시간을 현재 요청(ContextVar)과 전체 카운터에 누적
+- ASGI 미들웨어로 라우트별 지연 시간 히스토그램 기록
+"""
+import threading
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_BUCKETS = (0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+UNMATCHED_ROUTE = "unmatched"
+QUERY_START_KEY = "metrics_query_start"
+
+
+@dataclass
+class RequestMetrics:
+    """요청 하나의 DB 사용량 (스레드풀로 넘어가도 같은 객체를 공유)"""
+    scope: Optional[dict] = None
+    query_count: int = 0
+    db_seconds: float = 0.0
+
+    @property
+    def route(self) -> str:
+        """라우팅이 끝난 뒤에는 경로 템플릿, 그 전에는 매칭 전 상태"""
+        route = (self.scope or {}).get("route")
+        return getattr(route, "path", UNMATCHED_ROUTE)
+
+
+current_request: ContextVar[Optional[RequestMetrics]] = ContextVar("current_request", default=None)
+
+
+class Histogram:
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # 마지막은 +Inf
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.total += value
+        self.count += 1
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.requests: Dict[Tuple[str, str, int], int] = defaultdict(int)
+            self.request_latency: Dict[Tuple[str, str], Histogram] = {}
+            self.request_queries: Dict[Tuple[str, str], int] = defaultdict(int)
+            self.request_db_seconds: Dict[Tuple[str, str], float] = defaultdict(float)
+            self.query_latency = Histogram(QUERY_BUCKETS)
+            self.query_errors = 0
+            self.pool_events: Dict[Tuple[str, str], int] = defaultdict(int)
+            self.engines: List[Tuple[str, Engine]] = []
+
+    def observe_request(self, method: str, route: str, status: int, seconds: float, request: RequestMetrics) -> None:
+        key = (method, route)
+        with self._lock:
+            self.requests[(method, route, status)] += 1
+            histogram = self.request_latency.get(key)
+            if histogram is None:
+                histogram = self.request_latency[key] = Histogram(LATENCY_BUCKETS)
+            histogram.observe(seconds)
+            self.request_queries[key] += request.query_count
+            self.request_db_seconds[key] += request.db_seconds
+
+    def observe_query(self, seconds: float) -> None:
+        with self._lock:
+            self.query_latency.observe(seconds)
+        request = current_request.get()
+        if request is not None:
+            request.query_count += 1
+            request.db_seconds += seconds
+
+    def count_query_error(self) -> None:
+        with self._lock:
+            self.query_errors += 1
+
+    def count_pool_event(self, engine_name: str, name: str) -> None:
+        with self._lock:
+            self.pool_events[(engine_name, name)] += 1
+
+    def render(self) -> str:
+        """Prometheus text exposition format (0.0.4)"""
+        lines: List[str] = []
+        with self._lock:
+            lines += _header("http_requests_total", "counter", "HTTP 요청 수")
+            for (method, route, status), count in sorted(self.requests.items()):
+                lines.append(f"http_requests_total{_labels(method=method, route=route, status=status)} {count}")
+
+            lines += _header("http_request_duration_seconds", "histogram", "라우트별 요청 처리 시간")
+            for (method, route), histogram in sorted(self.request_latency.items()):
+                lines += _histogram_lines("http_request_duration_seconds", histogram, method=method, route=route)
+
+            lines += _header("http_request_db_queries_total", "counter", "라우트별 실행 SQL 문 수")
+            for (method, route), count in sorted(self.request_queries.items()):
+                lines.append(f"http_request_db_queries_total{_labels(method=method, route=route)} {count}")
+
+            lines += _header("http_request_db_seconds_total", "counter", "라우트별 누적 DB 시간")
+            for (method, route), seconds in sorted(self.request_db_seconds.items()):
+                lines.append(f"http_request_db_seconds_total{_labels(method=method, route=route)} {seconds:.6f}")
+
+            lines += _header("db_query_duration_seconds", "histogram", "SQL 문 실행 시간 (요청 밖 작업 포함)")
+            lines += _histogram_lines("db_query_duration_seconds", self.query_latency)
+            lines += _header("db_query_errors_total", "counter", "실패한 SQL 문 수")
+            lines.append(f"db_query_errors_total {self.query_errors}")
+
+            lines += _header("db_pool_events_total", "counter", "커넥션 풀 이벤트 (connect/checkout/checkin/invalidate)")
+            for (engine_name, name), count in sorted(self.pool_events.items()):
+                lines.append(f"db_pool_events_total{_labels(engine=engine_name, event=name)} {count}")
+
+            engines = list(self.engines)
+
+        for gauge, help_text in POOL_GAUGES.items():
+            lines += _header(f"db_pool_{gauge}", "gauge", help_text)
+            for name, engine in engines:
+                value = pool_stat(engine, gauge)
+                if value is not None:
+                    lines.append(f"db_pool_{gauge}{_labels(engine=name)} {value}")
+        return "\n".join(lines) + "\n"
+
+
+# 게이지 이름 -> 설명 (QueuePool 계열만 값이 있음)
+POOL_GAUGES = {
+    "size": "풀 크기",
+    "checked_out": "사용 중인 커넥션 수",
+    "checked_in": "풀에 반납된 유휴 커넥션 수",
+    "overflow": "pool_size를 넘어 만든 커넥션 수 (음수면 아직 만들지 않은 기본 커넥션)",
+}
+
+
+def pool_stat(engine: Engine, gauge: str) -> Optional[int]:
+    pool = engine.pool
+    method = {"size": "size", "checked_out": "checkedout", "checked_in": "checkedin", "overflow": "overflow"}[gauge]
+    getter = getattr(pool, method, None)
+    return getter() if callable(getter) else None
+
+
+def _header(name: str, kind: str, help_text: str) -> List[str]:
+    return [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + "}"
+
+
+def _histogram_lines(name: str, histogram: Histogram, **labels) -> List[str]:
+    lines = []
+    cumulative = 0
+    for bound, count in zip(histogram.buckets, histogram.counts):
+        cumulative += count
+        lines.append(f"{name}_bucket{_labels(**labels, le=bound)} {cumulative}")
+    lines.append(f"{name}_bucket{_labels(**labels, le='+Inf')} {histogram.count}")
+    lines.append(f"{name}_sum{_labels(**labels)} {histogram.total:.6f}")
+    lines.append(f"{name}_count{_labels(**labels)} {histogram.count}")
+    return lines
+
+
+metrics = MetricsRegistry()
+
+
+def instrument_engine(engine: Engine, name: str = "default") -> None:
+    """엔진에 쿼리 시간/풀 이벤트 훅 등록 (echo 로깅 대신 사용)"""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault(QUERY_START_KEY, []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        metrics.observe_query(time.perf_counter() - conn.info[QUERY_START_KEY].pop())
+
+    @event.listens_for(engine, "handle_error")
+    def _handle_error(context):
+        starts = context.connection.info.get(QUERY_START_KEY) if context.connection is not None else None
+        if starts:
+            starts.pop()
+        metrics.count_query_error()
+
+    for pool_event in ("connect", "checkout", "checkin", "invalidate"):
+        event.listen(
+            engine.pool, pool_event, lambda *args, _event=pool_event: metrics.count_pool_event(name, _event)
+        )
+
+    with metrics._lock:
+        metrics.engines.append((name, engine))
+
+
+class MetricsMiddleware:
+    """요청 처리 시간/쿼리 수를 라우트 템플릿 단위로 기록하고 응답 헤더에 요청별 DB 사용량 표시"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = RequestMetrics(scope=scope)
+        token = current_request.set(request)
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_with_headers(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = list(message.get("headers", []))
+                headers.append((b"x-db-query-count", str(request.query_count).encode()))
+                headers.append((b"server-timing", f"db;dur={request.db_seconds * 1000:.2f}".encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_headers)
+        finally:
+            metrics.observe_request(
+                scope["method"], request.route, status_code, time.perf_counter() - started, request
+            )
+            current_request.reset(token)
@@ -0,0 +1,34 @@
+import base64
+import binascii
+from datetime import date
+from typing import Tuple
+from app.core.exceptions import InvalidCursorError
+
+def encode_cursor(transaction_date: date, transaction_id: int) -> str:
+    """(거래일, id) 키를 불투명한 커서 문자열로 인코딩"""
+    raw = f"{transaction_date.isoformat()}:{transaction_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[date, int]:
+    """커서 문자열을 (거래일, id) 키로 디코딩"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+        date_part, id_part = raw.split(":")
+        return date.fromisoformat(date_part), int(id_part)
+    except (ValueError, binascii.Error, UnicodeDecodeError):
+        raise InvalidCursorError(f"Invalid cursor: {cursor}")
+
+def encode_search_cursor(score: float, transaction_id: int) -> str:
+    """검색 결과의 (관련도 점수, id) 키를 커서로 인코딩 (repr로 float를 손실 없이 왕복)"""
+    raw = f"{score!r}:{transaction_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def decode_search_cursor(cursor: str) -> Tuple[float, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+        score_part, id_part = raw.rsplit(":", 1)
+        return float(score_part), int(id_part)
+    except (ValueError, binascii.Error, UnicodeDecodeError):
+        raise InvalidCursorError(f"Invalid cursor: {cursor}")
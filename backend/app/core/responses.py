@@ -0,0 +1,43 @@
+"""
+빠른 JSON 응답 경로
+서비스가 돌려준 ORM 행/Row를 캐시된 TypeAdapter로 한 번만 검증·덤프하고 orjson으로 인코딩
+(엔드포인트가 Response를 직접 반환하면 FastAPI는 response_model 재검증/직렬화를 건너뜀)
+"""
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any
+import orjson
+from fastapi.responses import Response
+from pydantic import TypeAdapter
+
+
+@lru_cache(maxsize=None)
+def type_adapter(response_type: Any) -> TypeAdapter:
+    return TypeAdapter(response_type)
+
+
+def _default(value: Any) -> Any:
+    # Decimal은 기존 응답과 같이 문자열로 (부동소수점 오차 방지)
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def dump_json(response_type: Any, rows: Any) -> bytes:
+    """ORM 객체/Row/dict를 response_type으로 한 번 검증해서 JSON bytes로 인코딩"""
+    adapter = type_adapter(response_type)
+    validated = adapter.validate_python(rows, from_attributes=True)
+    return orjson.dumps(adapter.dump_python(validated), default=_default)
+
+
+class FastJSONResponse(Response):
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return orjson.dumps(content, default=_default)
+
+
+def json_response(response_type: Any, rows: Any, status_code: int = 200) -> FastJSONResponse:
+    return FastJSONResponse(dump_json(response_type, rows), status_code=status_code)
@@ -0,0 +1,111 @@
+import logging
+import threading
+import time
+from typing import Dict, List, Optional, Sequence
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+
+logger = logging.getLogger(__name__)
+
+READ_ONLY_KEY = "routing_read_only"
+PINNED_KEY = "routing_pinned_to_primary"
+
+
+class ReplicaSet:
+    """
+    읽기 복제본 엔진 라운드로빈 선택 + 주기적 헬스 체크
+    장애 복제본은 건너뛰고, 모두 장애면 None (호출 측에서 primary 사용)
+    """
+
+    def __init__(self, engines: Sequence[Engine], check_interval: float = 10.0):
+        self.engines: List[Engine] = list(engines)
+        self.check_interval = check_interval
+        self._healthy: Dict[Engine, bool] = {engine: True for engine in self.engines}
+        self._checked_at: Dict[Engine, float] = {}
+        self._next = 0
+        self._lock = threading.Lock()
+        for engine in self.engines:
+            event.listen(engine, "handle_error", self._on_error)
+
+    def choose(self) -> Optional[Engine]:
+        if not self.engines:
+            return None
+        with self._lock:
+            start = self._next
+            self._next = (self._next + 1) % len(self.engines)
+        for offset in range(len(self.engines)):
+            engine = self.engines[(start + offset) % len(self.engines)]
+            if self.is_healthy(engine):
+                return engine
+        return None
+
+    def is_healthy(self, engine: Engine) -> bool:
+        """마지막 확인 후 check_interval이 지났으면 SELECT 1로 다시 확인"""
+        now = time.monotonic()
+        if now - self._checked_at.get(engine, float("-inf")) >= self.check_interval:
+            self._checked_at[engine] = now
+            self._healthy[engine] = self.ping(engine)
+        return self._healthy[engine]
+
+    def mark_down(self, engine: Engine) -> None:
+        """다음 헬스 체크 전까지 선택 대상에서 제외"""
+        self._healthy[engine] = False
+        self._checked_at[engine] = time.monotonic()
+
+    @staticmethod
+    def ping(engine: Engine) -> bool:
+        try:
+            with engine.connect() as connection:
+                connection.exec_driver_sql("SELECT 1")
+            return True
+        except SQLAlchemyError:
+            logger.warning("Read replica %s failed health check", engine.url.render_as_string(hide_password=True))
+            return False
+
+    def _on_error(self, context) -> None:
+        if context.is_disconnect and context.engine is not None:
+            self.mark_down(context.engine)
+
+    def status(self) -> List[dict]:
+        return [
+            {"url": engine.url.render_as_string(hide_password=True), "healthy": self._healthy[engine]}
+            for engine in self.engines
+        ]
+
+
+class RoutingSession(Session):
+    """
+    읽기 전용으로 표시된 세션의 SELECT는 복제본으로, 나머지는 bind(primary)로 보내는 세션
+    - flush/DML/SELECT ... FOR UPDATE가 한 번이라도 나오면 이후 조회도 primary로 고정 (read-after-write)
+    - 복제본은 세션마다 하나를 골라 계속 사용 (한 요청 안에서는 같은 스냅샷 기준으로 읽음)
+    """
+
+    def __init__(self, *args, replicas: Optional[ReplicaSet] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.replicas = replicas
+        self._replica: Optional[Engine] = None
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self._use_replica(clause):
+            if self._replica is None:
+                self._replica = self.replicas.choose()
+            if self._replica is not None:
+                return self._replica
+        return super().get_bind(mapper, clause=clause, **kwargs)
+
+    def _use_replica(self, clause) -> bool:
+        if self.replicas is None or not self.info.get(READ_ONLY_KEY) or self.info.get(PINNED_KEY):
+            return False
+        if self._flushing or not isinstance(clause, Select) or clause._for_update_arg is not None:
+            if clause is not None or self._flushing:
+                self.info[PINNED_KEY] = True
+            return False
+        return True
+
+
+def mark_read_only(session, read_only: bool = True) -> None:
+    """요청 단위로 세션을 읽기 전용으로 표시 (Session/AsyncSession 모두 가능)"""
+    session.info[READ_ONLY_KEY] = read_only
@@ -0,0 +1,111 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field, asdict
+from datetime import datetime
+from typing import Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class JobStats:
+    runs: int = 0
+    failures: int = 0
+    last_started_at: Optional[datetime] = None
+    last_finished_at: Optional[datetime] = None
+    last_duration_seconds: Optional[float] = None
+    last_processed: Optional[int] = None
+    last_throughput: Optional[float] = None  # 처리 건수 / 초
+    last_error: Optional[str] = None
+
+
+@dataclass
+class ScheduledJob:
+    name: str
+    interval_seconds: float
+    func: Callable[[], int]  # 동기 함수, 처리 건수 반환
+    next_run_at: float = 0.0
+    stats: JobStats = field(default_factory=JobStats)
+
+
+class Scheduler:
+    """
+    FastAPI lifespan에서 시작하는 주기 작업 스케줄러
+    여러 워커 프로세스 중 리더 락을 잡은 하나만 작업을 실행
+    """
+
+    def __init__(self, lock, tick_seconds: float = 30):
+        self.lock = lock
+        self.tick_seconds = tick_seconds
+        self.jobs: Dict[str, ScheduledJob] = {}
+        self.is_leader = False
+        self._task: Optional[asyncio.Task] = None
+
+    def add_job(self, name: str, interval_seconds: float, func: Callable[[], int]) -> None:
+        self.jobs[name] = ScheduledJob(name=name, interval_seconds=interval_seconds, func=func)
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await asyncio.to_thread(self.lock.release)
+        self.is_leader = False
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                await self.tick()
+            except Exception:
+                logger.exception("Scheduler tick failed")
+            await asyncio.sleep(self.tick_seconds)
+
+    async def tick(self) -> None:
+        """리더이면 실행 시각이 된 작업을 순서대로 실행"""
+        self.is_leader = await asyncio.to_thread(self.lock.acquire)
+        if not self.is_leader:
+            return
+        for job in self.jobs.values():
+            if time.monotonic() >= job.next_run_at:
+                await self.run_job(job)
+
+    async def run_job(self, job: ScheduledJob) -> None:
+        stats = job.stats
+        stats.last_started_at = datetime.now()
+        started = time.perf_counter()
+        try:
+            processed = await asyncio.to_thread(job.func)
+            stats.last_processed = processed
+            stats.last_error = None
+        except Exception as e:
+            logger.exception("Scheduled job %s failed", job.name)
+            stats.failures += 1
+            stats.last_processed = None
+            stats.last_error = str(e)
+        duration = time.perf_counter() - started
+        stats.runs += 1
+        stats.last_finished_at = datetime.now()
+        stats.last_duration_seconds = round(duration, 4)
+        stats.last_throughput = (
+            round(stats.last_processed / duration, 1)
+            if stats.last_processed is not None and duration > 0 else None
+        )
+        job.next_run_at = time.monotonic() + job.interval_seconds
+
+    def status(self) -> dict:
+        return {
+            "running": self._task is not None,
+            "is_leader": self.is_leader,
+            "jobs": {
+                name: {"interval_seconds": job.interval_seconds, **asdict(job.stats)}
+                for name, job in self.jobs.items()
+            },
+        }
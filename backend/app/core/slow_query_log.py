@@ -0,0 +1,158 @@
+"""
+샘플링 기반 느린 쿼리 기록기
+임계값을 넘은 SQL 문을 (파라미터는 마스킹해서) 고정 크기 링 버퍼에 보관하고
+실행 계획(MySQL EXPLAIN / SQLite EXPLAIN QUERY PLAN)은 조회 시점에 별도로 수집
+"""
+import itertools
+import random
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Any, Deque, List, Optional
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine
+from app.core.config import settings
+from app.core.metrics import current_request
+
+START_KEY = "slow_query_start"
+SKIP_KEY = "slow_query_skip"  # EXPLAIN 실행 중에는 기록하지 않음
+EXPLAIN_PREFIXES = {"mysql": "EXPLAIN ", "sqlite": "EXPLAIN QUERY PLAN "}
+EXPLAINABLE = ("SELECT", "WITH", "UPDATE", "DELETE")
+# 그대로 보여줘도 되는 값 (ID/개수/날짜); 문자열·금액 등은 타입만 남김
+SAFE_TYPES = (bool, int, date, datetime, type(None))
+
+
+def redact(value: Any) -> Any:
+    if isinstance(value, SAFE_TYPES):
+        return value.isoformat() if isinstance(value, (date, datetime)) else value
+    if isinstance(value, dict):
+        return {key: redact(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [redact(item) for item in value]
+    return f"<{type(value).__name__}>"
+
+
+@dataclass
+class SlowQuery:
+    id: int
+    recorded_at: datetime
+    duration_ms: float
+    statement: str
+    parameters: Any  # 마스킹된 값
+    route: Optional[str]
+    executemany: bool
+    dialect: str
+    plan: Optional[List[str]] = None
+    plan_error: Optional[str] = None
+    _raw_parameters: Any = field(default=None, repr=False)  # EXPLAIN 재실행용, 외부로 노출하지 않음
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "recorded_at": self.recorded_at.isoformat(timespec="milliseconds"),
+            "duration_ms": self.duration_ms,
+            "statement": self.statement,
+            "parameters": self.parameters,
+            "route": self.route,
+            "executemany": self.executemany,
+            "plan": self.plan,
+            "plan_error": self.plan_error,
+        }
+
+
+class SlowQueryLog:
+    def __init__(self, threshold_ms: float = 200, sample_rate: float = 1.0, max_entries: int = 100):
+        self.threshold_ms = threshold_ms
+        self.sample_rate = sample_rate
+        self._entries: Deque[SlowQuery] = deque(maxlen=max_entries)
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self.seen = 0  # 임계값을 넘은 전체 수 (샘플링 전)
+
+    def record(self, statement: str, parameters: Any, executemany: bool, dialect: str, seconds: float) -> None:
+        duration_ms = seconds * 1000
+        if duration_ms < self.threshold_ms:
+            return
+        with self._lock:
+            self.seen += 1
+        if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            return
+        request = current_request.get()
+        entry = SlowQuery(
+            id=next(self._ids),
+            recorded_at=datetime.now(),
+            duration_ms=round(duration_ms, 3),
+            statement=statement,
+            # executemany는 첫 행만 보관
+            parameters=redact(parameters[0] if executemany and parameters else parameters),
+            route=request.route if request is not None else None,
+            executemany=executemany,
+            dialect=dialect,
+            _raw_parameters=parameters[0] if executemany and parameters else parameters,
+        )
+        with self._lock:
+            self._entries.append(entry)
+
+    def entries(self) -> List[SlowQuery]:
+        with self._lock:
+            return list(reversed(self._entries))
+
+    def explain_pending(self, connection: Connection) -> None:
+        """아직 실행 계획이 없는 항목을 같은 방언의 커넥션으로 EXPLAIN"""
+        for entry in self.entries():
+            if entry.plan is not None or entry.plan_error is not None:
+                continue
+            prefix = EXPLAIN_PREFIXES.get(entry.dialect)
+            if prefix is None or not entry.statement.lstrip().upper().startswith(EXPLAINABLE):
+                entry.plan_error = "not explainable"
+                continue
+            connection.info[SKIP_KEY] = True
+            try:
+                rows = connection.exec_driver_sql(prefix + entry.statement, entry._raw_parameters or ()).all()
+                entry.plan = [" | ".join(str(value) for value in row) for row in rows]
+            except Exception as e:
+                entry.plan_error = str(e).splitlines()[0]
+            finally:
+                connection.info.pop(SKIP_KEY, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.seen = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "threshold_ms": self.threshold_ms,
+                "sample_rate": self.sample_rate,
+                "max_entries": self._entries.maxlen,
+                "recorded": len(self._entries),
+                "seen": self.seen,
+            }
+
+
+slow_query_log = SlowQueryLog(
+    settings.SLOW_QUERY_THRESHOLD_MS, settings.SLOW_QUERY_SAMPLE_RATE, settings.SLOW_QUERY_LOG_SIZE
+)
+
+
+def attach_slow_query_log(engine: Engine, log: SlowQueryLog = slow_query_log) -> None:
+    dialect = engine.dialect.name
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault(START_KEY, []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info[START_KEY].pop()
+        if not conn.info.get(SKIP_KEY):
+            log.record(statement, parameters, executemany, dialect, elapsed)
+
+    @event.listens_for(engine, "handle_error")
+    def _handle_error(context):
+        starts = context.connection.info.get(START_KEY) if context.connection is not None else None
+        if starts:
+            starts.pop()
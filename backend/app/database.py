@@ -1,19 +1,95 @@
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from typing import Sequence
 from app.core.config import settings
+from app.core.metrics import instrument_engine
+from app.core.slow_query_log import attach_slow_query_log
+from app.core.routing import ReplicaSet, RoutingSession
 
-engine = create_engine(
-    settings.DATABASE_URL,
-    pool_pre_ping=True,
-    pool_recycle=3600,
-    echo=True  # 개발 시 SQL 로그 출력
-)
+def create_db_engine(url: str, name: str):
+    db_engine = create_engine(
+        url,
+        pool_pre_ping=True,
+        pool_recycle=3600,
+        echo=settings.SQL_ECHO  # 개발 시 SQL 로그 출력
+    )
+    if settings.METRICS_ENABLED:
+        instrument_engine(db_engine, name)
+    if settings.SLOW_QUERY_LOG_ENABLED:
+        attach_slow_query_log(db_engine)
+    return db_engine
+
+engine = create_db_engine(settings.DATABASE_URL, "sync")
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# 읽기 복제본 (설정된 경우에만, 읽기 전용 요청의 SELECT를 라운드로빈 분산)
+replica_set = None
+if settings.replica_urls:
+    replica_set = ReplicaSet(
+        [create_db_engine(url, f"replica{i}") for i, url in enumerate(settings.replica_urls)],
+        settings.REPLICA_HEALTH_CHECK_SECONDS
+    )
+
+SessionLocal = sessionmaker(
+    class_=RoutingSession, autocommit=False, autoflush=False, bind=engine, replicas=replica_set
+)
 
 Base = declarative_base()
 
+# 동기 드라이버 -> 비동기 드라이버 매핑
+ASYNC_DRIVERS = {
+    "mysql": "mysql+aiomysql",
+    "mysql+pymysql": "mysql+aiomysql",
+    "sqlite": "sqlite+aiosqlite",
+    "sqlite+pysqlite": "sqlite+aiosqlite",
+}
+
+def to_async_url(url: str) -> str:
+    """동기 DB URL을 비동기 드라이버 URL로 변환"""
+    scheme, sep, rest = url.partition("://")
+    if not sep:
+        raise ValueError(f"Invalid database URL: {url}")
+    return f"{ASYNC_DRIVERS.get(scheme, scheme)}://{rest}"
+
+def create_async_db_engine(url: str, name: str):
+    kwargs = {"pool_pre_ping": True}
+    if not url.startswith("sqlite"):
+        kwargs["pool_recycle"] = 3600
+    async_engine = create_async_engine(url, **kwargs)
+    if settings.METRICS_ENABLED:
+        instrument_engine(async_engine.sync_engine, name)
+    if settings.SLOW_QUERY_LOG_ENABLED:
+        attach_slow_query_log(async_engine.sync_engine)
+    return async_engine
+
+def create_async_session_factory(url: str, replica_urls: Sequence[str] = ()) -> async_sessionmaker:
+    """비동기 엔진과 세션 팩토리 생성 (복제본 라우팅은 동기 세션 클래스의 get_bind로 처리)"""
+    async_engine = create_async_db_engine(url, "async")
+    replicas = None
+    if replica_urls:
+        replicas = ReplicaSet(
+            [create_async_db_engine(replica_url, f"async_replica{i}").sync_engine for i, replica_url in enumerate(replica_urls)],
+            settings.REPLICA_HEALTH_CHECK_SECONDS
+        )
+    # commit 후에도 응답 직렬화를 위해 속성을 만료시키지 않음 (async에서는 lazy load 불가)
+    return async_sessionmaker(
+        async_engine,
+        class_=AsyncSession,
+        sync_session_class=RoutingSession,
+        replicas=replicas,
+        autoflush=False,
+        expire_on_commit=False
+    )
+
+# 비동기 모드일 때만 드라이버(aiomysql/aiosqlite)를 로드
+AsyncSessionLocal = None
+if settings.DB_ASYNC:
+    AsyncSessionLocal = create_async_session_factory(
+        settings.ASYNC_DATABASE_URL or to_async_url(settings.DATABASE_URL),
+        [to_async_url(url) for url in settings.replica_urls]
+    )
+
 # Dependency
 def get_db():
     db = SessionLocal()
@@ -0,0 +1,50 @@
+"""
+스케줄러에 등록하는 주기 작업
+각 작업은 동기 함수이며 처리 건수를 반환 (스케줄러가 스레드에서 실행)
+"""
+from app.core.config import settings
+from app.core.locks import create_leader_lock
+from app.core.scheduler import Scheduler
+from app.database import SessionLocal, engine
+
+def process_recurring_job() -> int:
+    """오늘까지 실행일이 된 정기 거래 생성 (계좌 샤드 병렬 처리)"""
+    from app.services.recurring_service import process_due_in_shards
+
+    return process_due_in_shards(
+        SessionLocal,
+        shard_count=settings.RECURRING_JOB_SHARDS,
+        max_workers=settings.RECURRING_JOB_WORKERS
+    )
+
+def generate_snapshots_job() -> int:
+    """오늘 날짜 자산 스냅샷 생성 (같은 날 재실행 시 갱신)"""
+    from app.services.snapshot_service import SnapshotService
+
+    db = SessionLocal()
+    try:
+        result = SnapshotService(db).generate_snapshots()
+        return result.created + result.updated
+    finally:
+        db.close()
+
+def archive_transactions_job() -> int:
+    """마감된 연도 거래를 콜드 아카이브로 이동 (새 연도가 마감된 뒤 첫 실행에서만 일이 생김)"""
+    from app.services.archive_service import TransactionArchiveService
+
+    db = SessionLocal()
+    try:
+        return TransactionArchiveService(db).archive_closed_years()["rows"]
+    finally:
+        db.close()
+
+def build_scheduler() -> Scheduler:
+    lock = create_leader_lock(engine, settings.SCHEDULER_LOCK_NAME, settings.SCHEDULER_LOCK_FILE)
+    scheduler = Scheduler(lock, tick_seconds=settings.SCHEDULER_TICK_SECONDS)
+    scheduler.add_job("process_recurring", settings.RECURRING_JOB_INTERVAL_SECONDS, process_recurring_job)
+    scheduler.add_job("generate_snapshots", settings.SNAPSHOT_JOB_INTERVAL_SECONDS, generate_snapshots_job)
+    if settings.ARCHIVE_JOB_ENABLED:
+        scheduler.add_job("archive_transactions", settings.ARCHIVE_JOB_INTERVAL_SECONDS, archive_transactions_job)
+    return scheduler
+
+scheduler = build_scheduler()
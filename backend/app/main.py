@@ -1,13 +1,28 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
 from app.api.v1 import api_router
+from app.api.v1_async import api_router as async_api_router
+from app.jobs import scheduler
+from app.core.metrics import MetricsMiddleware, metrics
+from app.database import replica_set
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 내장 스케줄러 (SCHEDULER_ENABLED=true일 때만)
+    if settings.SCHEDULER_ENABLED:
+        scheduler.start()
+    yield
+    await scheduler.stop()
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
     openapi_url=f"{settings.API_V1_PREFIX}/openapi.json",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
 # CORS 설정 (Vue.js 프론트엔드 연결용)
@@ -19,8 +34,15 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# API 라우터 등록
-app.include_router(api_router, prefix=settings.API_V1_PREFIX)
+# 요청별 처리 시간/쿼리 수 계측
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
+# API 라우터 등록 (DB_ASYNC 설정에 따라 동기/비동기 라우터 선택)
+app.include_router(
+    async_api_router if settings.DB_ASYNC else api_router,
+    prefix=settings.API_V1_PREFIX
+)
 
 @app.get("/")
 def root():
@@ -30,6 +52,13 @@ def root():
         "api": settings.API_V1_PREFIX
     }
 
+@app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+def get_metrics():
+    """Prometheus 수집용 지표 (라우트별 지연 시간, 쿼리 수/DB 시간, 커넥션 풀 상태)"""
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
+
 @app.get("/health")
 def health_check():
+    if replica_set is not None:
+        return {"status": "healthy", "replicas": replica_set.status()}
     return {"status": "healthy"}
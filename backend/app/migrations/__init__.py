@@ -0,0 +1,22 @@
+"""
+버전별 스키마 마이그레이션
+- versions/vNNNN_*.py: VERSION, DESCRIPTION, upgrade(ops)
+- python -m app.cli migrate: 적용 / make-migration: 인덱스 비교 결과로 새 버전 생성 / check-indexes: 비교만
+"""
+from app.migrations.index_diff import IndexDiff, IndexSpec, diff_indexes, render_migration, write_migration
+from app.migrations.operations import MigrationOps
+from app.migrations.runner import Migration, applied_versions, latest_version, load_migrations, migrate
+
+__all__ = [
+    "IndexDiff",
+    "IndexSpec",
+    "Migration",
+    "MigrationOps",
+    "applied_versions",
+    "diff_indexes",
+    "latest_version",
+    "load_migrations",
+    "migrate",
+    "render_migration",
+    "write_migration",
+]
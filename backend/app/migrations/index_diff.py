@@ -0,0 +1,125 @@
+"""
+선언된 인덱스(모델 __table_args__)와 실제 DB 인덱스 비교
+unique 제약도 같은 이름 공간의 인덱스로 취급, 전문 검색 인덱스와 MySQL이 FK용으로 자동 생성한 인덱스는 비교 대상에서 제외
+"""
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import MetaData, Table, UniqueConstraint, inspect
+from sqlalchemy.engine import Connection
+from app.database import Base
+
+# create_transaction_search_index가 따로 관리하는 인덱스
+IGNORED_INDEXES = {"ft_transactions_text"}
+
+VERSIONS_DIR = Path(__file__).parent / "versions"
+
+
+@dataclass(frozen=True)
+class IndexSpec:
+    columns: Tuple[str, ...]
+    unique: bool = False
+
+    def describe(self) -> str:
+        return f"{'UNIQUE ' if self.unique else ''}({', '.join(self.columns)})"
+
+
+@dataclass(frozen=True)
+class IndexChange:
+    table: str
+    name: str
+    declared: Optional[IndexSpec]  # None이면 선언되지 않은 인덱스
+    live: Optional[IndexSpec]      # None이면 DB에 없는 인덱스
+
+
+@dataclass
+class IndexDiff:
+    missing_tables: List[str] = field(default_factory=list)
+    missing: List[IndexChange] = field(default_factory=list)
+    changed: List[IndexChange] = field(default_factory=list)
+    extra: List[IndexChange] = field(default_factory=list)
+
+    @property
+    def is_clean(self) -> bool:
+        return not (self.missing_tables or self.missing or self.changed or self.extra)
+
+    def describe(self) -> List[str]:
+        lines = [f"+ table {table}" for table in self.missing_tables]
+        lines += [f"+ {c.table}.{c.name} {c.declared.describe()}" for c in self.missing]
+        lines += [f"~ {c.table}.{c.name} {c.live.describe()} -> {c.declared.describe()}" for c in self.changed]
+        lines += [f"- {c.table}.{c.name} {c.live.describe()}" for c in self.extra]
+        return lines
+
+
+def declared_indexes(table: Table) -> Dict[str, IndexSpec]:
+    specs = {
+        index.name: IndexSpec(tuple(column.name for column in index.columns), bool(index.unique))
+        for index in table.indexes
+    }
+    for constraint in table.constraints:
+        if isinstance(constraint, UniqueConstraint) and constraint.name:
+            specs[constraint.name] = IndexSpec(tuple(column.name for column in constraint.columns), True)
+    return specs
+
+
+def live_indexes(connection: Connection, table_name: str) -> Dict[str, IndexSpec]:
+    inspector = inspect(connection)
+    specs = {
+        index["name"]: IndexSpec(tuple(index["column_names"]), bool(index["unique"]))
+        for index in inspector.get_indexes(table_name)
+        if index["name"] not in IGNORED_INDEXES
+    }
+    for constraint in inspector.get_unique_constraints(table_name):
+        if constraint["name"]:
+            specs[constraint["name"]] = IndexSpec(tuple(constraint["column_names"]), True)
+    return specs
+
+
+def diff_indexes(connection: Connection, metadata: MetaData = Base.metadata) -> IndexDiff:
+    """모델에 선언된 테이블마다 선언 인덱스와 실제 인덱스를 이름 기준으로 비교"""
+    inspector = inspect(connection)
+    diff = IndexDiff()
+    for table in metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            diff.missing_tables.append(table.name)
+            continue
+        declared = declared_indexes(table)
+        live = live_indexes(connection, table.name)
+        foreign_key_columns = {tuple(fk["constrained_columns"]) for fk in inspector.get_foreign_keys(table.name)}
+        for name, spec in declared.items():
+            if name not in live:
+                diff.missing.append(IndexChange(table.name, name, spec, None))
+            elif live[name] != spec:
+                diff.changed.append(IndexChange(table.name, name, spec, live[name]))
+        for name, spec in live.items():
+            if name not in declared and spec.columns not in foreign_key_columns:
+                diff.extra.append(IndexChange(table.name, name, None, spec))
+    return diff
+
+
+def render_migration(diff: IndexDiff, version: int, description: str) -> str:
+    """비교 결과를 그대로 따라가는 마이그레이션 모듈 소스 (검토 후 커밋)"""
+    body = [f"    ops.create_table({table!r})" for table in diff.missing_tables]
+    body += [
+        f"    ops.create_index({c.table!r}, {c.name!r}, {list(c.declared.columns)!r}"
+        f"{', unique=True' if c.declared.unique else ''})"
+        for c in diff.missing + diff.changed
+    ]
+    body += [f"    ops.drop_index({c.table!r}, {c.name!r})" for c in diff.extra]
+    return (
+        f'"""{description}"""\n\n'
+        f"VERSION = {version}\n"
+        f"DESCRIPTION = {description!r}\n\n\n"
+        "def upgrade(ops):\n"
+        + ("\n".join(body) or "    pass")
+        + "\n"
+    )
+
+
+def write_migration(diff: IndexDiff, description: str, latest_version: int, directory: Path = VERSIONS_DIR) -> Path:
+    version = latest_version + 1
+    slug = re.sub(r"[^a-z0-9]+", "_", description.lower()).strip("_")[:40] or "indexes"
+    path = directory / f"v{version:04d}_{slug}.py"
+    path.write_text(render_migration(diff, version, description), encoding="utf-8")
+    return path
@@ -0,0 +1,50 @@
+from typing import Iterable, Optional, Sequence
+from sqlalchemy.engine import Connection
+from app.database import Base
+from app.migrations.index_diff import IndexSpec, live_indexes
+
+
+class MigrationOps:
+    """
+    마이그레이션 본문에서 쓰는 DDL 연산
+    현재 상태를 먼저 보고 필요할 때만 실행 - init.sql/create_all로 만든 DB나 재실행에도 안전
+    """
+
+    def __init__(self, connection: Connection):
+        self.connection = connection
+        self.dialect = connection.dialect.name
+
+    def create_table(self, name: str) -> None:
+        """모델에 선언된 테이블 생성 (선언된 인덱스 포함)"""
+        Base.metadata.tables[name].create(self.connection, checkfirst=True)
+
+    def create_index(self, table: str, name: str, columns: Sequence[str], unique: bool = False) -> bool:
+        """같은 이름의 인덱스가 다른 컬럼으로 있으면 교체, 이미 같으면 건너뜀"""
+        current = live_indexes(self.connection, table).get(name)
+        if current == IndexSpec(tuple(columns), unique):
+            return False
+        if current is not None:
+            self.drop_index(table, name)
+        quote = self.connection.dialect.identifier_preparer.quote
+        self.connection.exec_driver_sql(
+            f"CREATE {'UNIQUE ' if unique else ''}INDEX {quote(name)} ON {quote(table)} "
+            f"({', '.join(quote(column) for column in columns)})"
+        )
+        return True
+
+    def drop_index(self, table: str, name: str) -> bool:
+        if name not in live_indexes(self.connection, table):
+            return False
+        quote = self.connection.dialect.identifier_preparer.quote
+        if self.dialect == "mysql":
+            self.connection.exec_driver_sql(f"DROP INDEX {quote(name)} ON {quote(table)}")
+        else:
+            self.connection.exec_driver_sql(f"DROP INDEX {quote(name)}")
+        return True
+
+    def execute(self, statements: Iterable[str], dialects: Optional[Iterable[str]] = None) -> None:
+        """방언 전용 DDL (dialects를 주면 해당 방언에서만)"""
+        if dialects is not None and self.dialect not in dialects:
+            return
+        for statement in statements:
+            self.connection.exec_driver_sql(statement)
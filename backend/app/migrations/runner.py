@@ -0,0 +1,58 @@
+import importlib
+import pkgutil
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Set
+from sqlalchemy import insert, select
+from sqlalchemy.engine import Connection, Engine
+from app import models
+from app.migrations.operations import MigrationOps
+
+VERSIONS_PACKAGE = "app.migrations.versions"
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    description: str
+    upgrade: Callable[[MigrationOps], None]
+
+
+def load_migrations() -> List[Migration]:
+    """versions 패키지의 모듈(VERSION, DESCRIPTION, upgrade)을 버전 순으로"""
+    package = importlib.import_module(VERSIONS_PACKAGE)
+    migrations = []
+    for module_info in pkgutil.iter_modules(package.__path__):
+        module = importlib.import_module(f"{VERSIONS_PACKAGE}.{module_info.name}")
+        migrations.append(Migration(module.VERSION, module.DESCRIPTION, module.upgrade))
+    migrations.sort(key=lambda migration: migration.version)
+    versions = [migration.version for migration in migrations]
+    if len(set(versions)) != len(versions):
+        raise ValueError(f"Duplicate migration versions: {versions}")
+    return migrations
+
+
+def applied_versions(connection: Connection) -> Set[int]:
+    models.SchemaMigration.__table__.create(connection, checkfirst=True)
+    return set(connection.scalars(select(models.SchemaMigration.version)))
+
+
+def latest_version() -> int:
+    migrations = load_migrations()
+    return migrations[-1].version if migrations else 0
+
+
+def migrate(engine: Engine, target: Optional[int] = None) -> List[Migration]:
+    """적용되지 않은 마이그레이션을 버전 순으로 적용 (버전마다 트랜잭션 하나, 적용 기록은 schema_migrations)"""
+    with engine.begin() as connection:
+        applied = applied_versions(connection)
+    done = []
+    for migration in load_migrations():
+        if migration.version in applied or (target is not None and migration.version > target):
+            continue
+        with engine.begin() as connection:
+            migration.upgrade(MigrationOps(connection))
+            connection.execute(insert(models.SchemaMigration).values(
+                version=migration.version, description=migration.description
+            ))
+        done.append(migration)
+    return done
@@ -0,0 +1,12 @@
+"""기준 스키마 - 빈 DB면 모델 테이블 생성, db/init 기존 DB면 거래/정기 거래 category_id 컬럼 추가"""
+from app.database import Base
+from app.models import add_category_id_columns
+
+VERSION = 1
+DESCRIPTION = "baseline schema and category_id columns"
+
+
+def upgrade(ops):
+    for table in Base.metadata.sorted_tables:
+        ops.create_table(table.name)
+    add_category_id_columns(ops.connection)
@@ -0,0 +1,43 @@
+"""모델에 선언한 인덱스로 정리 - 커버링 인덱스 추가, 다른 인덱스의 앞부분과 겹치는 인덱스 제거"""
+
+VERSION = 2
+DESCRIPTION = "declared composite and covering indexes"
+
+# create_all이 index=True인 PK 컬럼마다 만들던 인덱스 (PK와 중복)
+PRIMARY_KEY_INDEX_TABLES = [
+    "accounts", "categories", "transactions", "monthly_category_totals",
+    "recurring_transactions", "budgets", "asset_snapshots",
+]
+
+
+def upgrade(ops):
+    for table in PRIMARY_KEY_INDEX_TABLES:
+        ops.drop_index(table, f"ix_{table}_id")
+
+    ops.drop_index("accounts", "idx_user_id")  # idx_account_user_balance가 대체
+    ops.create_index("accounts", "idx_account_user_balance", ["user_id", "balance"])
+    ops.drop_index("accounts", "idx_type")  # SQLite는 인덱스 이름이 DB 전체에서 유일해야 해서 테이블명 포함
+    ops.create_index("accounts", "idx_account_type", ["type"])
+
+    ops.create_index("categories", "idx_category_user_name", ["user_id", "name", "type"])
+
+    ops.create_index("transactions", "idx_transaction_date", ["transaction_date", "account_id", "type", "amount"])
+    ops.drop_index("transactions", "idx_type")
+    ops.drop_index("transactions", "idx_category")
+    ops.create_index("transactions", "idx_transaction_type", ["type"])
+    ops.create_index("transactions", "idx_transaction_category_name", ["category"])
+
+    ops.create_index(
+        "monthly_category_totals", "idx_monthly_total_summary",
+        ["year", "month", "account_id", "category", "type", "total_amount"]
+    )
+
+    ops.drop_index("recurring_transactions", "idx_active")  # idx_recurring_due/idx_recurring_schedule 앞부분
+    ops.drop_index("recurring_transactions", "idx_day_of_month")  # day_of_month 단독 조건 조회 없음
+    ops.create_index("recurring_transactions", "idx_recurring_schedule", ["is_active", "frequency", "day_of_month"])
+    ops.create_index(
+        "recurring_transactions", "idx_recurring_monthly_sum",
+        ["account_id", "is_active", "frequency", "type", "amount"]
+    )
+
+    ops.drop_index("asset_snapshots", "idx_user_date")  # unique_user_snapshot_date와 같은 컬럼
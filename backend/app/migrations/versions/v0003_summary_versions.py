@@ -0,0 +1,8 @@
+"""요약 캐시 무효화용 사용자별 데이터 버전 테이블 (워커/스케줄러/CLI가 공유)"""
+
+VERSION = 3
+DESCRIPTION = "shared summary data versions"
+
+
+def upgrade(ops):
+    ops.create_table("summary_versions")
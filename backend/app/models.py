@@ -1,7 +1,8 @@
-from sqlalchemy import Column, Integer, String, Numeric, DateTime, Boolean, Date, Enum, Text, ForeignKey, JSON
+from sqlalchemy import Column, Integer, String, Numeric, DateTime, Boolean, Date, Enum, Text, ForeignKey, JSON, Index, UniqueConstraint, event, inspect
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
+from typing import Dict, List
 import enum
 
 class AccountType(str, enum.Enum):
@@ -25,10 +26,18 @@ class Frequency(str, enum.Enum):
     monthly = "monthly"
     yearly = "yearly"
 
+# 인덱스는 모델의 __table_args__에 선언하고 db/init/01-init.sql과 app/migrations가 같은 집합을 유지
+# (python -m app.cli check-indexes로 실제 DB와 비교)
+
 class Account(Base):
     __tablename__ = "accounts"
-    
-    id = Column(Integer, primary_key=True, index=True)
+    __table_args__ = (
+        # 사용자별 잔액 합계/계좌 수 (스냅샷, 대시보드 요약)를 테이블 접근 없이
+        Index("idx_account_user_balance", "user_id", "balance"),
+        Index("idx_account_type", "type"),
+    )
+
+    id = Column(Integer, primary_key=True)
     user_id = Column(Integer, default=1)
     name = Column(String(100), nullable=False)
     type = Column(Enum(AccountType), nullable=False)
@@ -40,11 +49,16 @@ class Account(Base):
     
     transactions = relationship("Transaction", back_populates="account", cascade="all, delete-orphan")
     recurring_transactions = relationship("RecurringTransaction", back_populates="account", cascade="all, delete-orphan")
+    monthly_category_totals = relationship("MonthlyCategoryTotal", cascade="all, delete-orphan")
 
 class Category(Base):
     __tablename__ = "categories"
+    __table_args__ = (
+        # 거래 카테고리명 -> 카테고리 연결 (트리 집계, 예산, 인터닝 사전 조회)
+        Index("idx_category_user_name", "user_id", "name", "type"),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     user_id = Column(Integer, default=1)
     name = Column(String(50), nullable=False)
     type = Column(Enum(CategoryType), nullable=False)
@@ -53,12 +67,33 @@ class Category(Base):
 
     children = relationship("Category", backref="parent", remote_side=[id])
 
+class CategoryClosure(Base):
+    """카테고리 트리의 모든 (조상, 자손) 쌍 - 자기 자신은 depth 0, 카테고리 생성/이동/삭제 시 함께 갱신"""
+    __tablename__ = "category_closure"
+    __table_args__ = (
+        Index("idx_category_closure_descendant", "descendant_id", "depth"),
+    )
+
+    ancestor_id = Column(Integer, ForeignKey("categories.id", ondelete="CASCADE"), primary_key=True)
+    descendant_id = Column(Integer, ForeignKey("categories.id", ondelete="CASCADE"), primary_key=True)
+    depth = Column(Integer, nullable=False)
+
 class Transaction(Base):
     __tablename__ = "transactions"
+    __table_args__ = (
+        # db/init/01-init.sql과 동일한 인덱스 (keyset 페이지네이션이 사용)
+        Index("idx_account_date", "account_id", "transaction_date"),
+        # 기간 집계 (사용자 전체 계좌): 날짜 범위 + 계좌 조인 + 유형별 금액 합계를 인덱스만으로
+        Index("idx_transaction_date", "transaction_date", "account_id", "type", "amount"),
+        Index("idx_transaction_type", "type"),
+        Index("idx_transaction_category_name", "category"),
+        Index("idx_transaction_category", "category_id"),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     account_id = Column(Integer, ForeignKey("accounts.id"), nullable=False)
     category = Column(String(50), nullable=False)  # Reverted to match DB schema
+    category_id = Column(Integer, ForeignKey("categories.id"))  # 인터닝된 카테고리 (CATEGORY_INTERNING)
     type = Column(Enum(TransactionType), nullable=False)
     amount = Column(Numeric(15, 2), nullable=False)
     description = Column(Text)
@@ -68,13 +103,145 @@ class Transaction(Base):
 
     account = relationship("Account", back_populates="transactions")
 
+# 거래 설명/카테고리 전문 검색 인덱스 (db/init/01-init.sql의 ft_transactions_text와 동일)
+# - MySQL: FULLTEXT + ngram 파서 (한글 부분 일치)
+# - SQLite: transactions를 원본으로 하는 FTS5 외부 콘텐츠 테이블 + 동기화 트리거
+TRANSACTION_SEARCH_TABLE = "transactions_fts"
+TRANSACTION_SEARCH_DDL = {
+    "mysql": [
+        "CREATE FULLTEXT INDEX ft_transactions_text ON transactions (description, category) WITH PARSER ngram",
+    ],
+    "sqlite": [
+        "CREATE VIRTUAL TABLE IF NOT EXISTS transactions_fts USING fts5("
+        "description, category, content='transactions', content_rowid='id', tokenize='unicode61')",
+        "CREATE TRIGGER IF NOT EXISTS transactions_fts_ai AFTER INSERT ON transactions BEGIN "
+        "INSERT INTO transactions_fts(rowid, description, category) VALUES (new.id, new.description, new.category); END",
+        "CREATE TRIGGER IF NOT EXISTS transactions_fts_ad AFTER DELETE ON transactions BEGIN "
+        "INSERT INTO transactions_fts(transactions_fts, rowid, description, category) "
+        "VALUES ('delete', old.id, old.description, old.category); END",
+        "CREATE TRIGGER IF NOT EXISTS transactions_fts_au AFTER UPDATE OF description, category ON transactions BEGIN "
+        "INSERT INTO transactions_fts(transactions_fts, rowid, description, category) "
+        "VALUES ('delete', old.id, old.description, old.category); "
+        "INSERT INTO transactions_fts(rowid, description, category) VALUES (new.id, new.description, new.category); END",
+    ],
+}
+
+def create_transaction_search_index(connection, rebuild: bool = False) -> None:
+    """방언별 전문 검색 인덱스 생성 (이미 있으면 건너뜀, rebuild면 SQLite FTS 내용을 원본 테이블로 다시 채움)"""
+    dialect = connection.dialect.name
+    if dialect == "mysql":
+        indexes = {index["name"] for index in inspect(connection).get_indexes("transactions")}
+        if "ft_transactions_text" in indexes:
+            return
+    for statement in TRANSACTION_SEARCH_DDL.get(dialect, ()):
+        connection.exec_driver_sql(statement)
+    if dialect == "sqlite" and rebuild:
+        connection.exec_driver_sql("INSERT INTO transactions_fts(transactions_fts) VALUES ('rebuild')")
+
+def add_category_id_columns(connection) -> None:
+    """기존 DB에 거래/정기 거래 category_id 컬럼 추가 (이미 있으면 건너뜀, 인터닝 마이그레이션 1단계)"""
+    inspector = inspect(connection)
+    for table in ("transactions", "recurring_transactions"):
+        if "category_id" in {column["name"] for column in inspector.get_columns(table)}:
+            continue
+        connection.exec_driver_sql(f"ALTER TABLE {table} ADD COLUMN category_id INTEGER REFERENCES categories(id)")
+        if table == "transactions":
+            connection.exec_driver_sql("CREATE INDEX idx_transaction_category ON transactions (category_id)")
+
+def transaction_partitions(connection) -> Dict[int, str]:
+    """MySQL transactions의 연도 파티션 {연도: 파티션명} (pmax 제외, 파티션되지 않았으면 빈 dict)"""
+    rows = connection.exec_driver_sql(
+        "SELECT PARTITION_NAME, PARTITION_DESCRIPTION FROM information_schema.PARTITIONS "
+        "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'transactions' AND PARTITION_NAME IS NOT NULL"
+    )
+    return {int(bound) - 1: name for name, bound in rows if bound != "MAXVALUE"}
+
+def partition_transactions(connection, through_year: int) -> List[str]:
+    """
+    MySQL transactions를 YEAR(transaction_date) RANGE 파티션으로 (연도별 pYYYY + pmax), 이미 파티션되어 있으면 through_year까지 pmax를 분할
+    파티션 테이블은 FK와 FULLTEXT를 지원하지 않고 모든 unique 키에 파티션 컬럼이 있어야 하므로
+    처음 파티션할 때 FK/전문 검색 인덱스를 지우고 PK를 (id, transaction_date)로 바꿈 (이후 TRANSACTION_PARTITIONING=true)
+    """
+    if connection.dialect.name != "mysql":
+        raise NotImplementedError(f"Table partitioning is not supported on {connection.dialect.name}")
+    existing = transaction_partitions(connection)
+    if existing:
+        years = range(max(existing) + 1, through_year + 1)
+        if years:
+            connection.exec_driver_sql(
+                "ALTER TABLE transactions REORGANIZE PARTITION pmax INTO ("
+                + "".join(f"PARTITION p{year} VALUES LESS THAN ({year + 1}), " for year in years)
+                + "PARTITION pmax VALUES LESS THAN MAXVALUE)"
+            )
+        return [f"p{year}" for year in years]
+
+    first_date = connection.exec_driver_sql("SELECT MIN(transaction_date) FROM transactions").scalar()
+    years = range(min(first_date.year if first_date else through_year, through_year), through_year + 1)
+    inspector = inspect(connection)
+    for foreign_key in inspector.get_foreign_keys("transactions"):
+        connection.exec_driver_sql(f"ALTER TABLE transactions DROP FOREIGN KEY {foreign_key['name']}")
+    if "ft_transactions_text" in {index["name"] for index in inspector.get_indexes("transactions")}:
+        connection.exec_driver_sql("DROP INDEX ft_transactions_text ON transactions")
+    connection.exec_driver_sql("ALTER TABLE transactions DROP PRIMARY KEY, ADD PRIMARY KEY (id, transaction_date)")
+    connection.exec_driver_sql(
+        "ALTER TABLE transactions PARTITION BY RANGE (YEAR(transaction_date)) ("
+        + "".join(f"PARTITION p{year} VALUES LESS THAN ({year + 1}), " for year in years)
+        + "PARTITION pmax VALUES LESS THAN MAXVALUE)"
+    )
+    return [f"p{year}" for year in years]
+
+def truncate_transaction_partition(connection, year: int) -> bool:
+    """연도 파티션을 통째로 비움 (아카이브 후 정리, 행 단위 DELETE 없이), 파티션이 없으면 False"""
+    if connection.dialect.name != "mysql":
+        return False
+    partition = transaction_partitions(connection).get(year)
+    if partition is None:
+        return False
+    connection.exec_driver_sql(f"ALTER TABLE transactions TRUNCATE PARTITION {partition}")
+    return True
+
+@event.listens_for(Transaction.__table__, "after_create")
+def _create_search_index(target, connection, **kw):
+    create_transaction_search_index(connection)
+
+@event.listens_for(Transaction.__table__, "before_drop")
+def _drop_search_index(target, connection, **kw):
+    if connection.dialect.name == "sqlite":
+        connection.exec_driver_sql("DROP TABLE IF EXISTS transactions_fts")
+
+class MonthlyCategoryTotal(Base):
+    """(계좌, 연, 월, 카테고리, 유형)별 거래 합계 - 거래 쓰기와 같은 DB 트랜잭션에서 증분 갱신"""
+    __tablename__ = "monthly_category_totals"
+    __table_args__ = (
+        UniqueConstraint("account_id", "year", "month", "category", "type", name="uq_monthly_category_total"),
+        # 사용자 월 요약/예산 집계: 연/월로 찾고 계좌 조인, 카테고리/유형별 합계까지 인덱스만으로
+        Index("idx_monthly_total_summary", "year", "month", "account_id", "category", "type", "total_amount"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    account_id = Column(Integer, ForeignKey("accounts.id", ondelete="CASCADE"), nullable=False)
+    year = Column(Integer, nullable=False)
+    month = Column(Integer, nullable=False)
+    category = Column(String(50), nullable=False)
+    type = Column(Enum(TransactionType), nullable=False)
+    total_amount = Column(Numeric(15, 2), nullable=False, default=0)
+    transaction_count = Column(Integer, nullable=False, default=0)
+
 class RecurringTransaction(Base):
     __tablename__ = "recurring_transactions"
+    __table_args__ = (
+        # 실행 대상 조회: is_active = 1 AND next_run_date <= :date
+        Index("idx_recurring_due", "is_active", "next_run_date"),
+        Index("idx_recurring_schedule", "is_active", "frequency", "day_of_month"),
+        # 월 고정 수입/지출 합계: 계좌 IN + 활성 + 주기 + 유형, amount까지 포함
+        Index("idx_recurring_monthly_sum", "account_id", "is_active", "frequency", "type", "amount"),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     account_id = Column(Integer, ForeignKey("accounts.id"), nullable=False)
     type = Column(Enum(TransactionType), nullable=False)
     category = Column(String(50), nullable=False)  # Reverted to match DB schema
+    category_id = Column(Integer, ForeignKey("categories.id"))  # 인터닝된 카테고리 (CATEGORY_INTERNING)
     amount = Column(Numeric(15, 2), nullable=False)
     description = Column(Text)
     frequency = Column(Enum(Frequency), default=Frequency.monthly)
@@ -82,6 +249,7 @@ class RecurringTransaction(Base):
     is_active = Column(Boolean, default=True)
     start_date = Column(Date, nullable=False)
     end_date = Column(Date)
+    next_run_date = Column(Date)  # 다음 실행일 (NULL이면 미계산 또는 종료)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
@@ -89,8 +257,11 @@ class RecurringTransaction(Base):
 
 class Budget(Base):
     __tablename__ = "budgets"
+    __table_args__ = (
+        UniqueConstraint("user_id", "category_id", name="unique_user_budget_category"),
+    )
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     user_id = Column(Integer, default=1)
     category_id = Column(Integer, ForeignKey("categories.id"), nullable=False)
     monthly_limit = Column(Numeric(15, 2))
@@ -101,8 +272,11 @@ class Budget(Base):
 
 class AssetSnapshot(Base):
     __tablename__ = "asset_snapshots"
+    __table_args__ = (
+        UniqueConstraint("user_id", "snapshot_date", name="unique_user_snapshot_date"),
+    )
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     user_id = Column(Integer, default=1)
     total_assets = Column(Numeric(15, 2), nullable=False)
     net_worth = Column(Numeric(15, 2), nullable=False, default=0) # Added Net Worth
@@ -110,3 +284,17 @@ class AssetSnapshot(Base):
     snapshot_date = Column(Date, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
+class SummaryVersion(Base):
+    """사용자별 요약 데이터 버전 - 쓰기 commit마다 +1, 모든 프로세스의 요약 캐시가 키에 포함 (app/core/cache.py)"""
+    __tablename__ = "summary_versions"
+
+    user_id = Column(Integer, primary_key=True, autoincrement=False)
+    version = Column(Integer, nullable=False, default=0)
+
+class SchemaMigration(Base):
+    """적용된 스키마 마이그레이션 버전 (python -m app.cli migrate, app/migrations/versions)"""
+    __tablename__ = "schema_migrations"
+
+    version = Column(Integer, primary_key=True, autoincrement=False)
+    description = Column(String(200), nullable=False)
+    applied_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -1,9 +1,21 @@
-from app.repositories.account_repository import AccountRepository
-from app.repositories.transaction_repository import TransactionRepository
-from app.repositories.recurring_transaction_repository import RecurringTransactionRepository
+from app.repositories.account_repository import AccountRepository, AsyncAccountRepository
+from app.repositories.transaction_repository import TransactionRepository, AsyncTransactionRepository
+from app.repositories.recurring_transaction_repository import RecurringTransactionRepository, AsyncRecurringTransactionRepository
+from app.repositories.asset_snapshot_repository import AssetSnapshotRepository
+from app.repositories.category_repository import CategoryRepository
+from app.repositories.budget_repository import BudgetRepository
+from app.repositories.summary_version_repository import SummaryVersionRepository, AsyncSummaryVersionRepository
 
 __all__ = [
     "AccountRepository",
     "TransactionRepository",
-    "RecurringTransactionRepository"
+    "RecurringTransactionRepository",
+    "AssetSnapshotRepository",
+    "CategoryRepository",
+    "BudgetRepository",
+    "SummaryVersionRepository",
+    "AsyncAccountRepository",
+    "AsyncTransactionRepository",
+    "AsyncRecurringTransactionRepository",
+    "AsyncSummaryVersionRepository"
 ]
@@ -1,7 +1,13 @@
+from sqlalchemy import select, update
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from decimal import Decimal
 from app import models, schemas
+from app.repositories.projection import schema_columns
+
+ACCOUNT_COLUMNS = schema_columns(models.Account, schemas.Account)
 
 class AccountRepository:
     def __init__(self, db: Session):
@@ -12,6 +18,12 @@ class AccountRepository:
             models.Account.user_id == user_id
         ).all()
     
+    def get_rows(self, user_id: int) -> List[Row]:
+        """읽기 전용 조회: 필요한 컬럼만 Core select로 (identity map/변경 추적 없음)"""
+        return self.db.execute(
+            select(*ACCOUNT_COLUMNS).where(models.Account.user_id == user_id)
+        ).all()
+    
     def get_by_id(self, account_id: int) -> Optional[models.Account]:
         return self.db.query(models.Account).filter(
             models.Account.id == account_id
@@ -33,9 +45,85 @@ class AccountRepository:
         self.db.delete(account)
         self.db.flush()
     
-    def update_balance(self, account_id: int, amount_delta: Decimal) -> Optional[models.Account]:
-        account = self.get_by_id(account_id)
-        if account:
-            account.balance += amount_delta
-            self.db.flush()
+    def get_balances(self, account_ids: List[int], for_update: bool = False) -> Dict[int, Tuple[Decimal, int]]:
+        """계좌별 (잔액, user_id)를 한 번의 쿼리로 조회 (for_update: 잔액 검증 후 반영까지 행 잠금)"""
+        if not account_ids:
+            return {}
+        query = select(models.Account.id, models.Account.balance, models.Account.user_id).where(
+            models.Account.id.in_(account_ids)
+        )
+        if for_update:
+            query = query.with_for_update()
+        rows = self.db.execute(query).all()
+        return {row.id: (row.balance, row.user_id) for row in rows}
+    
+    def update_balance(self, account_id: int, amount_delta: Decimal, require_sufficient: bool = False) -> bool:
+        """
+        UPDATE ... SET balance = balance + :delta 단일 문장으로 잔액 변경 (조회 없이 DB에서 원자적으로 반영)
+        require_sufficient면 변경 후 잔액이 0 이상일 때만 반영 → 잔액 검사와 차감이 동시에 일어남
+        계좌가 없거나 잔액이 부족하면 False
+        """
+        result = self.db.execute(balance_update(account_id, amount_delta, require_sufficient))
+        expire_balance(self.db, account_id)
+        return result.rowcount == 1
+
+
+def balance_update(account_id: int, amount_delta: Decimal, require_sufficient: bool):
+    stmt = (
+        update(models.Account)
+        .where(models.Account.id == account_id)
+        .values(balance=models.Account.balance + amount_delta)
+        .execution_options(synchronize_session=False)
+    )
+    if require_sufficient:
+        stmt = stmt.where(models.Account.balance + amount_delta >= 0)
+    return stmt
+
+def expire_balance(db, account_id: int) -> None:
+    """세션에 올라와 있는 계좌 객체의 잔액은 다음 접근 시 DB에서 다시 읽도록 만료"""
+    account = db.identity_map.get(db.identity_key(models.Account, account_id))
+    if account is not None:
+        db.expire(account, ["balance", "updated_at"])
+
+
+class AsyncAccountRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+    
+    async def get_all(self, user_id: int) -> List[models.Account]:
+        result = await self.db.execute(
+            select(models.Account).where(models.Account.user_id == user_id)
+        )
+        return list(result.scalars().all())
+    
+    async def get_rows(self, user_id: int) -> List[Row]:
+        """읽기 전용 조회: 필요한 컬럼만 Core select로"""
+        result = await self.db.execute(
+            select(*ACCOUNT_COLUMNS).where(models.Account.user_id == user_id)
+        )
+        return list(result.all())
+    
+    async def get_by_id(self, account_id: int) -> Optional[models.Account]:
+        return await self.db.get(models.Account, account_id)
+    
+    async def create(self, account_data: dict) -> models.Account:
+        db_account = models.Account(**account_data)
+        self.db.add(db_account)
+        await self.db.flush()  # commit은 서비스 레이어에서
+        return db_account
+    
+    async def update(self, account: models.Account, update_data: dict) -> models.Account:
+        for key, value in update_data.items():
+            setattr(account, key, value)
+        await self.db.flush()
         return account
+    
+    async def delete(self, account: models.Account) -> None:
+        await self.db.delete(account)
+        await self.db.flush()
+    
+    async def update_balance(self, account_id: int, amount_delta: Decimal, require_sufficient: bool = False) -> bool:
+        """단일 UPDATE로 원자적 잔액 변경 (동기 버전과 동일)"""
+        result = await self.db.execute(balance_update(account_id, amount_delta, require_sufficient))
+        expire_balance(self.db, account_id)
+        return result.rowcount == 1
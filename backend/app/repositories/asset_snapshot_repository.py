@@ -0,0 +1,104 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import extract, func, insert, or_, select, update
+from typing import Dict, List
+from datetime import date
+from app import models
+
+class AssetSnapshotRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_user_totals(self) -> Dict[int, tuple]:
+        """사용자별 (총 잔액, 계좌 수) - SQL GROUP BY 한 번"""
+        rows = self.db.execute(
+            select(
+                models.Account.user_id,
+                func.sum(models.Account.balance),
+                func.count(models.Account.id)
+            ).group_by(models.Account.user_id)
+        ).all()
+        return {user_id: (total, count) for user_id, total, count in rows}
+
+    def get_account_rows(self) -> list:
+        """accounts_summary 구성용 계좌 컬럼 projection (사용자/계좌 순)"""
+        return self.db.execute(
+            select(
+                models.Account.user_id,
+                models.Account.id,
+                models.Account.name,
+                models.Account.type,
+                models.Account.balance
+            ).order_by(models.Account.user_id, models.Account.id)
+        ).all()
+
+    def get_latest_before(self, snapshot_date: date) -> Dict[int, models.AssetSnapshot]:
+        """사용자별로 snapshot_date 이전의 가장 최근 스냅샷"""
+        latest = (
+            select(
+                models.AssetSnapshot.user_id,
+                func.max(models.AssetSnapshot.snapshot_date).label("snapshot_date")
+            )
+            .where(models.AssetSnapshot.snapshot_date < snapshot_date)
+            .group_by(models.AssetSnapshot.user_id)
+            .subquery()
+        )
+        snapshots = self.db.execute(
+            select(models.AssetSnapshot).join(latest, (
+                (models.AssetSnapshot.user_id == latest.c.user_id)
+                & (models.AssetSnapshot.snapshot_date == latest.c.snapshot_date)
+            ))
+        ).scalars().all()
+        return {snapshot.user_id: snapshot for snapshot in snapshots}
+
+    def get_by_date(self, snapshot_date: date) -> Dict[int, models.AssetSnapshot]:
+        snapshots = self.db.execute(
+            select(models.AssetSnapshot).where(models.AssetSnapshot.snapshot_date == snapshot_date)
+        ).scalars().all()
+        return {snapshot.user_id: snapshot for snapshot in snapshots}
+
+    def get_user_dates(self, user_id: int, start_date: date, end_date: date) -> set:
+        rows = self.db.execute(
+            select(models.AssetSnapshot.snapshot_date).where(
+                models.AssetSnapshot.user_id == user_id,
+                models.AssetSnapshot.snapshot_date >= start_date,
+                models.AssetSnapshot.snapshot_date <= end_date
+            )
+        ).scalars().all()
+        return set(rows)
+
+    def get_month_ends(self, user_id: int, start_date: date, end_date: date) -> List[tuple]:
+        """구간 안 달마다 마지막 스냅샷 + 구간 직전 마지막 스냅샷의 (날짜, 순자산), 날짜 순"""
+        snapshot_date = models.AssetSnapshot.snapshot_date
+        month_ends = (
+            select(func.max(snapshot_date))
+            .where(
+                models.AssetSnapshot.user_id == user_id,
+                snapshot_date >= start_date,
+                snapshot_date <= end_date
+            )
+            .group_by(extract("year", snapshot_date), extract("month", snapshot_date))
+        )
+        previous = (
+            select(func.max(snapshot_date))
+            .where(models.AssetSnapshot.user_id == user_id, snapshot_date < start_date)
+            .scalar_subquery()
+        )
+        return self.db.execute(
+            select(snapshot_date, models.AssetSnapshot.net_worth)
+            .where(
+                models.AssetSnapshot.user_id == user_id,
+                or_(snapshot_date.in_(month_ends), snapshot_date == previous)
+            )
+            .order_by(snapshot_date)
+        ).all()
+
+    def bulk_create(self, rows: List[dict]) -> int:
+        if rows:
+            self.db.execute(insert(models.AssetSnapshot), rows)
+        return len(rows)
+
+    def bulk_update(self, rows: List[dict]) -> int:
+        """id를 포함한 dict 목록으로 PK 기준 일괄 UPDATE"""
+        if rows:
+            self.db.execute(update(models.AssetSnapshot), rows)
+        return len(rows)
@@ -0,0 +1,92 @@
+from sqlalchemy import func, select
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from app import models
+
+
+class BudgetRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_all(self, user_id: int) -> List[models.Budget]:
+        return self.db.query(models.Budget).filter(
+            models.Budget.user_id == user_id
+        ).order_by(models.Budget.id).all()
+
+    def get_by_id(self, budget_id: int) -> Optional[models.Budget]:
+        return self.db.get(models.Budget, budget_id)
+
+    def get_by_category(self, user_id: int, category_id: int) -> Optional[models.Budget]:
+        return self.db.query(models.Budget).filter(
+            models.Budget.user_id == user_id,
+            models.Budget.category_id == category_id
+        ).first()
+
+    def create(self, budget_data: dict) -> models.Budget:
+        db_budget = models.Budget(**budget_data)
+        self.db.add(db_budget)
+        self.db.flush()
+        return db_budget
+
+    def update(self, budget: models.Budget, update_data: dict) -> models.Budget:
+        for key, value in update_data.items():
+            setattr(budget, key, value)
+        self.db.flush()
+        return budget
+
+    def delete(self, budget: models.Budget) -> None:
+        self.db.delete(budget)
+        self.db.flush()
+
+    def get_month_spend(self, user_id: int, year: int, month: int) -> List[Row]:
+        """
+        사용자의 모든 예산별 월 지출 (하위 카테고리 포함) - 예산 수와 관계없이 쿼리 한 번
+        거래 원장 대신 거래 쓰기 때마다 갱신되는 월별 카테고리 합계(monthly_category_totals)를 읽음
+        """
+        total = models.MonthlyCategoryTotal
+        spend = (
+            select(
+                total.category,
+                func.sum(total.total_amount).label("amount"),
+                func.sum(total.transaction_count).label("count")
+            )
+            .join(models.Account, models.Account.id == total.account_id)
+            .where(
+                models.Account.user_id == user_id,
+                total.year == year,
+                total.month == month,
+                total.type == models.TransactionType.expense
+            )
+            .group_by(total.category)
+            .subquery()
+        )
+        # 같은 이름이 트리 여러 곳에 있으면 인터닝과 같이 가장 먼저 만든 카테고리 하나에만 지출을 연결 (예산 간 중복 합산 방지)
+        canonical = (
+            select(func.min(models.Category.id).label("id"), models.Category.name)
+            .where(models.Category.user_id == user_id, models.Category.type == models.CategoryType.expense)
+            .group_by(models.Category.name)
+            .subquery()
+        )
+        # 예산 카테고리 서브트리의 지출 카테고리명
+        names = (
+            select(models.CategoryClosure.ancestor_id.label("category_id"), canonical.c.name)
+            .join(canonical, canonical.c.id == models.CategoryClosure.descendant_id)
+            .subquery()
+        )
+        return self.db.execute(
+            select(
+                models.Budget.id,
+                models.Budget.category_id,
+                models.Category.name.label("category_name"),
+                models.Budget.monthly_limit,
+                func.coalesce(func.sum(spend.c.amount), 0).label("spent"),
+                func.coalesce(func.sum(spend.c.count), 0).label("transaction_count")
+            )
+            .join(models.Category, models.Category.id == models.Budget.category_id)
+            .outerjoin(names, names.c.category_id == models.Budget.category_id)
+            .outerjoin(spend, spend.c.category == names.c.name)
+            .where(models.Budget.user_id == user_id)
+            .group_by(models.Budget.id, models.Budget.category_id, models.Category.name, models.Budget.monthly_limit)
+            .order_by(models.Budget.id)
+        ).all()
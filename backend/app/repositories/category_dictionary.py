@@ -0,0 +1,169 @@
+import threading
+from typing import Dict, Iterable, List, Tuple
+from sqlalchemy import event, func, select, tuple_
+from sqlalchemy.orm import Session
+from app import models
+from app.core.config import settings
+from app.repositories.category_repository import CategoryRepository, INTERNED_TYPES
+
+PENDING_KEY = "category_dictionary_pending"
+
+# (user_id, 카테고리명, 유형)
+NameKey = Tuple[int, str, str]
+
+
+class CategoryDictionary:
+    """
+    카테고리명 <-> categories.id 프로세스 전체 공유 사전
+    - 쓰기: 거래/정기 거래의 카테고리명을 (사용자, 이름, 유형)별 id 하나로 인터닝해서 category_id에 저장
+      사전에 없는 이름은 최상위 카테고리로 등록하고, 새 id는 commit된 뒤에만 공유 사전에 올림
+    - 읽기: category_id로 GROUP BY한 결과에 이름을 붙일 때 categories 조인 없이 사전에서 조회
+    """
+
+    def __init__(self):
+        self._ids: Dict[NameKey, int] = {}
+        self._names: Dict[int, str] = {}
+        self._keys: Dict[int, NameKey] = {}
+        self._account_users: Dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    def names(self, db, category_ids: Iterable[int]) -> Dict[int, str]:
+        """id → 이름 (사전에 없는 id만 한 번에 조회, db는 Session/Connection 모두 가능)"""
+        wanted = {category_id for category_id in category_ids if category_id is not None}
+        with self._lock:
+            missing = [category_id for category_id in wanted if category_id not in self._names]
+        if missing:
+            rows = db.execute(
+                select(models.Category.id, models.Category.user_id, models.Category.name, models.Category.type)
+                .where(models.Category.id.in_(missing))
+            ).all()
+            with self._lock:
+                for row in rows:
+                    self._remember((row.user_id, row.name, category_type(row.type)), row.id)
+        with self._lock:
+            return {category_id: self._names[category_id] for category_id in wanted if category_id in self._names}
+
+    def intern(self, db: Session, rows: List[dict]) -> None:
+        """account_id/category/type가 있는 행 dict에 category_id를 채움 (같은 이름은 쿼리 없이 사전에서, 이체는 제외)"""
+        interned = {transaction_type.value for transaction_type in INTERNED_TYPES}
+        pending = [row for row in rows if row.get("category") and category_type(row["type"]) in interned]
+        if not pending:
+            return
+        users = self._users(db, {row["account_id"] for row in pending})
+        keyed = [
+            (row, (users[row["account_id"]], row["category"], category_type(row["type"])))
+            for row in pending
+            if row["account_id"] in users
+        ]
+        ids = self._resolve(db, {key for _, key in keyed})
+        for row, key in keyed:
+            row["category_id"] = ids[key]
+
+    def forget(self, category_id: int) -> None:
+        """이름 변경/삭제된 카테고리를 사전에서 제거"""
+        with self._lock:
+            key = self._keys.pop(category_id, None)
+            self._names.pop(category_id, None)
+            if key is not None and self._ids.get(key) == category_id:
+                del self._ids[key]
+
+    def publish(self, created: Dict[NameKey, int]) -> None:
+        with self._lock:
+            for key, category_id in created.items():
+                self._remember(key, category_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._ids.clear()
+            self._names.clear()
+            self._keys.clear()
+            self._account_users.clear()
+
+    def _users(self, db: Session, account_ids: set) -> Dict[int, int]:
+        """계좌 → 사용자 (계좌의 사용자는 바뀌지 않으므로 한 번 읽으면 계속 사용)"""
+        with self._lock:
+            missing = [account_id for account_id in account_ids if account_id not in self._account_users]
+        if missing:
+            rows = db.execute(
+                select(models.Account.id, models.Account.user_id).where(models.Account.id.in_(missing))
+            ).all()
+            with self._lock:
+                self._account_users.update((row.id, row.user_id) for row in rows)
+        with self._lock:
+            return {account_id: self._account_users[account_id] for account_id in account_ids if account_id in self._account_users}
+
+    def _resolve(self, db: Session, keys: set) -> Dict[NameKey, int]:
+        pending: Dict[NameKey, int] = db.info.setdefault(PENDING_KEY, {})
+        with self._lock:
+            ids = {key: self._ids[key] for key in keys if key in self._ids}
+        ids.update((key, pending[key]) for key in keys - ids.keys() if key in pending)
+        missing = keys - ids.keys()
+        if missing:
+            # 같은 이름이 트리 여러 곳에 있으면 가장 먼저 만든 카테고리로
+            category = models.Category
+            rows = db.execute(
+                select(category.user_id, category.name, category.type, func.min(category.id).label("id"))
+                .where(tuple_(category.user_id, category.name, category.type).in_(
+                    [(user_id, name, models.CategoryType(type_)) for user_id, name, type_ in missing]
+                ))
+                .group_by(category.user_id, category.name, category.type)
+            ).all()
+            found = {(row.user_id, row.name, category_type(row.type)): row.id for row in rows}
+            with self._lock:
+                for key, category_id in found.items():
+                    self._remember(key, category_id)
+            ids.update(found)
+
+        for key in keys - ids.keys():
+            user_id, name, type_ = key
+            created = CategoryRepository(db).create({"user_id": user_id, "name": name, "type": models.CategoryType(type_)})
+            pending[key] = ids[key] = created.id
+        return ids
+
+    def _remember(self, key: NameKey, category_id: int) -> None:
+        self._ids.setdefault(key, category_id)
+        self._names[category_id] = key[1]
+        self._keys[category_id] = key
+
+
+def category_type(value) -> str:
+    """TransactionType/CategoryType/문자열 → "income" | "expense" """
+    return getattr(value, "value", value)
+
+
+category_dictionary = CategoryDictionary()
+
+
+def intern_categories(db: Session, rows: List[dict]) -> None:
+    """CATEGORY_INTERNING 모드면 행 dict에 category_id를 채움 (꺼져 있으면 아무것도 안 함)"""
+    if settings.CATEGORY_INTERNING:
+        category_dictionary.intern(db, rows)
+
+
+def intern_instance(db: Session, instance) -> None:
+    """ORM 거래/정기 거래 객체의 현재 카테고리명으로 category_id 갱신 (CATEGORY_INTERNING 모드에서만)"""
+    if settings.CATEGORY_INTERNING:
+        row = {"account_id": instance.account_id, "category": instance.category, "type": instance.type}
+        category_dictionary.intern(db, [row])
+        instance.category_id = row.get("category_id")
+
+
+@event.listens_for(models.Transaction, "before_insert")
+@event.listens_for(models.RecurringTransaction, "before_insert")
+def _fill_category_name(mapper, connection, target) -> None:
+    """category_id만 지정한 ORM 객체는 사전에서 카테고리명을 채움"""
+    if target.category is None and target.category_id is not None:
+        target.category = category_dictionary.names(connection, [target.category_id]).get(target.category_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_created(session: Session) -> None:
+    created = session.info.pop(PENDING_KEY, None)
+    if created:
+        category_dictionary.publish(created)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_created(session: Session, previous_transaction) -> None:
+    if previous_transaction.parent is None:
+        session.info.pop(PENDING_KEY, None)
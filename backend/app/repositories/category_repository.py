@@ -0,0 +1,304 @@
+from collections import defaultdict, namedtuple
+from sqlalchemy import and_, case, delete, exists, func, insert, literal, or_, select, true, update
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session, aliased
+from typing import Dict, List, Optional
+from datetime import date
+from app import models
+from app.core.config import settings
+from app.repositories.transaction_archive import transaction_archive
+
+Closure = models.CategoryClosure
+RollupTotal = namedtuple("RollupTotal", ["category_id", "total_amount", "transaction_count", "own_amount", "own_count"])
+
+# 카테고리로 인터닝하는 거래 유형 (이체는 categories에 대응하는 유형이 없음)
+INTERNED_TYPES = [models.TransactionType.income, models.TransactionType.expense]
+
+
+class CategoryRepository:
+    """카테고리 CRUD + 클로저 테이블 유지 (트리 집계는 클로저 조인 한 번으로)"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_all(self, user_id: int) -> List[models.Category]:
+        return self.db.query(models.Category).filter(
+            models.Category.user_id == user_id
+        ).order_by(models.Category.id).all()
+
+    def get_by_id(self, category_id: int) -> Optional[models.Category]:
+        return self.db.get(models.Category, category_id)
+
+    def create(self, category_data: dict) -> models.Category:
+        """카테고리 생성 + 부모의 모든 조상과 자기 자신에 대한 클로저 행 추가"""
+        db_category = models.Category(**category_data)
+        self.db.add(db_category)
+        self.db.flush()
+        self._link_subtree(db_category.id, db_category.parent_id)
+        return db_category
+
+    def update(self, category: models.Category, update_data: dict) -> models.Category:
+        for key, value in update_data.items():
+            setattr(category, key, value)
+        self.db.flush()
+        return category
+
+    def get_subtree_ids(self, category_id: int) -> List[int]:
+        """자기 자신을 포함한 모든 자손 ID"""
+        return list(self.db.scalars(select(Closure.descendant_id).where(Closure.ancestor_id == category_id)))
+
+    def move(self, category: models.Category, new_parent_id: Optional[int]) -> None:
+        """
+        서브트리를 새 부모 밑으로 이동
+        서브트리 밖 조상과의 연결만 끊고, 새 부모의 조상 x 서브트리 노드 쌍을 INSERT ... SELECT로 추가
+        (자손 ID는 먼저 읽어 둠 - MySQL은 DELETE 대상 테이블을 서브쿼리에서 다시 읽을 수 없음)
+        """
+        subtree = self.get_subtree_ids(category.id)
+        self.db.execute(
+            delete(Closure)
+            .where(Closure.descendant_id.in_(subtree), Closure.ancestor_id.not_in(subtree))
+            .execution_options(synchronize_session=False)
+        )
+        category.parent_id = new_parent_id
+        self.db.flush()
+        if new_parent_id is not None:
+            self._link_subtree(category.id, new_parent_id, include_self=False)
+
+    def delete(self, category: models.Category) -> None:
+        """
+        카테고리 삭제 - 자식은 삭제된 카테고리의 부모 밑으로 올라감
+        이 노드를 거치던 (조상, 자손) 경로는 depth를 1 줄이고 이 노드가 들어간 행은 삭제
+        """
+        ancestors = select(Closure.ancestor_id).where(Closure.descendant_id == category.id, Closure.depth > 0)
+        descendants = select(Closure.descendant_id).where(Closure.ancestor_id == category.id, Closure.depth > 0)
+        ancestor_ids = list(self.db.scalars(ancestors))
+        descendant_ids = list(self.db.scalars(descendants))
+        if ancestor_ids and descendant_ids:
+            self.db.execute(
+                update(Closure)
+                .where(Closure.ancestor_id.in_(ancestor_ids), Closure.descendant_id.in_(descendant_ids))
+                .values(depth=Closure.depth - 1)
+                .execution_options(synchronize_session=False)
+            )
+        self.db.execute(
+            delete(Closure)
+            .where(or_(Closure.ancestor_id == category.id, Closure.descendant_id == category.id))
+            .execution_options(synchronize_session=False)
+        )
+        self.db.execute(
+            update(models.Category)
+            .where(models.Category.parent_id == category.id)
+            .values(parent_id=category.parent_id)
+            .execution_options(synchronize_session=False)
+        )
+        self.db.execute(
+            delete(models.Budget)
+            .where(models.Budget.category_id == category.id)
+            .execution_options(synchronize_session=False)
+        )
+        # 인터닝된 거래/정기 거래는 카테고리명만 남기고 연결 해제
+        for model in (models.Transaction, models.RecurringTransaction):
+            self.db.execute(
+                update(model)
+                .where(model.category_id == category.id)
+                .values(category_id=None)
+                .execution_options(synchronize_session=False)
+            )
+        self.db.delete(category)
+        self.db.flush()
+
+    def rebuild_closure(self) -> int:
+        """parent_id로 클로저 테이블 전체 재생성 (재귀 CTE 한 번, 백필/복구용)"""
+        paths = (
+            select(
+                models.Category.id.label("ancestor_id"),
+                models.Category.id.label("descendant_id"),
+                literal(0).label("depth")
+            ).cte("paths", recursive=True)
+        )
+        child = aliased(models.Category)
+        paths = paths.union_all(
+            select(paths.c.ancestor_id, child.id, paths.c.depth + 1)
+            .join(child, child.parent_id == paths.c.descendant_id)
+        )
+        self.db.execute(delete(Closure))
+        result = self.db.execute(
+            insert(Closure).from_select(
+                ["ancestor_id", "descendant_id", "depth"],
+                select(paths.c.ancestor_id, paths.c.descendant_id, paths.c.depth)
+            )
+        )
+        return result.rowcount
+
+    def get_rollup_totals(
+        self,
+        user_id: int,
+        start_date: date,
+        end_date: date,
+        transaction_type: Optional[models.TransactionType] = None
+    ) -> List[Row]:
+        """
+        기간 내 거래를 카테고리의 모든 조상에 더한 노드별 합계 (클로저 조인 + GROUP BY 한 번)
+        거래는 카테고리명/유형과 같은 사용자 계좌로 연결, own_*는 자기 카테고리(depth 0) 분
+        아카이브 구간은 연도 파일을 카테고리별로 합친 뒤 같은 클로저로 조상에 더함
+        """
+        tx = models.Transaction
+        own = Closure.depth == 0
+        query = select(
+            Closure.ancestor_id.label("category_id"),
+            func.sum(tx.amount).label("total_amount"),
+            func.count(tx.id).label("transaction_count"),
+            func.sum(case((own, tx.amount), else_=0)).label("own_amount"),
+            func.sum(case((own, 1), else_=0)).label("own_count"),
+        )
+        if settings.CATEGORY_INTERNING:
+            # 인터닝된 원장은 정수 category_id로 바로 연결 (문자열 비교 없음)
+            query = query.select_from(Closure).join(tx, tx.category_id == Closure.descendant_id)
+        else:
+            # 같은 이름이 트리 여러 곳에 있으면 인터닝과 같이 가장 먼저 만든 카테고리 하나로만 연결 (중복 합산 방지)
+            canonical = (
+                select(
+                    func.min(models.Category.id).label("id"),
+                    models.Category.name,
+                    models.Category.type
+                )
+                .where(models.Category.user_id == user_id)
+                .group_by(models.Category.name, models.Category.type)
+                .subquery()
+            )
+            query = (
+                query.select_from(canonical)
+                .join(Closure, Closure.descendant_id == canonical.c.id)
+                .join(tx, and_(tx.category == canonical.c.name, tx.type == canonical.c.type))
+            )
+        query = (
+            query.join(models.Account, and_(models.Account.id == tx.account_id, models.Account.user_id == user_id))
+            .where(tx.transaction_date >= start_date, tx.transaction_date <= end_date)
+            .group_by(Closure.ancestor_id)
+        )
+        if transaction_type is not None:
+            query = query.where(tx.type == transaction_type)
+        boundary = transaction_archive.boundary()
+        if not transaction_archive.reaches(start_date):
+            return self.db.execute(query).all()
+
+        totals = defaultdict(lambda: [0, 0, 0, 0])
+        for row in self.db.execute(query.where(tx.transaction_date >= boundary)):
+            totals[row.category_id] = [row.total_amount, row.transaction_count, row.own_amount, row.own_count]
+        own = self._archived_category_totals(user_id, start_date, end_date, transaction_type)
+        if own:
+            for ancestor_id, descendant_id, depth in self.db.execute(
+                select(Closure.ancestor_id, Closure.descendant_id, Closure.depth).where(Closure.descendant_id.in_(own))
+            ):
+                amount, count = own[descendant_id]
+                total = totals[ancestor_id]
+                total[0] += amount
+                total[1] += count
+                if depth == 0:
+                    total[2] += amount
+                    total[3] += count
+        return [RollupTotal(category_id, *total) for category_id, total in totals.items()]
+
+    def _archived_category_totals(
+        self,
+        user_id: int,
+        start_date: Optional[date],
+        end_date: date,
+        transaction_type: Optional[models.TransactionType]
+    ) -> Dict[int, tuple]:
+        """아카이브 거래를 Arrow에서 (카테고리, 유형)별로 합친 뒤 핫 테이블과 같은 규칙으로 카테고리 노드에 연결한 (합계, 건수)"""
+        account_ids = list(self.db.scalars(select(models.Account.id).where(models.Account.user_id == user_id)))
+        canonical = None
+        if not settings.CATEGORY_INTERNING:
+            # 인터닝 전 원장은 이름/유형으로 가장 먼저 만든 카테고리에 연결 (핫 테이블 조인과 같은 규칙)
+            canonical = {
+                (name, type_.value): category_id
+                for category_id, name, type_ in self.db.execute(
+                    select(func.min(models.Category.id), models.Category.name, models.Category.type)
+                    .where(models.Category.user_id == user_id)
+                    .group_by(models.Category.name, models.Category.type)
+                )
+            }
+        totals = defaultdict(lambda: [0, 0])
+        for archived in transaction_archive.iter_tables(
+            ["category", "category_id", "type", "amount"], account_ids, start_date, end_date, ordered=False
+        ):
+            grouped = archived.group_by(["category", "category_id", "type"]).aggregate([("amount", "sum"), ("amount", "count")])
+            for row in grouped.to_pylist():
+                if transaction_type is not None and row["type"] != transaction_type.value:
+                    continue
+                category_id = row["category_id"] if canonical is None else canonical.get((row["category"], row["type"]))
+                if category_id is None:
+                    continue
+                total = totals[category_id]
+                total[0] += row["amount_sum"]
+                total[1] += row["amount_count"]
+        return {category_id: tuple(total) for category_id, total in totals.items()}
+
+    def register_ledger_names(self) -> int:
+        """
+        거래/정기 거래에 쓰인 (사용자, 카테고리명, 유형) 중 categories에 없는 것을 최상위 카테고리로 등록
+        테이블마다 INSERT ... SELECT DISTINCT 한 번, 새 카테고리의 클로저 자기 행도 추가
+        """
+        created = 0
+        for model in (models.Transaction, models.RecurringTransaction):
+            missing = (
+                select(models.Account.user_id, model.category, model.type)
+                .join(models.Account, models.Account.id == model.account_id)
+                .where(model.type.in_(INTERNED_TYPES))
+                .where(~exists().where(
+                    models.Category.user_id == models.Account.user_id,
+                    models.Category.name == model.category,
+                    models.Category.type == model.type
+                ))
+                .distinct()
+            )
+            result = self.db.execute(insert(models.Category).from_select(["user_id", "name", "type"], missing))
+            created += result.rowcount
+        self.db.execute(insert(Closure).from_select(
+            ["ancestor_id", "descendant_id", "depth"],
+            select(models.Category.id, models.Category.id, literal(0))
+            .where(~exists().where(Closure.ancestor_id == models.Category.id, Closure.descendant_id == models.Category.id))
+        ))
+        return created
+
+    def get_max_id(self, model) -> int:
+        return self.db.scalar(select(func.max(model.id))) or 0
+
+    def backfill_category_ids(self, model, start_id: int, end_id: int) -> int:
+        """id가 [start_id, end_id)이고 category_id가 비어 있는 행을 (계좌 사용자, 이름, 유형)이 같은 카테고리로 채움"""
+        user_id = select(models.Account.user_id).where(models.Account.id == model.account_id).scalar_subquery()
+        category_id = (
+            select(func.min(models.Category.id))
+            .where(
+                models.Category.user_id == user_id,
+                models.Category.name == model.category,
+                models.Category.type == model.type
+            )
+            .scalar_subquery()
+        )
+        result = self.db.execute(
+            update(model)
+            .where(model.id >= start_id, model.id < end_id, model.category_id.is_(None), model.type.in_(INTERNED_TYPES))
+            .values(category_id=category_id)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+
+    def _link_subtree(self, category_id: int, parent_id: Optional[int], include_self: bool = True) -> None:
+        """(parent의 조상들) x (category 서브트리) 경로 추가, include_self면 새 노드의 자기 자신 행도"""
+        if include_self:
+            self.db.execute(insert(Closure).values(ancestor_id=category_id, descendant_id=category_id, depth=0))
+        if parent_id is None:
+            return
+        above = aliased(Closure)
+        below = aliased(Closure)
+        self.db.execute(
+            insert(Closure).from_select(
+                ["ancestor_id", "descendant_id", "depth"],
+                select(above.ancestor_id, below.descendant_id, above.depth + below.depth + 1)
+                .select_from(above)
+                .join(below, true())
+                .where(above.descendant_id == parent_id, below.ancestor_id == category_id)
+            )
+        )
@@ -0,0 +1,177 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import and_, delete, extract, func, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from typing import Dict, List, Optional, Tuple
+from datetime import date
+from decimal import Decimal
+from collections import defaultdict
+from app import models
+from app.core.config import settings
+from app.repositories.category_dictionary import category_dictionary
+from app.repositories.transaction_archive import transaction_archive
+
+# (account_id, year, month, category, type)
+TotalKey = Tuple[int, int, int, str, models.TransactionType]
+
+class MonthlyCategoryTotalRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    @staticmethod
+    def make_key(account_id: int, transaction_date: date, category: str, transaction_type: models.TransactionType) -> TotalKey:
+        return (account_id, transaction_date.year, transaction_date.month, category, transaction_type)
+
+    def apply(self, key: TotalKey, amount_delta: Decimal, count_delta: int) -> None:
+        """집계 행에 증분 반영 (UPDATE 우선, 행이 없으면 INSERT)"""
+        if self._increment(key, amount_delta, count_delta):
+            return
+        account_id, year, month, category, transaction_type = key
+        try:
+            # 동시 INSERT로 unique 충돌 시 savepoint만 롤백하고 UPDATE로 재시도
+            with self.db.begin_nested():
+                self.db.execute(insert(models.MonthlyCategoryTotal).values(
+                    account_id=account_id,
+                    year=year,
+                    month=month,
+                    category=category,
+                    type=transaction_type,
+                    total_amount=amount_delta,
+                    transaction_count=count_delta
+                ))
+        except IntegrityError:
+            self._increment(key, amount_delta, count_delta)
+
+    def apply_many(self, deltas: Dict[TotalKey, Tuple[Decimal, int]]) -> None:
+        """청크 단위로 모은 증분을 키별로 한 번씩 반영"""
+        for key, (amount_delta, count_delta) in deltas.items():
+            self.apply(key, amount_delta, count_delta)
+
+    def _increment(self, key: TotalKey, amount_delta: Decimal, count_delta: int) -> bool:
+        account_id, year, month, category, transaction_type = key
+        total = models.MonthlyCategoryTotal
+        result = self.db.execute(
+            update(total)
+            .where(
+                total.account_id == account_id,
+                total.year == year,
+                total.month == month,
+                total.category == category,
+                total.type == transaction_type
+            )
+            .values(
+                total_amount=total.total_amount + amount_delta,
+                transaction_count=total.transaction_count + count_delta
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount > 0
+
+    def get_account_month(self, account_id: int, year: int, month: int, transaction_type: Optional[models.TransactionType] = None) -> List[models.MonthlyCategoryTotal]:
+        query = self.db.query(models.MonthlyCategoryTotal).filter(
+            models.MonthlyCategoryTotal.account_id == account_id,
+            models.MonthlyCategoryTotal.year == year,
+            models.MonthlyCategoryTotal.month == month,
+            models.MonthlyCategoryTotal.transaction_count > 0
+        )
+        if transaction_type:
+            query = query.filter(models.MonthlyCategoryTotal.type == transaction_type)
+        return query.order_by(models.MonthlyCategoryTotal.total_amount.desc()).all()
+
+    def get_user_month(self, user_id: int, year: int, month: int) -> list:
+        """사용자의 월별 (카테고리, 유형, 합계, 고정지출 여부) - 카테고리 수만큼의 행"""
+        total = models.MonthlyCategoryTotal
+        # 트리의 다른 위치에 같은 이름의 카테고리가 있어도 합계가 불어나지 않도록 (이름, 유형)당 한 행으로 먼저 모음
+        fixed = (
+            select(
+                models.Category.name,
+                models.Category.type,
+                func.max(models.Category.is_fixed).label("is_fixed")
+            )
+            .where(models.Category.user_id == user_id)
+            .group_by(models.Category.name, models.Category.type)
+            .subquery()
+        )
+        return self.db.execute(
+            select(
+                total.category,
+                total.type,
+                func.sum(total.total_amount).label("amount"),
+                func.max(fixed.c.is_fixed).label("is_fixed")
+            )
+            .join(models.Account, models.Account.id == total.account_id)
+            .outerjoin(fixed, and_(
+                fixed.c.name == total.category,
+                fixed.c.type == total.type
+            ))
+            .where(
+                models.Account.user_id == user_id,
+                total.year == year,
+                total.month == month
+            )
+            .group_by(total.category, total.type)
+        ).all()
+
+    def rebuild(self) -> int:
+        """
+        transactions 원장으로부터 전체 집계 재생성 (백필용)
+        아카이브된 연도의 집계는 원장이 핫 테이블에 없으므로 그대로 두고 경계일 이후만 다시 계산
+        """
+        tx = models.Transaction
+        year = extract("year", tx.transaction_date)
+        month = extract("month", tx.transaction_date)
+        boundary = transaction_archive.boundary()
+        hot = [tx.transaction_date >= boundary] if boundary else []
+        clear = delete(models.MonthlyCategoryTotal)
+        if boundary:
+            clear = clear.where(models.MonthlyCategoryTotal.year >= boundary.year)
+        self.db.execute(clear)
+        if settings.CATEGORY_INTERNING:
+            return self._rebuild_interned(year, month, hot)
+        result = self.db.execute(
+            insert(models.MonthlyCategoryTotal).from_select(
+                ["account_id", "year", "month", "category", "type", "total_amount", "transaction_count"],
+                select(
+                    tx.account_id, year, month, tx.category, tx.type,
+                    func.sum(tx.amount), func.count(tx.id)
+                ).where(*hot).group_by(tx.account_id, year, month, tx.category, tx.type)
+            )
+        )
+        self.db.flush()
+        return result.rowcount
+
+    def _rebuild_interned(self, year, month, hot: list) -> int:
+        """
+        인터닝된 원장은 정수 category_id로 GROUP BY 하고 이름은 카테고리 사전에서 붙임
+        (category_id가 아직 없는 행만 이름으로 묶어서 같은 키에 합침)
+        """
+        tx = models.Transaction
+        totals = defaultdict(lambda: [0, 0])
+        rows = self.db.execute(
+            select(tx.account_id, year, month, tx.category_id, tx.type, func.sum(tx.amount), func.count(tx.id))
+            .where(tx.category_id.is_not(None), *hot)
+            .group_by(tx.account_id, year, month, tx.category_id, tx.type)
+        ).all()
+        names = category_dictionary.names(self.db, {row[3] for row in rows})
+        for account_id, row_year, row_month, category_id, transaction_type, amount, count in rows:
+            total = totals[(account_id, row_year, row_month, names[category_id], transaction_type)]
+            total[0] += amount
+            total[1] += count
+        for account_id, row_year, row_month, category, transaction_type, amount, count in self.db.execute(
+            select(tx.account_id, year, month, tx.category, tx.type, func.sum(tx.amount), func.count(tx.id))
+            .where(tx.category_id.is_(None), *hot)
+            .group_by(tx.account_id, year, month, tx.category, tx.type)
+        ):
+            total = totals[(account_id, row_year, row_month, category, transaction_type)]
+            total[0] += amount
+            total[1] += count
+
+        if totals:
+            self.db.execute(insert(models.MonthlyCategoryTotal), [
+                {
+                    "account_id": account_id, "year": row_year, "month": row_month, "category": category,
+                    "type": transaction_type, "total_amount": amount, "transaction_count": count
+                }
+                for (account_id, row_year, row_month, category, transaction_type), (amount, count) in totals.items()
+            ])
+        self.db.flush()
+        return len(totals)
@@ -0,0 +1,7 @@
+from typing import Tuple
+from pydantic import BaseModel
+from sqlalchemy import Column
+
+def schema_columns(model, schema: type[BaseModel]) -> Tuple[Column, ...]:
+    """응답 스키마 필드에 해당하는 컬럼만 선택 (읽기 전용 조회를 ORM 엔티티 대신 Row로)"""
+    return tuple(model.__table__.c[name] for name in schema.model_fields)
@@ -1,8 +1,18 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, select, update
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
+from datetime import date
 from decimal import Decimal
-from app import models
+from app import models, schemas
+from app.repositories.projection import schema_columns
+from app.repositories.category_dictionary import intern_categories, intern_instance
+
+# 바뀌면 category_id를 다시 인터닝해야 하는 컬럼
+CATEGORY_KEY_FIELDS = {"account_id", "type", "category"}
+
+RECURRING_COLUMNS = schema_columns(models.RecurringTransaction, schemas.RecurringTransaction)
 
 class RecurringTransactionRepository:
     def __init__(self, db: Session):
@@ -16,12 +26,17 @@ class RecurringTransactionRepository:
             query = query.filter(models.RecurringTransaction.account_id == account_id)
         return query.all()
     
+    def get_active_rows(self, account_id: Optional[int] = None) -> List[Row]:
+        """get_all_active의 읽기 전용 버전: 응답 컬럼만 Core select로"""
+        return self.db.execute(active_rows_query(account_id)).all()
+    
     def get_by_id(self, recurring_id: int) -> Optional[models.RecurringTransaction]:
         return self.db.query(models.RecurringTransaction).filter(
             models.RecurringTransaction.id == recurring_id
         ).first()
     
     def create(self, recurring_data: dict) -> models.RecurringTransaction:
+        intern_categories(self.db, [recurring_data])
         db_recurring = models.RecurringTransaction(**recurring_data)
         self.db.add(db_recurring)
         self.db.flush()
@@ -30,6 +45,8 @@ class RecurringTransactionRepository:
     def update(self, recurring: models.RecurringTransaction, update_data: dict) -> models.RecurringTransaction:
         for key, value in update_data.items():
             setattr(recurring, key, value)
+        if CATEGORY_KEY_FIELDS & update_data.keys():
+            intern_instance(self.db, recurring)
         self.db.flush()
         return recurring
 
@@ -38,6 +55,52 @@ class RecurringTransactionRepository:
         self.db.delete(recurring)
         self.db.flush()
     
+    def get_due(self, target_date: date, after_id: int = 0, limit: int = 500, account_ids: Optional[List[int]] = None) -> List[models.RecurringTransaction]:
+        """next_run_date가 target_date 이하인 활성 정기 거래 (idx_recurring_due, id 순 배치)"""
+        query = self.db.query(models.RecurringTransaction).filter(
+            models.RecurringTransaction.is_active == True,
+            models.RecurringTransaction.next_run_date <= target_date,
+            models.RecurringTransaction.id > after_id
+        )
+        if account_ids is not None:
+            query = query.filter(models.RecurringTransaction.account_id.in_(account_ids))
+        return query.order_by(models.RecurringTransaction.id).limit(limit).all()
+    
+    def get_due_account_ids(self, target_date: date) -> List[int]:
+        """실행할 정기 거래가 있는 계좌 ID (샤드 분할용)"""
+        rows = self.db.query(models.RecurringTransaction.account_id).filter(
+            models.RecurringTransaction.is_active == True,
+            models.RecurringTransaction.next_run_date <= target_date
+        ).distinct().all()
+        return [account_id for (account_id,) in rows]
+    
+    def get_unscheduled(self, target_date: date, account_ids: Optional[List[int]] = None) -> List[models.RecurringTransaction]:
+        """다음 실행일이 아직 계산되지 않은 활성 정기 거래 (종료된 것 제외)"""
+        query = self.db.query(models.RecurringTransaction).filter(
+            models.RecurringTransaction.is_active == True,
+            models.RecurringTransaction.next_run_date.is_(None),
+            (models.RecurringTransaction.end_date.is_(None)) | (models.RecurringTransaction.end_date >= target_date)
+        )
+        if account_ids is not None:
+            query = query.filter(models.RecurringTransaction.account_id.in_(account_ids))
+        return query.all()
+    
+    def advance(self, recurring_id: int, expected_next_run: date, next_run: Optional[date]) -> bool:
+        """
+        다음 실행일을 조건부로 전진 (compare-and-set)
+        다른 실행자가 이미 처리했으면 0건 갱신 → False (같은 날짜 중복 생성 방지)
+        """
+        result = self.db.execute(
+            update(models.RecurringTransaction)
+            .where(
+                models.RecurringTransaction.id == recurring_id,
+                models.RecurringTransaction.next_run_date == expected_next_run
+            )
+            .values(next_run_date=next_run)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount == 1
+    
     def get_monthly_sum_by_type(self, account_ids: List[int], transaction_type: models.TransactionType) -> Decimal:
         result = self.db.query(func.sum(models.RecurringTransaction.amount)).filter(
             models.RecurringTransaction.account_id.in_(account_ids),
@@ -46,3 +109,62 @@ class RecurringTransactionRepository:
             models.RecurringTransaction.frequency == models.Frequency.monthly
         ).scalar()
         return result or Decimal("0")
+
+
+def active_rows_query(account_id: Optional[int]):
+    query = select(*RECURRING_COLUMNS).where(models.RecurringTransaction.is_active == True)
+    if account_id:
+        query = query.where(models.RecurringTransaction.account_id == account_id)
+    return query
+
+
+class AsyncRecurringTransactionRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+    
+    async def get_all_active(self, account_id: Optional[int] = None) -> List[models.RecurringTransaction]:
+        query = select(models.RecurringTransaction).where(
+            models.RecurringTransaction.is_active == True
+        )
+        if account_id:
+            query = query.where(models.RecurringTransaction.account_id == account_id)
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
+    
+    async def get_active_rows(self, account_id: Optional[int] = None) -> List[Row]:
+        """get_all_active의 읽기 전용 버전"""
+        result = await self.db.execute(active_rows_query(account_id))
+        return list(result.all())
+    
+    async def get_by_id(self, recurring_id: int) -> Optional[models.RecurringTransaction]:
+        return await self.db.get(models.RecurringTransaction, recurring_id)
+    
+    async def create(self, recurring_data: dict) -> models.RecurringTransaction:
+        await self.db.run_sync(lambda session: intern_categories(session, [recurring_data]))
+        db_recurring = models.RecurringTransaction(**recurring_data)
+        self.db.add(db_recurring)
+        await self.db.flush()
+        return db_recurring
+    
+    async def update(self, recurring: models.RecurringTransaction, update_data: dict) -> models.RecurringTransaction:
+        for key, value in update_data.items():
+            setattr(recurring, key, value)
+        if CATEGORY_KEY_FIELDS & update_data.keys():
+            await self.db.run_sync(lambda session: intern_instance(session, recurring))
+        await self.db.flush()
+        return recurring
+    
+    async def delete(self, recurring: models.RecurringTransaction) -> None:
+        await self.db.delete(recurring)
+        await self.db.flush()
+    
+    async def get_monthly_sum_by_type(self, account_ids: List[int], transaction_type: models.TransactionType) -> Decimal:
+        result = await self.db.execute(
+            select(func.sum(models.RecurringTransaction.amount)).where(
+                models.RecurringTransaction.account_id.in_(account_ids),
+                models.RecurringTransaction.type == transaction_type,
+                models.RecurringTransaction.is_active == True,
+                models.RecurringTransaction.frequency == models.Frequency.monthly
+            )
+        )
+        return result.scalar() or Decimal("0")
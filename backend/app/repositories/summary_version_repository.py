@@ -0,0 +1,46 @@
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import insert, select, update
+from sqlalchemy.exc import IntegrityError
+from app import models
+
+class SummaryVersionRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get(self, user_id: int) -> int:
+        """사용자의 요약 데이터 버전 (행이 없으면 0)"""
+        return self.db.scalar(
+            select(models.SummaryVersion.version).where(models.SummaryVersion.user_id == user_id)
+        ) or 0
+
+    def bump(self, user_id: int) -> None:
+        """버전 +1 (UPDATE 우선, 행이 없으면 INSERT)"""
+        if self._increment(user_id):
+            return
+        try:
+            # 동시 INSERT로 unique 충돌 시 savepoint만 롤백하고 UPDATE로 재시도
+            with self.db.begin_nested():
+                self.db.execute(insert(models.SummaryVersion).values(user_id=user_id, version=1))
+        except IntegrityError:
+            self._increment(user_id)
+
+    def _increment(self, user_id: int) -> bool:
+        result = self.db.execute(
+            update(models.SummaryVersion)
+            .where(models.SummaryVersion.user_id == user_id)
+            .values(version=models.SummaryVersion.version + 1)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount > 0
+
+
+class AsyncSummaryVersionRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get(self, user_id: int) -> int:
+        """사용자의 요약 데이터 버전 (행이 없으면 0)"""
+        return await self.db.scalar(
+            select(models.SummaryVersion.version).where(models.SummaryVersion.user_id == user_id)
+        ) or 0
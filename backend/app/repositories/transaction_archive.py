@@ -0,0 +1,247 @@
+"""
+거래 콜드 아카이브 (연도별 zstd Parquet 파일 + manifest.json, 로컬 디스크)
+- manifest의 archived_through 이하 연도는 아카이브 파일에만 있고 transactions(핫 테이블)에는 없음
+  → 경계일(boundary = archived_through 다음 해 1월 1일) 하나로 두 계층을 나눔
+- 아카이브된 연도는 읽기 전용 (쓰기 경로는 ensure_writable로 거부), 아카이브 중인 연도(archiving_through)도 기록 전부터 거부
+"""
+import hashlib
+import json
+import os
+import threading
+from collections import namedtuple
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+from sqlalchemy.engine import Row
+from app import models
+from app.core.config import settings
+from app.core.exceptions import InvalidTransactionError
+
+MANIFEST_FILE = "manifest.json"
+
+# 아카이브 파일 컬럼 (transactions 전체 컬럼, 쓰기 배치도 이 순서)
+ARCHIVE_FIELDS = [
+    "id", "account_id", "category", "category_id", "type", "amount",
+    "description", "transaction_date", "is_recurring", "created_at",
+]
+ARCHIVE_COLUMNS = [getattr(models.Transaction, field) for field in ARCHIVE_FIELDS]
+SORT_KEY = ("transaction_date", "id")
+
+
+def archive_schema():
+    import pyarrow as pa
+
+    return pa.schema([
+        ("id", pa.int64()),
+        ("account_id", pa.int64()),
+        ("category", pa.string()),
+        ("category_id", pa.int64()),
+        ("type", pa.string()),
+        ("amount", pa.decimal128(15, 2)),
+        ("description", pa.string()),
+        ("transaction_date", pa.date32()),
+        ("is_recurring", pa.bool_()),
+        ("created_at", pa.timestamp("us")),
+    ])
+
+
+@lru_cache(maxsize=None)
+def _row_type(fields: Tuple[str, ...]):
+    """Row처럼 속성/인덱스/_asdict()로 읽을 수 있는 아카이브 행 타입"""
+    return namedtuple("ArchivedTransaction", fields)
+
+
+class TransactionArchive:
+    def __init__(self, root):
+        self.root = Path(root)
+        self._lock = threading.Lock()
+        self._manifest = None
+        self._manifest_key = None
+
+    @property
+    def manifest_path(self) -> Path:
+        return self.root / MANIFEST_FILE
+
+    def manifest(self) -> dict:
+        """manifest.json (파일이 바뀌었을 때만 다시 읽음 - 다른 워커/CLI가 아카이브해도 반영)"""
+        path = self.manifest_path
+        try:
+            key = (str(path), path.stat().st_mtime_ns)
+        except FileNotFoundError:
+            return {"archived_through": None, "years": {}}
+        with self._lock:
+            if self._manifest_key != key:
+                self._manifest = json.loads(path.read_text(encoding="utf-8"))
+                self._manifest_key = key
+            return self._manifest
+
+    def boundary(self) -> Optional[date]:
+        """핫 테이블의 첫 날짜 (이보다 앞은 아카이브), 아카이브가 없으면 None"""
+        through = self.manifest()["archived_through"]
+        return date(through + 1, 1, 1) if through is not None else None
+
+    def reaches(self, start_date: Optional[date]) -> bool:
+        """start_date부터의 조회가 아카이브된 기간까지 닿는지"""
+        boundary = self.boundary()
+        return boundary is not None and (start_date is None or start_date < boundary)
+
+    def ensure_writable(self, transaction_date: date) -> None:
+        manifest = self.manifest()
+        through = max(
+            (year for year in (manifest["archived_through"], manifest.get("archiving_through")) if year is not None),
+            default=None
+        )
+        if through is not None and transaction_date < date(through + 1, 1, 1):
+            raise InvalidTransactionError(f"Transactions before {date(through + 1, 1, 1)} are archived and read-only")
+
+    def fence(self, year: Optional[int]) -> None:
+        """year까지 쓰기를 막음 (연도 기록 전에 호출해서 기록~정리 사이 쓰기가 사라지지 않게 함, None이면 아카이브된 연도만)"""
+        self._replace({**self.manifest(), "archiving_through": year})
+
+    def iter_tables(
+        self,
+        fields: Sequence[str],
+        account_ids: Optional[Sequence[int]] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        descending: bool = False,
+        ordered: bool = True
+    ) -> Iterator:
+        """
+        기간에 걸리는 연도 파일을 하나씩 (transaction_date, id) 순으로 정렬해서 Arrow 테이블로
+        계좌/날짜 조건은 읽기 필터로 넘겨서 row group 통계로 건너뜀 (메모리에는 한 연도씩만)
+        """
+        import pyarrow.parquet as pq
+
+        if account_ids is not None and not account_ids:
+            return
+        filters = []
+        if account_ids is not None:
+            filters.append(("account_id", "in", list(account_ids)))
+        if start_date:
+            filters.append(("transaction_date", ">=", start_date))
+        if end_date:
+            filters.append(("transaction_date", "<=", end_date))
+        columns = list(dict.fromkeys([*fields, *SORT_KEY]))
+        order = "descending" if descending else "ascending"
+        years = sorted(self.manifest()["years"].items(), key=lambda item: int(item[0]), reverse=descending)
+        for year, entry in years:
+            if (start_date and int(year) < start_date.year) or (end_date and int(year) > end_date.year):
+                continue
+            table = pq.read_table(self.root / entry["file"], columns=columns, filters=filters or None)
+            if table.num_rows:
+                yield table.sort_by([(key, order) for key in SORT_KEY]) if ordered else table
+
+    def rows(
+        self,
+        fields: Sequence[str],
+        account_ids: Optional[Sequence[int]] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        descending: bool = False,
+        before: Optional[Tuple[date, int]] = None,
+        limit: Optional[int] = None
+    ) -> List[tuple]:
+        """
+        아카이브 행을 (transaction_date, id) 순으로 (before: 내림차순 keyset 위치보다 앞만)
+        keyset 조건과 limit은 Arrow 테이블에서 먼저 적용하고 남은 행만 파이썬 객체로 변환,
+        limit을 채우면 남은 연도 파일은 읽지 않음
+        """
+        import pyarrow.compute as pc
+
+        result = []
+        for table in self.iter_tables(fields, account_ids, start_date, end_date, descending):
+            if before is not None:
+                day, id_ = table.column("transaction_date"), table.column("id")
+                table = table.filter(pc.or_(
+                    pc.less(day, before[0]),
+                    pc.and_(pc.equal(day, before[0]), pc.less(id_, before[1]))
+                ))
+            if limit is not None:
+                table = table.slice(0, limit - len(result))
+            result.extend(to_rows(table, fields))
+            if limit is not None and len(result) >= limit:
+                break
+        return result
+
+    def iter_batches(
+        self,
+        fields: Sequence[str],
+        account_ids: Optional[Sequence[int]] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        batch_size: int = 1000
+    ) -> Iterator[List[tuple]]:
+        """오름차순 배치 스트리밍 (stream_columns의 아카이브 부분)"""
+        for table in self.iter_tables(fields, account_ids, start_date, end_date):
+            for batch in table.to_batches(max_chunksize=batch_size):
+                yield to_rows(batch, fields)
+
+    def write_year(self, year: int, batches: Iterable[List[Row]]) -> Optional[dict]:
+        """
+        연도 하나를 임시 파일에 쓰고 rename (배치 하나 = row group 하나), manifest 항목 반환
+        배치는 ARCHIVE_COLUMNS 순서의 행, 거래가 없는 해는 파일 없이 None
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        schema = archive_schema()
+        name = f"transactions_{year}.parquet"
+        temp_path = self.root / f"{name}.tmp"
+        type_index = ARCHIVE_FIELDS.index("type")
+        amount_index = ARCHIVE_FIELDS.index("amount")
+        rows, amount = 0, Decimal("0")
+        with pq.ParquetWriter(temp_path, schema, compression="zstd") as writer:
+            for batch in batches:
+                columns = [list(values) for values in zip(*batch)]
+                columns[type_index] = [value.value if value is not None else None for value in columns[type_index]]
+                writer.write_table(pa.Table.from_arrays(
+                    [pa.array(values, type=field.type) for values, field in zip(columns, schema)],
+                    schema=schema
+                ))
+                rows += len(batch)
+                amount += sum(columns[amount_index], Decimal("0"))
+        if not rows:
+            temp_path.unlink()
+            return None
+        os.replace(temp_path, self.root / name)
+        return {
+            "file": name,
+            "rows": rows,
+            "amount": str(amount),
+            "sha256": hashlib.sha256((self.root / name).read_bytes()).hexdigest(),
+            "archived_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        }
+
+    def publish(self, year: int, entry: Optional[dict]) -> None:
+        """연도 항목을 추가하고 archived_through를 올린 manifest로 원자적 교체 (이 시점부터 읽기가 아카이브로)"""
+        current = self.manifest()
+        manifest = {**current, "archived_through": year, "years": dict(current["years"])}
+        if entry:
+            manifest["years"][str(year)] = entry
+        self._replace(manifest)
+
+    def _replace(self, manifest: dict) -> None:
+        """manifest를 임시 파일에 쓰고 rename으로 원자적 교체"""
+        self.root.mkdir(parents=True, exist_ok=True)
+        temp_path = self.root / f"{MANIFEST_FILE}.tmp"
+        temp_path.write_text(json.dumps(manifest, ensure_ascii=False, indent=2), encoding="utf-8")
+        os.replace(temp_path, self.manifest_path)
+        with self._lock:
+            self._manifest_key = None
+
+
+def to_rows(table, fields: Sequence[str]) -> list:
+    """Arrow 테이블/배치를 fields 순서의 행 튜플로 (type은 TransactionType으로)"""
+    fields = tuple(fields)
+    columns = {name: table.column(name).to_pylist() for name in fields}
+    if "type" in columns:
+        columns["type"] = [models.TransactionType(value) if value is not None else None for value in columns["type"]]
+    row_type = _row_type(fields)
+    return [row_type(*values) for values in zip(*(columns[name] for name in fields))]
+
+
+transaction_archive = TransactionArchive(settings.TRANSACTION_ARCHIVE_DIR)
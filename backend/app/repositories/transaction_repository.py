@@ -1,7 +1,24 @@
+import asyncio
+import re
+from collections import defaultdict, namedtuple
+from sqlalchemy import select, insert, update, delete, and_, or_, case, cast, extract, func, literal, literal_column, table, column, Integer
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List, Optional
-from datetime import date
-from app import models
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+from datetime import date, timedelta
+from decimal import Decimal
+from app import models, schemas
+from app.core.config import settings
+from app.repositories.projection import schema_columns
+from app.repositories.category_dictionary import intern_categories, intern_instance
+from app.repositories.transaction_archive import to_rows, transaction_archive
+
+TRANSACTION_COLUMNS = schema_columns(models.Transaction, schemas.Transaction)
+TRANSACTION_FIELDS = [column.key for column in TRANSACTION_COLUMNS]
+SEARCH_TERM = re.compile(r"\w+")
+PeriodTotal = namedtuple("PeriodTotal", ["bucket", "type", "amount", "transaction_count"])
 
 class TransactionRepository:
     def __init__(self, db: Session):
@@ -15,21 +32,74 @@ class TransactionRepository:
             query = query.filter(models.Transaction.transaction_date >= start_date)
         if end_date:
             query = query.filter(models.Transaction.transaction_date <= end_date)
-        return query.order_by(models.Transaction.transaction_date.desc()).limit(limit).all()
+        rows = hot_range(query, start_date).order_by(models.Transaction.transaction_date.desc()).limit(limit).all()
+        return fill_from_archive(rows, limit, account_id, start_date, end_date)
+    
+    def get_rows(self, account_id: Optional[int] = None, limit: int = 100, start_date: Optional[date] = None, end_date: Optional[date] = None) -> List[Row]:
+        """get_all의 읽기 전용 버전: 응답 컬럼만 Core select로 (ORM 엔티티 생성 없음)"""
+        rows = self.db.execute(
+            hot_range(filter_transactions(select(*TRANSACTION_COLUMNS), account_id, start_date, end_date), start_date)
+            .order_by(models.Transaction.transaction_date.desc())
+            .limit(limit)
+        ).all()
+        return fill_from_archive(rows, limit, account_id, start_date, end_date)
     
-    def get_by_id(self, transaction_id: int) -> Optional[models.Transaction]:
-        return self.db.query(models.Transaction).filter(
+    def get_page(
+        self,
+        account_id: Optional[int] = None,
+        limit: int = 100,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        after: Optional[Tuple[date, int]] = None
+    ) -> List[models.Transaction]:
+        """
+        (transaction_date, id) 내림차순 keyset 페이지 조회
+        OFFSET 없이 이전 페이지 마지막 키부터 인덱스 범위 스캔 → 깊이와 무관하게 동일 비용
+        limit + 1개를 조회해서 다음 페이지 존재 여부는 서비스에서 판단 (아카이브 구간은 파일에서 이어서)
+        """
+        query = hot_range(self.db.query(models.Transaction), start_date)
+        if account_id:
+            query = query.filter(models.Transaction.account_id == account_id)
+        if start_date:
+            query = query.filter(models.Transaction.transaction_date >= start_date)
+        if end_date:
+            query = query.filter(models.Transaction.transaction_date <= end_date)
+        if after:
+            after_date, after_id = after
+            query = query.filter(or_(
+                models.Transaction.transaction_date < after_date,
+                and_(
+                    models.Transaction.transaction_date == after_date,
+                    models.Transaction.id < after_id
+                )
+            ))
+        rows = query.order_by(
+            models.Transaction.transaction_date.desc(),
+            models.Transaction.id.desc()
+        ).limit(limit + 1).all()
+        return fill_from_archive(rows, limit + 1, account_id, start_date, end_date, after)
+    
+    def get_by_id(self, transaction_id: int, for_update: bool = False) -> Optional[models.Transaction]:
+        """for_update: 수정/삭제 시 행 잠금 (동시 수정으로 잔액 차이가 두 번 반영되는 것 방지)"""
+        query = self.db.query(models.Transaction).filter(
             models.Transaction.id == transaction_id
-        ).first()
+        )
+        if for_update:
+            query = query.with_for_update()
+        return query.first()
     
     def get_by_date_range(self, account_id: int, start_date: date, end_date: date) -> List[models.Transaction]:
-        return self.db.query(models.Transaction).filter(
+        rows = hot_range(self.db.query(models.Transaction), start_date).filter(
             models.Transaction.account_id == account_id,
             models.Transaction.transaction_date >= start_date,
             models.Transaction.transaction_date <= end_date
         ).all()
+        if transaction_archive.reaches(start_date):
+            rows += transaction_archive.rows(TRANSACTION_FIELDS, [account_id], start_date, end_date)
+        return rows
     
     def create(self, transaction_data: dict) -> models.Transaction:
+        intern_categories(self.db, [transaction_data])
         db_transaction = models.Transaction(**transaction_data)
         self.db.add(db_transaction)
         self.db.flush()
@@ -40,9 +110,464 @@ class TransactionRepository:
         for key, value in update_data.items():
             if value is not None:
                 setattr(transaction, key, value)
+        if update_data.get("category") is not None:
+            intern_instance(self.db, transaction)
         self.db.flush()
         return transaction
     
     def delete(self, transaction: models.Transaction) -> None:
         self.db.delete(transaction)
         self.db.flush()
+    
+    def stream_columns(
+        self,
+        columns: Sequence,
+        account_id: Optional[int] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        batch_size: int = 1000
+    ) -> Iterator[List[Row]]:
+        """
+        필요한 컬럼만 서버 사이드 커서로 배치 단위 스트리밍 (ORM 엔티티 생성 없음)
+        yield_per가 stream_results를 켜므로 전체 결과를 메모리에 올리지 않음
+        기간이 아카이브까지 닿으면 아카이브 파일(더 오래된 연도)을 먼저 같은 순서로 내보냄
+        """
+        if transaction_archive.reaches(start_date):
+            yield from transaction_archive.iter_batches(
+                [column.key for column in columns], [account_id] if account_id else None, start_date, end_date, batch_size
+            )
+        query = hot_range(select(*columns), start_date)
+        if account_id:
+            query = query.where(models.Transaction.account_id == account_id)
+        if start_date:
+            query = query.where(models.Transaction.transaction_date >= start_date)
+        if end_date:
+            query = query.where(models.Transaction.transaction_date <= end_date)
+        query = query.order_by(
+            models.Transaction.transaction_date,
+            models.Transaction.id
+        ).execution_options(yield_per=batch_size)
+        
+        result = self.db.execute(query)
+        try:
+            for partition in result.partitions():
+                yield partition
+        finally:
+            result.close()
+    
+    def stream_signed_amounts(
+        self,
+        account_ids: Sequence[int],
+        after_date: date,
+        batch_size: int = 50000
+    ) -> Iterator[List[Row]]:
+        """
+        after_date 이후 거래의 (account_id, transaction_date, 부호 있는 금액) 배치 스트리밍
+        수입 +, 지출 -, 이체 0 (잔액 변경 규칙과 동일), 아카이브 구간은 파일에서 먼저
+        """
+        first_date = after_date + timedelta(days=1)
+        if transaction_archive.reaches(first_date):
+            fields = ["account_id", "transaction_date", "type", "amount"]
+            for batch in transaction_archive.iter_batches(fields, account_ids, first_date, None, batch_size):
+                yield [
+                    (row.account_id, row.transaction_date, row.amount if row.type == models.TransactionType.income else -row.amount)
+                    for row in batch if row.type != models.TransactionType.transfer
+                ]
+        signed_amount = case(
+            (models.Transaction.type == models.TransactionType.income, models.Transaction.amount),
+            (models.Transaction.type == models.TransactionType.expense, -models.Transaction.amount),
+            else_=0
+        )
+        query = hot_range(select(
+            models.Transaction.account_id,
+            models.Transaction.transaction_date,
+            signed_amount
+        ), first_date).where(
+            models.Transaction.account_id.in_(account_ids),
+            models.Transaction.transaction_date > after_date,
+            models.Transaction.type != models.TransactionType.transfer
+        ).execution_options(yield_per=batch_size)
+
+        result = self.db.execute(query)
+        try:
+            for partition in result.partitions():
+                yield partition
+        finally:
+            result.close()
+
+    def bulk_create(self, rows: List[dict]) -> int:
+        """여러 거래를 multi-row INSERT 한 번으로 생성 (ORM 객체 생성 없음)"""
+        if not rows:
+            return 0
+        intern_categories(self.db, rows)
+        self.db.execute(insert(models.Transaction), rows)
+        return len(rows)
+
+    def search(
+        self,
+        terms: Sequence[str],
+        account_id: Optional[int] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        min_amount: Optional[Decimal] = None,
+        max_amount: Optional[Decimal] = None,
+        limit: int = 20,
+        after: Optional[Tuple[float, int]] = None
+    ) -> List[Row]:
+        """
+        설명/카테고리 전문 검색 (모든 단어 포함, 관련도 내림차순 → id 내림차순 keyset)
+        MySQL은 FULLTEXT(ngram) MATCH ... AGAINST, SQLite는 FTS5 bm25로 점수 계산 (높을수록 관련도 높음)
+        아카이브 구간은 연도 파일에서 찾아 관련도 0으로 합침
+        limit + 1개를 조회해서 다음 페이지 존재 여부는 서비스에서 판단
+        """
+        dialect = self.db.get_bind().dialect.name
+        if dialect == "mysql" and settings.TRANSACTION_PARTITIONING:
+            # 파티션 테이블은 FULLTEXT 인덱스를 지원하지 않음 → 모든 단어를 LIKE로 (관련도 없이 최신 id 순)
+            score = literal(0.0)
+            query = select(*TRANSACTION_COLUMNS, score.label("score")).where(*[
+                or_(models.Transaction.description.contains(term), models.Transaction.category.contains(term))
+                for term in terms
+            ])
+        elif dialect == "mysql":
+            score = match(
+                models.Transaction.description, models.Transaction.category,
+                against=" ".join(f'+"{term}"' for term in terms)
+            ).in_boolean_mode()
+            query = select(*TRANSACTION_COLUMNS, score.label("score")).where(score > 0)
+        elif dialect == "sqlite":
+            fts = table(models.TRANSACTION_SEARCH_TABLE, column("rowid"))
+            fts_table = literal_column(models.TRANSACTION_SEARCH_TABLE)
+            score = -func.bm25(fts_table)
+            query = (
+                select(*TRANSACTION_COLUMNS, score.label("score"))
+                .join_from(fts, models.Transaction, models.Transaction.id == fts.c.rowid)
+                .where(fts_table.op("MATCH")(" ".join(f'"{term}"*' for term in terms)))
+            )
+        else:
+            raise NotImplementedError(f"Full-text search is not supported on {dialect}")
+
+        query = hot_range(filter_transactions(query, account_id, start_date, end_date), start_date)
+        if min_amount is not None:
+            query = query.where(models.Transaction.amount >= min_amount)
+        if max_amount is not None:
+            query = query.where(models.Transaction.amount <= max_amount)
+        ranked = query.subquery()
+        query = select(ranked)
+        if after:
+            after_score, after_id = after
+            query = query.where(or_(
+                ranked.c.score < after_score,
+                and_(ranked.c.score == after_score, ranked.c.id < after_id)
+            ))
+        rows = self.db.execute(
+            query.order_by(ranked.c.score.desc(), ranked.c.id.desc()).limit(limit + 1)
+        ).all()
+        if not transaction_archive.reaches(start_date):
+            return rows
+        archived = archived_search(terms, account_id, start_date, end_date, min_amount, max_amount, limit + 1, after)
+        return sorted([*rows, *archived], key=lambda row: (row.score, row.id), reverse=True)[:limit + 1]
+
+    def get_period_totals(
+        self,
+        granularity: str,
+        origin: date,
+        start_date: date,
+        end_before: date,
+        user_id: int = 1,
+        account_id: Optional[int] = None
+    ) -> List[Row]:
+        """
+        [start_date, end_before) 거래를 구간 번호(origin부터 0, 1, ...)와 유형별로 합산 (GROUP BY 한 번)
+        날짜 조건은 컬럼을 그대로 비교하는 반열린 범위라 idx_account_date / idx_transaction_date 범위 스캔
+        아카이브 구간은 연도 파일을 (날짜, 유형)별로 먼저 합친 뒤 같은 구간 번호로 더함
+        """
+        rows = self.db.execute(hot_range(period_totals_query(
+            self.db.get_bind().dialect.name, granularity, origin, start_date, end_before, user_id, account_id
+        ), start_date)).all()
+        if not transaction_archive.reaches(start_date):
+            return rows
+        account_ids = [account_id] if account_id else list(
+            self.db.scalars(select(models.Account.id).where(models.Account.user_id == user_id))
+        )
+        totals = archived_period_totals(granularity, origin, start_date, end_before, account_ids)
+        for row in rows:
+            total = totals[(row.bucket, row.type)]
+            total[0] += row.amount
+            total[1] += row.transaction_count
+        return [PeriodTotal(bucket, type_, amount, count) for (bucket, type_), (amount, count) in totals.items()]
+
+    def get_first_date(self) -> Optional[date]:
+        return self.db.scalar(select(func.min(models.Transaction.transaction_date)))
+
+    def get_range_totals(self, start_date: date, end_before: date) -> Tuple[int, Decimal]:
+        """[start_date, end_before) 거래 건수와 금액 합계 (아카이브 검증용)"""
+        count, amount = self.db.execute(
+            select(func.count(models.Transaction.id), func.coalesce(func.sum(models.Transaction.amount), 0))
+            .where(models.Transaction.transaction_date >= start_date, models.Transaction.transaction_date < end_before)
+        ).one()
+        return count, Decimal(amount)
+
+    def get_rows_by_ids(self, transaction_ids: Sequence[int], for_update: bool = False) -> Dict[int, Row]:
+        """여러 거래를 한 번의 쿼리로 조회 (for_update: 일괄 수정/삭제 대상 행 잠금)"""
+        if not transaction_ids:
+            return {}
+        query = select(*TRANSACTION_COLUMNS).where(models.Transaction.id.in_(transaction_ids))
+        if for_update:
+            query = query.with_for_update()
+        return {row.id: row for row in self.db.execute(query)}
+
+    def create_many(self, rows: List[dict]) -> List[Row]:
+        """
+        여러 거래를 생성하고 입력 순서대로 생성된 행 반환
+        RETURNING을 지원하면 multi-row INSERT ... RETURNING 한 번, 아니면(MySQL) 행마다 INSERT 후 한 번에 재조회
+        """
+        if not rows:
+            return []
+        intern_categories(self.db, rows)
+        dialect = self.db.get_bind().dialect
+        if dialect.insert_executemany_returning_sort_by_parameter_order:
+            return self.db.execute(
+                insert(models.Transaction).returning(*TRANSACTION_COLUMNS, sort_by_parameter_order=True), rows
+            ).all()
+        ids = [self.db.execute(insert(models.Transaction).values(**row)).inserted_primary_key[0] for row in rows]
+        created = self.get_rows_by_ids(ids)
+        return [created[transaction_id] for transaction_id in ids]
+
+    def update_many(self, rows: List[dict]) -> None:
+        """PK("id")가 포함된 dict 목록으로 ORM bulk UPDATE (같은 컬럼 조합끼리 executemany)"""
+        if rows:
+            self.db.execute(update(models.Transaction), rows)
+
+    def delete_many(self, transaction_ids: Sequence[int]) -> None:
+        if transaction_ids:
+            self.db.execute(
+                delete(models.Transaction)
+                .where(models.Transaction.id.in_(transaction_ids))
+                .execution_options(synchronize_session=False)
+            )
+
+
+def search_terms(text: str) -> List[str]:
+    """검색어를 단어로 분리 (따옴표/연산자 등 전문 검색 문법 문자는 제거)"""
+    return SEARCH_TERM.findall(text)
+
+def days_since(origin: date, column, dialect: str):
+    """origin부터 column 날짜까지의 일수 (방언별 날짜 차이 함수)"""
+    if dialect == "mysql":
+        return func.datediff(column, origin)
+    if dialect == "sqlite":
+        return cast(func.julianday(column) - func.julianday(origin), Integer)
+    return column - origin
+
+def period_bucket(column, granularity: str, origin: date, dialect: str):
+    """
+    origin(첫 구간 시작일)부터 센 구간 번호 - SELECT/GROUP BY에서만 쓰고 WHERE에는 쓰지 않음
+    week는 월요일 시작 origin에서 7일 단위, quarter는 분기 첫 달 origin에서 3개월 단위
+    """
+    if granularity in ("day", "week"):
+        days = days_since(origin, column, dialect)
+        return days if granularity == "day" else days // 7
+    year = extract("year", column)
+    if granularity == "year":
+        return year - origin.year
+    months = year * 12 + extract("month", column) - (origin.year * 12 + origin.month)
+    return months if granularity == "month" else months // 3
+
+def period_totals_query(
+    dialect: str,
+    granularity: str,
+    origin: date,
+    start_date: date,
+    end_before: date,
+    user_id: int = 1,
+    account_id: Optional[int] = None
+):
+    tx = models.Transaction
+    bucket = period_bucket(tx.transaction_date, granularity, origin, dialect).label("bucket")
+    query = (
+        select(bucket, tx.type, func.sum(tx.amount).label("amount"), func.count(tx.id).label("transaction_count"))
+        .where(tx.transaction_date >= start_date, tx.transaction_date < end_before)
+        .group_by(bucket, tx.type)
+    )
+    if account_id:
+        return query.where(tx.account_id == account_id)
+    return query.join(models.Account, and_(models.Account.id == tx.account_id, models.Account.user_id == user_id))
+
+def bucket_index(day: date, granularity: str, origin: date) -> int:
+    """period_bucket의 파이썬 버전 (아카이브 행용)"""
+    if granularity in ("day", "week"):
+        days = (day - origin).days
+        return days if granularity == "day" else days // 7
+    if granularity == "year":
+        return day.year - origin.year
+    months = day.year * 12 + day.month - (origin.year * 12 + origin.month)
+    return months if granularity == "month" else months // 3
+
+def archived_period_totals(
+    granularity: str,
+    origin: date,
+    start_date: date,
+    end_before: date,
+    account_ids: Sequence[int]
+) -> Dict[Tuple[int, models.TransactionType], list]:
+    """아카이브 연도 파일을 (날짜, 유형)별로 Arrow에서 합친 뒤 구간 번호별로 모음 (하루 단위라 파이썬 루프는 연 366회 이하)"""
+    totals = defaultdict(lambda: [Decimal("0"), 0])
+    for archived in transaction_archive.iter_tables(
+        ["transaction_date", "type", "amount"], account_ids, start_date, end_before - timedelta(days=1), ordered=False
+    ):
+        daily = archived.group_by(["transaction_date", "type"]).aggregate([("amount", "sum"), ("amount", "count")])
+        for row in daily.to_pylist():
+            total = totals[(bucket_index(row["transaction_date"], granularity, origin), models.TransactionType(row["type"]))]
+            total[0] += row["amount_sum"]
+            total[1] += row["amount_count"]
+    return totals
+
+def archived_search(
+    terms: Sequence[str],
+    account_id: Optional[int],
+    start_date: Optional[date],
+    end_date: Optional[date],
+    min_amount: Optional[Decimal],
+    max_amount: Optional[Decimal],
+    limit: int,
+    after: Optional[Tuple[float, int]] = None
+) -> list:
+    """
+    아카이브 연도 파일에서 모든 단어를 설명/카테고리에 포함하는 거래 (대소문자 무시 부분 일치, 관련도 0 → id 내림차순)
+    파일에는 전문 인덱스가 없어 파티션 테이블의 LIKE 검색처럼 Arrow에서 거르고, 연도마다 limit개만 행으로 변환
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    if after and after[0] < 0:
+        return []
+    result = []
+    for archived in transaction_archive.iter_tables(
+        TRANSACTION_FIELDS, [account_id] if account_id else None, start_date, end_date, ordered=False
+    ):
+        conditions = [
+            pc.or_kleene(
+                pc.match_substring(archived.column("description"), term, ignore_case=True),
+                pc.match_substring(archived.column("category"), term, ignore_case=True)
+            )
+            for term in terms
+        ]
+        if min_amount is not None:
+            conditions.append(pc.greater_equal(archived.column("amount"), min_amount))
+        if max_amount is not None:
+            conditions.append(pc.less_equal(archived.column("amount"), max_amount))
+        if after and after[0] == 0:
+            conditions.append(pc.less(archived.column("id"), after[1]))
+        mask = conditions[0]
+        for condition in conditions[1:]:
+            mask = pc.and_kleene(mask, condition)
+        archived = archived.filter(mask).sort_by([("id", "descending")]).slice(0, limit)
+        archived = archived.append_column("score", pa.array([0.0] * archived.num_rows, type=pa.float64()))
+        result.extend(to_rows(archived, [*TRANSACTION_FIELDS, "score"]))
+    return sorted(result, key=lambda row: row.id, reverse=True)[:limit]
+
+def hot_range(query, start_date: Optional[date]):
+    """조회 기간이 아카이브 경계일 앞까지 닿으면 핫 테이블은 경계일부터만 (앞쪽은 아카이브 파일에서)"""
+    boundary = transaction_archive.boundary()
+    if boundary is not None and (start_date is None or start_date < boundary):
+        return query.where(models.Transaction.transaction_date >= boundary)
+    return query
+
+def fill_from_archive(
+    rows: list,
+    limit: int,
+    account_id: Optional[int],
+    start_date: Optional[date],
+    end_date: Optional[date],
+    after: Optional[Tuple[date, int]] = None
+) -> list:
+    """
+    핫 테이블 결과(최신순)가 limit보다 적고 기간이 아카이브까지 닿으면 아카이브에서 최신순으로 이어서 채움
+    아카이브 행은 모두 경계일 이전이라 핫 테이블 행 뒤에 그대로 붙음
+    """
+    if len(rows) >= limit or not transaction_archive.reaches(start_date):
+        return rows
+    if after and (end_date is None or after[0] < end_date):
+        end_date = after[0]
+    return list(rows) + transaction_archive.rows(
+        TRANSACTION_FIELDS, [account_id] if account_id else None, start_date, end_date,
+        descending=True, before=after, limit=limit - len(rows)
+    )
+
+def filter_transactions(query, account_id: Optional[int], start_date: Optional[date], end_date: Optional[date]):
+    if account_id:
+        query = query.where(models.Transaction.account_id == account_id)
+    if start_date:
+        query = query.where(models.Transaction.transaction_date >= start_date)
+    if end_date:
+        query = query.where(models.Transaction.transaction_date <= end_date)
+    return query
+
+async def async_fill_from_archive(rows: list, limit: int, account_id: Optional[int], start_date: Optional[date], end_date: Optional[date]) -> list:
+    """fill_from_archive를 이벤트 루프 밖 스레드에서 (Parquet 읽기는 블로킹 I/O)"""
+    if len(rows) >= limit or not transaction_archive.reaches(start_date):
+        return rows
+    return await asyncio.to_thread(fill_from_archive, rows, limit, account_id, start_date, end_date)
+
+
+class AsyncTransactionRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+    
+    async def get_all(self, account_id: Optional[int] = None, limit: int = 100, start_date: Optional[date] = None, end_date: Optional[date] = None) -> List[models.Transaction]:
+        query = select(models.Transaction)
+        if account_id:
+            query = query.where(models.Transaction.account_id == account_id)
+        if start_date:
+            query = query.where(models.Transaction.transaction_date >= start_date)
+        if end_date:
+            query = query.where(models.Transaction.transaction_date <= end_date)
+        result = await self.db.execute(
+            hot_range(query, start_date).order_by(models.Transaction.transaction_date.desc()).limit(limit)
+        )
+        return await async_fill_from_archive(list(result.scalars().all()), limit, account_id, start_date, end_date)
+    
+    async def get_rows(self, account_id: Optional[int] = None, limit: int = 100, start_date: Optional[date] = None, end_date: Optional[date] = None) -> List[Row]:
+        """get_all의 읽기 전용 버전"""
+        result = await self.db.execute(
+            hot_range(filter_transactions(select(*TRANSACTION_COLUMNS), account_id, start_date, end_date), start_date)
+            .order_by(models.Transaction.transaction_date.desc())
+            .limit(limit)
+        )
+        return await async_fill_from_archive(list(result.all()), limit, account_id, start_date, end_date)
+    
+    async def get_by_id(self, transaction_id: int, for_update: bool = False) -> Optional[models.Transaction]:
+        return await self.db.get(models.Transaction, transaction_id, with_for_update=for_update)
+    
+    async def get_by_date_range(self, account_id: int, start_date: date, end_date: date) -> List[models.Transaction]:
+        result = await self.db.execute(
+            hot_range(select(models.Transaction), start_date).where(
+                models.Transaction.account_id == account_id,
+                models.Transaction.transaction_date >= start_date,
+                models.Transaction.transaction_date <= end_date
+            )
+        )
+        rows = list(result.scalars().all())
+        if transaction_archive.reaches(start_date):
+            rows += await asyncio.to_thread(transaction_archive.rows, TRANSACTION_FIELDS, [account_id], start_date, end_date)
+        return rows
+    
+    async def create(self, transaction_data: dict) -> models.Transaction:
+        await self.db.run_sync(lambda session: intern_categories(session, [transaction_data]))
+        db_transaction = models.Transaction(**transaction_data)
+        self.db.add(db_transaction)
+        await self.db.flush()
+        return db_transaction
+    
+    async def update(self, transaction: models.Transaction, update_data: dict) -> models.Transaction:
+        for key, value in update_data.items():
+            if value is not None:
+                setattr(transaction, key, value)
+        if update_data.get("category") is not None:
+            await self.db.run_sync(lambda session: intern_instance(session, transaction))
+        await self.db.flush()
+        return transaction
+    
+    async def delete(self, transaction: models.Transaction) -> None:
+        await self.db.delete(transaction)
+        await self.db.flush()
@@ -1,7 +1,7 @@
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 from decimal import Decimal
 from datetime import date, datetime
-from typing import Optional, List
+from typing import Literal, Optional, List
 from app.models import AccountType, TransactionType, Frequency, CategoryType
 
 # Category Schemas
@@ -14,12 +14,79 @@ class CategoryBase(BaseModel):
 class CategoryCreate(CategoryBase):
     pass
 
+class CategoryUpdate(BaseModel):
+    name: Optional[str] = None
+    is_fixed: Optional[bool] = None
+    parent_id: Optional[int] = None  # 변경 시 하위 카테고리도 함께 이동 (null이면 최상위로)
+
 class Category(CategoryBase):
     id: int
     user_id: int
     
     model_config = ConfigDict(from_attributes=True)
 
+class CategoryRollup(BaseModel):
+    id: int
+    name: str
+    type: CategoryType
+    parent_id: Optional[int] = None
+    own_amount: Decimal  # 이 카테고리에 직접 기록된 거래 합계
+    own_count: int
+    total_amount: Decimal  # 모든 하위 카테고리 포함 합계
+    transaction_count: int
+
+# Budget Schemas
+class BudgetBase(BaseModel):
+    category_id: int
+    monthly_limit: Optional[Decimal] = None
+
+class BudgetCreate(BudgetBase):
+    monthly_limit: Decimal = Field(..., gt=0)
+
+class BudgetUpdate(BaseModel):
+    monthly_limit: Optional[Decimal] = Field(None, gt=0)
+
+class Budget(BudgetBase):
+    id: int
+    user_id: int
+
+    model_config = ConfigDict(from_attributes=True)
+
+class BudgetStatus(BaseModel):
+    budget_id: int
+    category_id: int
+    category_name: str
+    monthly_limit: Optional[Decimal] = None
+    spent: Decimal  # 하위 카테고리 포함 이번 달 지출
+    transaction_count: int
+    remaining: Optional[Decimal] = None
+    utilization: Optional[float] = None  # spent / monthly_limit
+    projected_spend: Decimal  # 지금까지의 일평균으로 추정한 월말 지출
+    projected_utilization: Optional[float] = None
+    status: Literal["ok", "warning", "projected_over", "over"]
+
+class BudgetReport(BaseModel):
+    as_of: date
+    period_start: date
+    period_end: date
+    days_elapsed: int
+    days_in_period: int
+    total_limit: Decimal  # 예산별 값의 합 (상위/하위 카테고리에 모두 예산이 있으면 겹쳐서 더해짐)
+    total_spent: Decimal
+    total_projected: Decimal
+    budgets: List[BudgetStatus]
+
+class BudgetProjection(BaseModel):
+    budget_id: int
+    category_id: int
+    category_name: str
+    monthly_limit: Optional[Decimal] = None
+    spent: Decimal
+    daily_rate: Decimal
+    projected_spend: Decimal
+    projected_remaining: Optional[Decimal] = None
+    exhaust_date: Optional[date] = None  # 현재 속도로 예산을 다 쓰는 날 (이번 달 안일 때만)
+
 # Account Schemas
 class AccountBase(BaseModel):
     name: str
@@ -65,11 +132,57 @@ class TransactionUpdate(BaseModel):
 
 class Transaction(TransactionBase):
     id: int
+    category_id: Optional[int] = None  # 인터닝된 카테고리 (카테고리명은 category 그대로)
     is_recurring: bool
     created_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
 
+class TransactionPage(BaseModel):
+    items: List[Transaction]
+    next_cursor: Optional[str] = None
+
+class TransactionSearchHit(Transaction):
+    score: float  # 관련도 (높을수록 관련도 높음, 방언별 척도가 다름)
+
+class TransactionSearchPage(BaseModel):
+    items: List[TransactionSearchHit]
+    next_cursor: Optional[str] = None
+
+class TransactionImportResult(BaseModel):
+    imported: int
+    skipped: int
+    chunks: int
+    elapsed_seconds: float
+    rows_per_second: float
+    errors: List[str] = []
+
+class TransactionBatchOperation(BaseModel):
+    op: Literal["create", "update", "delete"]
+    id: Optional[int] = None  # update/delete 대상 거래 ID
+    transaction: Optional[TransactionCreate] = None  # create
+    changes: Optional[TransactionUpdate] = None  # update
+
+class TransactionBatchRequest(BaseModel):
+    # atomic: 하나라도 실패하면 전체 미반영 / best_effort: 유효한 항목만 반영
+    mode: Literal["atomic", "best_effort"] = "atomic"
+    operations: List[TransactionBatchOperation] = Field(..., min_length=1, max_length=1000)
+
+class TransactionBatchItemResult(BaseModel):
+    index: int
+    op: str
+    status: Literal["ok", "error", "skipped"]  # skipped: atomic 모드에서 다른 항목 실패로 미반영
+    id: Optional[int] = None
+    transaction: Optional[Transaction] = None
+    error: Optional[str] = None
+
+class TransactionBatchResult(BaseModel):
+    mode: str
+    committed: bool
+    succeeded: int
+    failed: int
+    results: List[TransactionBatchItemResult]
+
 # Recurring Transaction Schemas
 class RecurringTransactionBase(BaseModel):
     account_id: int
@@ -99,7 +212,9 @@ class RecurringTransactionUpdate(BaseModel):
 
 class RecurringTransaction(RecurringTransactionBase):
     id: int
+    category_id: Optional[int] = None
     is_active: bool
+    next_run_date: Optional[date] = None
     created_at: datetime
     updated_at: datetime
 
@@ -115,6 +230,29 @@ class MonthlyExpense(BaseModel):
     amount: Decimal
     is_fixed: bool
 
+class PeriodBucket(BaseModel):
+    period_start: date
+    period_end: date  # 포함 (요청 범위에 맞춰 잘린 구간일 수 있음)
+    income: Decimal
+    expense: Decimal
+    net: Decimal
+    transaction_count: int
+
+class PeriodSummary(BaseModel):
+    granularity: Literal["day", "week", "month", "quarter", "year"]
+    start_date: date
+    end_date: date
+    account_id: Optional[int] = None
+    buckets: List[PeriodBucket]  # 거래가 없는 구간도 0으로 포함
+
+class SnapshotResult(BaseModel):
+    snapshot_date: date
+    users: int
+    created: int
+    updated: int
+    skipped: int
+    elapsed_seconds: float
+
 class Summary(BaseModel):
     total_assets: Decimal
     net_worth: Decimal
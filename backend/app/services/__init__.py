@@ -1,11 +1,27 @@
-from app.services.account_service import AccountService
-from app.services.transaction_service import TransactionService
-from app.services.recurring_service import RecurringTransactionService
-from app.services.summary_service import SummaryService
+from app.services.account_service import AccountService, AsyncAccountService
+from app.services.transaction_service import TransactionService, AsyncTransactionService
+from app.services.recurring_service import RecurringTransactionService, AsyncRecurringTransactionService
+from app.services.summary_service import SummaryService, AsyncSummaryService
+from app.services.import_service import TransactionImportService
+from app.services.transaction_batch_service import TransactionBatchService
+from app.services.export_service import TransactionExportService
+from app.services.snapshot_service import SnapshotService
+from app.services.category_service import CategoryService
+from app.services.budget_service import BudgetService
 
 __all__ = [
     "AccountService",
     "TransactionService",
     "RecurringTransactionService",
-    "SummaryService"
+    "SummaryService",
+    "TransactionImportService",
+    "TransactionBatchService",
+    "TransactionExportService",
+    "SnapshotService",
+    "CategoryService",
+    "BudgetService",
+    "AsyncAccountService",
+    "AsyncTransactionService",
+    "AsyncRecurringTransactionService",
+    "AsyncSummaryService"
 ]
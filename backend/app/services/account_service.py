@@ -1,9 +1,12 @@
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from decimal import Decimal
 from app import schemas, models
-from app.repositories.account_repository import AccountRepository
+from app.repositories.account_repository import AccountRepository, AsyncAccountRepository
 from app.core.exceptions import AccountNotFoundError, InsufficientBalanceError
+from app.core.cache import mark_summary_dirty
 
 class AccountService:
     def __init__(self, db: Session):
@@ -11,9 +14,13 @@ class AccountService:
         self.repo = AccountRepository(db)
     
     def get_all_accounts(self, user_id: int = 1) -> List[schemas.Account]:
-        accounts = self.repo.get_all(user_id)
+        accounts = self.repo.get_rows(user_id)
         return [schemas.Account.model_validate(acc) for acc in accounts]
     
+    def get_account_rows(self, user_id: int = 1) -> List[Row]:
+        """응답 직렬화용 원본 행 (검증은 응답 단계에서 한 번만)"""
+        return self.repo.get_rows(user_id)
+    
     def get_account(self, account_id: int) -> schemas.Account:
         account = self.repo.get_by_id(account_id)
         if not account:
@@ -25,6 +32,7 @@ class AccountService:
         account_data['user_id'] = user_id
         
         db_account = self.repo.create(account_data)
+        mark_summary_dirty(self.db, user_id)
         self.db.commit()
         self.db.refresh(db_account)
         
@@ -37,6 +45,7 @@ class AccountService:
         
         update_data = account_update.model_dump(exclude_unset=True)
         updated_account = self.repo.update(db_account, update_data)
+        mark_summary_dirty(self.db, db_account.user_id)
         
         self.db.commit()
         self.db.refresh(updated_account)
@@ -53,6 +62,7 @@ class AccountService:
             raise InsufficientBalanceError("Cannot delete account with non-zero balance")
         
         self.repo.delete(db_account)
+        mark_summary_dirty(self.db, db_account.user_id)
         self.db.commit()
         return True
     
@@ -62,20 +72,99 @@ class AccountService:
         if not db_account:
             raise AccountNotFoundError(f"Account {account_id} not found")
         
+        # 잔액 검사와 차감을 UPDATE 한 문장으로 (동시 요청에서도 음수 잔액/갱신 유실 없음)
         if operation == "add":
-            db_account.balance += amount
+            self.repo.update_balance(account_id, amount)
         elif operation == "subtract":
-            if db_account.balance < amount:
+            if not self.repo.update_balance(account_id, -amount, require_sufficient=True):
                 raise InsufficientBalanceError("Insufficient balance")
-            db_account.balance -= amount
         
-        self.db.flush()
         return schemas.Account.model_validate(db_account)
 
     def calculate_net_worth(self, user_id: int = 1) -> Decimal:
         """순자산 계산 (모든 계좌 잔액 합계)"""
-        accounts = self.repo.get_all(user_id)
+        accounts = self.repo.get_rows(user_id)
         total_assets = sum(acc.balance for acc in accounts)
         # 추후 부채(Liabilities)가 추가되면 여기서 차감
         return total_assets
 
+
+class AsyncAccountService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.repo = AsyncAccountRepository(db)
+    
+    async def get_all_accounts(self, user_id: int = 1) -> List[schemas.Account]:
+        accounts = await self.repo.get_rows(user_id)
+        return [schemas.Account.model_validate(acc) for acc in accounts]
+    
+    async def get_account_rows(self, user_id: int = 1) -> List[Row]:
+        """응답 직렬화용 원본 행 (검증은 응답 단계에서 한 번만)"""
+        return await self.repo.get_rows(user_id)
+    
+    async def get_account(self, account_id: int) -> schemas.Account:
+        account = await self.repo.get_by_id(account_id)
+        if not account:
+            raise AccountNotFoundError(f"Account {account_id} not found")
+        return schemas.Account.model_validate(account)
+    
+    async def create_account(self, account: schemas.AccountCreate, user_id: int = 1) -> schemas.Account:
+        account_data = account.model_dump()
+        account_data['user_id'] = user_id
+        
+        db_account = await self.repo.create(account_data)
+        mark_summary_dirty(self.db, user_id)
+        await self.db.commit()
+        await self.db.refresh(db_account)
+        
+        return schemas.Account.model_validate(db_account)
+    
+    async def update_account(self, account_id: int, account_update: schemas.AccountUpdate) -> schemas.Account:
+        db_account = await self.repo.get_by_id(account_id)
+        if not db_account:
+            raise AccountNotFoundError(f"Account {account_id} not found")
+        
+        update_data = account_update.model_dump(exclude_unset=True)
+        updated_account = await self.repo.update(db_account, update_data)
+        mark_summary_dirty(self.db, db_account.user_id)
+        
+        await self.db.commit()
+        await self.db.refresh(updated_account)
+        
+        return schemas.Account.model_validate(updated_account)
+    
+    async def delete_account(self, account_id: int) -> bool:
+        db_account = await self.repo.get_by_id(account_id)
+        if not db_account:
+            raise AccountNotFoundError(f"Account {account_id} not found")
+        
+        # 비즈니스 로직: 잔액이 0이 아니면 삭제 불가
+        if db_account.balance != 0:
+            raise InsufficientBalanceError("Cannot delete account with non-zero balance")
+        
+        await self.repo.delete(db_account)
+        mark_summary_dirty(self.db, db_account.user_id)
+        await self.db.commit()
+        return True
+    
+    async def adjust_balance(self, account_id: int, amount: Decimal, operation: str) -> schemas.Account:
+        """계좌 잔액 조정 (내부 사용)"""
+        db_account = await self.repo.get_by_id(account_id)
+        if not db_account:
+            raise AccountNotFoundError(f"Account {account_id} not found")
+        
+        # 잔액 검사와 차감을 UPDATE 한 문장으로 (동시 요청에서도 음수 잔액/갱신 유실 없음)
+        if operation == "add":
+            await self.repo.update_balance(account_id, amount)
+        elif operation == "subtract":
+            if not await self.repo.update_balance(account_id, -amount, require_sufficient=True):
+                raise InsufficientBalanceError("Insufficient balance")
+        
+        # onupdate 컬럼은 flush 후 만료되므로 명시적으로 다시 읽음 (async는 lazy load 불가)
+        await self.db.refresh(db_account)
+        return schemas.Account.model_validate(db_account)
+
+    async def calculate_net_worth(self, user_id: int = 1) -> Decimal:
+        """순자산 계산 (모든 계좌 잔액 합계)"""
+        accounts = await self.repo.get_rows(user_id)
+        return sum(acc.balance for acc in accounts)
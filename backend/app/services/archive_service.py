@@ -0,0 +1,98 @@
+from datetime import date
+from decimal import Decimal
+from typing import Optional
+from sqlalchemy.orm import Session
+from app import models
+from app.core.config import settings
+from app.core.exceptions import InvalidTransactionError
+from app.repositories.transaction_repository import TransactionRepository
+from app.repositories.transaction_archive import ARCHIVE_COLUMNS, transaction_archive
+
+ARCHIVE_BATCH_SIZE = 10_000
+CENT = Decimal("0.01")
+
+
+def closed_through(today: Optional[date] = None) -> int:
+    """아카이브할 수 있는 마지막 연도 (최근 TRANSACTION_HOT_YEARS개 연도는 핫 테이블에 유지)"""
+    return (today or date.today()).year - settings.TRANSACTION_HOT_YEARS
+
+
+class TransactionArchiveService:
+    def __init__(self, db: Session):
+        self.db = db
+        self.transaction_repo = TransactionRepository(db)
+
+    def archive_closed_years(self, through_year: Optional[int] = None, today: Optional[date] = None) -> dict:
+        """
+        마감된 연도를 오래된 순으로 연도별 Parquet 파일로 옮기고 핫 테이블에서 삭제 (재실행 가능)
+        연도마다: 쓰기 차단 → 파일 기록 → 건수/합계 검증 → manifest 갱신(이때부터 읽기가 파일로) → 기록된 id만 핫 테이블에서 정리
+        """
+        limit = closed_through(today)
+        through_year = limit if through_year is None else through_year
+        if through_year > limit:
+            raise InvalidTransactionError(
+                f"Year {through_year} is not closed yet (the last {settings.TRANSACTION_HOT_YEARS} years stay hot)"
+            )
+
+        boundary = transaction_archive.boundary()
+        if boundary is not None:
+            # 이전 실행이 정리 도중 멈췄으면 마저 삭제
+            self._purge(boundary.year - 1)
+            first_year = boundary.year
+        else:
+            first_date = self.transaction_repo.get_first_date()
+            first_year = first_date.year if first_date else through_year + 1
+
+        archived, rows = [], 0
+        for year in range(first_year, through_year + 1):
+            start_date, end_before = date(year, 1, 1), date(year + 1, 1, 1)
+            # 기록 전에 이 연도 쓰기를 막음 (기록 이후 들어온 거래가 정리 때 함께 지워지지 않도록)
+            transaction_archive.fence(year)
+            expected = self.transaction_repo.get_range_totals(start_date, end_before)
+            entry = transaction_archive.write_year(year, self.transaction_repo.stream_columns(
+                ARCHIVE_COLUMNS, start_date=start_date, end_date=date(year, 12, 31), batch_size=ARCHIVE_BATCH_SIZE
+            ))
+            written = (entry["rows"], Decimal(entry["amount"])) if entry else (0, Decimal("0"))
+            if (written[0], written[1].quantize(CENT)) != (expected[0], expected[1].quantize(CENT)):
+                if entry:
+                    (transaction_archive.root / entry["file"]).unlink()
+                transaction_archive.fence(None)
+                raise InvalidTransactionError(
+                    f"Archive of {year} does not match the ledger ({written[0]} rows / {written[1]} "
+                    f"vs {expected[0]} rows / {expected[1]})"
+                )
+            transaction_archive.publish(year, entry)
+            self._purge(year)
+            archived.append(year)
+            rows += written[0]
+
+        if settings.TRANSACTION_PARTITIONING and self.db.get_bind().dialect.name == "mysql":
+            models.partition_transactions(self.db.connection(), (today or date.today()).year + 1)
+        return {"years": archived, "rows": rows}
+
+    def _purge(self, year: int) -> None:
+        """
+        아카이브 파일에 기록된 거래 id만 핫 테이블에서 배치 DELETE (핫 테이블 행이 모두 기록됐으면 파티션은 TRUNCATE PARTITION)
+        쓰기 차단 전에 시작된 트랜잭션이 기록 후 commit한 행은 지우지 않고 남겨 두고 알림
+        """
+        entry = transaction_archive.manifest()["years"].get(str(year))
+        start_date, end_before = date(year, 1, 1), date(year + 1, 1, 1)
+        remaining = self.transaction_repo.get_range_totals(start_date, end_before)[0]
+        truncated = (
+            settings.TRANSACTION_PARTITIONING and remaining == (entry["rows"] if entry else 0)
+            and models.truncate_transaction_partition(self.db.connection(), year)
+        )
+        if entry and not truncated:
+            for batch in transaction_archive.iter_batches(
+                ["id"], start_date=start_date, end_date=date(year, 12, 31), batch_size=ARCHIVE_BATCH_SIZE
+            ):
+                self.transaction_repo.delete_many([row.id for row in batch])
+                self.db.commit()
+        self.db.commit()
+
+        leftover = self.transaction_repo.get_range_totals(start_date, end_before)[0]
+        if leftover:
+            raise InvalidTransactionError(
+                f"{leftover} transactions were written to {year} while it was being archived "
+                f"and are kept in the hot table"
+            )
@@ -0,0 +1,170 @@
+import calendar
+import math
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from datetime import date, timedelta
+from decimal import Decimal, ROUND_HALF_UP
+from app import schemas, models
+from app.repositories.budget_repository import BudgetRepository
+from app.repositories.category_repository import CategoryRepository
+from app.core.config import settings
+from app.core.exceptions import BudgetNotFoundError, CategoryNotFoundError, InvalidBudgetError
+from app.core.cache import summary_cache, mark_summary_dirty
+
+CENT = Decimal("0.01")
+
+# 알림 정렬 순서 (심각한 것부터)
+ALERT_SEVERITY = {"over": 0, "projected_over": 1, "warning": 2}
+
+def budget_status(spent: Decimal, projected: Decimal, limit: Optional[Decimal], threshold: float) -> str:
+    """사용액/월말 예상액으로 예산 상태 판정"""
+    if not limit:
+        return "ok"
+    if spent > limit:
+        return "over"
+    if projected > limit:
+        return "projected_over"
+    if spent >= limit * Decimal(str(threshold)):
+        return "warning"
+    return "ok"
+
+def ratio(amount: Decimal, limit: Optional[Decimal]) -> Optional[float]:
+    return round(float(amount / limit), 4) if limit else None
+
+class BudgetService:
+    def __init__(self, db: Session):
+        self.db = db
+        self.repo = BudgetRepository(db)
+        self.category_repo = CategoryRepository(db)
+
+    def get_budgets(self, user_id: int = 1) -> List[schemas.Budget]:
+        return [schemas.Budget.model_validate(budget) for budget in self.repo.get_all(user_id)]
+
+    def create_budget(self, budget: schemas.BudgetCreate, user_id: int = 1) -> schemas.Budget:
+        """지출 카테고리에 월 예산 설정 (카테고리당 하나)"""
+        category = self.category_repo.get_by_id(budget.category_id)
+        if not category or category.user_id != user_id:
+            raise CategoryNotFoundError(f"Category {budget.category_id} not found")
+        if category.type != models.CategoryType.expense:
+            raise InvalidBudgetError("Budgets can only be set on expense categories")
+        if self.repo.get_by_category(user_id, budget.category_id):
+            raise InvalidBudgetError(f"Category {budget.category_id} already has a budget")
+
+        budget_data = budget.model_dump()
+        budget_data['user_id'] = user_id
+        db_budget = self.repo.create(budget_data)
+        mark_summary_dirty(self.db, user_id)
+        self.db.commit()
+        self.db.refresh(db_budget)
+        return schemas.Budget.model_validate(db_budget)
+
+    def update_budget(self, budget_id: int, budget_update: schemas.BudgetUpdate) -> schemas.Budget:
+        db_budget = self._get(budget_id)
+        update_data = budget_update.model_dump(exclude_unset=True, exclude_none=True)
+        updated_budget = self.repo.update(db_budget, update_data)
+        mark_summary_dirty(self.db, db_budget.user_id)
+        self.db.commit()
+        self.db.refresh(updated_budget)
+        return schemas.Budget.model_validate(updated_budget)
+
+    def delete_budget(self, budget_id: int) -> bool:
+        db_budget = self._get(budget_id)
+        user_id = db_budget.user_id
+        self.repo.delete(db_budget)
+        mark_summary_dirty(self.db, user_id)
+        self.db.commit()
+        return True
+
+    def get_utilization(self, as_of: Optional[date] = None, user_id: int = 1) -> schemas.BudgetReport:
+        """
+        as_of가 속한 달의 예산별 사용률과 월말 예상 지출
+        거래 쓰기 때 갱신되는 월별 합계로 모든 예산을 쿼리 한 번에 계산하고, 거래가 바뀌면 캐시 무효화
+        """
+        as_of = as_of or date.today()
+        return summary_cache.get_or_compute(
+            user_id, "budget_utilization", lambda: self._build_report(user_id, as_of), as_of, db=self.db
+        )
+
+    def get_alerts(
+        self,
+        as_of: Optional[date] = None,
+        threshold: Optional[float] = None,
+        user_id: int = 1
+    ) -> List[schemas.BudgetStatus]:
+        """초과, 월말 예상 초과, 경고 비율 이상인 예산 (심각한 순)"""
+        threshold = settings.BUDGET_ALERT_THRESHOLD if threshold is None else threshold
+        alerts = []
+        for item in self.get_utilization(as_of, user_id).budgets:
+            item_status = budget_status(item.spent, item.projected_spend, item.monthly_limit, threshold)
+            if item_status != "ok":
+                alerts.append(item.model_copy(update={"status": item_status}))
+        alerts.sort(key=lambda item: (ALERT_SEVERITY[item.status], -(item.projected_utilization or 0)))
+        return alerts
+
+    def get_projection(self, as_of: Optional[date] = None, user_id: int = 1) -> List[schemas.BudgetProjection]:
+        """예산별 일평균 지출, 월말 예상 지출, 현재 속도로 예산이 소진되는 날짜"""
+        report = self.get_utilization(as_of, user_id)
+        projections = []
+        for item in report.budgets:
+            daily_rate = (item.spent / report.days_elapsed).quantize(CENT, ROUND_HALF_UP)
+            exhaust_date = None
+            if item.monthly_limit and daily_rate > 0 and item.spent <= item.monthly_limit:
+                days_to_exhaust = math.ceil(item.monthly_limit / (item.spent / report.days_elapsed))
+                candidate = report.period_start + timedelta(days=days_to_exhaust - 1)
+                exhaust_date = candidate if candidate <= report.period_end else None
+            projections.append(schemas.BudgetProjection(
+                budget_id=item.budget_id,
+                category_id=item.category_id,
+                category_name=item.category_name,
+                monthly_limit=item.monthly_limit,
+                spent=item.spent,
+                daily_rate=daily_rate,
+                projected_spend=item.projected_spend,
+                projected_remaining=item.monthly_limit - item.projected_spend if item.monthly_limit else None,
+                exhaust_date=exhaust_date
+            ))
+        return projections
+
+    def _build_report(self, user_id: int, as_of: date) -> schemas.BudgetReport:
+        period_start = as_of.replace(day=1)
+        days_in_period = calendar.monthrange(as_of.year, as_of.month)[1]
+        period_end = as_of.replace(day=days_in_period)
+        days_elapsed = as_of.day
+
+        budgets = []
+        for row in self.repo.get_month_spend(user_id, as_of.year, as_of.month):
+            limit = row.monthly_limit
+            spent = Decimal(row.spent)
+            # 남은 날짜도 지금까지의 일평균으로 쓴다고 보고 월말 지출 추정
+            projected = (spent * days_in_period / days_elapsed).quantize(CENT, ROUND_HALF_UP)
+            budgets.append(schemas.BudgetStatus(
+                budget_id=row.id,
+                category_id=row.category_id,
+                category_name=row.category_name,
+                monthly_limit=limit,
+                spent=spent,
+                transaction_count=row.transaction_count,
+                remaining=limit - spent if limit else None,
+                utilization=ratio(spent, limit),
+                projected_spend=projected,
+                projected_utilization=ratio(projected, limit),
+                status=budget_status(spent, projected, limit, settings.BUDGET_ALERT_THRESHOLD)
+            ))
+
+        return schemas.BudgetReport(
+            as_of=as_of,
+            period_start=period_start,
+            period_end=period_end,
+            days_elapsed=days_elapsed,
+            days_in_period=days_in_period,
+            total_limit=sum((item.monthly_limit or Decimal("0") for item in budgets), Decimal("0")),
+            total_spent=sum((item.spent for item in budgets), Decimal("0")),
+            total_projected=sum((item.projected_spend for item in budgets), Decimal("0")),
+            budgets=budgets
+        )
+
+    def _get(self, budget_id: int) -> models.Budget:
+        budget = self.repo.get_by_id(budget_id)
+        if not budget:
+            raise BudgetNotFoundError(f"Budget {budget_id} not found")
+        return budget
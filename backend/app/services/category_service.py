@@ -0,0 +1,134 @@
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from datetime import date
+from decimal import Decimal
+from app import schemas, models
+from app.repositories.category_repository import CategoryRepository
+from app.core.exceptions import CategoryNotFoundError, InvalidCategoryError
+from app.core.cache import summary_cache, mark_summary_dirty
+from app.repositories.category_dictionary import category_dictionary
+
+class CategoryService:
+    def __init__(self, db: Session):
+        self.db = db
+        self.repo = CategoryRepository(db)
+
+    def get_categories(self, user_id: int = 1) -> List[schemas.Category]:
+        return [schemas.Category.model_validate(category) for category in self.repo.get_all(user_id)]
+
+    def create_category(self, category: schemas.CategoryCreate, user_id: int = 1) -> schemas.Category:
+        category_data = category.model_dump()
+        category_data['user_id'] = user_id
+        if category.parent_id is not None:
+            self._get_owned(category.parent_id, user_id)
+
+        db_category = self.repo.create(category_data)
+        mark_summary_dirty(self.db, user_id)
+        self.db.commit()
+        self.db.refresh(db_category)
+        return schemas.Category.model_validate(db_category)
+
+    def update_category(self, category_id: int, category_update: schemas.CategoryUpdate) -> schemas.Category:
+        """카테고리 수정 (parent_id가 바뀌면 서브트리를 함께 이동)"""
+        db_category = self._get(category_id)
+        update_data = category_update.model_dump(exclude_unset=True)
+
+        if 'parent_id' in update_data:
+            new_parent_id = update_data.pop('parent_id')
+            if new_parent_id != db_category.parent_id:
+                if new_parent_id is not None:
+                    self._get_owned(new_parent_id, db_category.user_id)
+                    if new_parent_id in self.repo.get_subtree_ids(category_id):
+                        raise InvalidCategoryError("Cannot move a category under itself or its descendants")
+                self.repo.move(db_category, new_parent_id)
+
+        updated_category = self.repo.update(db_category, update_data)
+        mark_summary_dirty(self.db, db_category.user_id)
+        self.db.commit()
+        if 'name' in update_data:
+            category_dictionary.forget(category_id)
+        self.db.refresh(updated_category)
+        return schemas.Category.model_validate(updated_category)
+
+    def delete_category(self, category_id: int) -> bool:
+        """카테고리 삭제 (하위 카테고리는 부모 카테고리 밑으로 이동, 이 카테고리의 예산은 삭제)"""
+        db_category = self._get(category_id)
+        user_id = db_category.user_id
+        self.repo.delete(db_category)
+        mark_summary_dirty(self.db, user_id)
+        self.db.commit()
+        category_dictionary.forget(category_id)
+        return True
+
+    def get_rollup(
+        self,
+        start_date: date,
+        end_date: date,
+        transaction_type: Optional[models.TransactionType] = None,
+        user_id: int = 1
+    ) -> List[schemas.CategoryRollup]:
+        """기간 내 카테고리별 합계 (자기 카테고리 + 모든 하위 카테고리 포함)"""
+        if start_date > end_date:
+            raise InvalidCategoryError("start_date must be on or before end_date")
+        return summary_cache.get_or_compute(
+            user_id, "category_rollup",
+            lambda: self._build_rollup(user_id, start_date, end_date, transaction_type),
+            start_date, end_date, transaction_type, db=self.db
+        )
+
+    def intern_ledger(self, batch_size: int = 50_000) -> dict:
+        """
+        기존 원장 카테고리 인터닝 (재실행 가능)
+        카테고리명을 categories에 등록한 뒤 거래/정기 거래의 category_id를 id 구간별로 채우고 구간마다 commit
+        """
+        created = self.repo.register_ledger_names()
+        self.db.commit()
+        updated = {}
+        for model in (models.Transaction, models.RecurringTransaction):
+            updated[model.__tablename__] = 0
+            max_id = self.repo.get_max_id(model)
+            for start_id in range(1, max_id + 1, batch_size):
+                updated[model.__tablename__] += self.repo.backfill_category_ids(model, start_id, start_id + batch_size)
+                self.db.commit()
+        summary_cache.clear()
+        return {"created_categories": created, **updated}
+
+    def rebuild_closure(self) -> int:
+        count = self.repo.rebuild_closure()
+        self.db.commit()
+        return count
+
+    def _build_rollup(
+        self,
+        user_id: int,
+        start_date: date,
+        end_date: date,
+        transaction_type: Optional[models.TransactionType]
+    ) -> List[schemas.CategoryRollup]:
+        totals = {row.category_id: row for row in self.repo.get_rollup_totals(user_id, start_date, end_date, transaction_type)}
+        rollup = []
+        for category in self.repo.get_all(user_id):
+            row = totals.get(category.id)
+            rollup.append(schemas.CategoryRollup(
+                id=category.id,
+                name=category.name,
+                type=category.type,
+                parent_id=category.parent_id,
+                own_amount=row.own_amount if row else Decimal("0"),
+                own_count=row.own_count if row else 0,
+                total_amount=row.total_amount if row else Decimal("0"),
+                transaction_count=row.transaction_count if row else 0
+            ))
+        return rollup
+
+    def _get(self, category_id: int) -> models.Category:
+        category = self.repo.get_by_id(category_id)
+        if not category:
+            raise CategoryNotFoundError(f"Category {category_id} not found")
+        return category
+
+    def _get_owned(self, category_id: int, user_id: int) -> models.Category:
+        category = self._get(category_id)
+        if category.user_id != user_id:
+            raise CategoryNotFoundError(f"Category {category_id} not found")
+        return category
@@ -0,0 +1,150 @@
+import csv
+import io
+import json
+from datetime import date
+from typing import Iterator, List, Optional
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+from app import models
+from app.repositories.transaction_repository import TransactionRepository
+from app.core.exceptions import InvalidTransactionError
+
+EXPORT_BATCH_SIZE = 5000
+
+# 내보내기 컬럼 (ORM 엔티티 대신 컬럼 projection으로 조회)
+EXPORT_COLUMNS = [
+    models.Transaction.id,
+    models.Transaction.account_id,
+    models.Transaction.transaction_date,
+    models.Transaction.type,
+    models.Transaction.category,
+    models.Transaction.amount,
+    models.Transaction.description,
+    models.Transaction.is_recurring,
+    models.Transaction.created_at,
+]
+EXPORT_FIELDS = [column.key for column in EXPORT_COLUMNS]
+
+MEDIA_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+
+def _plain(value):
+    """CSV/JSON 출력용 값 변환 (Decimal은 정밀도 유지를 위해 문자열)"""
+    if isinstance(value, models.TransactionType):
+        return value.value
+    if value is None or isinstance(value, (bool, int, str)):
+        return value
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value)
+
+
+class _StreamingSink:
+    """pyarrow ParquetWriter가 쓴 바이트를 모아서 꺼내가는 write-only 파일 객체"""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        # Parquet footer의 오프셋 계산에 사용되므로 누적 위치를 반환
+        return self._position
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+class TransactionExportService:
+    def __init__(self, db: Session):
+        self.db = db
+        self.transaction_repo = TransactionRepository(db)
+
+    def export(
+        self,
+        file_format: str,
+        account_id: Optional[int] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> Iterator[bytes]:
+        """거래 원장을 지정 포맷으로 배치 단위 스트리밍"""
+        writer = {
+            "csv": self._write_csv,
+            "ndjson": self._write_ndjson,
+            "parquet": self._write_parquet,
+        }.get(file_format)
+        if writer is None:
+            raise InvalidTransactionError(f"Unsupported export format: {file_format}")
+        batches = self.transaction_repo.stream_columns(
+            EXPORT_COLUMNS, account_id, start_date, end_date, batch_size=EXPORT_BATCH_SIZE
+        )
+        return writer(batches)
+
+    def _write_csv(self, batches: Iterator[List[Row]]) -> Iterator[bytes]:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(EXPORT_FIELDS)
+        # 엑셀에서 한글이 깨지지 않도록 BOM 포함
+        yield ("\ufeff" + buffer.getvalue()).encode("utf-8")
+        for batch in batches:
+            buffer.seek(0)
+            buffer.truncate()
+            writer.writerows([_plain(value) for value in row] for row in batch)
+            yield buffer.getvalue().encode("utf-8")
+
+    def _write_ndjson(self, batches: Iterator[List[Row]]) -> Iterator[bytes]:
+        for batch in batches:
+            lines = [
+                json.dumps(dict(zip(EXPORT_FIELDS, map(_plain, row))), ensure_ascii=False)
+                for row in batch
+            ]
+            yield ("\n".join(lines) + "\n").encode("utf-8")
+
+    def _write_parquet(self, batches: Iterator[List[Row]]) -> Iterator[bytes]:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        schema = pa.schema([
+            ("id", pa.int64()),
+            ("account_id", pa.int64()),
+            ("transaction_date", pa.date32()),
+            ("type", pa.string()),
+            ("category", pa.string()),
+            ("amount", pa.decimal128(15, 2)),
+            ("description", pa.string()),
+            ("is_recurring", pa.bool_()),
+            ("created_at", pa.timestamp("us")),
+        ])
+        sink = _StreamingSink()
+        writer = pq.ParquetWriter(sink, schema, compression="zstd")
+        try:
+            for batch in batches:
+                columns = list(zip(*batch))
+                columns[3] = [t.value if t is not None else None for t in columns[3]]
+                # 배치 하나를 row group 하나로 기록하고 바로 전송
+                writer.write_table(pa.Table.from_arrays(
+                    [pa.array(values, type=field.type) for values, field in zip(columns, schema)],
+                    schema=schema
+                ))
+                yield sink.drain()
+        finally:
+            writer.close()
+        yield sink.drain()
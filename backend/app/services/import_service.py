@@ -0,0 +1,234 @@
+import csv
+import io
+import re
+import time
+from collections import defaultdict
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from itertools import islice
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
+from sqlalchemy.orm import Session
+from app import schemas, models
+from app.repositories.transaction_repository import TransactionRepository
+from app.repositories.account_repository import AccountRepository
+from app.repositories.monthly_total_repository import MonthlyCategoryTotalRepository
+from app.repositories.transaction_archive import transaction_archive
+from app.core.exceptions import AccountNotFoundError, InvalidTransactionError
+from app.core.cache import mark_summary_dirty
+from app.services.transaction_service import balance_delta
+
+DEFAULT_CATEGORY = "기타"
+DEFAULT_CHUNK_SIZE = 1000
+MAX_REPORTED_ERRORS = 20
+# transactions.category 컬럼 길이 (VARCHAR(50)), 넘으면 MySQL이 청크 전체 INSERT를 거부함
+MAX_CATEGORY_LENGTH = models.Transaction.__table__.c.category.type.length
+
+DATE_FORMATS = ("%Y-%m-%d", "%Y/%m/%d", "%Y.%m.%d", "%Y%m%d")
+
+# CSV 헤더 별칭 -> 내부 필드명
+CSV_COLUMNS = {
+    "date": "transaction_date",
+    "transaction_date": "transaction_date",
+    "amount": "amount",
+    "type": "type",
+    "category": "category",
+    "description": "description",
+    "memo": "description",
+    "account_id": "account_id",
+}
+
+OFX_BLOCK = re.compile(r"<STMTTRN>(.*?)</STMTTRN>", re.S | re.I)
+OFX_FIELD = re.compile(r"<(\w+)>([^<\r\n]*)")
+OFX_READ_SIZE = 64 * 1024
+
+RawRow = Tuple[int, Dict[str, str]]
+
+
+def parse_date(value: str) -> date:
+    value = value.strip()[:10]
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(value, fmt).date()
+        except ValueError:
+            continue
+    # OFX DTPOSTED (YYYYMMDDHHMMSS[.XXX][TZ])
+    return datetime.strptime(value[:8], "%Y%m%d").date()
+
+
+def parse_amount(value: str) -> Decimal:
+    cleaned = re.sub(r"[,\s₩원$]", "", value)
+    if not cleaned:
+        raise ValueError("empty amount")
+    return Decimal(cleaned)
+
+
+def iter_csv_rows(text: io.TextIOBase) -> Iterator[RawRow]:
+    """CSV 명세서를 한 줄씩 읽어 (줄 번호, 필드) 반환"""
+    reader = csv.DictReader(text)
+    if not reader.fieldnames:
+        return
+    columns = {name: CSV_COLUMNS.get(name.strip().lower()) for name in reader.fieldnames}
+    for line_no, record in enumerate(reader, start=2):
+        yield line_no, {
+            columns[key]: value
+            for key, value in record.items()
+            if key in columns and columns[key] and value is not None
+        }
+
+
+def iter_ofx_rows(text: io.TextIOBase) -> Iterator[RawRow]:
+    """OFX(SGML/XML) 명세서를 고정 크기 블록으로 읽으며 STMTTRN 단위로 반환"""
+    buffer = ""
+    index = 0
+    while True:
+        data = text.read(OFX_READ_SIZE)
+        buffer += data
+        last_end = 0
+        for match in OFX_BLOCK.finditer(buffer):
+            index += 1
+            fields = {tag.upper(): value.strip() for tag, value in OFX_FIELD.findall(match.group(1))}
+            amount = fields.get("TRNAMT", "")
+            yield index, {
+                "transaction_date": fields.get("DTPOSTED", ""),
+                "amount": amount,
+                "description": fields.get("NAME") or fields.get("MEMO"),
+            }
+            last_end = match.end()
+        buffer = buffer[last_end:]
+        if not data:
+            break
+
+
+PARSERS = {
+    "csv": iter_csv_rows,
+    "ofx": iter_ofx_rows,
+    "qfx": iter_ofx_rows,
+}
+
+
+def detect_format(filename: Optional[str]) -> Optional[str]:
+    if filename and "." in filename:
+        return filename.rsplit(".", 1)[1].lower()
+    return None
+
+
+def chunked(rows: Iterable[RawRow], size: int) -> Iterator[List[RawRow]]:
+    iterator = iter(rows)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+class TransactionImportService:
+    def __init__(self, db: Session):
+        self.db = db
+        self.transaction_repo = TransactionRepository(db)
+        self.account_repo = AccountRepository(db)
+        self.monthly_total_repo = MonthlyCategoryTotalRepository(db)
+        self._account_users: Dict[int, int] = {}
+
+    def import_statement(
+        self,
+        stream: BinaryIO,
+        file_format: str,
+        account_id: int,
+        default_category: str = DEFAULT_CATEGORY,
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> schemas.TransactionImportResult:
+        """
+        CSV/OFX 명세서를 청크 단위로 스트리밍 파싱해서 일괄 등록
+        청크마다 multi-row INSERT 1회 + 계좌별 잔액 변경 1회 + 월별 집계 키별 갱신 1회 + commit 1회
+        과거 내역 적재용이므로 지출 잔액 부족 검사는 하지 않음
+        """
+        parser = PARSERS.get((file_format or "").lower())
+        if parser is None:
+            raise InvalidTransactionError(f"Unsupported statement format: {file_format}")
+        self._ensure_account(account_id)
+
+        text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+        started = time.perf_counter()
+        imported = skipped = chunks = 0
+        errors: List[str] = []
+
+        for chunk in chunked(parser(text), chunk_size):
+            rows = []
+            balance_deltas: Dict[int, Decimal] = defaultdict(Decimal)
+            total_deltas = defaultdict(lambda: [Decimal("0"), 0])
+            for line_no, raw in chunk:
+                try:
+                    row = self._to_row(raw, account_id, default_category)
+                except (ValueError, InvalidOperation, AccountNotFoundError, InvalidTransactionError) as e:
+                    skipped += 1
+                    if len(errors) < MAX_REPORTED_ERRORS:
+                        errors.append(f"row {line_no}: {e}")
+                    continue
+                rows.append(row)
+                balance_deltas[row["account_id"]] += balance_delta(row["type"], row["amount"])
+                total_delta = total_deltas[self.monthly_total_repo.make_key(
+                    row["account_id"], row["transaction_date"], row["category"], row["type"]
+                )]
+                total_delta[0] += row["amount"]
+                total_delta[1] += 1
+
+            try:
+                imported += self.transaction_repo.bulk_create(rows)
+                for target_account_id, delta in balance_deltas.items():
+                    if delta:
+                        self.account_repo.update_balance(target_account_id, delta)
+                self.monthly_total_repo.apply_many(total_deltas)
+                for target_account_id in balance_deltas:
+                    mark_summary_dirty(self.db, self._account_users[target_account_id])
+                self.db.commit()
+            except Exception:
+                self.db.rollback()
+                raise
+            chunks += 1
+
+        elapsed = time.perf_counter() - started
+        return schemas.TransactionImportResult(
+            imported=imported,
+            skipped=skipped,
+            chunks=chunks,
+            elapsed_seconds=round(elapsed, 4),
+            rows_per_second=round(imported / elapsed, 1) if elapsed > 0 else 0.0,
+            errors=errors
+        )
+
+    def _ensure_account(self, account_id: int) -> None:
+        if account_id in self._account_users:
+            return
+        account = self.account_repo.get_by_id(account_id)
+        if not account:
+            raise AccountNotFoundError(f"Account {account_id} not found")
+        self._account_users[account_id] = account.user_id
+
+    def _to_row(self, raw: Dict[str, str], default_account_id: int, default_category: str) -> dict:
+        amount = parse_amount(raw.get("amount") or "")
+        type_value = (raw.get("type") or "").strip().lower()
+        if type_value:
+            transaction_type = models.TransactionType(type_value)
+        else:
+            # 타입 컬럼이 없으면 부호로 판단 (음수 = 지출)
+            transaction_type = models.TransactionType.expense if amount < 0 else models.TransactionType.income
+        if amount == 0:
+            raise ValueError("amount must not be zero")
+
+        account_id = int(raw["account_id"]) if raw.get("account_id") else default_account_id
+        self._ensure_account(account_id)
+        transaction_date = parse_date(raw.get("transaction_date") or "")
+        transaction_archive.ensure_writable(transaction_date)
+        category = (raw.get("category") or "").strip() or default_category
+        if len(category) > MAX_CATEGORY_LENGTH:
+            raise InvalidTransactionError(f"category is longer than {MAX_CATEGORY_LENGTH} characters")
+
+        return {
+            "account_id": account_id,
+            "category": category,
+            "type": transaction_type,
+            "amount": abs(amount),
+            "description": raw.get("description") or None,
+            "transaction_date": transaction_date,
+            "is_recurring": False,
+        }
@@ -0,0 +1,38 @@
+from datetime import date, timedelta
+from typing import Iterator, Tuple
+
+GRANULARITIES = ("day", "week", "month", "quarter", "year")
+
+def period_floor(day: date, granularity: str) -> date:
+    """day가 속한 구간의 시작일 (week는 월요일 시작)"""
+    if granularity == "day":
+        return day
+    if granularity == "week":
+        return day - timedelta(days=day.weekday())
+    if granularity == "month":
+        return day.replace(day=1)
+    if granularity == "quarter":
+        return date(day.year, (day.month - 1) // 3 * 3 + 1, 1)
+    if granularity == "year":
+        return date(day.year, 1, 1)
+    raise ValueError(f"Unknown granularity: {granularity}")
+
+def next_period(start: date, granularity: str) -> date:
+    """구간 시작일 다음 구간의 시작일"""
+    if granularity == "day":
+        return start + timedelta(days=1)
+    if granularity == "week":
+        return start + timedelta(weeks=1)
+    if granularity == "year":
+        return date(start.year + 1, 1, 1)
+    month_index = start.year * 12 + start.month - 1 + (3 if granularity == "quarter" else 1)
+    return date(month_index // 12, month_index % 12 + 1, 1)
+
+def iter_periods(start_date: date, end_date: date, granularity: str) -> Iterator[Tuple[date, date]]:
+    """[start_date, end_date] 범위의 구간들을 (시작, 다음 구간 시작) 반열린 구간으로 (양 끝은 범위에 맞춰 자름)"""
+    current = period_floor(start_date, granularity)
+    end_before = end_date + timedelta(days=1)
+    while current < end_before:
+        following = next_period(current, granularity)
+        yield max(current, start_date), min(following, end_before)
+        current = following
@@ -0,0 +1,50 @@
+import calendar
+from datetime import date, timedelta
+from typing import Iterator, Optional
+from app import models
+
+def _clamp_day(year: int, month: int, day: int) -> date:
+    """31일 같은 날짜를 해당 월의 마지막 날로 보정"""
+    return date(year, month, min(day, calendar.monthrange(year, month)[1]))
+
+def occurrence_on_or_after(recurring, day: date) -> Optional[date]:
+    """
+    day 이후(포함) 첫 실행일 계산 (start_date/end_date 반영, 없으면 None)
+    - daily: 매일
+    - weekly: start_date와 같은 요일
+    - monthly: day_of_month (없으면 start_date의 일), 월말 보정
+    - yearly: start_date의 월 + day_of_month (없으면 start_date의 일), 월말 보정
+    """
+    start = recurring.start_date
+    day = max(day, start)
+    frequency = recurring.frequency or models.Frequency.monthly
+    anchor_day = recurring.day_of_month or start.day
+
+    if frequency == models.Frequency.daily:
+        candidate = day
+    elif frequency == models.Frequency.weekly:
+        weeks = -(-(day - start).days // 7)
+        candidate = start + timedelta(weeks=weeks)
+    elif frequency == models.Frequency.monthly:
+        candidate = _clamp_day(day.year, day.month, anchor_day)
+        if candidate < day:
+            year, month = (day.year + 1, 1) if day.month == 12 else (day.year, day.month + 1)
+            candidate = _clamp_day(year, month, anchor_day)
+    else:
+        candidate = _clamp_day(day.year, start.month, anchor_day)
+        if candidate < day:
+            candidate = _clamp_day(day.year + 1, start.month, anchor_day)
+
+    if recurring.end_date and candidate > recurring.end_date:
+        return None
+    return candidate
+
+def next_occurrence(recurring, after: date) -> Optional[date]:
+    return occurrence_on_or_after(recurring, after + timedelta(days=1))
+
+def occurrences_until(recurring, first: date, until: date) -> Iterator[date]:
+    """first부터 until까지의 실행일 (밀린 날짜 catch-up 용)"""
+    current = first
+    while current is not None and current <= until:
+        yield current
+        current = next_occurrence(recurring, current)
@@ -1,23 +1,51 @@
+import logging
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List
-from datetime import date, timedelta
+from typing import Callable, Dict, List, Optional
+from datetime import date
+from decimal import Decimal
 from app import schemas, models
-from app.repositories.recurring_transaction_repository import RecurringTransactionRepository
-from app.repositories.account_repository import AccountRepository
-from app.services.transaction_service import TransactionService
+from app.repositories.recurring_transaction_repository import RecurringTransactionRepository, AsyncRecurringTransactionRepository
+from app.repositories.account_repository import AccountRepository, AsyncAccountRepository
+from app.repositories.transaction_repository import TransactionRepository
+from app.repositories.monthly_total_repository import MonthlyCategoryTotalRepository
+from app.services.recurring_schedule import occurrence_on_or_after, next_occurrence
 from app.core.exceptions import AccountNotFoundError
+from app.core.cache import mark_summary_dirty
+
+logger = logging.getLogger(__name__)
+
+DUE_BATCH_SIZE = 500
+
+# 이 필드가 바뀌면 다음 실행일을 다시 계산
+SCHEDULE_FIELDS = {"frequency", "day_of_month", "start_date", "end_date", "is_active"}
+
+def initial_next_run(recurring, today: Optional[date] = None) -> Optional[date]:
+    """생성/스케줄 변경 시 다음 실행일 (과거 start_date의 지난 회차는 소급 생성하지 않음)"""
+    if not recurring.is_active:
+        return None
+    return occurrence_on_or_after(recurring, today or date.today())
 
 class RecurringTransactionService:
     def __init__(self, db: Session):
         self.db = db
         self.repo = RecurringTransactionRepository(db)
         self.account_repo = AccountRepository(db)
+        self.transaction_repo = TransactionRepository(db)
+        self.monthly_total_repo = MonthlyCategoryTotalRepository(db)
     
     def get_all_recurring(self, account_id: int = None) -> List[schemas.RecurringTransaction]:
         """모든 활성 정기 거래 조회"""
-        recurring_list = self.repo.get_all_active(account_id)
+        recurring_list = self.repo.get_active_rows(account_id)
         return [schemas.RecurringTransaction.model_validate(r) for r in recurring_list]
     
+    def get_recurring_rows(self, account_id: int = None) -> List[Row]:
+        """응답 직렬화용 원본 행 (검증은 응답 단계에서 한 번만)"""
+        return self.repo.get_active_rows(account_id)
+    
     def get_recurring(self, recurring_id: int) -> schemas.RecurringTransaction:
         """특정 정기 거래 조회"""
         recurring = self.repo.get_by_id(recurring_id)
@@ -33,7 +61,9 @@ class RecurringTransactionService:
             raise AccountNotFoundError(f"Account {recurring.account_id} not found")
         
         recurring_data = recurring.model_dump()
+        recurring_data['next_run_date'] = initial_next_run(recurring)
         db_recurring = self.repo.create(recurring_data)
+        mark_summary_dirty(self.db, account.user_id)
         
         self.db.commit()
         self.db.refresh(db_recurring)
@@ -50,8 +80,15 @@ class RecurringTransactionService:
         if not db_recurring:
             raise AccountNotFoundError(f"Recurring transaction {recurring_id} not found")
         
+        mark_summary_dirty(self.db, db_recurring.account.user_id)
         update_data = recurring_update.model_dump(exclude_unset=True)
         updated_recurring = self.repo.update(db_recurring, update_data)
+        if SCHEDULE_FIELDS & update_data.keys():
+            updated_recurring.next_run_date = initial_next_run(updated_recurring)
+        # 다른 계좌로 옮긴 경우 새 계좌 사용자의 요약도 무효화
+        new_account = self.account_repo.get_by_id(updated_recurring.account_id)
+        if new_account:
+            mark_summary_dirty(self.db, new_account.user_id)
         
         self.db.commit()
         self.db.refresh(updated_recurring)
@@ -65,6 +102,8 @@ class RecurringTransactionService:
             raise AccountNotFoundError(f"Recurring transaction {recurring_id} not found")
         
         db_recurring.is_active = False
+        db_recurring.next_run_date = None
+        mark_summary_dirty(self.db, db_recurring.account.user_id)
         self.db.commit()
         return True
 
@@ -75,47 +114,253 @@ class RecurringTransactionService:
         if not db_recurring:
             raise AccountNotFoundError(f"Recurring transaction {recurring_id} not found")
         
+        mark_summary_dirty(self.db, db_recurring.account.user_id)
         self.repo.delete(db_recurring)
         self.db.commit()
         return True
     
-    def process_due_recurring_transactions(self, target_date: date = None) -> int:
+    def process_due_recurring_transactions(
+        self,
+        target_date: date = None,
+        account_ids: Optional[List[int]] = None,
+        batch_size: int = DUE_BATCH_SIZE
+    ) -> int:
         """
-        오늘(또는 지정 날짜) 실행해야 할 정기 거래를 실제 거래로 생성
-        비즈니스 로직: 스케줄러가 매일 실행
+        next_run_date가 target_date 이하인 정기 거래를 실제 거래로 생성 (밀린 회차 포함)
+        - idx_recurring_due로 실행 대상만 조회, id 순 배치 처리
+        - 배치마다 거래 multi-row INSERT + 계좌별 잔액/월별 집계 1회 반영 + commit 1회
+        - next_run_date를 compare-and-set으로 전진시키므로 같은 날짜를 다시 실행해도 중복 생성 없음
+        - account_ids를 주면 해당 계좌의 정기 거래만 처리 (샤드 단위 병렬 처리용)
         """
         if target_date is None:
             target_date = date.today()
         
-        all_recurring = self.repo.get_all_active()
+        self.schedule_unscheduled(target_date, account_ids)
+        
         processed_count = 0
+        last_id = 0
+        while True:
+            due = self.repo.get_due(target_date, last_id, batch_size, account_ids)
+            if not due:
+                break
+            last_id = due[-1].id
+            processed_count += self._process_batch(due, target_date)
+        
+        return processed_count
+    
+    def schedule_unscheduled(self, target_date: date, account_ids: Optional[List[int]] = None) -> None:
+        """next_run_date가 없는 기존 정기 거래의 다음 실행일 계산"""
+        unscheduled = self.repo.get_unscheduled(target_date, account_ids)
+        for recurring in unscheduled:
+            recurring.next_run_date = occurrence_on_or_after(recurring, target_date)
+        if unscheduled:
+            self.db.commit()
+    
+    def _process_batch(self, due: List[models.RecurringTransaction], target_date: date) -> int:
+        # 1. 회차 계산 및 실행일 선점 (이미 다른 실행자가 처리한 정기 거래는 제외)
+        occurrences = []
+        for recurring in due:
+            run_dates = []
+            run_date = recurring.next_run_date
+            while run_date is not None and run_date <= target_date:
+                run_dates.append(run_date)
+                run_date = next_occurrence(recurring, run_date)
+            if not self.repo.advance(recurring.id, recurring.next_run_date, run_date):
+                continue
+            occurrences.extend((run_date, recurring) for run_date in run_dates)
+        
+        # 2. 날짜 순으로 잔액을 따라가며 거래 생성 (잔액 부족 지출은 건너뜀)
+        occurrences.sort(key=lambda item: (item[0], item[1].id))
+        balances = self.account_repo.get_balances(list({r.account_id for _, r in occurrences}))
+        running = {account_id: balance for account_id, (balance, _) in balances.items()}
+        rows = []
+        balance_deltas: Dict[int, Decimal] = defaultdict(Decimal)
+        total_deltas = defaultdict(lambda: [Decimal("0"), 0])
         
-        transaction_service = TransactionService(self.db)
-        
-        for recurring in all_recurring:
-            # 월간 거래이고 오늘이 설정된 날짜인 경우
-            if recurring.frequency == models.Frequency.monthly:
-                if recurring.day_of_month == target_date.day:
-                    # 종료일 체크
-                    if recurring.end_date and target_date > recurring.end_date:
-                        continue
-                    
-                    # 실제 거래 생성
-                    transaction = schemas.TransactionCreate(
-                        account_id=recurring.account_id,
-                        type=recurring.type,
-                        category=recurring.category,
-                        amount=recurring.amount,
-                        description=f"[자동] {recurring.description or recurring.category}",
-                        transaction_date=target_date,
-                        is_recurring=True
+        for run_date, recurring in occurrences:
+            if recurring.account_id not in running:
+                continue
+            delta = Decimal("0")
+            if recurring.type == models.TransactionType.income:
+                delta = recurring.amount
+            elif recurring.type == models.TransactionType.expense:
+                if running[recurring.account_id] < recurring.amount:
+                    logger.warning(
+                        "Skipped recurring transaction %s on %s: insufficient balance",
+                        recurring.id, run_date
                     )
-                    
-                    try:
-                        transaction_service.create_transaction(transaction)
-                        processed_count += 1
-                    except Exception as e:
-                        # 로깅 처리 (실제로는 logging 모듈 사용)
-                        print(f"Failed to process recurring transaction {recurring.id}: {e}")
+                    continue
+                delta = -recurring.amount
+            running[recurring.account_id] += delta
+            balance_deltas[recurring.account_id] += delta
+            
+            rows.append({
+                "account_id": recurring.account_id,
+                "type": recurring.type,
+                "category": recurring.category,
+                "amount": recurring.amount,
+                "description": f"[자동] {recurring.description or recurring.category}",
+                "transaction_date": run_date,
+                "is_recurring": True,
+            })
+            total_delta = total_deltas[self.monthly_total_repo.make_key(
+                recurring.account_id, run_date, recurring.category, recurring.type
+            )]
+            total_delta[0] += recurring.amount
+            total_delta[1] += 1
         
-        return processed_count
+        # 3. 한 번에 반영하고 배치당 1회 commit
+        try:
+            self.transaction_repo.bulk_create(rows)
+            for account_id, delta in balance_deltas.items():
+                if delta:
+                    self.account_repo.update_balance(account_id, delta)
+                mark_summary_dirty(self.db, balances[account_id][1])
+            self.monthly_total_repo.apply_many(total_deltas)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        
+        return len(rows)
+
+
+def process_due_in_shards(
+    session_factory: Callable[[], Session],
+    target_date: Optional[date] = None,
+    shard_count: int = 4,
+    max_workers: int = 4
+) -> int:
+    """
+    실행 대상 계좌를 account_id % shard_count로 나눠 워커 풀에서 병렬 처리
+    샤드마다 별도 세션을 사용하고, 같은 계좌는 항상 같은 샤드라 잔액 갱신이 겹치지 않음
+    """
+    if target_date is None:
+        target_date = date.today()
+    
+    db = session_factory()
+    try:
+        service = RecurringTransactionService(db)
+        service.schedule_unscheduled(target_date)
+        account_ids = service.repo.get_due_account_ids(target_date)
+    finally:
+        db.close()
+    
+    shards = [[] for _ in range(max(shard_count, 1))]
+    for account_id in account_ids:
+        shards[account_id % len(shards)].append(account_id)
+    shards = [shard for shard in shards if shard]
+    if not shards:
+        return 0
+    
+    def run_shard(shard: List[int]) -> int:
+        shard_db = session_factory()
+        try:
+            return RecurringTransactionService(shard_db).process_due_recurring_transactions(
+                target_date, account_ids=shard
+            )
+        finally:
+            shard_db.close()
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(shards))) as pool:
+        return sum(pool.map(run_shard, shards))
+
+
+class AsyncRecurringTransactionService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.repo = AsyncRecurringTransactionRepository(db)
+        self.account_repo = AsyncAccountRepository(db)
+    
+    async def _mark_account_user_dirty(self, account_id: int) -> None:
+        account = await self.account_repo.get_by_id(account_id)
+        if account:
+            mark_summary_dirty(self.db, account.user_id)
+    
+    async def get_all_recurring(self, account_id: int = None) -> List[schemas.RecurringTransaction]:
+        """모든 활성 정기 거래 조회"""
+        recurring_list = await self.repo.get_active_rows(account_id)
+        return [schemas.RecurringTransaction.model_validate(r) for r in recurring_list]
+    
+    async def get_recurring_rows(self, account_id: int = None) -> List[Row]:
+        """응답 직렬화용 원본 행 (검증은 응답 단계에서 한 번만)"""
+        return await self.repo.get_active_rows(account_id)
+    
+    async def get_recurring(self, recurring_id: int) -> schemas.RecurringTransaction:
+        """특정 정기 거래 조회"""
+        recurring = await self.repo.get_by_id(recurring_id)
+        if not recurring:
+            raise AccountNotFoundError(f"Recurring transaction {recurring_id} not found")
+        return schemas.RecurringTransaction.model_validate(recurring)
+    
+    async def create_recurring(self, recurring: schemas.RecurringTransactionCreate) -> schemas.RecurringTransaction:
+        """정기 거래 생성"""
+        # 계좌 존재 확인
+        account = await self.account_repo.get_by_id(recurring.account_id)
+        if not account:
+            raise AccountNotFoundError(f"Account {recurring.account_id} not found")
+        
+        recurring_data = recurring.model_dump()
+        recurring_data['next_run_date'] = initial_next_run(recurring)
+        db_recurring = await self.repo.create(recurring_data)
+        mark_summary_dirty(self.db, account.user_id)
+        
+        await self.db.commit()
+        await self.db.refresh(db_recurring)
+        
+        return schemas.RecurringTransaction.model_validate(db_recurring)
+    
+    async def update_recurring(
+        self, 
+        recurring_id: int, 
+        recurring_update: schemas.RecurringTransactionUpdate
+    ) -> schemas.RecurringTransaction:
+        """정기 거래 수정"""
+        db_recurring = await self.repo.get_by_id(recurring_id)
+        if not db_recurring:
+            raise AccountNotFoundError(f"Recurring transaction {recurring_id} not found")
+        
+        await self._mark_account_user_dirty(db_recurring.account_id)
+        update_data = recurring_update.model_dump(exclude_unset=True)
+        updated_recurring = await self.repo.update(db_recurring, update_data)
+        if SCHEDULE_FIELDS & update_data.keys():
+            updated_recurring.next_run_date = initial_next_run(updated_recurring)
+        # 다른 계좌로 옮긴 경우 새 계좌 사용자의 요약도 무효화
+        await self._mark_account_user_dirty(updated_recurring.account_id)
+        
+        await self.db.commit()
+        await self.db.refresh(updated_recurring)
+        
+        return schemas.RecurringTransaction.model_validate(updated_recurring)
+    
+    async def deactivate_recurring(self, recurring_id: int) -> bool:
+        """정기 거래 비활성화"""
+        db_recurring = await self.repo.get_by_id(recurring_id)
+        if not db_recurring:
+            raise AccountNotFoundError(f"Recurring transaction {recurring_id} not found")
+        
+        db_recurring.is_active = False
+        db_recurring.next_run_date = None
+        await self._mark_account_user_dirty(db_recurring.account_id)
+        await self.db.commit()
+        return True
+    
+    async def delete_recurring(self, recurring_id: int) -> bool:
+        """정기 거래 삭제"""
+        db_recurring = await self.repo.get_by_id(recurring_id)
+        if not db_recurring:
+            raise AccountNotFoundError(f"Recurring transaction {recurring_id} not found")
+        
+        await self._mark_account_user_dirty(db_recurring.account_id)
+        await self.repo.delete(db_recurring)
+        await self.db.commit()
+        return True
+    
+    async def process_due_recurring_transactions(self, target_date: date = None) -> int:
+        """
+        실행일이 된 정기 거래를 실제 거래로 생성
+        배치 처리 로직은 동기 엔진을 그대로 사용 (run_sync)
+        """
+        return await self.db.run_sync(
+            lambda session: RecurringTransactionService(session).process_due_recurring_transactions(target_date)
+        )
@@ -0,0 +1,98 @@
+import logging
+import time
+from collections import defaultdict
+from datetime import date
+from decimal import Decimal
+from typing import Dict, List, Optional
+from sqlalchemy.orm import Session
+from app import schemas, models
+from app.repositories.asset_snapshot_repository import AssetSnapshotRepository
+from app.core.cache import mark_summary_dirty
+
+logger = logging.getLogger(__name__)
+
+
+def build_accounts_summary(rows) -> Dict[int, List[dict]]:
+    """(user_id, id, name, type, balance) 행으로 사용자별 accounts_summary JSON 구성"""
+    summaries: Dict[int, List[dict]] = defaultdict(list)
+    for user_id, account_id, name, account_type, balance in rows:
+        summaries[user_id].append({
+            "account_id": account_id,
+            "name": name,
+            "type": account_type.value if isinstance(account_type, models.AccountType) else account_type,
+            "balance": float(balance or 0),
+        })
+    return summaries
+
+
+def is_unchanged(snapshot: Optional[models.AssetSnapshot], total: Decimal, accounts_summary: List[dict]) -> bool:
+    return (
+        snapshot is not None
+        and Decimal(str(snapshot.total_assets)) == total
+        and snapshot.accounts_summary == accounts_summary
+    )
+
+
+class SnapshotService:
+    def __init__(self, db: Session):
+        self.db = db
+        self.snapshot_repo = AssetSnapshotRepository(db)
+
+    def generate_snapshots(self, snapshot_date: Optional[date] = None) -> schemas.SnapshotResult:
+        """
+        전체 사용자의 자산 스냅샷을 한 번에 생성 (사용자 수와 무관하게 고정된 쿼리 수)
+        - 사용자별 총액은 SQL GROUP BY, accounts_summary는 계좌 projection 1회로 구성
+        - 직전 스냅샷과 잔액이 같으면 건너뜀
+        - 같은 날짜로 다시 실행하면 기존 행을 갱신 (user_id, snapshot_date 유니크)
+        """
+        snapshot_date = snapshot_date or date.today()
+        started = time.perf_counter()
+
+        totals = self.snapshot_repo.get_user_totals()
+        summaries = build_accounts_summary(self.snapshot_repo.get_account_rows())
+        previous = self.snapshot_repo.get_latest_before(snapshot_date)
+        existing = self.snapshot_repo.get_by_date(snapshot_date)
+
+        to_create: List[dict] = []
+        to_update: List[dict] = []
+        changed_users: List[int] = []
+        for user_id, (total, _) in totals.items():
+            total = Decimal(str(total or 0))
+            accounts_summary = summaries.get(user_id, [])
+            current = existing.get(user_id)
+            if is_unchanged(current or previous.get(user_id), total, accounts_summary):
+                continue
+            values = {
+                "total_assets": total,
+                "net_worth": total,
+                "accounts_summary": accounts_summary,
+            }
+            changed_users.append(user_id)
+            if current is not None:
+                to_update.append({"id": current.id, **values})
+            else:
+                to_create.append({"user_id": user_id, "snapshot_date": snapshot_date, **values})
+
+        try:
+            created = self.snapshot_repo.bulk_create(to_create)
+            updated = self.snapshot_repo.bulk_update(to_update)
+            for user_id in changed_users:
+                mark_summary_dirty(self.db, user_id)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+        elapsed = time.perf_counter() - started
+        logger.info(
+            "Generated asset snapshots for %s: %d created, %d updated in %.3fs",
+            snapshot_date, created, updated, elapsed
+        )
+        return schemas.SnapshotResult(
+            snapshot_date=snapshot_date,
+            users=len(totals),
+            created=created,
+            updated=updated,
+            skipped=len(totals) - created - updated,
+            elapsed_seconds=round(elapsed, 4)
+        )
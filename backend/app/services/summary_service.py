@@ -1,10 +1,38 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy.ext.asyncio import AsyncSession
 from decimal import Decimal
-from typing import List
+from datetime import date
+from typing import List, Optional
 from app import schemas, models
-from app.repositories.account_repository import AccountRepository
-from app.repositories.recurring_transaction_repository import RecurringTransactionRepository
+from app.core.cache import summary_cache
+from app.repositories.account_repository import AccountRepository, AsyncAccountRepository
+from app.repositories.asset_snapshot_repository import AssetSnapshotRepository
+from app.repositories.recurring_transaction_repository import RecurringTransactionRepository, AsyncRecurringTransactionRepository
+from app.services.net_worth_history import NetWorthHistoryService
+
+def trend_range(months: int, start_date: Optional[date], end_date: Optional[date]) -> tuple:
+    """재구성 구간 기본값: 오늘까지 최근 N개월 (시작 월 1일부터)"""
+    end_date = end_date or date.today()
+    if start_date is None:
+        month_index = end_date.year * 12 + end_date.month - 1 - (max(months, 1) - 1)
+        start_date = date(month_index // 12, month_index % 12 + 1, 1)
+    return start_date, end_date
+
+def month_end_trend(snapshots: List[tuple], start_date: date, end_date: date) -> dict:
+    """달마다 마지막 스냅샷 값, 스냅샷이 없는 달은 직전 값을 이어서 채움 (첫 스냅샷 이전 달은 제외)"""
+    by_month = {(day.year, day.month): float(net_worth) for day, net_worth in snapshots}
+    current = None
+    for day, net_worth in snapshots:
+        if day < start_date:
+            current = float(net_worth)
+    labels, data = [], []
+    for index in range(start_date.year * 12 + start_date.month - 1, end_date.year * 12 + end_date.month):
+        month = (index // 12, index % 12 + 1)
+        current = by_month.get(month, current)
+        if current is not None:
+            labels.append(f"{month[0]:04d}-{month[1]:02d}")
+            data.append(current)
+    return {"labels": labels, "data": data}
 
 class SummaryService:
     def __init__(self, db: Session):
@@ -14,42 +42,155 @@ class SummaryService:
     
     def get_total_assets(self, user_id: int = 1) -> Decimal:
         """총 자산 계산"""
-        accounts = self.account_repo.get_all(user_id)
-        total = sum(acc.balance for acc in accounts)
-        return Decimal(str(total))
+        return summary_cache.get_or_compute(
+            user_id, "total_assets", lambda: self._sum_balances(self.account_repo.get_rows(user_id)), db=self.db
+        )
     
     def get_monthly_fixed_expenses(self, user_id: int = 1) -> Decimal:
         """월 고정 지출 계산"""
-        accounts = self.account_repo.get_all(user_id)
-        account_ids = [acc.id for acc in accounts]
-        
-        if not account_ids:
-            return Decimal("0")
-        
-        return self.recurring_repo.get_monthly_sum_by_type(
-            account_ids, 
-            models.TransactionType.expense
+        return summary_cache.get_or_compute(
+            user_id, "monthly_fixed_expenses",
+            lambda: self._monthly_recurring_sum(user_id, models.TransactionType.expense), db=self.db
         )
     
     def get_monthly_fixed_income(self, user_id: int = 1) -> Decimal:
         """월 고정 수입 계산"""
-        accounts = self.account_repo.get_all(user_id)
+        return summary_cache.get_or_compute(
+            user_id, "monthly_fixed_income",
+            lambda: self._monthly_recurring_sum(user_id, models.TransactionType.income), db=self.db
+        )
+    
+    def get_full_summary(self, user_id: int = 1) -> schemas.Summary:
+        """전체 요약 정보"""
+        return summary_cache.get_or_compute(user_id, "full_summary", lambda: self._build_full_summary(user_id), db=self.db)
+
+    def get_net_worth_trend(
+        self,
+        user_id: int = 1,
+        months: int = 6,
+        mode: str = "snapshot",
+        granularity: str = "monthly",
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> dict:
+        """
+        순자산 추이 조회
+        - snapshot: 최근 N개월 달마다 마지막 스냅샷 (빈 달은 직전 값, 스냅샷이 없으면 원장 재구성으로 대체)
+        - reconstruct: 현재 잔액과 거래 원장으로 구간별 순자산 재구성
+        """
+        if mode == "reconstruct":
+            start_date, end_date = trend_range(months, start_date, end_date)
+            return summary_cache.get_or_compute(
+                user_id, "net_worth_history",
+                lambda: NetWorthHistoryService(self.db).get_trend(user_id, start_date, end_date, granularity),
+                start_date, end_date, granularity, db=self.db
+            )
+        return summary_cache.get_or_compute(
+            user_id, "net_worth_trend", lambda: self._build_net_worth_trend(user_id, months), months, date.today(), db=self.db
+        )
+
+    def _build_full_summary(self, user_id: int) -> schemas.Summary:
+        # 계좌는 한 번만 조회하고 총 자산/정기 거래 합계 모두 여기서 계산
+        accounts = self.account_repo.get_rows(user_id)
         account_ids = [acc.id for acc in accounts]
+        total_assets = self._sum_balances(accounts)
+        monthly_income = self._monthly_recurring_sum(user_id, models.TransactionType.income, account_ids)
+        monthly_expenses = self._monthly_recurring_sum(user_id, models.TransactionType.expense, account_ids)
         
+        return schemas.Summary(
+            total_assets=total_assets,
+            net_worth=total_assets,
+            monthly_fixed_expenses=monthly_expenses,
+            monthly_variable_expenses=Decimal("0"),
+            monthly_income=monthly_income,
+            net_monthly_cashflow=monthly_income - monthly_expenses,
+            accounts=[schemas.Account.model_validate(acc) for acc in accounts]
+        )
+
+    def _build_net_worth_trend(self, user_id: int, months: int) -> dict:
+        start_date, end_date = trend_range(months, None, None)
+        snapshots = AssetSnapshotRepository(self.db).get_month_ends(user_id, start_date, end_date)
+
+        # 스냅샷이 없으면 원장으로 월별 추이 재구성
+        if not snapshots:
+            return NetWorthHistoryService(self.db).get_trend(user_id, start_date, end_date, "monthly")
+        return month_end_trend(snapshots, start_date, end_date)
+
+    def _monthly_recurring_sum(self, user_id: int, transaction_type: models.TransactionType, account_ids: Optional[List[int]] = None) -> Decimal:
+        if account_ids is None:
+            account_ids = [acc.id for acc in self.account_repo.get_rows(user_id)]
         if not account_ids:
             return Decimal("0")
-        
-        return self.recurring_repo.get_monthly_sum_by_type(
-            account_ids, 
-            models.TransactionType.income
+        return self.recurring_repo.get_monthly_sum_by_type(account_ids, transaction_type)
+
+    @staticmethod
+    def _sum_balances(accounts) -> Decimal:
+        return Decimal(str(sum(acc.balance for acc in accounts)))
+
+
+class AsyncSummaryService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.account_repo = AsyncAccountRepository(db)
+        self.recurring_repo = AsyncRecurringTransactionRepository(db)
+    
+    async def get_total_assets(self, user_id: int = 1) -> Decimal:
+        """총 자산 계산"""
+        return await summary_cache.get_or_compute_async(user_id, "total_assets", lambda: self._total_assets(user_id), db=self.db)
+    
+    async def get_monthly_fixed_expenses(self, user_id: int = 1) -> Decimal:
+        """월 고정 지출 계산"""
+        return await summary_cache.get_or_compute_async(
+            user_id, "monthly_fixed_expenses",
+            lambda: self._monthly_recurring_sum(user_id, models.TransactionType.expense), db=self.db
         )
     
-    def get_full_summary(self, user_id: int = 1) -> schemas.Summary:
+    async def get_monthly_fixed_income(self, user_id: int = 1) -> Decimal:
+        """월 고정 수입 계산"""
+        return await summary_cache.get_or_compute_async(
+            user_id, "monthly_fixed_income",
+            lambda: self._monthly_recurring_sum(user_id, models.TransactionType.income), db=self.db
+        )
+    
+    async def get_full_summary(self, user_id: int = 1) -> schemas.Summary:
         """전체 요약 정보"""
-        accounts = self.account_repo.get_all(user_id)
-        total_assets = self.get_total_assets(user_id)
-        monthly_income = self.get_monthly_fixed_income(user_id)
-        monthly_expenses = self.get_monthly_fixed_expenses(user_id)
+        return await summary_cache.get_or_compute_async(user_id, "full_summary", lambda: self._build_full_summary(user_id), db=self.db)
+
+    async def get_net_worth_trend(
+        self,
+        user_id: int = 1,
+        months: int = 6,
+        mode: str = "snapshot",
+        granularity: str = "monthly",
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> dict:
+        """순자산 추이 조회 (원장 재구성은 동기 로직을 run_sync로 재사용)"""
+        if mode == "reconstruct":
+            return await self.db.run_sync(
+                lambda session: SummaryService(session).get_net_worth_trend(
+                    user_id, months, mode, granularity, start_date, end_date
+                )
+            )
+        return await summary_cache.get_or_compute_async(
+            user_id, "net_worth_trend", lambda: self._build_net_worth_trend(user_id, months), months, date.today(), db=self.db
+        )
+
+    async def _total_assets(self, user_id: int) -> Decimal:
+        accounts = await self.account_repo.get_rows(user_id)
+        return Decimal(str(sum(acc.balance for acc in accounts)))
+
+    async def _monthly_recurring_sum(self, user_id: int, transaction_type: models.TransactionType) -> Decimal:
+        account_ids = [acc.id for acc in await self.account_repo.get_rows(user_id)]
+        if not account_ids:
+            return Decimal("0")
+        return await self.recurring_repo.get_monthly_sum_by_type(account_ids, transaction_type)
+
+    async def _build_full_summary(self, user_id: int) -> schemas.Summary:
+        accounts = await self.account_repo.get_rows(user_id)
+        total_assets = await self.get_total_assets(user_id)
+        monthly_income = await self.get_monthly_fixed_income(user_id)
+        monthly_expenses = await self.get_monthly_fixed_expenses(user_id)
         
         return schemas.Summary(
             total_assets=total_assets,
@@ -61,39 +202,5 @@ class SummaryService:
             accounts=[schemas.Account.model_validate(acc) for acc in accounts]
         )
 
-    def get_net_worth_trend(self, user_id: int = 1, months: int = 6) -> dict:
-        """순자산 추이 조회 (최근 N개월)"""
-        # 1. Get snapshots ordered by date desc
-        snapshots = self.db.query(models.AssetSnapshot)\
-            .filter(models.AssetSnapshot.user_id == user_id)\
-            .order_by(models.AssetSnapshot.snapshot_date.desc())\
-            .limit(months)\
-            .all()
-        
-        # 2. If no snapshots, return current state as a single point
-        if not snapshots:
-            current_assets = self.get_total_assets(user_id)
-            # For simplicity, we assume liabilities are 0 for now or need a way to calculate them.
-            # But get_total_assets only sums account balances (which are assets).
-            # If we want true net worth, we need to subtract liabilities.
-            # For now, let's assume net_worth ~= total_assets (unless we have liability accounts).
-            # Let's check AccountType.
-            
-            # Create a pseudo-snapshot for today
-            from datetime import date
-            return {
-                "labels": [date.today().strftime("%Y-%m")],
-                "data": [float(current_assets)]
-            }
-
-        # 3. Process snapshots
-        # Reverse to show chronological order
-        snapshots.reverse()
-        
-        labels = [s.snapshot_date.strftime("%Y-%m") for s in snapshots]
-        data = [float(s.net_worth) for s in snapshots]
-        
-        return {
-            "labels": labels,
-            "data": data
-        }
+    async def _build_net_worth_trend(self, user_id: int, months: int) -> dict:
+        return await self.db.run_sync(lambda session: SummaryService(session)._build_net_worth_trend(user_id, months))
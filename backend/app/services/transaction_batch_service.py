@@ -0,0 +1,205 @@
+from collections import defaultdict
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Dict, List, Optional, Set, Tuple
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+from app import schemas
+from app.repositories.transaction_repository import TransactionRepository
+from app.repositories.account_repository import AccountRepository
+from app.repositories.monthly_total_repository import MonthlyCategoryTotalRepository, TotalKey
+from app.repositories.category_dictionary import intern_categories
+from app.repositories.transaction_archive import transaction_archive
+from app.services.transaction_service import balance_delta, total_changes
+from app.core.exceptions import AccountNotFoundError, InvalidTransactionError
+from app.core.cache import mark_summary_dirty
+
+
+@dataclass
+class PlannedOperation:
+    """검증을 통과한 항목 하나의 반영 내용"""
+    index: int
+    op: str
+    account_id: int
+    balance_delta: Decimal
+    totals: List[Tuple[TotalKey, Decimal, int]]
+    transaction_id: Optional[int] = None
+    values: dict = field(default_factory=dict)  # create: 새 행 / update: 변경 컬럼
+
+
+class TransactionBatchService:
+    def __init__(self, db: Session):
+        self.db = db
+        self.transaction_repo = TransactionRepository(db)
+        self.account_repo = AccountRepository(db)
+        self.monthly_total_repo = MonthlyCategoryTotalRepository(db)
+
+    def apply(self, batch: schemas.TransactionBatchRequest) -> schemas.TransactionBatchResult:
+        """
+        생성/수정/삭제가 섞인 작업을 먼저 모두 검증한 뒤 한 번의 commit으로 반영
+        - 검증: 대상 거래/계좌를 한 번씩 잠금 조회하고, 항목 순서대로 잔액을 계산해서 지출 생성의 잔액 부족 판단
+        - 반영: 생성 multi-row INSERT, 수정 PK 기준 executemany UPDATE, 삭제 IN 절 DELETE
+          잔액은 계좌별 순변화량으로 한 번씩, 월별 집계는 키별로 한 번씩
+        """
+        operations = batch.operations
+        existing = self.transaction_repo.get_rows_by_ids(
+            sorted({op.id for op in operations if op.op != "create" and op.id is not None}), for_update=True
+        )
+        account_ids = {op.transaction.account_id for op in operations if op.op == "create" and op.transaction}
+        account_ids.update(row.account_id for row in existing.values())
+        accounts = self.account_repo.get_balances(sorted(account_ids), for_update=True)
+        balances = {account_id: balance for account_id, (balance, _) in accounts.items()}
+
+        planned: List[PlannedOperation] = []
+        errors: Dict[int, str] = {}
+        seen_ids: Set[int] = set()
+        for index, operation in enumerate(operations):
+            try:
+                plan = self._plan(index, operation, existing, balances, seen_ids)
+            except (AccountNotFoundError, InvalidTransactionError) as e:
+                errors[index] = str(e)
+                continue
+            balances[plan.account_id] += plan.balance_delta
+            planned.append(plan)
+
+        if errors and batch.mode == "atomic":
+            self.db.rollback()
+            return self._result(batch, planned, errors, {}, committed=False)
+
+        try:
+            rows = self._write(planned, existing, accounts)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return self._result(batch, planned, errors, rows, committed=True)
+
+    def _plan(
+        self,
+        index: int,
+        operation: schemas.TransactionBatchOperation,
+        existing: Dict[int, Row],
+        balances: Dict[int, Decimal],
+        seen_ids: Set[int]
+    ) -> PlannedOperation:
+        if operation.op == "create":
+            data = operation.transaction
+            if data is None:
+                raise InvalidTransactionError("create requires 'transaction'")
+            if data.account_id not in balances:
+                raise AccountNotFoundError(f"Account {data.account_id} not found")
+            transaction_archive.ensure_writable(data.transaction_date)
+            delta = balance_delta(data.type, data.amount)
+            if delta < 0 and balances[data.account_id] + delta < 0:
+                raise InvalidTransactionError("Insufficient balance for expense")
+            key = self.monthly_total_repo.make_key(data.account_id, data.transaction_date, data.category, data.type)
+            return PlannedOperation(index, "create", data.account_id, delta, [(key, data.amount, 1)], values=data.model_dump())
+
+        if operation.id is None:
+            raise InvalidTransactionError(f"{operation.op} requires 'id'")
+        current = existing.get(operation.id)
+        if current is None:
+            raise InvalidTransactionError(f"Transaction {operation.id} not found")
+        if operation.id in seen_ids:
+            raise InvalidTransactionError(f"Transaction {operation.id} appears more than once in the batch")
+        seen_ids.add(operation.id)
+        old_key = self.monthly_total_repo.make_key(
+            current.account_id, current.transaction_date, current.category, current.type
+        )
+
+        if operation.op == "delete":
+            return PlannedOperation(
+                index, "delete", current.account_id, -balance_delta(current.type, current.amount),
+                [(old_key, -current.amount, -1)], transaction_id=current.id
+            )
+
+        if operation.changes is None:
+            raise InvalidTransactionError("update requires 'changes'")
+        # 단건 수정과 같이 None 값은 무시
+        values = {key: value for key, value in operation.changes.model_dump(exclude_unset=True).items() if value is not None}
+        if "transaction_date" in values:
+            transaction_archive.ensure_writable(values["transaction_date"])
+        if "category" in values:
+            # 수정은 PK 기준 bulk UPDATE라 인터닝된 category_id도 여기서 같이 채움
+            probe = {"account_id": current.account_id, "category": values["category"], "type": current.type}
+            intern_categories(self.db, [probe])
+            if "category_id" in probe:
+                values["category_id"] = probe["category_id"]
+        updated = {**current._asdict(), **values}
+        new_key = self.monthly_total_repo.make_key(
+            current.account_id, updated["transaction_date"], updated["category"], current.type
+        )
+        return PlannedOperation(
+            index, "update", current.account_id,
+            balance_delta(current.type, updated["amount"]) - balance_delta(current.type, current.amount),
+            total_changes(old_key, current.amount, new_key, updated["amount"]),
+            transaction_id=current.id, values=values
+        )
+
+    def _write(
+        self,
+        planned: List[PlannedOperation],
+        existing: Dict[int, Row],
+        accounts: Dict[int, Tuple[Decimal, int]]
+    ) -> Dict[int, dict]:
+        """검증된 항목을 종류별 문장 한 번씩으로 반영하고 항목 index별 결과 행 반환"""
+        creates = [plan for plan in planned if plan.op == "create"]
+        updates = [plan for plan in planned if plan.op == "update" and plan.values]
+        deletes = [plan.transaction_id for plan in planned if plan.op == "delete"]
+
+        created = self.transaction_repo.create_many([plan.values for plan in creates])
+        self.transaction_repo.update_many([{"id": plan.transaction_id, **plan.values} for plan in updates])
+        self.transaction_repo.delete_many(deletes)
+
+        net_deltas: Dict[int, Decimal] = defaultdict(Decimal)
+        total_deltas = defaultdict(lambda: [Decimal("0"), 0])
+        for plan in planned:
+            net_deltas[plan.account_id] += plan.balance_delta
+            for key, amount_delta, count_delta in plan.totals:
+                total_deltas[key][0] += amount_delta
+                total_deltas[key][1] += count_delta
+        for account_id, delta in net_deltas.items():
+            if delta:
+                self.account_repo.update_balance(account_id, delta)
+        self.monthly_total_repo.apply_many(total_deltas)
+        for account_id in net_deltas:
+            mark_summary_dirty(self.db, accounts[account_id][1])
+
+        rows = {plan.index: row._asdict() for plan, row in zip(creates, created)}
+        for plan in planned:
+            if plan.op == "update":
+                rows[plan.index] = {**existing[plan.transaction_id]._asdict(), **plan.values}
+        return rows
+
+    @staticmethod
+    def _result(
+        batch: schemas.TransactionBatchRequest,
+        planned: List[PlannedOperation],
+        errors: Dict[int, str],
+        rows: Dict[int, dict],
+        committed: bool
+    ) -> schemas.TransactionBatchResult:
+        planned_ids = {plan.index: plan.transaction_id for plan in planned}
+        results = []
+        for index, operation in enumerate(batch.operations):
+            if index in errors:
+                results.append(schemas.TransactionBatchItemResult(
+                    index=index, op=operation.op, status="error", id=operation.id, error=errors[index]
+                ))
+                continue
+            row = rows.get(index)
+            results.append(schemas.TransactionBatchItemResult(
+                index=index,
+                op=operation.op,
+                status="ok" if committed else "skipped",
+                id=row["id"] if row else planned_ids.get(index),
+                transaction=schemas.Transaction.model_validate(row) if row else None
+            ))
+        succeeded = len(planned) if committed else 0
+        return schemas.TransactionBatchResult(
+            mode=batch.mode,
+            committed=committed,
+            succeeded=succeeded,
+            failed=len(errors),
+            results=results
+        )
@@ -1,43 +1,139 @@
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import func, extract
-from typing import List, Optional
-from datetime import date
+from typing import List, Optional, Tuple
+from datetime import date, timedelta
 from decimal import Decimal
 from app import schemas, models
-from app.repositories.transaction_repository import TransactionRepository
-from app.repositories.account_repository import AccountRepository
+from app.repositories.transaction_repository import TransactionRepository, AsyncTransactionRepository, search_terms
+from app.repositories.account_repository import AccountRepository, AsyncAccountRepository
+from app.repositories.monthly_total_repository import MonthlyCategoryTotalRepository, TotalKey
+from app.repositories.transaction_archive import transaction_archive
 from app.core.exceptions import AccountNotFoundError, InvalidTransactionError
+from app.core.pagination import encode_cursor, decode_cursor, encode_search_cursor, decode_search_cursor
+from app.core.cache import summary_cache, mark_summary_dirty
+from app.services.periods import iter_periods, period_floor
+
+# 한 번에 반환하는 최대 구간 수 (일 단위로 약 10년)
+MAX_PERIOD_BUCKETS = 3660
+
+def total_key(transaction) -> TotalKey:
+    """거래(ORM/스키마)의 월별 집계 키"""
+    return MonthlyCategoryTotalRepository.make_key(
+        transaction.account_id, transaction.transaction_date, transaction.category, transaction.type
+    )
+
+def apply_monthly_totals(db: Session, changes: List[Tuple[TotalKey, Decimal, int]]) -> None:
+    """월별 집계 증분 반영 (async 서비스는 run_sync로 호출)"""
+    repo = MonthlyCategoryTotalRepository(db)
+    for key, amount_delta, count_delta in changes:
+        repo.apply(key, amount_delta, count_delta)
+
+def balance_delta(transaction_type: models.TransactionType, amount: Decimal) -> Decimal:
+    """거래가 계좌 잔액에 주는 변화량 (수입 +, 지출 -, 이체 0)"""
+    if transaction_type == models.TransactionType.income:
+        return amount
+    if transaction_type == models.TransactionType.expense:
+        return -amount
+    return Decimal("0")
+
+def total_changes(old_key: TotalKey, old_amount: Decimal, new_key: TotalKey, new_amount: Decimal) -> List[Tuple[TotalKey, Decimal, int]]:
+    """거래 수정 시 집계 변경분 (기존 키에서 빼고 새 키에 더함)"""
+    if old_key == new_key and old_amount == new_amount:
+        return []
+    return [(old_key, -old_amount, -1), (new_key, new_amount, 1)]
 
 class TransactionService:
     def __init__(self, db: Session):
         self.db = db
         self.transaction_repo = TransactionRepository(db)
         self.account_repo = AccountRepository(db)
+        self.monthly_total_repo = MonthlyCategoryTotalRepository(db)
     
     def get_transactions(self, account_id: Optional[int] = None, limit: int = 100, start_date: Optional[date] = None, end_date: Optional[date] = None) -> List[schemas.Transaction]:
-        transactions = self.transaction_repo.get_all(account_id, limit, start_date, end_date)
+        transactions = self.transaction_repo.get_rows(account_id, limit, start_date, end_date)
         return [schemas.Transaction.model_validate(tx) for tx in transactions]
     
+    def get_transaction_rows(self, account_id: Optional[int] = None, limit: int = 100, start_date: Optional[date] = None, end_date: Optional[date] = None) -> List[Row]:
+        """응답 직렬화용 원본 행 (검증은 응답 단계에서 한 번만)"""
+        return self.transaction_repo.get_rows(account_id, limit, start_date, end_date)
+    
+    def get_transaction_page(
+        self,
+        account_id: Optional[int] = None,
+        limit: int = 100,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        cursor: Optional[str] = None
+    ) -> schemas.TransactionPage:
+        """커서 기반 거래 내역 페이지 조회"""
+        after = decode_cursor(cursor) if cursor else None
+        transactions = self.transaction_repo.get_page(account_id, limit, start_date, end_date, after)
+        
+        next_cursor = None
+        if len(transactions) > limit:
+            transactions = transactions[:limit]
+            last = transactions[-1]
+            next_cursor = encode_cursor(last.transaction_date, last.id)
+        
+        return schemas.TransactionPage(
+            items=[schemas.Transaction.model_validate(tx) for tx in transactions],
+            next_cursor=next_cursor
+        )
+    
+    def search_transactions(
+        self,
+        query: str,
+        account_id: Optional[int] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        min_amount: Optional[Decimal] = None,
+        max_amount: Optional[Decimal] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None
+    ) -> schemas.TransactionSearchPage:
+        """설명/카테고리 전문 검색 (관련도 순 커서 페이지)"""
+        terms = search_terms(query)
+        if not terms:
+            raise InvalidTransactionError("Search query must contain at least one word")
+        after = decode_search_cursor(cursor) if cursor else None
+        rows = self.transaction_repo.search(
+            terms, account_id, start_date, end_date, min_amount, max_amount, limit, after
+        )
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_search_cursor(rows[-1].score, rows[-1].id)
+
+        return schemas.TransactionSearchPage(
+            items=[schemas.TransactionSearchHit.model_validate(row) for row in rows],
+            next_cursor=next_cursor
+        )
+    
     def create_transaction(self, transaction: schemas.TransactionCreate) -> schemas.Transaction:
+        # 아카이브된 연도에는 쓸 수 없음
+        transaction_archive.ensure_writable(transaction.transaction_date)
+
         # 비즈니스 로직: 계좌 존재 확인
         account = self.account_repo.get_by_id(transaction.account_id)
         if not account:
             raise AccountNotFoundError(f"Account {transaction.account_id} not found")
         
-        # 비즈니스 로직: 지출 시 잔액 확인
-        if transaction.type == models.TransactionType.expense:
-            if account.balance < transaction.amount:
-                raise InvalidTransactionError("Insufficient balance for expense")
+        # 비즈니스 로직: 계좌 잔액 업데이트 (지출은 잔액 검사와 차감을 UPDATE 한 문장으로)
+        delta = balance_delta(transaction.type, transaction.amount)
+        if delta and not self.account_repo.update_balance(
+            transaction.account_id, delta, require_sufficient=transaction.type == models.TransactionType.expense
+        ):
+            raise InvalidTransactionError("Insufficient balance for expense")
         
         # 거래 생성
         transaction_data = transaction.model_dump()
         db_transaction = self.transaction_repo.create(transaction_data)
         
-        # 비즈니스 로직: 계좌 잔액 업데이트
-        if transaction.type == models.TransactionType.income:
-            self.account_repo.update_balance(transaction.account_id, transaction.amount)
-        elif transaction.type == models.TransactionType.expense:
-            self.account_repo.update_balance(transaction.account_id, -transaction.amount)
+        # 월별 집계도 같은 DB 트랜잭션에서 갱신
+        self.monthly_total_repo.apply(total_key(db_transaction), transaction.amount, 1)
+        mark_summary_dirty(self.db, account.user_id)
         
         self.db.commit()
         self.db.refresh(db_transaction)
@@ -47,34 +143,32 @@ class TransactionService:
     
     def update_transaction(self, transaction_id: int, transaction_update: schemas.TransactionUpdate) -> schemas.Transaction:
         """거래 수정 (잔액 조정 포함)"""
-        db_transaction = self.transaction_repo.get_by_id(transaction_id)
+        db_transaction = self.transaction_repo.get_by_id(transaction_id, for_update=True)
         if not db_transaction:
             raise InvalidTransactionError(f"Transaction {transaction_id} not found")
         
         # 기존 거래 정보 저장
         old_amount = db_transaction.amount
         old_type = db_transaction.type
+        old_key = total_key(db_transaction)
         
         # 거래 정보 업데이트
         update_data = transaction_update.model_dump(exclude_unset=True)
+        if update_data.get('transaction_date') is not None:
+            transaction_archive.ensure_writable(update_data['transaction_date'])
         updated_transaction = self.transaction_repo.update(db_transaction, update_data)
         
-        # 금액이나 타입이 변경된 경우 잔액 조정
+        apply_monthly_totals(self.db, total_changes(
+            old_key, old_amount, total_key(updated_transaction), updated_transaction.amount
+        ))
+        
+        # 금액이나 타입이 변경된 경우 기존/새 거래의 차이만큼 한 번에 잔액 조정
         if 'amount' in update_data or 'type' in update_data:
-            # 기존 거래 롤백
-            if old_type == models.TransactionType.income:
-                self.account_repo.update_balance(db_transaction.account_id, -old_amount)
-            elif old_type == models.TransactionType.expense:
-                self.account_repo.update_balance(db_transaction.account_id, old_amount)
-            
-            # 새 거래 적용
-            new_type = updated_transaction.type
-            new_amount = updated_transaction.amount
-            if new_type == models.TransactionType.income:
-                self.account_repo.update_balance(db_transaction.account_id, new_amount)
-            elif new_type == models.TransactionType.expense:
-                self.account_repo.update_balance(db_transaction.account_id, -new_amount)
+            delta = balance_delta(updated_transaction.type, updated_transaction.amount) - balance_delta(old_type, old_amount)
+            if delta:
+                self.account_repo.update_balance(db_transaction.account_id, delta)
         
+        mark_summary_dirty(self.db, db_transaction.account.user_id)
         self.db.commit()
         self.db.refresh(updated_transaction)
         
@@ -82,40 +176,36 @@ class TransactionService:
     
     def delete_transaction(self, transaction_id: int) -> bool:
         """거래 삭제 및 잔액 롤백"""
-        db_transaction = self.transaction_repo.get_by_id(transaction_id)
+        db_transaction = self.transaction_repo.get_by_id(transaction_id, for_update=True)
         if not db_transaction:
             raise InvalidTransactionError(f"Transaction {transaction_id} not found")
         
         # 비즈니스 로직: 잔액 원복
-        if db_transaction.type == models.TransactionType.income:
-            self.account_repo.update_balance(db_transaction.account_id, -db_transaction.amount)
-        elif db_transaction.type == models.TransactionType.expense:
-            self.account_repo.update_balance(db_transaction.account_id, db_transaction.amount)
+        delta = balance_delta(db_transaction.type, db_transaction.amount)
+        if delta:
+            self.account_repo.update_balance(db_transaction.account_id, -delta)
+        
+        self.monthly_total_repo.apply(total_key(db_transaction), -db_transaction.amount, -1)
+        mark_summary_dirty(self.db, db_transaction.account.user_id)
         
         self.transaction_repo.delete(db_transaction)
         self.db.commit()
         return True
     
     def get_monthly_summary(self, year: int, month: int, user_id: int = 1) -> dict:
-        """월별 수입/지출(고정/변동) 요약"""
-        transactions = self.db.query(models.Transaction).join(models.Category).filter(
-            models.Transaction.account.has(user_id=user_id),
-            extract('year', models.Transaction.transaction_date) == year,
-            extract('month', models.Transaction.transaction_date) == month
-        ).all()
-
+        """월별 수입/지출(고정/변동) 요약 - 월별 집계 테이블에서 카테고리 수만큼만 읽음"""
         income = Decimal(0)
         fixed_expenses = Decimal(0)
         variable_expenses = Decimal(0)
 
-        for tx in transactions:
-            if tx.type == models.TransactionType.income:
-                income += tx.amount
-            elif tx.type == models.TransactionType.expense:
-                if tx.category.is_fixed:
-                    fixed_expenses += tx.amount
+        for row in self.monthly_total_repo.get_user_month(user_id, year, month):
+            if row.type == models.TransactionType.income:
+                income += row.amount
+            elif row.type == models.TransactionType.expense:
+                if row.is_fixed:
+                    fixed_expenses += row.amount
                 else:
-                    variable_expenses += tx.amount
+                    variable_expenses += row.amount
 
         return {
             "income": income,
@@ -124,3 +214,244 @@ class TransactionService:
             "net_cashflow": income - (fixed_expenses + variable_expenses)
         }
 
+    def get_period_summary(
+        self,
+        granularity: str,
+        start_date: date,
+        end_date: date,
+        account_id: Optional[int] = None,
+        user_id: int = 1
+    ) -> schemas.PeriodSummary:
+        """기간을 일/주/월/분기/연 구간으로 나눈 구간별 수입/지출 (모든 구간을 쿼리 한 번으로)"""
+        if start_date > end_date:
+            raise InvalidTransactionError("start_date must be on or before end_date")
+        periods = list(iter_periods(start_date, end_date, granularity))
+        if len(periods) > MAX_PERIOD_BUCKETS:
+            raise InvalidTransactionError(f"Too many periods ({len(periods)}), use a coarser granularity")
+        if account_id and not self.account_repo.get_by_id(account_id):
+            raise AccountNotFoundError(f"Account {account_id} not found")
+        return summary_cache.get_or_compute(
+            user_id, "period_summary",
+            lambda: self._build_period_summary(granularity, start_date, end_date, periods, account_id, user_id),
+            granularity, start_date, end_date, account_id, db=self.db
+        )
+
+    def _build_period_summary(
+        self,
+        granularity: str,
+        start_date: date,
+        end_date: date,
+        periods: List[Tuple[date, date]],
+        account_id: Optional[int],
+        user_id: int
+    ) -> schemas.PeriodSummary:
+        totals = {}
+        for row in self.transaction_repo.get_period_totals(
+            granularity, period_floor(start_date, granularity),
+            start_date, end_date + timedelta(days=1), user_id, account_id
+        ):
+            totals[(row.bucket, row.type)] = (row.amount, row.transaction_count)
+
+        buckets = []
+        for index, (period_start, period_before) in enumerate(periods):
+            income, income_count = totals.get((index, models.TransactionType.income), (Decimal(0), 0))
+            expense, expense_count = totals.get((index, models.TransactionType.expense), (Decimal(0), 0))
+            buckets.append(schemas.PeriodBucket(
+                period_start=period_start,
+                period_end=period_before - timedelta(days=1),
+                income=income,
+                expense=expense,
+                net=income - expense,
+                transaction_count=income_count + expense_count
+            ))
+        return schemas.PeriodSummary(
+            granularity=granularity,
+            start_date=start_date,
+            end_date=end_date,
+            account_id=account_id,
+            buckets=buckets
+        )
+
+    def get_monthly_spending_by_category(self, account_id: int, year: int, month: int) -> List[schemas.MonthlyExpense]:
+        """계좌의 월별 카테고리별 지출 (금액 내림차순)"""
+        account = self.account_repo.get_by_id(account_id)
+        if not account:
+            raise AccountNotFoundError(f"Account {account_id} not found")
+        
+        fixed_categories = {
+            name for (name,) in self.db.query(models.Category.name).filter(
+                models.Category.user_id == account.user_id,
+                models.Category.type == models.CategoryType.expense,
+                models.Category.is_fixed == True
+            )
+        }
+        totals = self.monthly_total_repo.get_account_month(
+            account_id, year, month, models.TransactionType.expense
+        )
+        return [
+            schemas.MonthlyExpense(
+                category_name=total.category,
+                amount=total.total_amount,
+                is_fixed=total.category in fixed_categories
+            )
+            for total in totals
+        ]
+
+    def rebuild_monthly_totals(self) -> int:
+        """월별 집계 테이블 전체 재생성"""
+        count = self.monthly_total_repo.rebuild()
+        self.db.commit()
+        return count
+
+
+class AsyncTransactionService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.transaction_repo = AsyncTransactionRepository(db)
+        self.account_repo = AsyncAccountRepository(db)
+    
+    async def get_transactions(self, account_id: Optional[int] = None, limit: int = 100, start_date: Optional[date] = None, end_date: Optional[date] = None) -> List[schemas.Transaction]:
+        transactions = await self.transaction_repo.get_rows(account_id, limit, start_date, end_date)
+        return [schemas.Transaction.model_validate(tx) for tx in transactions]
+
+    async def get_transaction_page(
+        self,
+        account_id: Optional[int] = None,
+        limit: int = 100,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        cursor: Optional[str] = None
+    ) -> schemas.TransactionPage:
+        """커서 기반 거래 내역 페이지 조회 (keyset 조회는 동기 서비스를 run_sync로 재사용)"""
+        return await self.db.run_sync(lambda session: TransactionService(session).get_transaction_page(
+            account_id, limit, start_date, end_date, cursor
+        ))
+
+    async def get_monthly_summary(self, year: int, month: int, user_id: int = 1) -> dict:
+        """월별 수입/지출(고정/변동) 요약 (월별 집계 조회는 동기 서비스를 run_sync로 재사용)"""
+        return await self.db.run_sync(lambda session: TransactionService(session).get_monthly_summary(year, month, user_id))
+
+    async def get_monthly_spending_by_category(self, account_id: int, year: int, month: int) -> List[schemas.MonthlyExpense]:
+        """계좌의 월별 카테고리별 지출 (월별 집계 조회는 동기 서비스를 run_sync로 재사용)"""
+        return await self.db.run_sync(
+            lambda session: TransactionService(session).get_monthly_spending_by_category(account_id, year, month)
+        )
+    
+    async def get_transaction_rows(self, account_id: Optional[int] = None, limit: int = 100, start_date: Optional[date] = None, end_date: Optional[date] = None) -> List[Row]:
+        """응답 직렬화용 원본 행 (검증은 응답 단계에서 한 번만)"""
+        return await self.transaction_repo.get_rows(account_id, limit, start_date, end_date)
+    
+    async def search_transactions(
+        self,
+        query: str,
+        account_id: Optional[int] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        min_amount: Optional[Decimal] = None,
+        max_amount: Optional[Decimal] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None
+    ) -> schemas.TransactionSearchPage:
+        """전문 검색 (방언별 검색 SQL은 동기 리포지토리를 run_sync로 재사용)"""
+        return await self.db.run_sync(lambda session: TransactionService(session).search_transactions(
+            query, account_id, start_date, end_date, min_amount, max_amount, limit, cursor
+        ))
+
+    async def get_period_summary(
+        self,
+        granularity: str,
+        start_date: date,
+        end_date: date,
+        account_id: Optional[int] = None,
+        user_id: int = 1
+    ) -> schemas.PeriodSummary:
+        """기간별 집계 (방언별 구간 계산식은 동기 리포지토리를 run_sync로 재사용)"""
+        return await self.db.run_sync(lambda session: TransactionService(session).get_period_summary(
+            granularity, start_date, end_date, account_id, user_id
+        ))
+    
+    async def create_transaction(self, transaction: schemas.TransactionCreate) -> schemas.Transaction:
+        # 아카이브된 연도에는 쓸 수 없음
+        transaction_archive.ensure_writable(transaction.transaction_date)
+
+        # 비즈니스 로직: 계좌 존재 확인
+        account = await self.account_repo.get_by_id(transaction.account_id)
+        if not account:
+            raise AccountNotFoundError(f"Account {transaction.account_id} not found")
+        
+        # 비즈니스 로직: 계좌 잔액 업데이트 (지출은 잔액 검사와 차감을 UPDATE 한 문장으로)
+        delta = balance_delta(transaction.type, transaction.amount)
+        if delta and not await self.account_repo.update_balance(
+            transaction.account_id, delta, require_sufficient=transaction.type == models.TransactionType.expense
+        ):
+            raise InvalidTransactionError("Insufficient balance for expense")
+        
+        # 거래 생성
+        transaction_data = transaction.model_dump()
+        db_transaction = await self.transaction_repo.create(transaction_data)
+        
+        # 월별 집계도 같은 DB 트랜잭션에서 갱신
+        await self.db.run_sync(apply_monthly_totals, [(total_key(db_transaction), transaction.amount, 1)])
+        mark_summary_dirty(self.db, account.user_id)
+        
+        await self.db.commit()
+        await self.db.refresh(db_transaction)
+        
+        return schemas.Transaction.model_validate(db_transaction)
+    
+    async def update_transaction(self, transaction_id: int, transaction_update: schemas.TransactionUpdate) -> schemas.Transaction:
+        """거래 수정 (잔액 조정 포함)"""
+        db_transaction = await self.transaction_repo.get_by_id(transaction_id, for_update=True)
+        if not db_transaction:
+            raise InvalidTransactionError(f"Transaction {transaction_id} not found")
+        
+        # 기존 거래 정보 저장
+        old_amount = db_transaction.amount
+        old_type = db_transaction.type
+        old_key = total_key(db_transaction)
+        
+        # 거래 정보 업데이트
+        update_data = transaction_update.model_dump(exclude_unset=True)
+        if update_data.get('transaction_date') is not None:
+            transaction_archive.ensure_writable(update_data['transaction_date'])
+        updated_transaction = await self.transaction_repo.update(db_transaction, update_data)
+        
+        await self.db.run_sync(apply_monthly_totals, total_changes(
+            old_key, old_amount, total_key(updated_transaction), updated_transaction.amount
+        ))
+        
+        # 금액이나 타입이 변경된 경우 기존/새 거래의 차이만큼 한 번에 잔액 조정
+        if 'amount' in update_data or 'type' in update_data:
+            delta = balance_delta(updated_transaction.type, updated_transaction.amount) - balance_delta(old_type, old_amount)
+            if delta:
+                await self.account_repo.update_balance(db_transaction.account_id, delta)
+        
+        account = await self.account_repo.get_by_id(db_transaction.account_id)
+        mark_summary_dirty(self.db, account.user_id)
+        await self.db.commit()
+        await self.db.refresh(updated_transaction)
+        
+        return schemas.Transaction.model_validate(updated_transaction)
+    
+    async def delete_transaction(self, transaction_id: int) -> bool:
+        """거래 삭제 및 잔액 롤백"""
+        db_transaction = await self.transaction_repo.get_by_id(transaction_id, for_update=True)
+        if not db_transaction:
+            raise InvalidTransactionError(f"Transaction {transaction_id} not found")
+        
+        # 비즈니스 로직: 잔액 원복
+        delta = balance_delta(db_transaction.type, db_transaction.amount)
+        if delta:
+            await self.account_repo.update_balance(db_transaction.account_id, -delta)
+        
+        await self.db.run_sync(apply_monthly_totals, [(total_key(db_transaction), -db_transaction.amount, -1)])
+        account = await self.account_repo.get_by_id(db_transaction.account_id)
+        mark_summary_dirty(self.db, account.user_id)
+        
+        await self.transaction_repo.delete(db_transaction)
+        await self.db.commit()
+        return True
+
+    async def rebuild_monthly_totals(self) -> int:
+        """월별 집계 테이블 전체 재생성"""
+        return await self.db.run_sync(lambda session: TransactionService(session).rebuild_monthly_totals())
@@ -0,0 +1,194 @@
+"""
+잔액 동시성 스트레스 벤치마크
+스레드 풀로 여러 계좌에 거래 생성/수정/삭제를 동시에 실행한 뒤
+최종 잔액 = 초기 잔액 + 남아 있는 거래의 부호 있는 합계 인지 검증하고 처리량을 출력
+
+사용법 (backend 디렉터리에서):
+    python -m benchmarks.balance_stress --operations 5000 --workers 16
+    python -m benchmarks.balance_stress --database-url mysql+pymysql://user:pw@localhost/bench
+"""
+import argparse
+import os
+import random
+import tempfile
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import create_engine, event, func, select
+from sqlalchemy.exc import DBAPIError, InvalidRequestError
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm.exc import StaleDataError
+
+from app import models, schemas
+from app.database import Base
+from app.core.exceptions import InvalidTransactionError
+from app.services.transaction_service import TransactionService, balance_delta
+
+INITIAL_BALANCE = Decimal("100000")
+
+
+def create_bench_engine(url: str):
+    if not url.startswith("sqlite"):
+        return create_engine(url, pool_size=32, max_overflow=32, pool_pre_ping=True)
+
+    # SQLite에는 행 잠금(SELECT ... FOR UPDATE)이 없으므로 트랜잭션 시작 시 쓰기 잠금을 잡아
+    # MySQL의 잠금 읽기와 같은 직렬화 보장을 맞춤 (pysqlite는 기본적으로 첫 DML 전까지 BEGIN을 미룸)
+    engine = create_engine(url, connect_args={"check_same_thread": False, "timeout": 30})
+
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_begin(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _begin_immediate(connection):
+        connection.exec_driver_sql("BEGIN IMMEDIATE")
+
+    return engine
+
+
+class StressRun:
+    def __init__(self, session_factory, account_ids, seed: int):
+        self.session_factory = session_factory
+        self.account_ids = account_ids
+        self.seed = seed
+        self.created_ids = []
+        self.ids_lock = threading.Lock()
+        self.outcomes = Counter()
+        self.outcomes_lock = threading.Lock()
+
+    def record(self, outcome: str) -> None:
+        with self.outcomes_lock:
+            self.outcomes[outcome] += 1
+
+    def pick_transaction(self, rng: random.Random):
+        with self.ids_lock:
+            return rng.choice(self.created_ids) if self.created_ids else None
+
+    def run_operation(self, index: int) -> None:
+        rng = random.Random(self.seed * 1_000_003 + index)
+        roll = rng.random()
+        db = self.session_factory()
+        service = TransactionService(db)
+        try:
+            transaction_id = self.pick_transaction(rng) if roll >= 0.6 else None
+            if transaction_id is None:
+                created = service.create_transaction(schemas.TransactionCreate(
+                    account_id=rng.choice(self.account_ids),
+                    category="벤치마크",
+                    type=rng.choice([models.TransactionType.income, models.TransactionType.expense]),
+                    amount=Decimal(rng.randint(100, 500_000)) / 100,
+                    transaction_date=date(2024, 1, rng.randint(1, 28))
+                ))
+                with self.ids_lock:
+                    self.created_ids.append(created.id)
+                self.record("create")
+            elif roll < 0.8:
+                service.update_transaction(transaction_id, schemas.TransactionUpdate(
+                    amount=Decimal(rng.randint(100, 500_000)) / 100
+                ))
+                self.record("update")
+            else:
+                service.delete_transaction(transaction_id)
+                self.record("delete")
+        except InvalidTransactionError:
+            # 잔액 부족 또는 이미 삭제된 거래
+            db.rollback()
+            self.record("rejected")
+        except (StaleDataError, DBAPIError, InvalidRequestError):
+            # 동시 삭제/잠금 대기 초과/데드락 (commit 후 refresh 시점에 이미 삭제된 경우 포함)
+            db.rollback()
+            self.record("conflict")
+        finally:
+            db.close()
+
+
+def setup_accounts(session_factory, account_count: int):
+    db = session_factory()
+    try:
+        accounts = [
+            models.Account(name=f"Stress {i}", type=models.AccountType.checking, balance=INITIAL_BALANCE)
+            for i in range(account_count)
+        ]
+        db.add_all(accounts)
+        db.commit()
+        return [account.id for account in accounts]
+    finally:
+        db.close()
+
+
+def verify_balances(session_factory, account_ids):
+    """계좌별 실제 잔액과 원장으로 계산한 기대 잔액 비교 → 불일치 계좌 목록"""
+    db = session_factory()
+    try:
+        signed = {account_id: Decimal("0") for account_id in account_ids}
+        rows = db.execute(
+            select(models.Transaction.account_id, models.Transaction.type, func.sum(models.Transaction.amount))
+            .where(models.Transaction.account_id.in_(account_ids))
+            .group_by(models.Transaction.account_id, models.Transaction.type)
+        ).all()
+        for account_id, transaction_type, amount in rows:
+            signed[account_id] += balance_delta(transaction_type, Decimal(str(amount)))
+
+        mismatches = []
+        for account in db.query(models.Account).filter(models.Account.id.in_(account_ids)):
+            expected = INITIAL_BALANCE + signed[account.id]
+            if Decimal(str(account.balance)) != expected:
+                mismatches.append((account.id, account.balance, expected))
+            if account.balance < 0:
+                mismatches.append((account.id, account.balance, "negative"))
+        return mismatches
+    finally:
+        db.close()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="잔액 동시성 스트레스 벤치마크")
+    parser.add_argument("--database-url", default=None, help="기본값: 임시 SQLite 파일")
+    parser.add_argument("--operations", type=int, default=3000)
+    parser.add_argument("--workers", type=int, default=16)
+    parser.add_argument("--accounts", type=int, default=4, help="적을수록 같은 계좌 경합이 심해짐")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    temp_dir = None
+    url = args.database_url
+    if url is None:
+        temp_dir = tempfile.TemporaryDirectory()
+        url = f"sqlite:///{os.path.join(temp_dir.name, 'stress.db')}"
+
+    engine = create_bench_engine(url)
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    try:
+        account_ids = setup_accounts(session_factory, args.accounts)
+        run = StressRun(session_factory, account_ids, args.seed)
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.workers) as pool:
+            list(pool.map(run.run_operation, range(args.operations)))
+        elapsed = time.perf_counter() - started
+
+        mismatches = verify_balances(session_factory, account_ids)
+        print(f"database: {engine.dialect.name}, workers: {args.workers}, accounts: {args.accounts}")
+        print(f"operations: {args.operations} in {elapsed:.2f}s ({args.operations / elapsed:.1f} ops/s)")
+        print("outcomes: " + ", ".join(f"{name}={count}" for name, count in sorted(run.outcomes.items())))
+        if mismatches:
+            for account_id, actual, expected in mismatches:
+                print(f"MISMATCH account {account_id}: balance {actual}, expected {expected}")
+            return 1
+        print("balances: OK (balance == initial + signed ledger sum for every account)")
+        return 0
+    finally:
+        if temp_dir is None:
+            Base.metadata.drop_all(bind=engine)
+        engine.dispose()
+        if temp_dir is not None:
+            temp_dir.cleanup()
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
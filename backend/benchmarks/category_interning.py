@@ -0,0 +1,93 @@
+"""
+카테고리 인터닝 벤치마크
+- before: 거래의 카테고리 문자열로 조인/GROUP BY (카테고리 트리 집계, 월별 집계 재계산)
+- after: 인터닝된 정수 category_id로 조인/GROUP BY
+기존 원장을 인터닝하는 마이그레이션(intern-categories) 시간도 함께 측정
+
+사용법 (backend 디렉터리에서):
+    python -m benchmarks.category_interning --depth 4 --fanout 6 --transactions 500000
+"""
+import argparse
+import json
+import time
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from app.core.cache import summary_cache
+from app.core.config import settings
+from app.database import Base
+from app.repositories.category_dictionary import category_dictionary
+from app.services.category_service import CategoryService
+from app.services.transaction_service import TransactionService
+from benchmarks.category_rollup import END_DATE, START_DATE, build_tree, load_transactions, measure
+
+
+def rollup(db: Session):
+    summary_cache.clear()
+    return {node.name: node.total_amount for node in CategoryService(db).get_rollup(START_DATE, END_DATE)}
+
+
+def rebuild(db: Session) -> int:
+    return TransactionService(db).rebuild_monthly_totals()
+
+
+def run_both(db: Session, func_):
+    """문자열 키 / 정수 키 모드로 각각 실행한 결과와 최소 시간"""
+    timings = {}
+    results = []
+    for interning in (False, True):
+        settings.CATEGORY_INTERNING = interning
+        category_dictionary.clear()
+        results.append(func_(db))
+        timings[interning] = measure(func_, db)
+    settings.CATEGORY_INTERNING = False
+    assert results[0] == results[1]
+    return timings[False], timings[True]
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="카테고리 인터닝 벤치마크")
+    parser.add_argument("--database-url", default="sqlite:///:memory:")
+    parser.add_argument("--depth", type=int, default=4)
+    parser.add_argument("--fanout", type=int, default=6)
+    parser.add_argument("--transactions", type=int, default=500_000)
+    parser.add_argument("--output", default=None, help="결과 JSON 파일 경로")
+    args = parser.parse_args(argv)
+
+    engine = create_engine(args.database_url)
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    with Session(engine) as db:
+        category_ids = build_tree(db, args.depth, args.fanout)
+        load_transactions(db, category_ids, args.transactions)
+
+        started = time.perf_counter()
+        migrated = CategoryService(db).intern_ledger()
+        migrate_seconds = time.perf_counter() - started
+
+        rollup_name, rollup_id = run_both(db, rollup)
+        rebuild_name, rebuild_id = run_both(db, rebuild)
+
+    results = {
+        "categories": len(category_ids),
+        "transactions": args.transactions,
+        "migrated_rows": migrated["transactions"],
+        "migrate_seconds": round(migrate_seconds, 3),
+        "rollup_by_name_ms": round(rollup_name * 1000, 3),
+        "rollup_by_id_ms": round(rollup_id * 1000, 3),
+        "rollup_speedup": round(rollup_name / rollup_id, 2),
+        "rebuild_by_name_ms": round(rebuild_name * 1000, 3),
+        "rebuild_by_id_ms": round(rebuild_id * 1000, 3),
+        "rebuild_speedup": round(rebuild_name / rebuild_id, 2),
+    }
+    for key, value in results.items():
+        print(f"{key:<24} {value}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"depth": args.depth, "fanout": args.fanout, "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""
+카테고리 트리 집계 벤치마크 (깊고 넓은 트리)
+- before: 노드마다 자식 조회 + 자기 거래 합계 조회를 재귀로 (lazy load와 같은 노드당 쿼리)
+- after: 클로저 테이블 조인 + GROUP BY 한 번 (CategoryService.get_rollup)
+트리 유지 비용(노드 생성, 서브트리 이동)도 함께 측정
+
+사용법 (backend 디렉터리에서):
+    python -m benchmarks.category_rollup --depth 5 --fanout 5 --transactions 200000
+"""
+import argparse
+import json
+import random
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Dict, List
+
+from sqlalchemy import create_engine, func, insert, select
+from sqlalchemy.orm import Session
+
+from app import models, schemas
+from app.core.cache import summary_cache
+from app.database import Base
+from app.services.category_service import CategoryService
+
+START_DATE = date(2024, 1, 1)
+END_DATE = date(2024, 12, 31)
+
+
+def build_tree(db: Session, depth: int, fanout: int) -> List[int]:
+    """루트 하나 아래 depth 단계 x fanout 자식의 완전 트리를 서비스 경로(클로저 유지 포함)로 생성"""
+    service = CategoryService(db)
+    ids: List[int] = []
+    level = [None]
+    for _ in range(depth):
+        next_level = []
+        for parent_id in level:
+            for _ in range(1 if parent_id is None else fanout):
+                category = service.create_category(schemas.CategoryCreate(
+                    name=f"c{len(ids)}", type=models.CategoryType.expense, parent_id=parent_id
+                ))
+                ids.append(category.id)
+                next_level.append(category.id)
+        level = next_level
+    return ids
+
+
+def load_transactions(db: Session, category_ids: List[int], count: int, seed: int = 42) -> None:
+    rng = random.Random(seed)
+    account = models.Account(name="벤치마크", type=models.AccountType.checking, balance=Decimal("0"))
+    db.add(account)
+    db.flush()
+    days = (END_DATE - START_DATE).days
+    rows = [
+        {
+            "account_id": account.id,
+            "category": f"c{rng.randrange(len(category_ids))}",
+            "type": models.TransactionType.expense,
+            "amount": Decimal(rng.randint(1, 500) * 100),
+            "transaction_date": START_DATE + timedelta(days=rng.randint(0, days)),
+            "is_recurring": False,
+        }
+        for _ in range(count)
+    ]
+    for start in range(0, len(rows), 10_000):
+        db.execute(insert(models.Transaction), rows[start:start + 10_000])
+    db.commit()
+
+
+def naive_rollup(db: Session, user_id: int = 1) -> Dict[str, Decimal]:
+    """재귀 노드 순회: 노드마다 자식 목록 쿼리 1번 + 자기 거래 합계 쿼리 1번"""
+    totals: Dict[str, Decimal] = {}
+
+    def visit(category_id: int, name: str) -> Decimal:
+        own = db.execute(
+            select(func.coalesce(func.sum(models.Transaction.amount), 0)).where(
+                models.Transaction.category == name,
+                models.Transaction.transaction_date >= START_DATE,
+                models.Transaction.transaction_date <= END_DATE
+            )
+        ).scalar()
+        children = db.execute(
+            select(models.Category.id, models.Category.name).where(models.Category.parent_id == category_id)
+        ).all()
+        total = Decimal(own) + sum((visit(child.id, child.name) for child in children), Decimal("0"))
+        totals[name] = total
+        return total
+
+    roots = db.execute(
+        select(models.Category.id, models.Category.name)
+        .where(models.Category.user_id == user_id, models.Category.parent_id.is_(None))
+    ).all()
+    for root in roots:
+        visit(root.id, root.name)
+    return totals
+
+
+def closure_rollup(db: Session) -> Dict[str, Decimal]:
+    summary_cache.clear()
+    rollup = CategoryService(db).get_rollup(START_DATE, END_DATE)
+    return {node.name: node.total_amount for node in rollup}
+
+
+def measure(func_, *args, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func_(*args)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="카테고리 트리 집계 벤치마크")
+    parser.add_argument("--database-url", default="sqlite:///:memory:")
+    parser.add_argument("--depth", type=int, default=5)
+    parser.add_argument("--fanout", type=int, default=5)
+    parser.add_argument("--transactions", type=int, default=200_000)
+    parser.add_argument("--output", default=None, help="결과 JSON 파일 경로")
+    args = parser.parse_args(argv)
+
+    engine = create_engine(args.database_url)
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    with Session(engine) as db:
+        started = time.perf_counter()
+        category_ids = build_tree(db, args.depth, args.fanout)
+        create_seconds = time.perf_counter() - started
+        load_transactions(db, category_ids, args.transactions)
+
+        # 두 방식의 결과가 같은지 먼저 확인
+        assert naive_rollup(db) == closure_rollup(db)
+        naive_seconds = measure(naive_rollup, db)
+        closure_seconds = measure(closure_rollup, db)
+
+        # 루트 바로 밑 서브트리 하나를 다른 형제 밑으로 이동했다가 되돌림
+        service = CategoryService(db)
+        subtree_root, new_parent = category_ids[1], category_ids[2]
+        started = time.perf_counter()
+        service.update_category(subtree_root, schemas.CategoryUpdate(parent_id=new_parent))
+        move_seconds = time.perf_counter() - started
+        service.update_category(subtree_root, schemas.CategoryUpdate(parent_id=category_ids[0]))
+        closure_rows = db.execute(select(func.count()).select_from(models.CategoryClosure)).scalar()
+
+    results = {
+        "categories": len(category_ids),
+        "closure_rows": closure_rows,
+        "transactions": args.transactions,
+        "create_ms_per_category": round(create_seconds / len(category_ids) * 1000, 3),
+        "move_subtree_ms": round(move_seconds * 1000, 3),
+        "naive_rollup_ms": round(naive_seconds * 1000, 3),
+        "closure_rollup_ms": round(closure_seconds * 1000, 3),
+        "speedup": round(naive_seconds / closure_seconds, 2),
+    }
+    for key, value in results.items():
+        print(f"{key:<24} {value}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"depth": args.depth, "fanout": args.fanout, "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
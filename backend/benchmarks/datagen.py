@@ -0,0 +1,233 @@
+"""
+벤치마크용 결정적(seed 고정) 합성 데이터 생성기
+사용자 N명 x 계좌 M개, 수년치 거래, 정기 거래, 월말 자산 스냅샷을 빈 DB에 일괄 적재
+
+사용법 (backend 디렉터리에서):
+    python -m benchmarks.datagen --database-url sqlite:////tmp/bench.db --users 20 --years 3
+"""
+import argparse
+import calendar
+import random
+import time
+from dataclasses import dataclass, asdict
+from datetime import date
+from decimal import Decimal
+from typing import Dict, List
+
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import Session
+
+from app import models
+from app.database import Base
+from app.repositories.category_repository import CategoryRepository
+from app.repositories.monthly_total_repository import MonthlyCategoryTotalRepository
+from app.services.recurring_schedule import occurrence_on_or_after
+
+# (이름, 타입, 고정 여부, 최소 금액, 최대 금액)
+CATEGORIES = [
+    ("급여", models.CategoryType.income, True, 2_500_000, 4_500_000),
+    ("이자", models.CategoryType.income, False, 1_000, 50_000),
+    ("월세", models.CategoryType.expense, True, 500_000, 900_000),
+    ("통신비", models.CategoryType.expense, True, 50_000, 120_000),
+    ("식비", models.CategoryType.expense, False, 5_000, 60_000),
+    ("교통", models.CategoryType.expense, False, 1_500, 30_000),
+    ("쇼핑", models.CategoryType.expense, False, 10_000, 300_000),
+    ("기타", models.CategoryType.expense, False, 1_000, 100_000),
+]
+INCOME_CATEGORIES = [c for c in CATEGORIES if c[1] == models.CategoryType.income]
+EXPENSE_CATEGORIES = [c for c in CATEGORIES if c[1] == models.CategoryType.expense]
+ACCOUNT_TYPES = list(models.AccountType)
+# 거래 설명에 붙는 가맹점명 (전문 검색 벤치마크용)
+MERCHANTS = ["스타벅스", "이마트", "쿠팡", "배달의민족", "GS25", "카카오택시", "올리브영", "교보문고", "넷플릭스", "점심 김밥천국"]
+INSERT_CHUNK = 10_000
+
+
+@dataclass(frozen=True)
+class DatasetSpec:
+    users: int = 10
+    accounts_per_user: int = 3
+    years: int = 1
+    transactions_per_month: int = 20  # 계좌당
+    recurring_per_account: int = 2
+    end_date: date = date(2025, 12, 31)
+    seed: int = 42
+
+    @property
+    def start_date(self) -> date:
+        return date(self.end_date.year - self.years + 1, 1, 1)
+
+
+SIZES: Dict[str, DatasetSpec] = {
+    "small": DatasetSpec(users=5, accounts_per_user=3, years=1, transactions_per_month=20),
+    "medium": DatasetSpec(users=20, accounts_per_user=3, years=3, transactions_per_month=30),
+    "large": DatasetSpec(users=50, accounts_per_user=4, years=5, transactions_per_month=40),
+}
+
+
+def month_starts(start: date, end: date) -> List[date]:
+    months = []
+    current = start.replace(day=1)
+    while current <= end:
+        months.append(current)
+        current = date(current.year + current.month // 12, current.month % 12 + 1, 1)
+    return months
+
+
+def amount_between(rng: random.Random, low: int, high: int) -> Decimal:
+    return Decimal(rng.randint(low, high))
+
+
+def generate(db: Session, spec: DatasetSpec) -> dict:
+    """
+    빈 테이블에 데이터셋 적재 후 건수 반환
+    잔액은 초기 잔액 + 생성한 거래의 부호 있는 합계와 일치하고, 월말 스냅샷도 같은 잔액 흐름으로 기록
+    """
+    rng = random.Random(spec.seed)
+    started = time.perf_counter()
+    months = month_starts(spec.start_date, spec.end_date)
+
+    categories, accounts, recurring, snapshots = [], [], [], []
+    transactions: List[dict] = []
+    transaction_count = 0
+    account_id = 0
+
+    def flush_transactions() -> None:
+        nonlocal transaction_count
+        if transactions:
+            db.execute(insert(models.Transaction), transactions)
+            transaction_count += len(transactions)
+            transactions.clear()
+
+    for user_id in range(1, spec.users + 1):
+        for name, category_type, is_fixed, _, _ in CATEGORIES:
+            categories.append({"user_id": user_id, "name": name, "type": category_type, "is_fixed": is_fixed})
+
+        user_accounts = []
+        for index in range(spec.accounts_per_user):
+            account_id += 1
+            user_accounts.append({
+                "id": account_id,
+                "user_id": user_id,
+                "name": f"계좌 {user_id}-{index + 1}",
+                "type": ACCOUNT_TYPES[index % len(ACCOUNT_TYPES)],
+                "balance": amount_between(rng, 1_000_000, 20_000_000),
+                "institution": f"은행 {index + 1}",
+            })
+
+        for account in user_accounts:
+            for _ in range(spec.recurring_per_account):
+                name, category_type, _, low, high = rng.choice([c for c in CATEGORIES if c[2]])
+                row = {
+                    "account_id": account["id"],
+                    "type": models.TransactionType(category_type.value),
+                    "category": name,
+                    "amount": amount_between(rng, low, high),
+                    "frequency": models.Frequency.monthly,
+                    "day_of_month": rng.randint(1, 28),
+                    "is_active": True,
+                    "start_date": spec.start_date,
+                }
+                probe = models.RecurringTransaction(**row)
+                row["next_run_date"] = occurrence_on_or_after(probe, spec.end_date)
+                recurring.append(row)
+
+        for month_start in months:
+            last_day = calendar.monthrange(month_start.year, month_start.month)[1]
+            for account in user_accounts:
+                for _ in range(spec.transactions_per_month):
+                    # 수입 비중을 높여 잔액이 음수가 되지 않도록 유지
+                    is_income = rng.random() < 0.2
+                    name, category_type, _, low, high = rng.choice(INCOME_CATEGORIES if is_income else EXPENSE_CATEGORIES)
+                    amount = amount_between(rng, low, high)
+                    transaction_type = models.TransactionType(category_type.value)
+                    if transaction_type == models.TransactionType.expense and account["balance"] < amount:
+                        transaction_type, name = models.TransactionType.income, "이자"
+                    account["balance"] += amount if transaction_type == models.TransactionType.income else -amount
+                    transactions.append({
+                        "account_id": account["id"],
+                        "category": name,
+                        "type": transaction_type,
+                        "amount": amount,
+                        "description": f"{rng.choice(MERCHANTS)} {name} {month_start:%Y-%m}",
+                        "transaction_date": month_start.replace(day=rng.randint(1, last_day)),
+                        "is_recurring": False,
+                    })
+                if len(transactions) >= INSERT_CHUNK:
+                    flush_transactions()
+
+            month_end = month_start.replace(day=last_day)
+            total = sum(acc["balance"] for acc in user_accounts)
+            snapshots.append({
+                "user_id": user_id,
+                "snapshot_date": month_end,
+                "total_assets": total,
+                "net_worth": total,
+                "accounts_summary": [
+                    {"account_id": acc["id"], "name": acc["name"], "type": acc["type"].value, "balance": float(acc["balance"])}
+                    for acc in user_accounts
+                ],
+            })
+        accounts.extend(user_accounts)
+
+    db.execute(insert(models.Category), categories)
+    CategoryRepository(db).rebuild_closure()
+    # 지출 카테고리마다 월 예산 (대략 월 10건 상한 수준)
+    limits = {name: (low + high) * 5 for name, _, _, low, high in EXPENSE_CATEGORIES}
+    budgets = [
+        {"user_id": row.user_id, "category_id": row.id, "monthly_limit": Decimal(limits[row.name])}
+        for row in db.execute(
+            select(models.Category.id, models.Category.user_id, models.Category.name)
+            .where(models.Category.type == models.CategoryType.expense)
+        )
+    ]
+    db.execute(insert(models.Budget), budgets)
+    db.execute(insert(models.Account), accounts)
+    flush_transactions()
+    db.execute(insert(models.RecurringTransaction), recurring)
+    db.execute(insert(models.AssetSnapshot), snapshots)
+    totals = MonthlyCategoryTotalRepository(db).rebuild()
+    db.commit()
+
+    return {
+        "spec": {**asdict(spec), "end_date": spec.end_date.isoformat()},
+        "users": spec.users,
+        "accounts": len(accounts),
+        "transactions": transaction_count,
+        "recurring_transactions": len(recurring),
+        "snapshots": len(snapshots),
+        "monthly_totals": totals,
+        "elapsed_seconds": round(time.perf_counter() - started, 3),
+    }
+
+
+def reset_schema(engine) -> None:
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="벤치마크용 합성 데이터 생성")
+    parser.add_argument("--database-url", required=True)
+    parser.add_argument("--size", choices=sorted(SIZES), default=None, help="미리 정의된 크기 (개별 옵션보다 우선)")
+    parser.add_argument("--users", type=int, default=DatasetSpec.users)
+    parser.add_argument("--accounts-per-user", type=int, default=DatasetSpec.accounts_per_user)
+    parser.add_argument("--years", type=int, default=DatasetSpec.years)
+    parser.add_argument("--transactions-per-month", type=int, default=DatasetSpec.transactions_per_month)
+    parser.add_argument("--seed", type=int, default=DatasetSpec.seed)
+    args = parser.parse_args(argv)
+
+    spec = SIZES[args.size] if args.size else DatasetSpec(
+        users=args.users,
+        accounts_per_user=args.accounts_per_user,
+        years=args.years,
+        transactions_per_month=args.transactions_per_month,
+        seed=args.seed,
+    )
+    engine = create_engine(args.database_url)
+    reset_schema(engine)
+    with Session(engine) as db:
+        print(generate(db, spec))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,370 @@
+"""
+app/api/v1 전체 라우트 지연 시간 벤치마크
+합성 데이터(benchmarks.datagen)를 크기별로 적재한 뒤 ASGI 앱을 프로세스 안에서 호출하고
+라우트별 p50/p95/p99 지연 시간과 요청당 쿼리 수를 JSON으로 저장 (커밋 간 diff 용)
+
+사용법 (backend 디렉터리에서):
+    python -m benchmarks.endpoints --sizes small,medium --iterations 30 --output bench_results.json
+    BENCH_MYSQL_URL=mysql+pymysql://user:pw@localhost/bench python -m benchmarks.endpoints
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import sqlalchemy
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import sessionmaker
+
+from app.core.cache import summary_cache
+from app.core.config import settings
+from benchmarks.datagen import SIZES, DatasetSpec, generate, reset_schema
+
+PREFIX = settings.API_V1_PREFIX
+
+
+class QueryCounter:
+    """엔진에서 실행된 SQL 문 수 (엔드포인트는 스레드풀에서 실행되므로 잠금 사용)"""
+
+    def __init__(self, engine):
+        self.count = 0
+        self._lock = threading.Lock()
+        event.listen(engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, *args) -> None:
+        with self._lock:
+            self.count += 1
+
+
+@dataclass
+class Route:
+    name: str  # "METHOD /path/template" (라우터에 등록된 경로와 동일)
+    call: Callable[[TestClient, dict], object]  # ctx: 데이터셋 정보와 이전 호출 결과
+
+
+def _json(response) -> dict:
+    return response.json() if response.content else {}
+
+
+def _statement_csv(ctx: dict) -> bytes:
+    lines = ["date,amount,type,category,description"]
+    for day in range(1, 11):
+        lines.append(f"{ctx['end_date'][:8]}{day:02d},{1000 + day},income,벤치마크,import {day}")
+    return "\n".join(lines).encode("utf-8")
+
+
+def _create_transaction(client, ctx):
+    response = client.post(f"{PREFIX}/transactions/", json={
+        "account_id": ctx["account_id"], "category": "벤치마크", "type": "income",
+        "amount": "1000", "transaction_date": ctx["end_date"],
+    })
+    ctx["transaction_id"] = _json(response).get("id")
+    return response
+
+
+def _transaction_batch(client, ctx):
+    operations = [
+        {"op": "create", "transaction": {
+            "account_id": ctx["account_id"], "category": "벤치마크", "type": "income",
+            "amount": "1000", "transaction_date": ctx["end_date"],
+        }}
+        for _ in range(20)
+    ]
+    return client.post(f"{PREFIX}/transactions/batch", json={"mode": "atomic", "operations": operations})
+
+
+def _create_account(client, ctx):
+    response = client.post(f"{PREFIX}/accounts/", json={"name": "벤치마크 계좌", "type": "checking"})
+    ctx["new_account_id"] = _json(response).get("id")
+    return response
+
+
+def _create_category(client, ctx):
+    response = client.post(f"{PREFIX}/categories/", json={"name": "벤치마크", "type": "expense"})
+    ctx["category_id"] = _json(response).get("id")
+    return response
+
+
+def _create_budget(client, ctx):
+    category = client.post(f"{PREFIX}/categories/", json={"name": "예산 벤치마크", "type": "expense"})
+    ctx["budget_category_id"] = _json(category).get("id")
+    response = client.post(f"{PREFIX}/budgets/", json={"category_id": ctx["budget_category_id"], "monthly_limit": "100000"})
+    ctx["budget_id"] = _json(response).get("id")
+    return response
+
+
+def _create_recurring(client, ctx):
+    response = client.post(f"{PREFIX}/recurring/", json={
+        "account_id": ctx["account_id"], "type": "expense", "category": "구독", "amount": "9900",
+        "frequency": "monthly", "day_of_month": 15, "start_date": ctx["end_date"],
+    })
+    ctx["recurring_id"] = _json(response).get("id")
+    return response
+
+
+# 한 반복에서 이 순서대로 호출 (생성 → 조회/수정 → 삭제 순으로 데이터 크기 유지)
+ROUTES: List[Route] = [
+    Route("GET /accounts/", lambda c, ctx: c.get(f"{PREFIX}/accounts/")),
+    Route("GET /accounts/{account_id}", lambda c, ctx: c.get(f"{PREFIX}/accounts/{ctx['account_id']}")),
+    Route("POST /accounts/", _create_account),
+    Route("PATCH /accounts/{account_id}", lambda c, ctx: c.patch(
+        f"{PREFIX}/accounts/{ctx['new_account_id']}", json={"institution": "벤치마크 은행"})),
+    Route("DELETE /accounts/{account_id}", lambda c, ctx: c.delete(f"{PREFIX}/accounts/{ctx['new_account_id']}")),
+
+    Route("GET /transactions/", lambda c, ctx: c.get(f"{PREFIX}/transactions/", params={"limit": 100})),
+    Route("GET /transactions/page", lambda c, ctx: c.get(
+        f"{PREFIX}/transactions/page", params={"account_id": ctx["account_id"], "limit": 100})),
+    Route("GET /transactions/search", lambda c, ctx: c.get(
+        f"{PREFIX}/transactions/search", params={"q": "점심", "limit": 20})),
+    Route("GET /transactions/periods", lambda c, ctx: c.get(f"{PREFIX}/transactions/periods", params={
+        "granularity": "week", "start_date": f"{ctx['year'] - 1}-01-01", "end_date": ctx["end_date"]})),
+    Route("GET /transactions/export", lambda c, ctx: c.get(f"{PREFIX}/transactions/export", params={
+        "format": "csv", "account_id": ctx["account_id"], "start_date": ctx["month_start"]})),
+    Route("POST /transactions/", _create_transaction),
+    Route("PATCH /transactions/{transaction_id}", lambda c, ctx: c.patch(
+        f"{PREFIX}/transactions/{ctx['transaction_id']}", json={"amount": "1500"})),
+    Route("DELETE /transactions/{transaction_id}", lambda c, ctx: c.delete(
+        f"{PREFIX}/transactions/{ctx['transaction_id']}")),
+    Route("POST /transactions/import", lambda c, ctx: c.post(
+        f"{PREFIX}/transactions/import",
+        data={"account_id": str(ctx["account_id"])},
+        files={"file": ("statement.csv", _statement_csv(ctx), "text/csv")})),
+    Route("POST /transactions/batch", _transaction_batch),
+    Route("GET /transactions/monthly-spending/{account_id}/{year}/{month}", lambda c, ctx: c.get(
+        f"{PREFIX}/transactions/monthly-spending/{ctx['account_id']}/{ctx['year']}/{ctx['month']}")),
+
+    Route("GET /recurring/", lambda c, ctx: c.get(f"{PREFIX}/recurring/")),
+    Route("POST /recurring/", _create_recurring),
+    Route("GET /recurring/{recurring_id}", lambda c, ctx: c.get(f"{PREFIX}/recurring/{ctx['recurring_id']}")),
+    Route("PATCH /recurring/{recurring_id}", lambda c, ctx: c.patch(
+        f"{PREFIX}/recurring/{ctx['recurring_id']}", json={"amount": "10900"})),
+    Route("POST /recurring/{recurring_id}/deactivate", lambda c, ctx: c.post(
+        f"{PREFIX}/recurring/{ctx['recurring_id']}/deactivate")),
+    Route("DELETE /recurring/{recurring_id}", lambda c, ctx: c.delete(f"{PREFIX}/recurring/{ctx['recurring_id']}")),
+    Route("POST /recurring/process-due", lambda c, ctx: c.post(
+        f"{PREFIX}/recurring/process-due", params={"target_date": ctx["end_date"]})),
+
+    Route("GET /categories/", lambda c, ctx: c.get(f"{PREFIX}/categories/")),
+    Route("POST /categories/", _create_category),
+    Route("PATCH /categories/{category_id}", lambda c, ctx: c.patch(
+        f"{PREFIX}/categories/{ctx['category_id']}", json={"is_fixed": True})),
+    Route("GET /categories/rollup", lambda c, ctx: c.get(
+        f"{PREFIX}/categories/rollup", params={"start_date": ctx["month_start"], "end_date": ctx["end_date"]})),
+    Route("DELETE /categories/{category_id}", lambda c, ctx: c.delete(f"{PREFIX}/categories/{ctx['category_id']}")),
+
+    Route("GET /budgets/", lambda c, ctx: c.get(f"{PREFIX}/budgets/")),
+    Route("POST /budgets/", _create_budget),
+    Route("PATCH /budgets/{budget_id}", lambda c, ctx: c.patch(
+        f"{PREFIX}/budgets/{ctx['budget_id']}", json={"monthly_limit": "200000"})),
+    Route("GET /budgets/utilization", lambda c, ctx: c.get(
+        f"{PREFIX}/budgets/utilization", params={"as_of": ctx["end_date"]})),
+    Route("GET /budgets/alerts", lambda c, ctx: c.get(f"{PREFIX}/budgets/alerts", params={"as_of": ctx["end_date"]})),
+    Route("GET /budgets/projection", lambda c, ctx: c.get(
+        f"{PREFIX}/budgets/projection", params={"as_of": ctx["end_date"]})),
+    Route("DELETE /budgets/{budget_id}", lambda c, ctx: c.delete(f"{PREFIX}/budgets/{ctx['budget_id']}")),
+
+    Route("GET /summary/total-assets", lambda c, ctx: c.get(f"{PREFIX}/summary/total-assets")),
+    Route("GET /summary/monthly-expenses", lambda c, ctx: c.get(f"{PREFIX}/summary/monthly-expenses")),
+    Route("GET /summary/monthly-income", lambda c, ctx: c.get(f"{PREFIX}/summary/monthly-income")),
+    Route("GET /summary/", lambda c, ctx: c.get(f"{PREFIX}/summary/")),
+    Route("GET /summary/net-worth-trend", lambda c, ctx: c.get(
+        f"{PREFIX}/summary/net-worth-trend", params={"months": 12})),
+    Route("POST /summary/snapshots", lambda c, ctx: c.post(
+        f"{PREFIX}/summary/snapshots", params={"snapshot_date": ctx["end_date"]})),
+    Route("GET /summary/monthly/{year}/{month}", lambda c, ctx: c.get(
+        f"{PREFIX}/summary/monthly/{ctx['year']}/{ctx['month']}")),
+    Route("GET /summary/cache-stats", lambda c, ctx: c.get(f"{PREFIX}/summary/cache-stats")),
+
+    Route("GET /scheduler/status", lambda c, ctx: c.get(f"{PREFIX}/scheduler/status")),
+
+    Route("GET /debug/slow-queries", lambda c, ctx: c.get(f"{PREFIX}/debug/slow-queries")),
+    Route("DELETE /debug/slow-queries", lambda c, ctx: c.delete(f"{PREFIX}/debug/slow-queries")),
+]
+
+
+def registered_routes() -> set:
+    """app/api/v1 라우터에 등록된 "METHOD /path" 목록 (커버리지 확인용)"""
+    from app.api.v1 import api_router
+
+    return {
+        f"{method} {route.path}"
+        for route in api_router.routes
+        for method in getattr(route, "methods", ()) or ()
+        if method != "HEAD"
+    }
+
+
+def percentiles(samples: List[float]) -> dict:
+    values = np.array(samples) * 1000
+    p50, p95, p99 = np.percentile(values, [50, 95, 99])
+    return {
+        "p50_ms": round(float(p50), 3),
+        "p95_ms": round(float(p95), 3),
+        "p99_ms": round(float(p99), 3),
+        "mean_ms": round(float(values.mean()), 3),
+    }
+
+
+def create_bench_engine(url: str):
+    if url.startswith("sqlite"):
+        return create_engine(url, connect_args={"check_same_thread": False})
+    return create_engine(url, pool_pre_ping=True)
+
+
+def run_size(url: str, size: str, spec: DatasetSpec, iterations: int, warmup: int) -> dict:
+    """데이터셋 하나를 적재하고 모든 라우트를 iterations번 호출"""
+    from app.main import app
+    from app.api.deps import get_db
+
+    engine = create_bench_engine(url)
+    reset_schema(engine)
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    with session_factory() as db:
+        dataset = generate(db, spec)
+
+    def override_get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    counter = QueryCounter(engine)
+    summary_cache.clear()
+    app.dependency_overrides[get_db] = override_get_db
+    end_date = spec.end_date
+    ctx_base = {
+        "account_id": 1,
+        "end_date": end_date.isoformat(),
+        "month_start": end_date.replace(day=1).isoformat(),
+        "year": end_date.year,
+        "month": end_date.month,
+    }
+    latencies: Dict[str, List[float]] = {route.name: [] for route in ROUTES}
+    queries: Dict[str, List[int]] = {route.name: [] for route in ROUTES}
+    errors: Dict[str, int] = {route.name: 0 for route in ROUTES}
+    try:
+        client = TestClient(app)
+        for iteration in range(warmup + iterations):
+            # 반복마다 날짜를 하루씩 옮겨 생성/삭제 데이터가 겹치지 않게 함
+            ctx = dict(ctx_base, end_date=(end_date - timedelta(days=iteration % 28)).isoformat())
+            for route in ROUTES:
+                before = counter.count
+                started = time.perf_counter()
+                response = route.call(client, ctx)
+                elapsed = time.perf_counter() - started
+                if iteration < warmup:
+                    continue
+                latencies[route.name].append(elapsed)
+                queries[route.name].append(counter.count - before)
+                if response.status_code >= 400:
+                    errors[route.name] += 1
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+        engine.dispose()
+
+    return {
+        "dataset": dataset,
+        "routes": {
+            name: {
+                **percentiles(latencies[name]),
+                "queries_per_request": round(float(np.mean(queries[name])), 2),
+                "requests": len(latencies[name]),
+                "errors": errors[name],
+            }
+            for name in latencies
+        },
+    }
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def mysql_available(url: str) -> bool:
+    try:
+        engine = create_engine(url)
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+        engine.dispose()
+        return True
+    except Exception as e:
+        print(f"MySQL benchmark skipped ({url}): {e}")
+        return False
+
+
+def print_report(database: str, size: str, result: dict) -> None:
+    dataset = result["dataset"]
+    print(f"\n[{database} / {size}] {dataset['transactions']} transactions, {dataset['users']} users")
+    print(f"{'route':<62} {'p50':>8} {'p95':>8} {'p99':>8} {'queries':>8}")
+    for name, stats in result["routes"].items():
+        flag = f"  ({stats['errors']} errors)" if stats["errors"] else ""
+        print(
+            f"{name:<62} {stats['p50_ms']:>8.2f} {stats['p95_ms']:>8.2f} "
+            f"{stats['p99_ms']:>8.2f} {stats['queries_per_request']:>8.1f}{flag}"
+        )
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="API 라우트 지연 시간 벤치마크")
+    parser.add_argument("--sizes", default="small,medium", help=f"쉼표 구분 ({', '.join(SIZES)})")
+    parser.add_argument("--iterations", type=int, default=30)
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--database-url", action="append", default=None, help="여러 번 지정 가능 (기본: 임시 SQLite)")
+    parser.add_argument("--output", default="bench_results.json")
+    args = parser.parse_args(argv)
+
+    uncovered = registered_routes() - {route.name for route in ROUTES}
+    if uncovered:
+        print("Routes without a benchmark scenario: " + ", ".join(sorted(uncovered)))
+
+    temp_dir = tempfile.TemporaryDirectory()
+    urls = args.database_url or [f"sqlite:///{os.path.join(temp_dir.name, 'bench.db')}"]
+    mysql_url = os.environ.get("BENCH_MYSQL_URL")
+    if mysql_url and mysql_url not in urls and mysql_available(mysql_url):
+        urls.append(mysql_url)
+
+    results = {}
+    try:
+        for url in urls:
+            database = create_engine(url).dialect.name
+            for size in [s.strip() for s in args.sizes.split(",") if s.strip()]:
+                result = run_size(url, size, SIZES[size], args.iterations, args.warmup)
+                results.setdefault(database, {})[size] = result
+                print_report(database, size, result)
+    finally:
+        temp_dir.cleanup()
+
+    report = {
+        "meta": {
+            "commit": git_commit(),
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "sqlalchemy": sqlalchemy.__version__,
+            "iterations": args.iterations,
+            "warmup": args.warmup,
+        },
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\nWrote {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
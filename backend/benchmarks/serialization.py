@@ -0,0 +1,107 @@
+"""
+응답 직렬화 벤치마크 (1000행 기준)
+- before: 서비스에서 행마다 model_validate → FastAPI response_model 재검증 → jsonable_encoder + json.dumps
+- after: 캐시된 TypeAdapter로 한 번 검증/덤프 → orjson 인코딩 (app.core.responses)
+
+사용법 (backend 디렉터리에서):
+    python -m benchmarks.serialization --rows 1000 --repeat 50
+"""
+import argparse
+import asyncio
+import json
+import time
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Callable, List
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from app import models, schemas
+from app.core.responses import json_response
+
+
+def make_rows(count: int) -> dict:
+    created_at = datetime(2024, 1, 1, 9, 30)
+    return {
+        "accounts": (schemas.Account, [
+            models.Account(
+                id=i, user_id=1, name=f"계좌 {i}", type=models.AccountType.checking,
+                balance=Decimal("1234567.89"), institution="은행", account_number=f"110-{i:06d}",
+                created_at=created_at, updated_at=created_at
+            )
+            for i in range(count)
+        ]),
+        "transactions": (schemas.Transaction, [
+            models.Transaction(
+                id=i, account_id=1, category="식비", type=models.TransactionType.expense,
+                amount=Decimal("12500.00"), description="점심 식사", transaction_date=date(2024, 1, 1 + i % 28),
+                is_recurring=False, created_at=created_at
+            )
+            for i in range(count)
+        ]),
+        "recurring": (schemas.RecurringTransaction, [
+            models.RecurringTransaction(
+                id=i, account_id=1, type=models.TransactionType.expense, category="구독",
+                amount=Decimal("9900.00"), description="월 구독", frequency=models.Frequency.monthly,
+                day_of_month=15, is_active=True, start_date=date(2024, 1, 1), next_run_date=date(2024, 2, 15),
+                created_at=created_at, updated_at=created_at
+            )
+            for i in range(count)
+        ]),
+    }
+
+
+def before(schema, rows) -> bytes:
+    """기존 경로: 서비스의 model_validate + FastAPI 기본 응답 처리"""
+    validated = [schema.model_validate(row) for row in rows]
+    field = create_response_field(name="response", type_=List[schema])
+    content = asyncio.run(serialize_response(field=field, response_content=validated))
+    return JSONResponse(content).body
+
+
+def after(schema, rows) -> bytes:
+    return json_response(List[schema], rows).body
+
+
+def measure(func: Callable, schema, rows, repeat: int) -> float:
+    func(schema, rows)  # 워밍업 (TypeAdapter 캐시 등)
+    started = time.perf_counter()
+    for _ in range(repeat):
+        func(schema, rows)
+    return (time.perf_counter() - started) / repeat
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="응답 직렬화 벤치마크")
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--output", default=None, help="결과 JSON 파일 경로")
+    args = parser.parse_args(argv)
+
+    results = {}
+    print(f"{'payload':<14} {'before ms/1k':>14} {'after ms/1k':>14} {'speedup':>8}")
+    for name, (schema, rows) in make_rows(args.rows).items():
+        # 두 경로의 결과가 같은 JSON인지 먼저 확인
+        assert json.loads(before(schema, rows)) == json.loads(after(schema, rows)), name
+        before_seconds = measure(before, schema, rows, args.repeat)
+        after_seconds = measure(after, schema, rows, args.repeat)
+        scale = 1000 / args.rows * 1000
+        results[name] = {
+            "before_ms_per_1000": round(before_seconds * scale, 3),
+            "after_ms_per_1000": round(after_seconds * scale, 3),
+            "speedup": round(before_seconds / after_seconds, 2),
+        }
+        print(
+            f"{name:<14} {results[name]['before_ms_per_1000']:>14.2f} "
+            f"{results[name]['after_ms_per_1000']:>14.2f} {results[name]['speedup']:>7.2f}x"
+        )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"rows": args.rows, "repeat": args.repeat, "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
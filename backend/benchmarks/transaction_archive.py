@@ -0,0 +1,109 @@
+"""
+거래 콜드 아카이브 벤치마크 (여러 해 원장)
+- before: 모든 연도가 transactions(핫 테이블)에 있는 상태
+- after: 마감된 연도를 Parquet 아카이브로 옮긴 상태 (archive_closed_years)
+최근 조회(핫 테이블만)와 과거 조회(아카이브 파일까지)를 나눠 측정하고, 아카이브 시간과 파일 크기도 함께 측정
+
+사용법 (backend 디렉터리에서):
+    python -m benchmarks.transaction_archive --years 5 --transactions-per-month 40
+"""
+import argparse
+import json
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session
+
+from app import models
+from app.core.cache import summary_cache
+from app.repositories.transaction_archive import transaction_archive
+from app.services.archive_service import TransactionArchiveService
+from app.services.transaction_service import TransactionService
+from benchmarks.datagen import DatasetSpec, generate, reset_schema
+
+
+def recent_queries(db: Session, spec: DatasetSpec):
+    """최근 목록, 올해 월별 요약 (요약 캐시 없이)"""
+    service = TransactionService(db)
+
+    def run():
+        summary_cache.clear()
+        service.get_transactions(limit=100)
+        service.get_period_summary("month", date(spec.end_date.year, 1, 1), spec.end_date)
+
+    return run
+
+
+def history_queries(db: Session, spec: DatasetSpec):
+    """첫해 목록, 전체 기간 월별 요약 (요약 캐시 없이)"""
+    service = TransactionService(db)
+    first_year = spec.start_date.year
+
+    def run():
+        summary_cache.clear()
+        service.get_transactions(limit=100, start_date=date(first_year, 1, 1), end_date=date(first_year, 12, 31))
+        service.get_period_summary("month", spec.start_date, spec.end_date)
+
+    return run
+
+
+def measure(func_, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func_()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="거래 콜드 아카이브 벤치마크")
+    parser.add_argument("--database-url", default="sqlite:///:memory:")
+    parser.add_argument("--years", type=int, default=5)
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--transactions-per-month", type=int, default=40)
+    parser.add_argument("--output", default=None, help="결과 JSON 파일 경로")
+    args = parser.parse_args(argv)
+
+    spec = DatasetSpec(users=args.users, years=args.years, transactions_per_month=args.transactions_per_month)
+    engine = create_engine(args.database_url)
+    reset_schema(engine)
+    with tempfile.TemporaryDirectory() as archive_dir, Session(engine) as db:
+        transaction_archive.root = Path(archive_dir)
+        generate(db, spec)
+        total = db.scalar(select(func.count(models.Transaction.id)))
+        before = [measure(recent_queries(db, spec)), measure(history_queries(db, spec))]
+
+        started = time.perf_counter()
+        result = TransactionArchiveService(db).archive_closed_years(
+            spec.end_date.year - 1, today=date(spec.end_date.year + 1, 1, 1)
+        )
+        archive_seconds = time.perf_counter() - started
+        hot = db.scalar(select(func.count(models.Transaction.id)))
+        archive_bytes = sum(path.stat().st_size for path in Path(archive_dir).glob("*.parquet"))
+        after = [measure(recent_queries(db, spec)), measure(history_queries(db, spec))]
+
+    results = {
+        "transactions": total,
+        "archived_years": len(result["years"]),
+        "hot_rows": hot,
+        "archive_ms": round(archive_seconds * 1000, 3),
+        "archive_bytes": archive_bytes,
+        "recent_before_ms": round(before[0] * 1000, 3),
+        "recent_after_ms": round(after[0] * 1000, 3),
+        "history_before_ms": round(before[1] * 1000, 3),
+        "history_after_ms": round(after[1] * 1000, 3),
+    }
+    for key, value in results.items():
+        print(f"{key:<24} {value}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"years": args.years, "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
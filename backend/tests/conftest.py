@@ -0,0 +1,9 @@
+import pytest
+from app.core.cache import summary_cache
+
+@pytest.fixture(autouse=True)
+def clear_summary_cache():
+    # 테스트마다 DB를 새로 만들므로 프로세스 전역 캐시도 비움
+    summary_cache.clear()
+    yield
+    summary_cache.clear()
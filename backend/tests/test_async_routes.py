@@ -0,0 +1,95 @@
+import pytest
+from datetime import date
+from decimal import Decimal
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import NullPool
+
+from app import database
+from app.database import Base
+from app.api import deps
+from app.api.v1_async import api_router as async_api_router
+from app.models import Account, AccountType
+from app.core.cache import summary_cache
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    """DB_ASYNC=true 라우터를 임시 SQLite 파일 DB(aiosqlite)에 연결한 앱"""
+    path = tmp_path / "async.db"
+    sync_engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=sync_engine)
+    with Session(sync_engine) as db:
+        db.add(Account(name="Bank", type=AccountType.checking, balance=Decimal("1000")))
+        db.commit()
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}", poolclass=NullPool)
+    monkeypatch.setattr(database, "AsyncSessionLocal", async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False))
+    # 동기 라우트를 그대로 쓰는 엔드포인트(가져오기/내보내기)용
+    monkeypatch.setattr(deps, "SessionLocal", sessionmaker(bind=sync_engine, autoflush=False))
+    summary_cache.clear()
+    app = FastAPI()
+    app.include_router(async_api_router, prefix="/api/v1")
+    with TestClient(app) as test_client:
+        yield test_client
+    sync_engine.dispose()
+
+def test_import_statement(client):
+    csv_data = "date,amount,category,description\n2024-01-01,3000,급여,salary\n2024-01-02,-500,식비,lunch\n"
+    response = client.post(
+        "/api/v1/transactions/import",
+        data={"account_id": "1"},
+        files={"file": ("statement.csv", csv_data.encode("utf-8"), "text/csv")}
+    )
+    assert response.status_code == 200
+    assert response.json()["imported"] == 2
+    assert client.get("/api/v1/accounts/1").json()["balance"] == "3500.00"
+
+def test_cursor_pages(client):
+    for day in range(1, 6):
+        client.post("/api/v1/transactions/", json={
+            "account_id": 1, "type": "income", "category": "급여", "amount": "10", "transaction_date": f"2024-01-0{day}"
+        })
+    first = client.get("/api/v1/transactions/page", params={"limit": 3}).json()
+    second = client.get("/api/v1/transactions/page", params={"limit": 3, "cursor": first["next_cursor"]}).json()
+    assert [tx["transaction_date"] for tx in first["items"] + second["items"]] == [f"2024-01-0{day}" for day in range(5, 0, -1)]
+    assert second["next_cursor"] is None
+    assert client.get("/api/v1/transactions/page", params={"cursor": "broken"}).status_code == 400
+
+def test_streaming_export(client):
+    for day in range(1, 4):
+        client.post("/api/v1/transactions/", json={
+            "account_id": 1, "type": "income", "category": "급여", "amount": "10", "transaction_date": f"2024-01-0{day}"
+        })
+    response = client.get("/api/v1/transactions/export", params={"format": "ndjson"})
+    assert response.status_code == 200
+    assert len(response.text.strip().splitlines()) == 3
+
+def test_monthly_summary(client):
+    client.post("/api/v1/transactions/", json={
+        "account_id": 1, "type": "expense", "category": "식비", "amount": "300", "transaction_date": "2024-03-02"
+    })
+    summary = client.get("/api/v1/summary/monthly/2024/3").json()
+    assert summary["variable_expenses"] == 300
+    assert summary["net_cashflow"] == -300
+
+def test_cache_stats(client):
+    client.get("/api/v1/summary/total-assets")
+    client.get("/api/v1/summary/total-assets")
+    stats = client.get("/api/v1/summary/cache-stats").json()
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+
+def test_snapshots(client):
+    today = date.today()
+    result = client.post("/api/v1/summary/snapshots", params={"snapshot_date": today.isoformat()}).json()
+    assert result["created"] == 1
+    trend = client.get("/api/v1/summary/net-worth-trend").json()
+    assert trend == {"labels": [today.strftime("%Y-%m")], "data": [1000.0]}
+
+def test_async_routers_mirror_sync_routers():
+    from app.api.v1 import api_router as sync_api_router
+
+    def routes(router):
+        return {(route.path, method) for route in router.routes for method in route.methods}
+    assert routes(async_api_router) == routes(sync_api_router)
@@ -0,0 +1,97 @@
+import asyncio
+import pytest
+from datetime import date
+from decimal import Decimal
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.database import Base, to_async_url
+from app.models import AccountType, TransactionType
+from app.services.account_service import AsyncAccountService
+from app.services.transaction_service import AsyncTransactionService
+from app.services.summary_service import AsyncSummaryService
+from app.core.exceptions import InvalidTransactionError
+from app.core.cache import summary_cache
+from app.schemas import AccountCreate, TransactionCreate, TransactionUpdate
+
+def run(coro_fn):
+    """테스트마다 새 in-memory DB를 만들고 코루틴 실행"""
+    async def runner():
+        engine = create_async_engine(
+            "sqlite+aiosqlite:///:memory:",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool
+        )
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        session_factory = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
+        try:
+            async with session_factory() as session:
+                return await coro_fn(session)
+        finally:
+            await engine.dispose()
+    return asyncio.run(runner())
+
+def test_to_async_url():
+    assert to_async_url("mysql+pymysql://u:p@db:3306/x?charset=utf8mb4") == "mysql+aiomysql://u:p@db:3306/x?charset=utf8mb4"
+    assert to_async_url("sqlite:///./test.db") == "sqlite+aiosqlite:///./test.db"
+
+def test_async_transaction_flow():
+    async def scenario(db):
+        account = await AsyncAccountService(db).create_account(
+            AccountCreate(name="Bank", type=AccountType.checking, balance=Decimal("1000"))
+        )
+        service = AsyncTransactionService(db)
+        tx = await service.create_transaction(TransactionCreate(
+            account_id=account.id, type=TransactionType.expense, category="Food",
+            amount=Decimal("300"), transaction_date=date(2024, 1, 5)
+        ))
+        await service.update_transaction(tx.id, TransactionUpdate(amount=Decimal("100")))
+        assert (await AsyncAccountService(db).get_account(account.id)).balance == Decimal("900")
+
+        with pytest.raises(InvalidTransactionError):
+            await service.create_transaction(TransactionCreate(
+                account_id=account.id, type=TransactionType.expense, category="Food",
+                amount=Decimal("5000"), transaction_date=date(2024, 1, 6)
+            ))
+
+        await service.delete_transaction(tx.id)
+        assert await AsyncSummaryService(db).get_total_assets() == Decimal("1000")
+        assert await service.get_transactions(account.id) == []
+    run(scenario)
+
+def test_async_monthly_spending_reuses_sync_service():
+    async def scenario(db):
+        account = await AsyncAccountService(db).create_account(
+            AccountCreate(name="Bank", type=AccountType.checking, balance=Decimal("1000"))
+        )
+        service = AsyncTransactionService(db)
+        for category, amount in [("Food", "300"), ("Rent", "500"), ("Food", "100")]:
+            await service.create_transaction(TransactionCreate(
+                account_id=account.id, type=TransactionType.expense, category=category,
+                amount=Decimal(amount), transaction_date=date(2024, 1, 5)
+            ))
+        spending = await service.get_monthly_spending_by_category(account.id, 2024, 1)
+        assert [(row.category_name, row.amount) for row in spending] == [("Rent", Decimal("500")), ("Food", Decimal("400"))]
+    run(scenario)
+
+def test_async_summary_methods_use_versioned_cache():
+    async def scenario(db):
+        summary_cache.clear()
+        account = await AsyncAccountService(db).create_account(
+            AccountCreate(name="Bank", type=AccountType.checking, balance=Decimal("1000"))
+        )
+        service = AsyncSummaryService(db)
+        for _ in range(2):
+            assert await service.get_monthly_fixed_expenses(account.user_id) == Decimal("0")
+            assert await service.get_monthly_fixed_income(account.user_id) == Decimal("0")
+            await service.get_net_worth_trend(account.user_id)
+        assert summary_cache.stats()["hits"] == 3
+
+        # 쓰기가 commit되면 버전이 올라가서 다시 계산
+        await AsyncTransactionService(db).create_transaction(TransactionCreate(
+            account_id=account.id, type=TransactionType.income, category="Salary",
+            amount=Decimal("500"), transaction_date=date(2024, 1, 5)
+        ))
+        assert await service.get_total_assets(account.user_id) == Decimal("1500")
+    run(scenario)
@@ -0,0 +1,29 @@
+from sqlalchemy import create_engine, func
+from sqlalchemy.orm import Session
+
+from app.models import Account, Transaction, AssetSnapshot
+from benchmarks.datagen import DatasetSpec, generate, reset_schema
+from benchmarks.endpoints import ROUTES, registered_routes
+
+def test_every_route_has_a_benchmark_scenario():
+    assert registered_routes() <= {route.name for route in ROUTES}
+
+def test_datagen_is_deterministic():
+    spec = DatasetSpec(users=2, accounts_per_user=2, years=1, transactions_per_month=5)
+    fingerprints = []
+    for _ in range(2):
+        engine = create_engine("sqlite:///:memory:")
+        reset_schema(engine)
+        with Session(engine) as db:
+            counts = generate(db, spec)
+            balances = [a.balance for a in db.query(Account).order_by(Account.id)]
+            amount_sum = db.query(func.sum(Transaction.amount)).scalar()
+            last_snapshot = db.query(AssetSnapshot).filter_by(user_id=1).order_by(AssetSnapshot.snapshot_date.desc()).first()
+        fingerprints.append((balances, amount_sum))
+        engine.dispose()
+
+    assert counts["transactions"] == 2 * 2 * 12 * 5
+    assert counts["snapshots"] == 2 * 12
+    assert fingerprints[0] == fingerprints[1]
+    # 마지막 월말 스냅샷은 현재 잔액과 일치
+    assert last_snapshot.total_assets == sum(fingerprints[1][0][:2])
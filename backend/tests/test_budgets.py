@@ -0,0 +1,145 @@
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from datetime import date
+from decimal import Decimal
+
+from app.database import Base
+from app.models import Account, AccountType, TransactionType, CategoryType
+from app.services.budget_service import BudgetService
+from app.services.category_service import CategoryService
+from app.services.transaction_service import TransactionService
+from app.core.cache import summary_cache
+from app.core.exceptions import InvalidBudgetError
+from app.schemas import BudgetCreate, CategoryCreate, TransactionCreate
+
+engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+AS_OF = date(2024, 3, 10)
+
+@pytest.fixture(scope="function")
+def db():
+    Base.metadata.create_all(bind=engine)
+    session = TestingSessionLocal()
+    summary_cache.clear()
+    yield session
+    session.close()
+    Base.metadata.drop_all(bind=engine)
+
+@pytest.fixture
+def budgets(db):
+    # 식비 ─ 외식 ─ 카페
+    #      └ 장보기
+    # 교통
+    categories = CategoryService(db)
+    def add(name, parent=None):
+        return categories.create_category(CategoryCreate(name=name, type=CategoryType.expense, parent_id=parent)).id
+    food = add("식비")
+    cafe = add("카페", add("외식", food))
+    grocery = add("장보기", food)
+    transport = add("교통")
+
+    account = Account(name="Bank", type=AccountType.checking, balance=Decimal("1000000"))
+    db.add(account)
+    db.commit()
+    transactions = TransactionService(db)
+    for category, amount, day in [
+        ("카페", "20000", date(2024, 3, 2)),
+        ("장보기", "10000", date(2024, 3, 5)),
+        ("식비", "5000", date(2024, 3, 9)),
+        ("교통", "12000", date(2024, 3, 3)),
+        ("식비", "90000", date(2024, 2, 20)),  # 지난달
+    ]:
+        transactions.create_transaction(TransactionCreate(
+            account_id=account.id, category=category, type=TransactionType.expense,
+            amount=Decimal(amount), transaction_date=day
+        ))
+
+    service = BudgetService(db)
+    ids = {
+        name: service.create_budget(BudgetCreate(category_id=category_id, monthly_limit=Decimal(limit))).id
+        for name, category_id, limit in [("식비", food, "100000"), ("장보기", grocery, "50000"), ("교통", transport, "10000")]
+    }
+    return account.id, cafe, ids
+
+def test_utilization_for_all_budgets_in_one_query(db, budgets):
+    _, _, ids = budgets
+    statements = []
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        report = BudgetService(db).get_utilization(AS_OF)
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    # 요약 캐시 버전 조회(PK 1건)를 빼면 예산 집계는 쿼리 한 번
+    assert len([statement for statement in statements if "summary_versions" not in statement]) == 1
+    assert (report.days_elapsed, report.days_in_period) == (10, 31)
+    by_id = {item.budget_id: item for item in report.budgets}
+
+    food = by_id[ids["식비"]]
+    # 하위 카테고리 포함, 지난달 제외
+    assert food.spent == Decimal("35000") and food.transaction_count == 3
+    assert food.utilization == 0.35
+    assert food.projected_spend == Decimal("108500.00")
+    assert food.status == "projected_over"
+    assert by_id[ids["장보기"]].status == "ok"
+    assert by_id[ids["교통"]].status == "over"
+    assert by_id[ids["교통"]].remaining == Decimal("-2000")
+
+def test_alerts_and_projection_follow_new_transactions(db, budgets):
+    account_id, _, ids = budgets
+    service = BudgetService(db)
+
+    alerts = service.get_alerts(AS_OF)
+    assert [(item.budget_id, item.status) for item in alerts] == [(ids["교통"], "over"), (ids["식비"], "projected_over")]
+
+    projection = {item.budget_id: item for item in service.get_projection(AS_OF)}
+    assert projection[ids["식비"]].daily_rate == Decimal("3500.00")
+    assert projection[ids["식비"]].exhaust_date == date(2024, 3, 29)  # 100000 / 3500 = 28.6일
+    assert projection[ids["교통"]].exhaust_date is None
+
+    # 거래가 쓰이면 월별 합계가 증분 갱신되고 캐시된 평가도 무효화됨
+    TransactionService(db).create_transaction(TransactionCreate(
+        account_id=account_id, category="카페", type=TransactionType.expense,
+        amount=Decimal("70000"), transaction_date=date(2024, 3, 10)
+    ))
+    food = next(item for item in service.get_utilization(AS_OF).budgets if item.budget_id == ids["식비"])
+    assert food.spent == Decimal("105000") and food.status == "over"
+
+def test_budget_rejects_duplicate_and_income_category(db, budgets):
+    _, cafe, _ = budgets
+    service = BudgetService(db)
+    service.create_budget(BudgetCreate(category_id=cafe, monthly_limit=Decimal("30000")))
+    with pytest.raises(InvalidBudgetError):
+        service.create_budget(BudgetCreate(category_id=cafe, monthly_limit=Decimal("40000")))
+
+    salary = CategoryService(db).create_category(CategoryCreate(name="급여", type=CategoryType.income))
+    with pytest.raises(InvalidBudgetError):
+        service.create_budget(BudgetCreate(category_id=salary.id, monthly_limit=Decimal("1")))
+
+def test_same_named_categories_do_not_share_spend(db):
+    # 외식 ─ 음식, 여행 ─ 음식: 같은 이름의 지출은 먼저 만든 외식 > 음식에만 잡힘
+    categories = CategoryService(db)
+    def add(name, parent=None):
+        return categories.create_category(CategoryCreate(name=name, type=CategoryType.expense, parent_id=parent)).id
+    dining = add("외식")
+    dining_food = add("음식", dining)
+    travel = add("여행")
+    travel_food = add("음식", travel)
+
+    account = Account(name="Bank", type=AccountType.checking, balance=Decimal("1000"))
+    db.add(account)
+    db.commit()
+    TransactionService(db).create_transaction(TransactionCreate(
+        account_id=account.id, category="음식", type=TransactionType.expense,
+        amount=Decimal("100"), transaction_date=date(2024, 3, 2)
+    ))
+
+    service = BudgetService(db)
+    for category_id in (dining, dining_food, travel, travel_food):
+        service.create_budget(BudgetCreate(category_id=category_id, monthly_limit=Decimal("1000")))
+    report = service.get_utilization(AS_OF)
+    assert [item.spent for item in report.budgets] == [Decimal("100"), Decimal("100"), Decimal("0"), Decimal("0")]
+    assert report.total_spent == Decimal("200")
@@ -0,0 +1,118 @@
+import pytest
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.orm import sessionmaker
+from datetime import date
+from decimal import Decimal
+
+from app.database import Base
+from app.models import Account, Category, Transaction, AccountType, TransactionType, CategoryType
+from app.services.category_service import CategoryService
+from app.services.transaction_service import TransactionService
+from app.services.transaction_batch_service import TransactionBatchService
+from app.repositories.category_dictionary import category_dictionary
+from app.core.cache import summary_cache
+from app.core.config import settings
+from app.schemas import CategoryCreate, TransactionBatchRequest, TransactionCreate
+
+engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+@pytest.fixture(scope="function")
+def db():
+    Base.metadata.create_all(bind=engine)
+    session = TestingSessionLocal()
+    category_dictionary.clear()
+    summary_cache.clear()
+    yield session
+    session.close()
+    Base.metadata.drop_all(bind=engine)
+
+@pytest.fixture
+def interning(monkeypatch):
+    monkeypatch.setattr(settings, "CATEGORY_INTERNING", True)
+
+@pytest.fixture
+def account_id(db):
+    account = Account(name="Bank", type=AccountType.checking, balance=Decimal("100000"))
+    db.add(account)
+    db.commit()
+    return account.id
+
+def add_transaction(db, account_id, category, type_=TransactionType.expense, amount="100", day=date(2024, 3, 1)):
+    return TransactionService(db).create_transaction(TransactionCreate(
+        account_id=account_id, category=category, type=type_, amount=Decimal(amount), transaction_date=day
+    ))
+
+def test_writes_store_interned_ids_and_keep_names(db, account_id, interning):
+    food = CategoryService(db).create_category(CategoryCreate(name="식비", type=CategoryType.expense))
+
+    first = add_transaction(db, account_id, "식비")
+    statements = []
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        second = add_transaction(db, account_id, "식비", amount="200")
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    # 기존 카테고리를 재사용하고, 두 번째부터는 사전에서 바로 찾음
+    assert first.category_id == second.category_id == food.id
+    assert first.category == "식비"
+    assert not any("FROM categories" in statement for statement in statements)
+
+    # 없는 이름은 카테고리로 등록, 같은 이름이라도 유형이 다르면 다른 카테고리
+    bonus = add_transaction(db, account_id, "식비", type_=TransactionType.income)
+    assert bonus.category_id not in (None, food.id)
+    assert db.get(Category, bonus.category_id).type == CategoryType.income
+
+    # 일괄 수정으로 카테고리가 바뀌면 category_id도 함께
+    result = TransactionBatchService(db).apply(TransactionBatchRequest(operations=[
+        {"op": "update", "id": first.id, "changes": {"category": "교통"}}
+    ]))
+    moved = result.results[0].transaction
+    assert moved.category == "교통"
+    assert db.get(Category, moved.category_id).name == "교통"
+
+    # category_id만 지정한 ORM 객체는 이름을 사전에서 채움
+    raw = Transaction(account_id=account_id, category_id=food.id, type=TransactionType.expense,
+                      amount=Decimal("1"), transaction_date=date(2024, 3, 2))
+    db.add(raw)
+    db.commit()
+    assert raw.category == "식비"
+
+def test_migration_backfills_legacy_ledger(db, account_id, monkeypatch):
+    categories = CategoryService(db)
+    food = categories.create_category(CategoryCreate(name="식비", type=CategoryType.expense)).id
+    categories.create_category(CategoryCreate(name="외식", type=CategoryType.expense, parent_id=food))
+    for category, amount in [("식비", "100"), ("외식", "50"), ("외식", "30"), ("간식", "7")]:
+        add_transaction(db, account_id, category, amount=amount)
+    assert db.scalar(select(Transaction.category_id).limit(1)) is None
+    by_name = {row.name: row.total_amount for row in categories.get_rollup(date(2024, 3, 1), date(2024, 3, 31))}
+
+    result = categories.intern_ledger(batch_size=2)
+    assert result == {"created_categories": 1, "transactions": 4, "recurring_transactions": 0}
+    assert categories.intern_ledger()["transactions"] == 0
+
+    monkeypatch.setattr(settings, "CATEGORY_INTERNING", True)
+    by_id = {row.name: row.total_amount for row in categories.get_rollup(date(2024, 3, 1), date(2024, 3, 31))}
+    assert by_id == {**by_name, "간식": Decimal("7")}
+    assert by_id["식비"] == Decimal("180")
+    assert TransactionService(db).rebuild_monthly_totals() == 3
+
+def test_transfers_are_left_uninterned(db, account_id, monkeypatch):
+    # 인터닝 전 원장의 이체도 마이그레이션이 카테고리로 등록하지 않음
+    add_transaction(db, account_id, "계좌이체", type_=TransactionType.transfer)
+    categories = CategoryService(db)
+    assert categories.intern_ledger() == {"created_categories": 0, "transactions": 0, "recurring_transactions": 0}
+
+    monkeypatch.setattr(settings, "CATEGORY_INTERNING", True)
+    transfer = add_transaction(db, account_id, "계좌이체", type_=TransactionType.transfer)
+    assert transfer.category_id is None
+    result = TransactionBatchService(db).apply(TransactionBatchRequest(operations=[
+        {"op": "create", "transaction": {
+            "account_id": account_id, "category": "계좌이체", "type": "transfer",
+            "amount": "10", "transaction_date": "2024-03-02"
+        }}
+    ]))
+    assert result.committed and result.results[0].transaction.category_id is None
+    assert categories.get_categories() == []
@@ -0,0 +1,103 @@
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+from datetime import date
+from decimal import Decimal
+
+from app.database import Base
+from app.models import Account, Transaction, CategoryClosure, AccountType, TransactionType, CategoryType
+from app.services.category_service import CategoryService
+from app.core.exceptions import InvalidCategoryError
+from app.schemas import CategoryCreate, CategoryUpdate
+
+engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+@pytest.fixture(scope="function")
+def db():
+    Base.metadata.create_all(bind=engine)
+    session = TestingSessionLocal()
+    yield session
+    session.close()
+    Base.metadata.drop_all(bind=engine)
+
+@pytest.fixture
+def tree(db):
+    # 식비 ─ 외식 ─ 카페
+    #      └ 장보기
+    # 교통
+    service = CategoryService(db)
+    def add(name, parent=None):
+        return service.create_category(CategoryCreate(name=name, type=CategoryType.expense, parent_id=parent)).id
+    food = add("식비")
+    dining = add("외식", food)
+    cafe = add("카페", dining)
+    grocery = add("장보기", food)
+    transport = add("교통")
+
+    account = Account(name="Bank", type=AccountType.checking, balance=Decimal("0"))
+    db.add(account)
+    db.commit()
+    amounts = {"식비": 100, "외식": 200, "카페": 300, "장보기": 400, "교통": 500}
+    db.add_all([
+        Transaction(account_id=account.id, category=name, type=TransactionType.expense,
+                    amount=Decimal(amount), transaction_date=date(2024, 3, day))
+        for day, (name, amount) in enumerate(amounts.items(), start=1)
+    ])
+    # 기간 밖 거래는 제외
+    db.add(Transaction(account_id=account.id, category="카페", type=TransactionType.expense,
+                       amount=Decimal("999"), transaction_date=date(2024, 4, 1)))
+    db.commit()
+    return {"food": food, "dining": dining, "cafe": cafe, "grocery": grocery, "transport": transport}
+
+def totals(db):
+    rollup = CategoryService(db).get_rollup(date(2024, 3, 1), date(2024, 3, 31))
+    return {node.name: (node.own_amount, node.total_amount, node.transaction_count) for node in rollup}
+
+def closure(db):
+    return set(db.execute(select(CategoryClosure.ancestor_id, CategoryClosure.descendant_id, CategoryClosure.depth)).all())
+
+def test_rollup_includes_all_descendants(db, tree):
+    assert totals(db) == {
+        "식비": (Decimal("100"), Decimal("1000"), 4),
+        "외식": (Decimal("200"), Decimal("500"), 2),
+        "카페": (Decimal("300"), Decimal("300"), 1),
+        "장보기": (Decimal("400"), Decimal("400"), 1),
+        "교통": (Decimal("500"), Decimal("500"), 1),
+    }
+
+def test_duplicate_names_are_counted_once(db, tree):
+    # 교통 밑에 같은 이름의 "카페"를 하나 더 만들어도 카페 거래는 먼저 만든 카테고리에만 더해짐
+    duplicate = CategoryService(db).create_category(
+        CategoryCreate(name="카페", type=CategoryType.expense, parent_id=tree["transport"])
+    ).id
+    rollup = {node.id: node for node in CategoryService(db).get_rollup(date(2024, 3, 1), date(2024, 3, 31))}
+    assert rollup[duplicate].total_amount == Decimal("0")
+    assert rollup[tree["cafe"]].own_amount == Decimal("300")
+    assert rollup[tree["food"]].total_amount == Decimal("1000")
+    assert rollup[tree["transport"]].total_amount == Decimal("500")
+
+def test_closure_follows_move_and_delete(db, tree):
+    service = CategoryService(db)
+    before = closure(db)
+
+    # 외식 서브트리를 교통 밑으로 이동
+    service.update_category(tree["dining"], CategoryUpdate(parent_id=tree["transport"]))
+    assert totals(db)["식비"][1] == Decimal("500")
+    assert totals(db)["교통"][1] == Decimal("1000")
+    assert (tree["transport"], tree["cafe"], 2) in closure(db)
+
+    with pytest.raises(InvalidCategoryError):
+        service.update_category(tree["transport"], CategoryUpdate(parent_id=tree["cafe"]))
+
+    # 다시 원래 자리로 옮기면 클로저도 원래대로
+    service.update_category(tree["dining"], CategoryUpdate(parent_id=tree["food"]))
+    assert closure(db) == before
+
+    # 외식 삭제 → 카페는 식비 바로 밑으로, 재구성 결과와 동일
+    service.delete_category(tree["dining"])
+    assert (tree["food"], tree["cafe"], 1) in closure(db)
+    assert totals(db)["식비"][1] == Decimal("800")
+    maintained = closure(db)
+    service.rebuild_closure()
+    assert closure(db) == maintained
@@ -0,0 +1,88 @@
+import io
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from decimal import Decimal
+
+from app.database import Base
+from app.models import Account, Transaction, AccountType, TransactionType
+from app.services.import_service import TransactionImportService
+from app.core.exceptions import AccountNotFoundError
+
+engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+@pytest.fixture(scope="function")
+def db():
+    Base.metadata.create_all(bind=engine)
+    session = TestingSessionLocal()
+    yield session
+    session.close()
+    Base.metadata.drop_all(bind=engine)
+
+@pytest.fixture
+def account(db):
+    account = Account(name="Bank", type=AccountType.checking, balance=Decimal("1000"))
+    db.add(account)
+    db.commit()
+    return account
+
+def test_import_csv_in_chunks(db, account):
+    csv_data = (
+        "date,amount,category,description\n"
+        "2024-01-01,\"3,000\",급여,salary\n"
+        "2024/01/02,-500,식비,lunch\n"
+        "bad-date,-100,식비,broken\n"
+        "20240103,-200,,coffee\n"
+    )
+    result = TransactionImportService(db).import_statement(
+        io.BytesIO(csv_data.encode("utf-8")), "csv", account.id, chunk_size=2
+    )
+
+    assert result.imported == 3
+    assert result.skipped == 1
+    assert result.chunks == 2
+    assert "row 4" in result.errors[0]
+    db.refresh(account)
+    assert account.balance == Decimal("3300")
+    categories = sorted(tx.category for tx in db.query(Transaction).all())
+    assert categories == sorted(["급여", "식비", "기타"])
+
+def test_import_rejects_overlong_category_per_row(db, account):
+    csv_data = (
+        "date,amount,category\n"
+        f"2024-01-01,-100,{'가' * 51}\n"
+        "2024-01-02,-200,식비\n"
+    )
+    result = TransactionImportService(db).import_statement(
+        io.BytesIO(csv_data.encode("utf-8")), "csv", account.id
+    )
+
+    assert (result.imported, result.skipped) == (1, 1)
+    assert "row 2" in result.errors[0]
+    db.refresh(account)
+    assert account.balance == Decimal("800")
+
+def test_import_ofx(db, account):
+    ofx_data = """OFXHEADER:100
+<OFX><BANKMSGSRSV1><STMTTRNRS><STMTRS><BANKTRANLIST>
+<STMTTRN><TRNTYPE>DEBIT<DTPOSTED>20240105120000[0:GMT]<TRNAMT>-250.50<NAME>MART
+</STMTTRN>
+<STMTTRN><TRNTYPE>CREDIT<DTPOSTED>20240106<TRNAMT>100<MEMO>refund
+</STMTTRN>
+</BANKTRANLIST></STMTRS></STMTTRNRS></BANKMSGSRSV1></OFX>
+"""
+    result = TransactionImportService(db).import_statement(
+        io.BytesIO(ofx_data.encode("utf-8")), "ofx", account.id
+    )
+
+    assert result.imported == 2
+    expense = db.query(Transaction).filter(Transaction.type == TransactionType.expense).one()
+    assert expense.amount == Decimal("250.50")
+    assert expense.description == "MART"
+    db.refresh(account)
+    assert account.balance == Decimal("849.50")
+
+def test_import_unknown_account(db):
+    with pytest.raises(AccountNotFoundError):
+        TransactionImportService(db).import_statement(io.BytesIO(b"date,amount\n"), "csv", 999)
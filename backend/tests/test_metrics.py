@@ -0,0 +1,49 @@
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.database import Base
+from app.main import app
+from app.api.deps import get_db
+from app.core.metrics import metrics, instrument_engine
+
+engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+def override_get_db():
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+def test_request_metrics_and_prometheus_output():
+    metrics.reset()
+    instrument_engine(engine, "test")
+    Base.metadata.create_all(bind=engine)
+    app.dependency_overrides[get_db] = override_get_db
+    try:
+        client = TestClient(app)
+        response = client.post("/api/v1/accounts/", json={"name": "Bank", "type": "checking"})
+        assert response.status_code == 201
+        account_id = response.json()["id"]
+        response = client.get(f"/api/v1/accounts/{account_id}")
+        assert response.headers["x-db-query-count"] == "1"
+        assert response.headers["server-timing"].startswith("db;dur=")
+        client.get("/api/v1/accounts/999999")
+
+        body = client.get("/metrics").text
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+        Base.metadata.drop_all(bind=engine)
+
+    # 라우트는 경로 템플릿 단위로 집계
+    assert 'http_requests_total{method="GET",route="/api/v1/accounts/{account_id}",status="200"} 1' in body
+    assert 'http_requests_total{method="GET",route="/api/v1/accounts/{account_id}",status="404"} 1' in body
+    assert 'http_request_duration_seconds_count{method="GET",route="/api/v1/accounts/{account_id}"} 2' in body
+    assert 'http_request_db_queries_total{method="GET",route="/api/v1/accounts/{account_id}"} 2' in body
+    assert 'http_request_duration_seconds_bucket{method="POST",route="/api/v1/accounts/",le="+Inf"} 1' in body
+    assert "# TYPE db_query_duration_seconds histogram" in body
+    assert 'db_pool_events_total{engine="test",event="checkout"}' in body
+    assert "# TYPE db_pool_checked_out gauge" in body
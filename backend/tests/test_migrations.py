@@ -0,0 +1,95 @@
+import importlib.util
+import pytest
+from sqlalchemy import create_engine, func, select
+from datetime import date
+
+from app import models
+from app.database import Base
+from app.migrations import MigrationOps, diff_indexes, load_migrations, migrate, write_migration
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+    yield engine
+    engine.dispose()
+
+def explain(engine, query):
+    with engine.connect() as connection:
+        compiled = query.compile(connection, compile_kwargs={"literal_binds": True})
+        return " | ".join(row[-1] for row in connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}"))
+
+def make_legacy(engine):
+    """db/init 이전 인덱스 구성 흉내: 단일 컬럼 인덱스, 중복 인덱스, 커버링 인덱스 없음"""
+    with engine.begin() as connection:
+        ops = MigrationOps(connection)
+        ops.drop_index("accounts", "idx_account_user_balance")
+        ops.create_index("accounts", "idx_user_id", ["user_id"])
+        ops.create_index("transactions", "idx_transaction_date", ["transaction_date"])
+        ops.drop_index("recurring_transactions", "idx_recurring_schedule")
+        ops.drop_index("recurring_transactions", "idx_recurring_monthly_sum")
+        ops.create_index("recurring_transactions", "idx_active", ["is_active"])
+
+def test_migrate_empty_database_matches_declared_indexes(engine):
+    applied = migrate(engine)
+    assert [migration.version for migration in applied] == [migration.version for migration in load_migrations()]
+    assert migrate(engine) == []
+    with engine.connect() as connection:
+        assert diff_indexes(connection).is_clean
+        assert connection.scalar(select(func.count()).select_from(models.SchemaMigration)) == len(applied)
+
+def test_diff_reports_and_migration_fixes_legacy_indexes(engine):
+    Base.metadata.create_all(bind=engine)
+    with engine.connect() as connection:
+        assert diff_indexes(connection).is_clean
+    make_legacy(engine)
+
+    with engine.connect() as connection:
+        diff = diff_indexes(connection)
+    assert {(c.table, c.name) for c in diff.missing} == {
+        ("accounts", "idx_account_user_balance"),
+        ("recurring_transactions", "idx_recurring_schedule"),
+        ("recurring_transactions", "idx_recurring_monthly_sum"),
+    }
+    assert [(c.name, c.live.columns) for c in diff.changed] == [("idx_transaction_date", ("transaction_date",))]
+    assert {c.name for c in diff.extra} == {"idx_user_id", "idx_active"}
+    assert "~ transactions.idx_transaction_date (transaction_date) -> (transaction_date, account_id, type, amount)" in diff.describe()
+
+    migrate(engine)
+    with engine.connect() as connection:
+        assert diff_indexes(connection).is_clean
+
+def test_generated_migration_applies_the_diff(engine, tmp_path):
+    Base.metadata.create_all(bind=engine)
+    make_legacy(engine)
+    with engine.connect() as connection:
+        path = write_migration(diff_indexes(connection), "Restore declared indexes", latest_version=2, directory=tmp_path)
+    assert path.name == "v0003_restore_declared_indexes.py"
+
+    spec = importlib.util.spec_from_file_location("generated_migration", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    assert module.VERSION == 3
+    with engine.begin() as connection:
+        module.upgrade(MigrationOps(connection))
+    with engine.connect() as connection:
+        assert diff_indexes(connection).is_clean
+
+def test_summary_queries_use_covering_indexes(engine):
+    migrate(engine)
+    account, recurring = models.Account, models.RecurringTransaction
+    user_totals = select(account.user_id, func.sum(account.balance), func.count(account.id)).group_by(account.user_id)
+    assert "COVERING INDEX idx_account_user_balance" in explain(engine, user_totals)
+
+    monthly_fixed = select(func.sum(recurring.amount)).where(
+        recurring.account_id.in_([1, 2]),
+        recurring.type == models.TransactionType.expense,
+        recurring.is_active == True,
+        recurring.frequency == models.Frequency.monthly
+    )
+    assert "COVERING INDEX idx_recurring_monthly_sum" in explain(engine, monthly_fixed)
+
+    period = select(models.Transaction.type, func.sum(models.Transaction.amount)).where(
+        models.Transaction.transaction_date >= date(2024, 1, 1),
+        models.Transaction.transaction_date < date(2024, 2, 1)
+    ).group_by(models.Transaction.type)
+    assert "COVERING INDEX idx_transaction_date" in explain(engine, period)
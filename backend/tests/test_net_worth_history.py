@@ -0,0 +1,97 @@
+import numpy as np
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from datetime import date
+from decimal import Decimal
+
+from app.database import Base
+from app.models import Account, Transaction, AssetSnapshot, AccountType, TransactionType
+from app.services.archive_service import TransactionArchiveService
+from app.services.net_worth_history import NetWorthHistoryService, period_ends, reconstruct_balances
+from app.repositories.transaction_archive import transaction_archive
+
+engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+@pytest.fixture(scope="function")
+def db():
+    Base.metadata.create_all(bind=engine)
+    session = TestingSessionLocal()
+    yield session
+    session.close()
+    Base.metadata.drop_all(bind=engine)
+
+@pytest.fixture
+def ledger(db):
+    bank = Account(name="Bank", type=AccountType.checking, balance=Decimal("1000"))
+    stock = Account(name="Stock", type=AccountType.investment, balance=Decimal("500"))
+    db.add_all([bank, stock])
+    db.flush()
+    db.add_all([
+        Transaction(account_id=bank.id, category="급여", type=TransactionType.income, amount=Decimal("300"), transaction_date=date(2024, 2, 10)),
+        Transaction(account_id=bank.id, category="식비", type=TransactionType.expense, amount=Decimal("50"), transaction_date=date(2024, 3, 5)),
+        Transaction(account_id=stock.id, category="투자", type=TransactionType.income, amount=Decimal("100"), transaction_date=date(2024, 3, 31)),
+        Transaction(account_id=stock.id, category="이체", type=TransactionType.transfer, amount=Decimal("999"), transaction_date=date(2024, 3, 20)),
+    ])
+    db.commit()
+    return bank, stock
+
+def test_period_ends():
+    assert period_ends(date(2024, 1, 15), date(2024, 3, 10), "monthly").tolist() == [
+        date(2024, 1, 31), date(2024, 2, 29), date(2024, 3, 10)
+    ]
+    assert period_ends(date(2024, 1, 1), date(2024, 1, 10), "weekly").tolist() == [
+        date(2024, 1, 7), date(2024, 1, 10)
+    ]
+    assert len(period_ends(date(2024, 1, 1), date(2024, 1, 10), "daily")) == 10
+
+def test_reconstruct_matches_ledger(db, ledger):
+    trend = NetWorthHistoryService(db).get_trend(1, date(2024, 1, 1), date(2024, 3, 31), "monthly")
+    # 1월 말: 1500 - 300 + 50 - 100, 2월 말: 1500 + 50 - 100, 3월 말: 현재
+    assert trend == {"labels": ["2024-01", "2024-02", "2024-03"], "data": [1150.0, 1450.0, 1500.0]}
+
+    daily = NetWorthHistoryService(db).get_trend(1, date(2024, 3, 30), date(2024, 3, 31), "daily")
+    assert daily["data"] == [1400.0, 1500.0]
+
+def test_reconstruct_vectorized_matches_loop():
+    rng = np.random.default_rng(0)
+    count, accounts = 5000, 3
+    days = np.datetime64("2024-01-01") + rng.integers(0, 365, count)
+    account_index = rng.integers(0, accounts, count)
+    amounts = rng.integers(-10000, 10000, count) / 100
+    current = np.array([100.0, 200.0, 300.0])
+    ends = period_ends(date(2024, 1, 1), date(2024, 12, 31), "weekly")
+
+    matrix = reconstruct_balances(current, account_index, days, amounts, ends)
+    for k, end in enumerate(ends):
+        later = days > end
+        expected = current - np.bincount(account_index[later], weights=amounts[later], minlength=accounts)
+        assert np.allclose(matrix[k], expected)
+
+def test_backfill_snapshots_keeps_existing(db, ledger):
+    db.add(AssetSnapshot(user_id=1, total_assets=Decimal("1"), net_worth=Decimal("1"), snapshot_date=date(2024, 2, 29)))
+    db.commit()
+
+    created = NetWorthHistoryService(db).backfill_snapshots(1, date(2024, 1, 1), date(2024, 3, 31))
+    assert created == 2
+    snapshots = db.query(AssetSnapshot).order_by(AssetSnapshot.snapshot_date).all()
+    assert [s.net_worth for s in snapshots] == [Decimal("1150"), Decimal("1"), Decimal("1500")]
+    assert snapshots[0].accounts_summary[0] == {"account_id": 1, "name": "Bank", "type": "checking", "balance": 750.0}
+
+def test_reconstruct_skips_archive_batches_with_only_transfers(db, tmp_path, monkeypatch):
+    monkeypatch.setattr(transaction_archive, "root", tmp_path)
+    monkeypatch.setattr(transaction_archive, "_manifest_key", None)
+    bank = Account(name="Bank", type=AccountType.checking, balance=Decimal("1000"))
+    db.add(bank)
+    db.flush()
+    db.add_all([
+        Transaction(account_id=bank.id, category="이체", type=TransactionType.transfer, amount=Decimal("999"), transaction_date=date(2021, 5, 1)),
+        Transaction(account_id=bank.id, category="급여", type=TransactionType.income, amount=Decimal("300"), transaction_date=date(2024, 2, 10)),
+    ])
+    db.commit()
+    TransactionArchiveService(db).archive_closed_years(2021, today=date(2025, 6, 1))
+
+    # 아카이브 배치가 이체만 있어 비어도 재구성 가능
+    trend = NetWorthHistoryService(db).get_trend(1, date(2021, 1, 1), date(2024, 3, 31), "monthly")
+    assert (trend["data"][0], trend["data"][-1]) == (700.0, 1000.0)
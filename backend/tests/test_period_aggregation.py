@@ -0,0 +1,84 @@
+import pytest
+from sqlalchemy import create_engine, extract, func, select
+from sqlalchemy.orm import sessionmaker
+from datetime import date
+from decimal import Decimal
+
+from app.database import Base
+from app.models import Account, Transaction, AccountType, TransactionType
+from app.repositories.transaction_repository import period_totals_query
+from app.services.transaction_service import TransactionService
+from app.core.cache import summary_cache
+
+engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+@pytest.fixture(scope="function")
+def db():
+    Base.metadata.create_all(bind=engine)
+    session = TestingSessionLocal()
+    summary_cache.clear()
+    yield session
+    session.close()
+    Base.metadata.drop_all(bind=engine)
+
+@pytest.fixture
+def ledger(db):
+    bank = Account(name="Bank", type=AccountType.checking, balance=Decimal("0"))
+    card = Account(name="Card", type=AccountType.checking, balance=Decimal("0"))
+    other = Account(name="Other", type=AccountType.checking, balance=Decimal("0"), user_id=2)
+    db.add_all([bank, card, other])
+    db.flush()
+    for account, type_, amount, day in [
+        (bank, TransactionType.income, "3000", date(2024, 1, 1)),   # 월
+        (bank, TransactionType.expense, "100", date(2024, 1, 7)),   # 일
+        (card, TransactionType.expense, "50", date(2024, 1, 8)),    # 다음 주 월
+        (bank, TransactionType.expense, "200", date(2024, 3, 31)),
+        (bank, TransactionType.expense, "999", date(2024, 4, 1)),   # 범위 밖
+        (other, TransactionType.expense, "777", date(2024, 1, 2)),  # 다른 사용자
+    ]:
+        db.add(Transaction(account_id=account.id, category="기타", type=type_, amount=Decimal(amount), transaction_date=day))
+    db.commit()
+    return bank.id
+
+def test_week_and_month_buckets_cover_range_in_one_query(db, ledger):
+    service = TransactionService(db)
+
+    weeks = service.get_period_summary("week", date(2024, 1, 3), date(2024, 1, 20))
+    assert [(b.period_start, b.period_end) for b in weeks.buckets] == [
+        (date(2024, 1, 3), date(2024, 1, 7)),
+        (date(2024, 1, 8), date(2024, 1, 14)),
+        (date(2024, 1, 15), date(2024, 1, 20)),
+    ]
+    assert [(b.expense, b.transaction_count) for b in weeks.buckets] == [(Decimal("100"), 1), (Decimal("50"), 1), (Decimal("0"), 0)]
+
+    months = service.get_period_summary("month", date(2024, 1, 1), date(2024, 3, 31))
+    assert [b.net for b in months.buckets] == [Decimal("2850"), Decimal("0"), Decimal("-200")]
+
+    quarters = service.get_period_summary("quarter", date(2024, 1, 1), date(2024, 4, 30), account_id=ledger)
+    assert [(b.income, b.expense) for b in quarters.buckets] == [(Decimal("3000"), Decimal("300")), (Decimal("0"), Decimal("999"))]
+
+@pytest.mark.parametrize("granularity", ["day", "week", "month", "quarter", "year"])
+@pytest.mark.parametrize("account_id", [None, 1])
+def test_period_query_uses_date_index(db, granularity, account_id):
+    query = period_totals_query("sqlite", granularity, date(2024, 1, 1), date(2024, 1, 1), date(2025, 1, 1), 1, account_id)
+    plan = explain(query)
+    # 사용자 전체 계좌는 idx_account_user_balance로 계좌를 찾은 뒤 계좌별 날짜 범위 검색
+    assert "SEARCH transactions USING INDEX idx_account_date (account_id=? AND transaction_date>? AND transaction_date<?)" in plan
+    assert "SCAN transactions" not in plan
+
+def test_extract_filter_scans_whole_table(db):
+    # 비교용: 컬럼에 함수를 씌운 조건은 인덱스를 탈 수 없음
+    tx = Transaction
+    query = select(func.sum(tx.amount)).where(
+        tx.account_id == 1,
+        extract("year", tx.transaction_date) == 2024,
+        extract("month", tx.transaction_date) == 1
+    )
+    plan = explain(query)
+    assert "transaction_date>?" not in plan and "transaction_date<?" not in plan
+
+def explain(query) -> str:
+    sql = str(query.compile(dialect=engine.dialect, compile_kwargs={"literal_binds": True}))
+    with engine.connect() as connection:
+        return "\n".join(row[-1] for row in connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}"))
@@ -0,0 +1,87 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from datetime import date
+from decimal import Decimal
+
+from app.database import Base
+from app.models import Account, Transaction, RecurringTransaction, MonthlyCategoryTotal, AccountType, TransactionType, Frequency
+from app.services.recurring_service import RecurringTransactionService
+from app.services.recurring_schedule import occurrence_on_or_after, occurrences_until
+from app.schemas import RecurringTransactionCreate
+
+engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+@pytest.fixture(scope="function")
+def db():
+    Base.metadata.create_all(bind=engine)
+    session = TestingSessionLocal()
+    yield session
+    session.close()
+    Base.metadata.drop_all(bind=engine)
+
+@pytest.fixture
+def account(db):
+    account = Account(name="Bank", type=AccountType.checking, balance=Decimal("100"))
+    db.add(account)
+    db.commit()
+    return account
+
+def schedule(frequency, start, day_of_month=None, end=None):
+    return RecurringTransaction(frequency=frequency, start_date=start, day_of_month=day_of_month, end_date=end)
+
+def test_schedule_rules():
+    month_end = schedule(Frequency.monthly, date(2024, 1, 1), day_of_month=31)
+    assert list(occurrences_until(month_end, date(2024, 1, 31), date(2024, 4, 30))) == [
+        date(2024, 1, 31), date(2024, 2, 29), date(2024, 3, 31), date(2024, 4, 30)
+    ]
+    weekly = schedule(Frequency.weekly, date(2024, 1, 3))
+    assert occurrence_on_or_after(weekly, date(2024, 1, 4)) == date(2024, 1, 10)
+    yearly = schedule(Frequency.yearly, date(2020, 2, 29))
+    assert occurrence_on_or_after(yearly, date(2021, 1, 1)) == date(2021, 2, 28)
+    daily = schedule(Frequency.daily, date(2024, 5, 1), end=date(2024, 5, 2))
+    assert occurrence_on_or_after(daily, date(2024, 4, 1)) == date(2024, 5, 1)
+    assert occurrence_on_or_after(daily, date(2024, 5, 3)) is None
+
+def test_process_due_catches_up_once(db, account):
+    service = RecurringTransactionService(db)
+    salary = service.create_recurring(RecurringTransactionCreate(
+        account_id=account.id, type=TransactionType.income, category="급여",
+        amount=Decimal("1000"), frequency=Frequency.monthly, day_of_month=25,
+        start_date=date(2024, 1, 1)
+    ))
+    coffee = service.create_recurring(RecurringTransactionCreate(
+        account_id=account.id, type=TransactionType.expense, category="커피",
+        amount=Decimal("30"), frequency=Frequency.daily, start_date=date(2024, 1, 1)
+    ))
+    db.query(RecurringTransaction).filter(RecurringTransaction.id == salary.id).update({"next_run_date": date(2024, 1, 25)})
+    db.query(RecurringTransaction).filter(RecurringTransaction.id == coffee.id).update({"next_run_date": date(2024, 1, 24)})
+    db.commit()
+
+    # 1/24 커피는 잔액 100에서 차감, 1/25 급여 입금 후 1/25~1/27 커피 차감
+    assert service.process_due_recurring_transactions(date(2024, 1, 27), batch_size=1) == 5
+    assert service.process_due_recurring_transactions(date(2024, 1, 27)) == 0
+
+    db.refresh(account)
+    assert account.balance == Decimal("100") + Decimal("1000") - Decimal("30") * 4
+    assert db.query(Transaction).filter(Transaction.is_recurring == True).count() == 5
+    total = db.query(MonthlyCategoryTotal).filter(MonthlyCategoryTotal.category == "커피").one()
+    assert (total.total_amount, total.transaction_count) == (Decimal("120"), 4)
+    assert service.get_recurring(salary.id).next_run_date == date(2024, 2, 25)
+
+def test_process_due_skips_insufficient_expense(db, account):
+    service = RecurringTransactionService(db)
+    rent = service.create_recurring(RecurringTransactionCreate(
+        account_id=account.id, type=TransactionType.expense, category="월세",
+        amount=Decimal("500"), frequency=Frequency.monthly, day_of_month=1,
+        start_date=date(2024, 1, 1)
+    ))
+    db.query(RecurringTransaction).update({"next_run_date": None})
+    db.commit()
+
+    # next_run_date가 없는 기존 데이터는 처리 날짜 기준으로 스케줄링
+    assert service.process_due_recurring_transactions(date(2024, 3, 1)) == 0
+    assert service.get_recurring(rent.id).next_run_date == date(2024, 4, 1)
+    db.refresh(account)
+    assert account.balance == Decimal("100")
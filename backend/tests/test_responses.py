@@ -0,0 +1,26 @@
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import List
+
+from fastapi.encoders import jsonable_encoder
+
+from app import models, schemas
+from app.core.responses import dump_json, type_adapter, json_response
+
+def test_fast_path_matches_default_encoding():
+    rows = [
+        models.Transaction(
+            id=1, account_id=2, category="식비", type=models.TransactionType.expense,
+            amount=Decimal("12500.50"), description=None, transaction_date=date(2024, 3, 1),
+            is_recurring=False, created_at=datetime(2024, 3, 1, 12, 0)
+        )
+    ]
+    expected = jsonable_encoder([schemas.Transaction.model_validate(row) for row in rows])
+    assert json.loads(dump_json(List[schemas.Transaction], rows)) == expected
+    assert expected[0]["amount"] == "12500.50"
+
+    response = json_response(List[schemas.Transaction], rows)
+    assert response.media_type == "application/json"
+    assert json.loads(response.body) == expected
+    assert type_adapter(List[schemas.Transaction]) is type_adapter(List[schemas.Transaction])
@@ -0,0 +1,114 @@
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from app.models import Account, AccountType
+from app.core.routing import ReplicaSet, RoutingSession, mark_read_only
+from app.repositories.account_repository import AccountRepository
+from app.services.summary_service import SummaryService
+from app.core.cache import mark_summary_dirty, summary_cache
+
+def make_engine(path, name):
+    engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    with sessionmaker(bind=engine)() as session:
+        session.add(Account(name=name, type=AccountType.checking, balance=Decimal("0")))
+        session.commit()
+    return engine
+
+@pytest.fixture
+def engines(tmp_path):
+    # 복제가 없는 두 SQLite 파일에 서로 다른 계좌명을 넣어 어느 쪽에서 읽었는지 구분
+    engines = [make_engine(tmp_path / f"{name}.db", name) for name in ("primary", "replica0", "replica1")]
+    yield engines
+    for engine in engines:
+        engine.dispose()
+
+def account_names(session):
+    return [row.name for row in AccountRepository(session).get_rows(1)]
+
+def test_read_only_session_reads_from_replicas_round_robin(engines):
+    primary, *replicas = engines
+    factory = sessionmaker(class_=RoutingSession, bind=primary, replicas=ReplicaSet(replicas))
+
+    seen = []
+    for _ in range(4):
+        with factory() as session:
+            mark_read_only(session)
+            seen.append(account_names(session))
+    assert seen == [["replica0"], ["replica1"], ["replica0"], ["replica1"]]
+
+    with factory() as session:
+        assert account_names(session) == ["primary"]
+
+def test_write_pins_session_to_primary(engines):
+    primary, *replicas = engines
+    factory = sessionmaker(class_=RoutingSession, bind=primary, replicas=ReplicaSet(replicas))
+
+    with factory() as session:
+        mark_read_only(session)
+        assert account_names(session) == ["replica0"]
+        AccountRepository(session).create({"user_id": 1, "name": "new", "type": AccountType.savings})
+        session.commit()
+        # 같은 요청 안의 쓰기 이후 조회는 방금 쓴 데이터가 있는 primary에서
+        assert account_names(session) == ["primary", "new"]
+
+def test_unhealthy_replica_is_skipped(engines, tmp_path):
+    primary, replica, _ = engines
+    broken = create_engine(f"sqlite:///{tmp_path / 'missing' / 'replica.db'}")
+    replica_set = ReplicaSet([broken, replica], check_interval=60)
+    factory = sessionmaker(class_=RoutingSession, bind=primary, replicas=replica_set)
+
+    for _ in range(2):
+        with factory() as session:
+            mark_read_only(session)
+            assert account_names(session) == ["replica0"]
+    assert [entry["healthy"] for entry in replica_set.status()] == [False, True]
+
+    with factory() as session:
+        mark_read_only(session)
+        replica_set.mark_down(replica)
+        assert account_names(session) == ["primary"]
+
+def test_cached_summaries_are_computed_on_replica(engines):
+    primary, replica, _ = engines
+    factory = sessionmaker(class_=RoutingSession, bind=primary, replicas=ReplicaSet([replica]))
+    summary_cache.clear()
+
+    # primary에만 반영된 쓰기 (replica0 파일은 복제가 지연된 상태)
+    with factory() as session:
+        account = AccountRepository(session).create({"user_id": 1, "name": "new", "type": AccountType.savings, "balance": Decimal("500")})
+        mark_summary_dirty(session, account.user_id)
+        session.commit()
+
+    # 캐시 미스도 복제본에서 계산, 복제본에서 읽은 이전 버전 키에 저장
+    with factory() as session:
+        mark_read_only(session)
+        assert SummaryService(session).get_total_assets() == Decimal("0")
+        assert account_names(session) == ["replica0"]
+
+    # 새 버전을 읽는 primary 조회는 이전 결과를 재사용하지 않음
+    with factory() as session:
+        assert SummaryService(session).get_total_assets() == Decimal("500")
+    assert summary_cache.stats()["hits"] == 0
+
+def test_summary_computed_across_a_version_change_is_not_cached(engines):
+    primary, replica, _ = engines
+    factory = sessionmaker(class_=RoutingSession, bind=primary, replicas=ReplicaSet([replica]))
+    summary_cache.clear()
+
+    def compute():
+        # 계산 도중 다른 요청의 쓰기가 commit됨
+        with factory() as writer:
+            mark_summary_dirty(writer, 1)
+            writer.commit()
+        return "computed"
+
+    with factory() as session:
+        assert summary_cache.get_or_compute(1, "probe", compute, db=session) == "computed"
+        assert summary_cache.stats()["entries"] == 0
+        assert summary_cache.get_or_compute(1, "probe", lambda: "fresh", db=session) == "fresh"
+    assert summary_cache.stats()["entries"] == 1
@@ -0,0 +1,70 @@
+import asyncio
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from datetime import date
+from decimal import Decimal
+
+from app.database import Base
+from app.models import Account, RecurringTransaction, Transaction, AccountType, TransactionType, Frequency
+from app.core.locks import FileLeaderLock
+from app.core.scheduler import Scheduler
+from app.services.recurring_service import process_due_in_shards
+
+def test_only_lock_holder_runs_jobs(tmp_path):
+    lock_path = str(tmp_path / "scheduler.lock")
+    calls = []
+    leader = Scheduler(FileLeaderLock(lock_path))
+    follower = Scheduler(FileLeaderLock(lock_path))
+    for scheduler in (leader, follower):
+        scheduler.add_job("job", 3600, lambda: calls.append(1) or 10)
+
+    async def scenario():
+        await leader.tick()
+        await follower.tick()
+        await leader.tick()  # interval 전이므로 다시 실행하지 않음
+        await leader.stop()
+        await follower.tick()  # 리더가 락을 놓으면 다른 워커가 이어받음
+
+    asyncio.run(scenario())
+    assert len(calls) == 2
+    status = leader.status()["jobs"]["job"]
+    assert status["runs"] == 1 and status["last_processed"] == 10
+    assert follower.is_leader
+
+def test_failed_job_is_recorded(tmp_path):
+    scheduler = Scheduler(FileLeaderLock(str(tmp_path / "scheduler.lock")))
+    scheduler.add_job("broken", 60, lambda: 1 / 0)
+    asyncio.run(scheduler.tick())
+    stats = scheduler.status()["jobs"]["broken"]
+    assert stats["failures"] == 1
+    assert "division by zero" in stats["last_error"]
+
+def test_process_due_in_shards(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'shards.db'}", connect_args={"check_same_thread": False, "timeout": 30})
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    db = SessionLocal()
+    accounts = [Account(name=f"acc{i}", type=AccountType.checking, balance=Decimal("0")) for i in range(10)]
+    db.add_all(accounts)
+    db.flush()
+    db.add_all([
+        RecurringTransaction(
+            account_id=account.id, type=TransactionType.income, category="급여", amount=Decimal("100"),
+            frequency=Frequency.monthly, day_of_month=25, start_date=date(2024, 1, 1),
+            next_run_date=date(2024, 1, 25)
+        )
+        for account in accounts
+    ])
+    db.commit()
+    db.close()
+
+    assert process_due_in_shards(SessionLocal, date(2024, 2, 25), shard_count=3, max_workers=3) == 20
+    assert process_due_in_shards(SessionLocal, date(2024, 2, 25), shard_count=3, max_workers=3) == 0
+
+    db = SessionLocal()
+    assert db.query(Transaction).count() == 20
+    assert {a.balance for a in db.query(Account)} == {Decimal("200")}
+    db.close()
+    engine.dispose()
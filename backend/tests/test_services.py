@@ -5,10 +5,13 @@ from datetime import date
 from decimal import Decimal
 
 from app.database import Base
-from app.models import Account, Category, Transaction, AccountType, TransactionType, CategoryType
+from app.models import Account, Category, Transaction, MonthlyCategoryTotal, AccountType, TransactionType, CategoryType
 from app.services.transaction_service import TransactionService
 from app.services.account_service import AccountService
-from app.schemas import TransactionCreate, AccountCreate
+from app.services.summary_service import SummaryService
+from app.core.cache import SummaryCache, summary_cache
+from app.core.exceptions import InsufficientBalanceError, InvalidTransactionError
+from app.schemas import TransactionCreate, TransactionUpdate, AccountCreate
 
 # Setup in-memory SQLite database for testing
 SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
@@ -88,3 +91,149 @@ def test_net_worth(db):
     net_worth = service.calculate_net_worth(user_id=1)
 
     assert net_worth == Decimal(6000)
+
+def test_monthly_summary_counts_duplicate_category_names_once(db):
+    account = Account(name="Bank", type=AccountType.checking, balance=10000, user_id=1)
+    dining = Category(name="Dining", type=CategoryType.expense)
+    travel = Category(name="Travel", type=CategoryType.expense)
+    db.add_all([account, dining, travel])
+    db.commit()
+    # 서로 다른 부모 밑의 같은 이름 카테고리 ("Dining > Food", "Travel > Food")
+    db.add_all([
+        Category(name="Food", type=CategoryType.expense, parent_id=dining.id),
+        Category(name="Food", type=CategoryType.expense, parent_id=travel.id, is_fixed=True),
+    ])
+    db.commit()
+
+    service = TransactionService(db)
+    service.create_transaction(TransactionCreate(
+        account_id=account.id, type=TransactionType.expense, category="Food",
+        amount=Decimal(100), transaction_date=date(2024, 3, 1)
+    ))
+
+    summary = service.get_monthly_summary(2024, 3, user_id=1)
+    assert summary["fixed_expenses"] + summary["variable_expenses"] == Decimal(100)
+    assert summary["fixed_expenses"] == Decimal(100)
+
+def test_monthly_totals_follow_writes(db):
+    account = Account(name="Bank", type=AccountType.checking, balance=10000, user_id=1)
+    db.add_all([account, Category(name="Rent", type=CategoryType.expense, is_fixed=True)])
+    db.commit()
+
+    service = TransactionService(db)
+    def expense(category, amount, day):
+        return service.create_transaction(TransactionCreate(
+            account_id=account.id, type=TransactionType.expense, category=category,
+            amount=Decimal(amount), transaction_date=date(2024, 3, day)
+        ))
+
+    expense("Rent", 1000, 1)
+    food = expense("Food", 200, 2)
+    expense("Food", 300, 3)
+    service.create_transaction(TransactionCreate(
+        account_id=account.id, type=TransactionType.income, category="Salary",
+        amount=Decimal(5000), transaction_date=date(2024, 3, 25)
+    ))
+
+    # 금액/날짜 변경은 기존 월에서 빠지고 새 월에 더해짐
+    service.update_transaction(food.id, TransactionUpdate(amount=Decimal(250)))
+    moved = expense("Food", 50, 4)
+    service.update_transaction(moved.id, TransactionUpdate(transaction_date=date(2024, 4, 1)))
+
+    spending = service.get_monthly_spending_by_category(account.id, 2024, 3)
+    assert [(s.category_name, s.amount, s.is_fixed) for s in spending] == [
+        ("Rent", Decimal(1000), True),
+        ("Food", Decimal(550), False),
+    ]
+
+    summary = service.get_monthly_summary(2024, 3, user_id=1)
+    assert summary["income"] == Decimal(5000)
+    assert summary["fixed_expenses"] == Decimal(1000)
+    assert summary["variable_expenses"] == Decimal(550)
+
+    service.delete_transaction(moved.id)
+    assert service.get_monthly_spending_by_category(account.id, 2024, 4) == []
+
+    # 원장 기준 재생성 결과가 증분 결과와 같아야 함
+    incremental = {
+        (t.year, t.month, t.category, t.type): t.total_amount
+        for t in db.query(MonthlyCategoryTotal).filter(MonthlyCategoryTotal.transaction_count > 0)
+    }
+    service.rebuild_monthly_totals()
+    rebuilt = {(t.year, t.month, t.category, t.type): t.total_amount for t in db.query(MonthlyCategoryTotal)}
+    assert rebuilt == incremental
+
+def test_balance_updates_are_guarded_in_sql(db):
+    account = Account(name="Bank", type=AccountType.checking, balance=Decimal(100), user_id=1)
+    db.add(account)
+    db.commit()
+    service = TransactionService(db)
+
+    with pytest.raises(InvalidTransactionError):
+        service.create_transaction(TransactionCreate(
+            account_id=account.id, type=TransactionType.expense, category="Food",
+            amount=Decimal(150), transaction_date=date(2024, 3, 1)
+        ))
+    db.rollback()
+    assert db.query(Transaction).count() == 0
+
+    spent = service.create_transaction(TransactionCreate(
+        account_id=account.id, type=TransactionType.expense, category="Food",
+        amount=Decimal(100), transaction_date=date(2024, 3, 1)
+    ))
+    assert account.balance == Decimal(0)
+
+    # 금액 변경은 차이(+60)만 UPDATE 한 번으로 반영
+    service.update_transaction(spent.id, TransactionUpdate(amount=Decimal(40)))
+    assert account.balance == Decimal(60)
+
+    account_service = AccountService(db)
+    with pytest.raises(InsufficientBalanceError):
+        account_service.adjust_balance(account.id, Decimal(61), "subtract")
+    assert account_service.adjust_balance(account.id, Decimal(60), "subtract").balance == Decimal(0)
+
+def test_summary_cache_invalidated_on_commit(db):
+    account_service = AccountService(db)
+    account = account_service.create_account(AccountCreate(name="Bank", type=AccountType.checking, balance=Decimal(1000)))
+    summary_service = SummaryService(db)
+
+    assert summary_service.get_full_summary().total_assets == Decimal(1000)
+    assert summary_service.get_full_summary().total_assets == Decimal(1000)
+    assert summary_cache.stats()["hits"] == 1
+
+    TransactionService(db).create_transaction(TransactionCreate(
+        account_id=account.id, type=TransactionType.income, category="Salary",
+        amount=Decimal(500), transaction_date=date(2024, 1, 25)
+    ))
+    assert summary_service.get_full_summary().total_assets == Decimal(1500)
+    # 다른 사용자의 쓰기는 user 1의 캐시를 무효화하지 않음
+    account_service.create_account(AccountCreate(name="Other", type=AccountType.savings), user_id=2)
+    summary_service.get_full_summary()
+    assert summary_cache.stats()["hits"] == 2
+
+def test_summary_cache_lru_eviction(db):
+    cache = SummaryCache(max_entries=2)
+    for user_id in (1, 2, 3):
+        cache.get_or_compute(user_id, "total_assets", lambda: Decimal(user_id), db=db)
+    cache.get_or_compute(1, "total_assets", lambda: Decimal(0), db=db)
+
+    stats = cache.stats()
+    assert stats["evictions"] == 2
+    assert stats["misses"] == 4
+    assert stats["entries"] == 2
+
+def test_summary_cache_versions_are_shared_across_workers(db):
+    account = AccountService(db).create_account(AccountCreate(name="Bank", type=AccountType.checking, balance=Decimal(1000)))
+    # 이 프로세스의 summary_cache와 별개인 다른 워커의 캐시
+    worker = SummaryCache()
+    balance = lambda: AccountService(db).get_account(account.id).balance
+
+    assert worker.get_or_compute(account.user_id, "total_assets", balance, db=db) == Decimal(1000)
+    assert worker.get_or_compute(account.user_id, "total_assets", balance, db=db) == Decimal(1000)
+    # 이 프로세스에서 commit된 쓰기가 DB의 버전을 올리므로 다른 워커도 다시 계산
+    TransactionService(db).create_transaction(TransactionCreate(
+        account_id=account.id, type=TransactionType.income, category="Salary",
+        amount=Decimal(500), transaction_date=date(2024, 1, 25)
+    ))
+    assert worker.get_or_compute(account.user_id, "total_assets", balance, db=db) == Decimal(1500)
+    assert (worker.stats()["hits"], worker.stats()["misses"]) == (1, 2)
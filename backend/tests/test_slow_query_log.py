@@ -0,0 +1,59 @@
+from decimal import Decimal
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.database import Base
+from app.main import app
+from app.api.deps import get_db
+from app.core.slow_query_log import SlowQueryLog, attach_slow_query_log, redact, slow_query_log
+
+engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+def override_get_db():
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+def test_redact_keeps_ids_and_dates_only():
+    assert redact((1, "홍길동", Decimal("10.5"), None)) == [1, "<str>", "<Decimal>", None]
+
+def test_ring_buffer_and_sampling():
+    log = SlowQueryLog(threshold_ms=10, sample_rate=1.0, max_entries=2)
+    for i in range(3):
+        log.record(f"SELECT {i}", (), False, "sqlite", 0.02)
+    log.record("SELECT fast", (), False, "sqlite", 0.001)
+    assert [e.statement for e in log.entries()] == ["SELECT 2", "SELECT 1"]
+    assert log.stats()["seen"] == 3
+
+    sampled_out = SlowQueryLog(threshold_ms=10, sample_rate=0.0)
+    sampled_out.record("SELECT 1", (), False, "sqlite", 0.02)
+    assert sampled_out.entries() == [] and sampled_out.stats()["seen"] == 1
+
+def test_slow_queries_endpoint_captures_route_and_plan():
+    attach_slow_query_log(engine)
+    threshold = slow_query_log.threshold_ms
+    slow_query_log.threshold_ms = 0  # 모든 문장을 느린 쿼리로 간주
+    slow_query_log.clear()
+    Base.metadata.create_all(bind=engine)
+    app.dependency_overrides[get_db] = override_get_db
+    try:
+        client = TestClient(app)
+        client.get("/api/v1/transactions/", params={"account_id": 7, "start_date": "2024-01-01"})
+        body = client.get("/api/v1/debug/slow-queries").json()
+        client.delete("/api/v1/debug/slow-queries")
+        assert client.get("/api/v1/debug/slow-queries", params={"explain": False}).json()["recorded"] == 0
+    finally:
+        slow_query_log.threshold_ms = threshold
+        app.dependency_overrides.pop(get_db, None)
+        Base.metadata.drop_all(bind=engine)
+
+    entry = next(q for q in body["queries"] if q["route"] == "/api/v1/transactions/")
+    assert "FROM transactions" in entry["statement"]
+    # SQLite는 날짜도 문자열로 바인딩되므로 마스킹됨
+    assert entry["parameters"][:2] == [7, "<str>"]
+    assert any("idx_account_date" in line for line in entry["plan"])
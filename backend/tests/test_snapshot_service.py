@@ -0,0 +1,78 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from datetime import date, timedelta
+from decimal import Decimal
+
+from app.database import Base
+from app.models import Account, AssetSnapshot, AccountType
+from app.services.snapshot_service import SnapshotService
+from app.services.summary_service import SummaryService, trend_range
+
+engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+@pytest.fixture(scope="function")
+def db():
+    Base.metadata.create_all(bind=engine)
+    session = TestingSessionLocal()
+    yield session
+    session.close()
+    Base.metadata.drop_all(bind=engine)
+
+def test_generate_snapshots_skips_unchanged_and_reruns(db):
+    db.add_all([
+        Account(user_id=1, name="Bank", type=AccountType.checking, balance=Decimal("100")),
+        Account(user_id=1, name="Stock", type=AccountType.investment, balance=Decimal("50.5")),
+        Account(user_id=2, name="Bank", type=AccountType.savings, balance=Decimal("10")),
+    ])
+    db.commit()
+    service = SnapshotService(db)
+
+    first = service.generate_snapshots(date(2024, 1, 1))
+    assert (first.users, first.created, first.updated, first.skipped) == (2, 2, 0, 0)
+    snapshot = db.query(AssetSnapshot).filter_by(user_id=1).one()
+    assert snapshot.total_assets == Decimal("150.50")
+    assert [item["name"] for item in snapshot.accounts_summary] == ["Bank", "Stock"]
+    assert snapshot.accounts_summary[1] == {"account_id": 2, "name": "Stock", "type": "investment", "balance": 50.5}
+
+    # 같은 날짜 재실행은 변경 없음
+    rerun = service.generate_snapshots(date(2024, 1, 1))
+    assert (rerun.created, rerun.updated, rerun.skipped) == (0, 0, 2)
+
+    # 잔액이 바뀐 사용자만 다음 날 스냅샷 생성
+    db.query(Account).filter_by(user_id=2).update({"balance": Decimal("20")})
+    db.commit()
+    next_day = service.generate_snapshots(date(2024, 1, 2))
+    assert (next_day.created, next_day.skipped) == (1, 1)
+
+    # 같은 날짜에 잔액이 다시 바뀌면 기존 행 갱신
+    db.query(Account).filter_by(user_id=2).update({"balance": Decimal("30")})
+    db.commit()
+    rerun = service.generate_snapshots(date(2024, 1, 2))
+    assert (rerun.created, rerun.updated) == (0, 1)
+    assert db.query(AssetSnapshot).count() == 3
+
+    # 같은 달 스냅샷은 마지막 값 하나로, 이후 빈 달은 그 값을 이어서 채움
+    trend = SummaryService(db).get_net_worth_trend(user_id=2)
+    assert trend["data"] == [30.0] * 6
+
+def test_net_worth_trend_uses_month_end_snapshots(db):
+    start_date, today = trend_range(5, None, None)
+    months = [date(start_date.year + (start_date.month - 1 + offset) // 12, (start_date.month - 1 + offset) % 12 + 1, 1) for offset in range(5)]
+    # 구간 직전 스냅샷 1개, 1·4번째 달은 스냅샷 없음, 2번째 달은 사흘, 3·5번째 달은 매일
+    snapshots = [(start_date - timedelta(days=1), 5)]
+    for index in (2, 4):
+        first = months[index]
+        last = today if index == 4 else months[index + 1] - timedelta(days=1)
+        snapshots += [(first + timedelta(days=day), 100 * index + day) for day in range((last - first).days + 1)]
+    snapshots += [(months[1] + timedelta(days=day), 10 + day) for day in range(3)]
+    db.add_all([
+        AssetSnapshot(user_id=1, total_assets=value, net_worth=value, snapshot_date=day) for day, value in snapshots
+    ])
+    db.commit()
+
+    trend = SummaryService(db).get_net_worth_trend(user_id=1, months=5)
+    assert trend["labels"] == [month.strftime("%Y-%m") for month in months]
+    last_of_third = (months[3] - timedelta(days=1) - months[2]).days
+    assert trend["data"] == [5.0, 12.0, 200.0 + last_of_third, 200.0 + last_of_third, 400.0 + (today - months[4]).days]
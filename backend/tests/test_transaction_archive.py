@@ -0,0 +1,175 @@
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+from datetime import date
+from decimal import Decimal
+
+from app.database import Base
+from app.models import Account, MonthlyCategoryTotal, Transaction, AccountType, CategoryType, TransactionType
+from app.services.archive_service import TransactionArchiveService
+from app.services.category_service import CategoryService
+from app.services.export_service import TransactionExportService
+from app.services.transaction_service import TransactionService
+from app.repositories.transaction_archive import transaction_archive
+from app.core.cache import summary_cache
+from app.core.exceptions import InvalidTransactionError
+from app.schemas import CategoryCreate, TransactionCreate
+
+engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+TODAY = date(2025, 6, 1)
+
+@pytest.fixture(scope="function")
+def db(tmp_path, monkeypatch):
+    monkeypatch.setattr(transaction_archive, "root", tmp_path)
+    monkeypatch.setattr(transaction_archive, "_manifest_key", None)
+    Base.metadata.create_all(bind=engine)
+    session = TestingSessionLocal()
+    summary_cache.clear()
+    yield session
+    session.close()
+    Base.metadata.drop_all(bind=engine)
+
+@pytest.fixture
+def account_id(db):
+    account = Account(name="Bank", type=AccountType.checking, balance=Decimal("1000000"))
+    db.add(account)
+    db.commit()
+    service = TransactionService(db)
+    for day, amount in [
+        (date(2021, 3, 1), "100"), (date(2021, 11, 5), "200"),
+        (date(2022, 1, 10), "300"), (date(2022, 12, 31), "400"),
+        (date(2024, 2, 1), "500"), (date(2024, 2, 1), "600"),
+    ]:
+        service.create_transaction(TransactionCreate(
+            account_id=account.id, category="식비", type=TransactionType.expense,
+            amount=Decimal(amount), transaction_date=day
+        ))
+    return account.id
+
+def test_archive_moves_closed_years_and_reads_span_both_tiers(db, account_id):
+    service = TransactionService(db)
+    before_summary = service.get_period_summary("year", date(2021, 1, 1), date(2024, 12, 31)).model_dump()
+    before_listing = [tx.id for tx in service.get_transactions(limit=10)]
+
+    result = TransactionArchiveService(db).archive_closed_years(2022, today=TODAY)
+    summary_cache.clear()
+
+    assert result == {"years": [2021, 2022], "rows": 4}
+    manifest = transaction_archive.manifest()
+    assert manifest["archived_through"] == 2022
+    assert {year: entry["rows"] for year, entry in manifest["years"].items()} == {"2021": 2, "2022": 2}
+    assert all((transaction_archive.root / entry["file"]).exists() for entry in manifest["years"].values())
+    # 핫 테이블에는 마감되지 않은 연도만 남음
+    assert db.scalar(select(func.count(Transaction.id))) == 2
+
+    assert [tx.id for tx in service.get_transactions(limit=10)] == before_listing
+    assert [tx.amount for tx in service.get_transactions(start_date=date(2022, 1, 1), end_date=date(2022, 12, 31))] == [
+        Decimal("400"), Decimal("300")
+    ]
+    assert service.get_period_summary("year", date(2021, 1, 1), date(2024, 12, 31)).model_dump() == before_summary
+
+    # 커서 페이지가 경계를 넘어 이어짐
+    ids, cursor = [], None
+    while True:
+        page = service.get_transaction_page(limit=4, cursor=cursor)
+        ids.extend(tx.id for tx in page.items)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+    assert ids == before_listing
+
+    csv = b"".join(TransactionExportService(db).export("csv")).decode("utf-8")
+    assert len(csv.strip().splitlines()) == 1 + 6
+
+def test_archived_years_are_read_only_and_keep_monthly_totals(db, account_id):
+    TransactionArchiveService(db).archive_closed_years(2022, today=TODAY)
+
+    with pytest.raises(InvalidTransactionError):
+        TransactionService(db).create_transaction(TransactionCreate(
+            account_id=account_id, category="식비", type=TransactionType.expense,
+            amount=Decimal("10"), transaction_date=date(2022, 5, 1)
+        ))
+
+    TransactionService(db).rebuild_monthly_totals()
+    years = db.execute(
+        select(MonthlyCategoryTotal.year, func.sum(MonthlyCategoryTotal.total_amount)).group_by(MonthlyCategoryTotal.year)
+    ).all()
+    assert {year: Decimal(amount) for year, amount in years} == {2021: 300, 2022: 700, 2024: 1100}
+
+def test_open_years_cannot_be_archived(db, account_id):
+    with pytest.raises(InvalidTransactionError):
+        TransactionArchiveService(db).archive_closed_years(2024, today=TODAY)
+    assert transaction_archive.manifest()["archived_through"] is None
+
+def test_archiving_year_rejects_writes(db, account_id, monkeypatch):
+    write_year = transaction_archive.write_year
+    rejected = []
+
+    def write_during_archive(year, batches):
+        entry = write_year(year, batches)
+        # 기록 중에 들어온 쓰기는 거부됨
+        try:
+            TransactionService(db).create_transaction(TransactionCreate(
+                account_id=account_id, category="식비", type=TransactionType.expense,
+                amount=Decimal("10"), transaction_date=date(year, 6, 1)
+            ))
+        except InvalidTransactionError:
+            rejected.append(year)
+        return entry
+
+    monkeypatch.setattr(transaction_archive, "write_year", write_during_archive)
+    TransactionArchiveService(db).archive_closed_years(2022, today=TODAY)
+    assert rejected == [2021, 2022]
+    assert db.scalar(select(func.count(Transaction.id))) == 2
+
+def test_purge_removes_only_archived_rows(db, account_id, monkeypatch):
+    write_year = transaction_archive.write_year
+
+    def commit_late_row(year, batches):
+        entry = write_year(year, batches)
+        # 쓰기 차단 전에 검사를 통과한 트랜잭션이 기록 뒤에 commit한 경우
+        if year == 2021:
+            db.add(Transaction(
+                account_id=account_id, category="식비", type=TransactionType.expense,
+                amount=Decimal("10"), transaction_date=date(2021, 6, 1)
+            ))
+            db.commit()
+        return entry
+
+    monkeypatch.setattr(transaction_archive, "write_year", commit_late_row)
+    with pytest.raises(InvalidTransactionError):
+        TransactionArchiveService(db).archive_closed_years(2022, today=TODAY)
+    late = db.scalars(select(Transaction).where(Transaction.transaction_date < date(2022, 1, 1))).all()
+    assert [(tx.transaction_date, tx.amount) for tx in late] == [(date(2021, 6, 1), Decimal("10"))]
+
+def test_search_and_rollup_span_archive(db, account_id):
+    food = CategoryService(db).create_category(CategoryCreate(name="식비", type=CategoryType.expense))
+    service = TransactionService(db)
+
+    def search_ids(limit):
+        ids, cursor = [], None
+        while True:
+            page = service.search_transactions("식비", limit=limit, cursor=cursor)
+            ids.extend(hit.id for hit in page.items)
+            cursor = page.next_cursor
+            if cursor is None:
+                return ids
+
+    def rollup():
+        summary_cache.clear()
+        totals = CategoryService(db).get_rollup(date(2021, 1, 1), date(2024, 12, 31))
+        return [(item.id, item.total_amount, item.transaction_count) for item in totals]
+
+    before_rollup = rollup()
+    assert before_rollup == [(food.id, Decimal("2100"), 6)]
+    TransactionArchiveService(db).archive_closed_years(2022, today=TODAY)
+    summary_cache.clear()
+
+    ids = search_ids(4)
+    assert len(ids) == len(set(ids)) == 6
+    hits = service.search_transactions("식비", start_date=date(2022, 1, 1), end_date=date(2022, 12, 31), limit=10).items
+    assert [hit.amount for hit in hits] == [Decimal("400"), Decimal("300")]
+    assert service.search_transactions("식비", min_amount=Decimal("350"), max_amount=Decimal("450"), limit=10).items[0].amount == Decimal("400")
+    assert rollup() == before_rollup
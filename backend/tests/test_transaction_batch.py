@@ -0,0 +1,93 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from datetime import date
+from decimal import Decimal
+
+from app.database import Base
+from app.models import Account, Transaction, MonthlyCategoryTotal, AccountType, TransactionType
+from app.services.transaction_service import TransactionService
+from app.services.transaction_batch_service import TransactionBatchService
+from app.schemas import TransactionBatchRequest, TransactionCreate
+
+engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+@pytest.fixture(scope="function")
+def db():
+    Base.metadata.create_all(bind=engine)
+    session = TestingSessionLocal()
+    yield session
+    session.close()
+    Base.metadata.drop_all(bind=engine)
+
+@pytest.fixture
+def ledger(db):
+    account = Account(name="Bank", type=AccountType.checking, balance=Decimal("1000"))
+    db.add(account)
+    db.commit()
+    service = TransactionService(db)
+    first = service.create_transaction(TransactionCreate(
+        account_id=account.id, category="식비", type=TransactionType.expense,
+        amount=Decimal("100"), transaction_date=date(2024, 3, 1)
+    ))
+    second = service.create_transaction(TransactionCreate(
+        account_id=account.id, category="식비", type=TransactionType.expense,
+        amount=Decimal("200"), transaction_date=date(2024, 3, 2)
+    ))
+    return account.id, first.id, second.id
+
+def create_op(account_id, type_, amount, category="급여"):
+    return {"op": "create", "transaction": {
+        "account_id": account_id, "category": category, "type": type_,
+        "amount": amount, "transaction_date": "2024-03-10",
+    }}
+
+def balance_of(db, account_id):
+    db.expire_all()
+    return db.get(Account, account_id).balance
+
+def test_best_effort_applies_valid_items_once(db, ledger):
+    account_id, first_id, second_id = ledger
+    # 잔액 700 → +500 = 1200, 이후 지출 2000은 잔액 부족
+    batch = TransactionBatchRequest(mode="best_effort", operations=[
+        create_op(account_id, "income", "500"),
+        create_op(account_id, "expense", "2000", category="식비"),
+        {"op": "update", "id": first_id, "changes": {"amount": "150"}},
+        {"op": "delete", "id": second_id},
+        {"op": "delete", "id": second_id},
+        {"op": "delete", "id": 9999},
+        create_op(9999, "income", "1"),
+    ])
+    result = TransactionBatchService(db).apply(batch)
+
+    assert result.committed
+    assert [item.status for item in result.results] == ["ok", "error", "ok", "ok", "error", "error", "error"]
+    assert result.succeeded == 3 and result.failed == 4
+    assert "Insufficient balance" in result.results[1].error
+    assert result.results[0].transaction.id is not None
+    assert result.results[2].transaction.amount == Decimal("150")
+
+    # 1000 - 100 - 200 + 500 - 50(수정) + 200(삭제)
+    assert balance_of(db, account_id) == Decimal("1350")
+    assert db.get(Transaction, second_id) is None
+    totals = {
+        (total.category, total.type): (total.total_amount, total.transaction_count)
+        for total in db.query(MonthlyCategoryTotal).all()
+    }
+    assert totals[("식비", TransactionType.expense)] == (Decimal("150"), 1)
+    assert totals[("급여", TransactionType.income)] == (Decimal("500"), 1)
+
+def test_atomic_batch_applies_nothing_on_any_error(db, ledger):
+    account_id, first_id, _ = ledger
+    batch = TransactionBatchRequest(operations=[
+        create_op(account_id, "income", "500"),
+        {"op": "update", "id": first_id, "changes": {"amount": "10"}},
+        {"op": "update", "id": first_id},
+    ])
+    result = TransactionBatchService(db).apply(batch)
+
+    assert not result.committed
+    assert [item.status for item in result.results] == ["skipped", "skipped", "error"]
+    assert balance_of(db, account_id) == Decimal("700")
+    assert db.query(Transaction).count() == 2
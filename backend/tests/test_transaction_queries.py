@@ -0,0 +1,105 @@
+import csv
+import io
+import json
+import pytest
+import pyarrow.parquet as pq
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+from datetime import date, timedelta
+from decimal import Decimal
+
+from app.database import Base
+from app.models import Account, Transaction, AccountType, TransactionType
+from app.services.transaction_service import TransactionService
+from app.repositories.transaction_repository import TransactionRepository
+from app.services.export_service import TransactionExportService
+from app.core.exceptions import InvalidCursorError
+
+engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+@pytest.fixture(scope="function")
+def db():
+    Base.metadata.create_all(bind=engine)
+    session = TestingSessionLocal()
+    yield session
+    session.close()
+    Base.metadata.drop_all(bind=engine)
+
+@pytest.fixture
+def ledger(db):
+    account = Account(name="Bank", type=AccountType.checking, balance=Decimal("0"))
+    db.add(account)
+    db.commit()
+    # 같은 날짜에 여러 거래가 있어도 (date, id) 키로 순서가 결정되어야 함
+    db.add_all([
+        Transaction(
+            account_id=account.id,
+            category="식비",
+            type=TransactionType.expense,
+            amount=Decimal(i + 1),
+            transaction_date=date(2024, 1, 1) + timedelta(days=i // 3)
+        )
+        for i in range(25)
+    ])
+    db.commit()
+    return account
+
+def test_read_rows_skip_orm_hydration(db, ledger):
+    account_id = ledger.id
+    db.expunge_all()
+    repo = TransactionRepository(db)
+    rows = repo.get_rows(account_id, limit=10, start_date=date(2024, 1, 2))
+    # Row 조회는 세션 identity map에 엔티티를 올리지 않음
+    assert len(db.identity_map) == 0
+    assert not isinstance(rows[0], Transaction)
+    assert rows[0].type is TransactionType.expense
+
+    orm = repo.get_all(account_id, limit=10, start_date=date(2024, 1, 2))
+    assert [tuple(row) for row in rows] == [
+        tuple(getattr(tx, name) for name in rows[0]._fields)
+        for tx in orm
+    ]
+
+def test_keyset_pages_cover_ledger_without_overlap(db, ledger):
+    service = TransactionService(db)
+    seen = []
+    cursor = None
+    while True:
+        page = service.get_transaction_page(ledger.id, limit=7, cursor=cursor)
+        seen.extend((tx.transaction_date, tx.id) for tx in page.items)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert len(seen) == 25
+    assert seen == sorted(seen, reverse=True)
+
+def test_invalid_cursor(db, ledger):
+    with pytest.raises(InvalidCursorError):
+        TransactionService(db).get_transaction_page(ledger.id, cursor="not-a-cursor")
+
+def test_keyset_query_uses_account_date_index(db, ledger):
+    plan = db.execute(text(
+        "EXPLAIN QUERY PLAN SELECT id FROM transactions "
+        "WHERE account_id = :a AND (transaction_date < :d OR (transaction_date = :d AND id < :i)) "
+        "ORDER BY transaction_date DESC, id DESC LIMIT 10"
+    ), {"a": ledger.id, "d": date(2024, 1, 5), "i": 10}).all()
+    assert any("idx_account_date" in row[-1] for row in plan)
+
+@pytest.mark.parametrize("file_format", ["csv", "ndjson", "parquet"])
+def test_export_streams_all_rows(db, ledger, file_format):
+    chunks = list(TransactionExportService(db).export(file_format, account_id=ledger.id))
+    data = b"".join(chunks)
+
+    if file_format == "csv":
+        rows = list(csv.DictReader(io.StringIO(data.decode("utf-8-sig"))))
+        assert rows[0]["type"] == "expense"
+        assert rows[0]["amount"] == "1.00"
+    elif file_format == "ndjson":
+        rows = [json.loads(line) for line in data.decode().splitlines()]
+        assert rows[0]["transaction_date"] == "2024-01-01"
+    else:
+        rows = pq.read_table(io.BytesIO(data)).to_pylist()
+        assert rows[-1]["amount"] == Decimal("25.00")
+    assert len(rows) == 25
@@ -0,0 +1,75 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from datetime import date, timedelta
+from decimal import Decimal
+
+from app.database import Base
+from app.models import Account, Transaction, AccountType, TransactionType
+from app.services.transaction_service import TransactionService
+from app.core.exceptions import InvalidTransactionError
+
+engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+@pytest.fixture(scope="function")
+def db():
+    Base.metadata.create_all(bind=engine)
+    session = TestingSessionLocal()
+    yield session
+    session.close()
+    Base.metadata.drop_all(bind=engine)
+
+@pytest.fixture
+def ledger(db):
+    account = Account(name="Bank", type=AccountType.checking, balance=Decimal("0"))
+    db.add(account)
+    db.commit()
+    descriptions = ["스타벅스 강남점", "스타벅스 역삼점 스타벅스 카드", "이마트 장보기", None]
+    db.add_all([
+        Transaction(
+            account_id=account.id,
+            category="카페" if i % 4 < 2 else "식비",
+            type=TransactionType.expense,
+            amount=Decimal(1000 * (i + 1)),
+            description=descriptions[i % 4],
+            transaction_date=date(2024, 1, 1) + timedelta(days=i)
+        )
+        for i in range(20)
+    ])
+    db.commit()
+    return account
+
+def test_search_ranks_and_pages_by_relevance(db, ledger):
+    service = TransactionService(db)
+    seen = []
+    cursor = None
+    while True:
+        page = service.search_transactions("스타", limit=3, cursor=cursor)
+        seen.extend(page.items)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert len(seen) == 10
+    assert len({hit.id for hit in seen}) == 10
+    assert [hit.score for hit in seen] == sorted((hit.score for hit in seen), reverse=True)
+    # 검색어가 두 번 나오는 설명이 먼저
+    assert seen[0].description == "스타벅스 역삼점 스타벅스 카드"
+
+def test_search_filters_and_index_follows_writes(db, ledger):
+    service = TransactionService(db)
+    hits = service.search_transactions("식비", min_amount=Decimal("5000"), max_amount=Decimal("12000"), limit=50).items
+    assert sorted(hit.amount for hit in hits) == [Decimal("7000"), Decimal("8000"), Decimal("11000"), Decimal("12000")]
+    assert service.search_transactions("이마트", end_date=date(2024, 1, 3), limit=50).items[0].id == 3
+
+    # 수정/삭제가 트리거로 FTS 테이블에 반영
+    target = db.get(Transaction, 3)
+    target.description = "쿠팡 로켓배송"
+    db.delete(db.get(Transaction, 7))
+    db.commit()
+    assert [hit.id for hit in service.search_transactions("이마트", limit=50).items] == [19, 15, 11]
+    assert [hit.id for hit in service.search_transactions("쿠팡", limit=50).items] == [3]
+
+    with pytest.raises(InvalidTransactionError):
+        service.search_transactions("\"*")
@@ -19,16 +19,19 @@ CREATE TABLE accounts (
     account_number VARCHAR(50) COMMENT '계좌번호',
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-    INDEX idx_user_id (user_id),
-    INDEX idx_type (type)
+    INDEX idx_account_user_balance (user_id, balance),
+    INDEX idx_account_type (type)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='계좌 정보';
 
 -- 거래내역 테이블
+-- 연도별 RANGE 파티션은 python -m app.cli partition-transactions로 적용 (FK/FULLTEXT 제거, PK를 (id, transaction_date)로 변경)
+-- 마감된 연도는 python -m app.cli archive-transactions로 Parquet 콜드 아카이브(TRANSACTION_ARCHIVE_DIR)로 이동
 CREATE TABLE transactions (
     id INT AUTO_INCREMENT PRIMARY KEY,
     account_id INT NOT NULL,
     type ENUM('income', 'expense', 'transfer') NOT NULL COMMENT '거래 유형',
     category VARCHAR(50) NOT NULL COMMENT '카테고리',
+    category_id INT COMMENT '인터닝된 카테고리 (CATEGORY_INTERNING)',
     amount DECIMAL(15, 2) NOT NULL COMMENT '금액',
     description TEXT COMMENT '설명',
     transaction_date DATE NOT NULL COMMENT '거래 날짜',
@@ -36,17 +39,36 @@ CREATE TABLE transactions (
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     FOREIGN KEY (account_id) REFERENCES accounts(id) ON DELETE CASCADE,
     INDEX idx_account_date (account_id, transaction_date),
-    INDEX idx_type (type),
-    INDEX idx_category (category),
-    INDEX idx_transaction_date (transaction_date)
+    INDEX idx_transaction_type (type),
+    INDEX idx_transaction_category_name (category),
+    INDEX idx_transaction_category (category_id),
+    INDEX idx_transaction_date (transaction_date, account_id, type, amount),
+    -- 설명/카테고리 전문 검색 (GET /transactions/search, 한글 부분 일치를 위해 ngram 파서)
+    FULLTEXT INDEX ft_transactions_text (description, category) WITH PARSER ngram
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='거래 내역';
 
+-- 월별 카테고리 집계 테이블 (거래 쓰기 시 증분 갱신, python -m app.cli rebuild-monthly-totals로 백필)
+CREATE TABLE monthly_category_totals (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    account_id INT NOT NULL,
+    year INT NOT NULL COMMENT '연도',
+    month INT NOT NULL COMMENT '월',
+    category VARCHAR(50) NOT NULL COMMENT '카테고리',
+    type ENUM('income', 'expense', 'transfer') NOT NULL COMMENT '거래 유형',
+    total_amount DECIMAL(15, 2) NOT NULL DEFAULT 0 COMMENT '합계 금액',
+    transaction_count INT NOT NULL DEFAULT 0 COMMENT '거래 건수',
+    FOREIGN KEY (account_id) REFERENCES accounts(id) ON DELETE CASCADE,
+    UNIQUE KEY uq_monthly_category_total (account_id, year, month, category, type),
+    INDEX idx_monthly_total_summary (year, month, account_id, category, type, total_amount)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='월별 카테고리 집계';
+
 -- 정기 거래 테이블
 CREATE TABLE recurring_transactions (
     id INT AUTO_INCREMENT PRIMARY KEY,
     account_id INT NOT NULL,
     type ENUM('income', 'expense') NOT NULL COMMENT '거래 유형',
     category VARCHAR(50) NOT NULL COMMENT '카테고리',
+    category_id INT COMMENT '인터닝된 카테고리 (CATEGORY_INTERNING)',
     amount DECIMAL(15, 2) NOT NULL COMMENT '금액',
     description TEXT COMMENT '설명',
     frequency ENUM('daily', 'weekly', 'monthly', 'yearly') NOT NULL DEFAULT 'monthly' COMMENT '주기',
@@ -54,11 +76,13 @@ CREATE TABLE recurring_transactions (
     is_active BOOLEAN DEFAULT TRUE COMMENT '활성화 여부',
     start_date DATE NOT NULL COMMENT '시작일',
     end_date DATE COMMENT '종료일',
+    next_run_date DATE COMMENT '다음 실행일',
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
     FOREIGN KEY (account_id) REFERENCES accounts(id) ON DELETE CASCADE,
-    INDEX idx_active (is_active),
-    INDEX idx_day_of_month (day_of_month)
+    INDEX idx_recurring_due (is_active, next_run_date),
+    INDEX idx_recurring_schedule (is_active, frequency, day_of_month),
+    INDEX idx_recurring_monthly_sum (account_id, is_active, frequency, type, amount)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='정기 거래';
 
 -- 지출 카테고리 테이블
@@ -73,18 +97,78 @@ CREATE TABLE budget_categories (
     UNIQUE KEY unique_user_category (user_id, name)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='예산 카테고리';
 
+-- 거래 카테고리 트리 (parent_id)
+CREATE TABLE categories (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    user_id INT DEFAULT 1,
+    name VARCHAR(50) NOT NULL COMMENT '카테고리명',
+    type ENUM('income', 'expense') NOT NULL COMMENT '카테고리 유형',
+    is_fixed BOOLEAN DEFAULT FALSE COMMENT '고정 지출 여부',
+    parent_id INT COMMENT '상위 카테고리',
+    FOREIGN KEY (parent_id) REFERENCES categories(id),
+    INDEX idx_category_user_name (user_id, name, type)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='거래 카테고리';
+
+-- 카테고리 인터닝 (거래/정기 거래 테이블이 categories보다 먼저 만들어지므로 FK는 여기서)
+-- 기존 DB는 python -m app.cli intern-categories가 컬럼 추가와 category_id 백필을 함께 수행
+ALTER TABLE transactions ADD FOREIGN KEY (category_id) REFERENCES categories(id);
+ALTER TABLE recurring_transactions ADD FOREIGN KEY (category_id) REFERENCES categories(id);
+
+-- 카테고리 클로저 테이블 (모든 조상-자손 쌍, 하위 포함 집계를 조인 한 번으로)
+-- python -m app.cli rebuild-category-closure로 parent_id에서 재생성
+CREATE TABLE category_closure (
+    ancestor_id INT NOT NULL,
+    descendant_id INT NOT NULL,
+    depth INT NOT NULL COMMENT '0이면 자기 자신',
+    PRIMARY KEY (ancestor_id, descendant_id),
+    FOREIGN KEY (ancestor_id) REFERENCES categories(id) ON DELETE CASCADE,
+    FOREIGN KEY (descendant_id) REFERENCES categories(id) ON DELETE CASCADE,
+    INDEX idx_category_closure_descendant (descendant_id, depth)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='카테고리 클로저';
+
+-- 지출 카테고리별 월 예산 (하위 카테고리 지출 포함해서 평가)
+CREATE TABLE budgets (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    user_id INT DEFAULT 1,
+    category_id INT NOT NULL,
+    monthly_limit DECIMAL(15, 2) COMMENT '월 예산',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    UNIQUE KEY unique_user_budget_category (user_id, category_id),
+    FOREIGN KEY (category_id) REFERENCES categories(id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='예산';
+
 -- 자산 스냅샷 테이블
 CREATE TABLE asset_snapshots (
     id INT AUTO_INCREMENT PRIMARY KEY,
     user_id INT NOT NULL DEFAULT 1,
     total_assets DECIMAL(15, 2) NOT NULL COMMENT '총 자산',
+    net_worth DECIMAL(15, 2) NOT NULL DEFAULT 0 COMMENT '순자산',
     accounts_summary JSON COMMENT '계좌별 상세',
     snapshot_date DATE NOT NULL COMMENT '스냅샷 날짜',
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    INDEX idx_user_date (user_id, snapshot_date),
     UNIQUE KEY unique_user_snapshot_date (user_id, snapshot_date)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='자산 스냅샷';
 
+-- 사용자별 요약 데이터 버전 (쓰기 commit마다 +1, 모든 워커의 요약 캐시가 키에 포함)
+CREATE TABLE summary_versions (
+    user_id INT PRIMARY KEY,
+    version INT NOT NULL DEFAULT 0
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='요약 데이터 버전';
+
+-- 스키마 마이그레이션 기록 (이 스크립트는 최신 스키마를 만들므로 모든 버전을 적용된 것으로 기록)
+-- 인덱스는 backend/app/models.py에 선언된 것과 같아야 함: python -m app.cli check-indexes
+CREATE TABLE schema_migrations (
+    version INT PRIMARY KEY,
+    description VARCHAR(200) NOT NULL,
+    applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='스키마 마이그레이션';
+
+INSERT INTO schema_migrations (version, description) VALUES
+(1, 'baseline schema and category_id columns'),
+(2, 'declared composite and covering indexes'),
+(3, 'shared summary data versions');
+
 -- 초기 데이터: 기본 카테고리
 INSERT INTO budget_categories (name, color) VALUES
 ('급여', '#10B981'),